@@ -77,9 +77,16 @@ class RunToolArgument(Enum):
         f"{LanguageVersion.JAVA_11.value}, {LanguageVersion.KOTLIN.value}.",
     )
 
-    CPU = ArgumentsInfo(None, "--n-cpu", "Specify number of cpu that can be used to run inspectors")
+    CPU = ArgumentsInfo(
+        None,
+        "--n-cpu",
+        "Specify number of cpu that can be used by the linters and by the worker processes of the Python inspectors. "
+        "The inspectors themselves are always run concurrently, 4 inspectors per cpu at most",
+    )
 
-    PATH = ArgumentsInfo(None, "path", "Path to file or directory to inspect.")
+    PATH = ArgumentsInfo(
+        None, "path", "Path to file or directory to inspect. It is required without --warmup and --batch."
+    )
 
     FORMAT = ArgumentsInfo("-f", "--format", "The output format. Default is JSON.")
 
@@ -116,5 +123,114 @@ class RunToolArgument(Enum):
         "--ij-config",
         "JSON string containing information for setting up a connection to the IJ server "
         "for each language to be analyzed with the IJ inspector. "
-        "It should be a dictionary of dictionaries where for each language host and port are specified.",
+        "It should be a dictionary of dictionaries where for each language host and port are specified. "
+        "Several servers of a language can be listed in endpoints, see the README for details.",
+    )
+
+    CACHE_DIR = ArgumentsInfo(
+        None,
+        "--cache-dir",
+        "Path to a directory with the issue cache. If it is specified, the issues found by the inspectors "
+        "are stored there and reused for the files with the same content. By default, the cache is disabled.",
+    )
+
+    CACHE_SIZE = ArgumentsInfo(
+        None,
+        "--cache-size",
+        "The maximum size of the issue cache in megabytes. Default is 512.",
+    )
+
+    TIMEOUT = ArgumentsInfo(
+        None,
+        "--timeout",
+        "Wall-clock time limit of each inspector in seconds. Per-inspector limits can be specified as well, "
+        "for example, 60,pmd=120,pylint=30. The timed out inspector is stopped and the review is marked as partial. "
+        "By default, there is no limit.",
+    )
+
+    CPU_TIME_LIMIT = ArgumentsInfo(
+        None,
+        "--cpu-time-limit",
+        "CPU time limit of each linter process in seconds. It has the same format as --timeout. "
+        "By default, there is no limit.",
+    )
+
+    MANIFEST = ArgumentsInfo(
+        None,
+        "--manifest",
+        "Path to a manifest file for the incremental review of a project. The manifest keeps the file hashes "
+        "and the issues from the previous review, so only the changed files are inspected again.",
+    )
+
+    WARMUP = ArgumentsInfo(
+        None,
+        "--warmup",
+        "Build the AppCDS archives of the JVM linters (Checkstyle, PMD, Detekt) and fill the Go caches "
+        "of golangci-lint for the linters that are set up, then print their run times before and after "
+        "the warm-up. The path is not required.",
+    )
+
+    BATCH = ArgumentsInfo(
+        None,
+        "--batch",
+        "Path to a JSONL file with the submissions to review. Each line is a JSON object with an id, "
+        "a path or a code, a language and a history. The results are printed as NDJSON in the order of completion, "
+        "each line contains the id and the same JSON as the review of a single submission or the error. "
+        "The path is not required.",
+    )
+
+    BATCH_WORKERS = ArgumentsInfo(
+        None,
+        "--batch-workers",
+        "Number of worker processes that review the submissions of --batch. Default is 1.",
+    )
+
+    BATCH_WINDOW = ArgumentsInfo(
+        None,
+        "--batch-window",
+        "Maximum number of submissions of --batch that are reviewed or wait for the output at the same time. "
+        "Default is 100.",
+    )
+
+    BATCH_PACK_SIZE = ArgumentsInfo(
+        None,
+        "--batch-pack-size",
+        "Number of single-file submissions of --batch that are packed into one directory, so each file-local linter "
+        "is run once over the whole pack. Default is 1, which means the submissions are not packed.",
+    )
+
+
+@unique
+class DaemonArgument(Enum):
+    HOST = ArgumentsInfo(None, "--host", "The loopback host to listen on. Default is 127.0.0.1.")
+
+    PORT = ArgumentsInfo(None, "--port", "The port to listen on. Default is 8000.")
+
+    SOCKET = ArgumentsInfo(
+        None,
+        "--socket",
+        "Path to a UNIX socket to listen on. If it is specified, --host and --port are ignored.",
+    )
+
+    WORKERS = ArgumentsInfo(None, "--workers", "Number of worker processes that run reviews. Default is 1.")
+
+    MAX_JOBS_PER_WORKER = ArgumentsInfo(
+        None,
+        "--max-jobs-per-worker",
+        "Number of reviews after which a worker process is recycled. Default is 100.",
+    )
+
+    MAX_QUEUE = ArgumentsInfo(
+        None,
+        "--max-queue",
+        "Number of reviews that can wait for a free worker. "
+        "If the queue is full, new requests are rejected with 503. Default is 100.",
+    )
+
+    ROOT = ArgumentsInfo(
+        None,
+        "--root",
+        "The directory with the files that can be reviewed by path. The relative paths of the requests "
+        "are resolved against it, and the paths outside it are rejected. "
+        "If it is not specified, only the inline code can be reviewed.",
     )
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
     from hyperstyle.src.python.review.common.language import Language
+    from hyperstyle.src.python.review.common.subprocess_runner import ResourceLimits
     from hyperstyle.src.python.review.inspectors.common.inspector.inspector_type import InspectorType
 
 
@@ -22,6 +25,10 @@ class ApplicationConfig:
     history: str | None = None
     group_by_difficulty: bool = False
     ij_config: str | None = None
+    cache_dir: Path | None = None
+    cache_size: int | None = None
+    manifest_path: Path | None = None
+    inspector_limits: dict[InspectorType, ResourceLimits] = field(default_factory=dict)
 
     @staticmethod
     def get_default_config() -> ApplicationConfig:
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import fcntl
+import hashlib
 import linecache
 import logging
 import os
@@ -99,6 +101,14 @@ def get_file_line(path: Path, line_number: int) -> str:
     ).strip()
 
 
+def get_code_line(code_lines: list[str], line_number: int) -> str:
+    """Get the line of the code like ``get_file_line`` does for a file."""
+    if not 1 <= line_number <= len(code_lines):
+        return ""
+
+    return code_lines[line_number - 1].strip()
+
+
 def get_content_from_file(
     file_path: Path, encoding: str = Encoding.ISO_ENCODING.value, to_strip_nl: bool = True
 ) -> str:
@@ -130,3 +140,47 @@ def check_set_up_env_variable(variable_name: str) -> bool:
         logger.warning(f"{variable_name} was not set up!")
         return False
     return True
+
+
+def get_content_hash(path: Path) -> str:
+    """Get the hash of the file or of all files in the directory.
+
+    The hash depends on the names of the files (relative to the directory) as well as on their content,
+    because the result of some linters depends on the file names.
+    """
+    if path.is_file():
+        files = [(path.name, path)]
+    else:
+        files = sorted((str(file.relative_to(path)), file) for file in get_all_file_system_items(path))
+
+    content_hash = hashlib.sha256()
+    for name, file in files:
+        content_hash.update(name.encode())
+        content_hash.update(b"\0")
+        content_hash.update(get_file_hash(file).encode())
+
+    return content_hash.hexdigest()
+
+
+def get_file_hash(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def get_file_hashes(root: Path) -> dict[str, str]:
+    """Get the hashes of all files in the directory by their paths relative to it."""
+    return {str(file.relative_to(root)): get_file_hash(file) for file in get_all_file_system_items(root)}
+
+
+@contextmanager
+def file_lock(path: Path, *, shared: bool = False) -> Iterator[None]:
+    """Lock that works across processes. The lock file is created if it does not exist.
+
+    The lock is exclusive by default. A shared lock can be held by several processes at once,
+    but not together with an exclusive one.
+    """
+    with path.open("a") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
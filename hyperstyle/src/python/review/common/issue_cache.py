@@ -0,0 +1,285 @@
+from __future__ import annotations
+
+import atexit
+import functools
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from importlib import metadata
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from hyperstyle.src.python.review.common.file_system import file_lock
+from hyperstyle.src.python.review.inspectors.common.issue.issue_serialization import (
+    convert_issue_to_json_dict,
+    convert_json_dict_to_issue,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from hyperstyle.src.python.review.application_config import ApplicationConfig
+    from hyperstyle.src.python.review.inspectors.common.inspector.base_inspector import BaseInspector
+    from hyperstyle.src.python.review.inspectors.common.issue.issue import BaseIssue
+
+logger = logging.getLogger(__name__)
+
+# Increase it when the format of the entries is changed
+CACHE_FORMAT_VERSION = 1
+
+DEFAULT_CACHE_SIZE = 512 * 1024 * 1024
+
+ENTRIES_DIRECTORY = "entries"
+ENTRY_EXTENSION = ".json"
+LOCK_FILE = "cache.lock"
+KEY_LOCKS_DIRECTORY = "locks"
+STATS_FILE = "stats.json"
+
+# The eviction removes the least recently used entries until the cache takes this fraction of its maximum size,
+# so it is not run on each save after the cache becomes full
+EVICTION_TARGET = 0.9
+
+# The hits and misses are counted in memory and added to the stats file after this number of lookups
+# or this number of seconds, so the cache hits of different processes don't wait for each other
+STATS_FLUSH_INTERVAL = 100
+STATS_FLUSH_PERIOD = 10
+
+
+@functools.cache
+def get_hyperstyle_version() -> str:
+    try:
+        return metadata.version("hyperstyle")
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+@functools.cache
+def _get_config_files_hashes(config_files: tuple[Path, ...]) -> dict[str, str]:
+    return {
+        str(config_file): hashlib.sha256(config_file.read_bytes()).hexdigest() if config_file.exists() else ""
+        for config_file in config_files
+    }
+
+
+def create_cache_key(
+    inspector: BaseInspector, config: ApplicationConfig, content_hash: str, in_memory: bool
+) -> str:
+    """Create the key of the issues found by the inspector in the content with the given hash.
+
+    Besides the content, the key depends on everything that can change the issues: the version of hyperstyle
+    and of the linter, the linter configuration files and the language version.
+    """
+    language_version = config.inspectors_config.get("language_version")
+    key_data = {
+        "format": CACHE_FORMAT_VERSION,
+        "hyperstyle": get_hyperstyle_version(),
+        "inspector": inspector.inspector_type.value,
+        "version": inspector.get_version(),
+        "config_files": _get_config_files_hashes(tuple(inspector.config_files)),
+        "language_version": None if language_version is None else language_version.value,
+        "in_memory": in_memory,
+        "content": content_hash,
+    }
+    return hashlib.sha256(json.dumps(key_data, sort_keys=True).encode()).hexdigest()
+
+
+class IssueCache:
+    """Persistent content-addressed cache of the issues found by the inspectors.
+
+    The raw issues of each inspector are stored, so all filters, grading and penalty are applied to them as usual.
+    File paths of the issues are stored relative to the inspected path, so the same content
+    inspected at another path (e.g. in a new temporary directory) reuses the entry.
+
+    Each entry is written atomically, so the cache can be shared by several processes.
+    The processes that inspect the same content at the same time can lock its entry with ``lock_key``,
+    so only one of them runs the inspector, and the others get its issues from the cache.
+    The counters and the total size are stored in the cache directory and updated under a file lock.
+    The hits and misses are batched in each process (see ``STATS_FLUSH_INTERVAL``), so the stored counters
+    may lag behind the lookups of a running process.
+    When the total size exceeds ``max_size``, the least recently used entries are removed.
+    """
+
+    def __init__(self, directory: Path, max_size: int | None = None) -> None:
+        self.directory = directory
+        self.max_size = DEFAULT_CACHE_SIZE if max_size is None else max_size
+        self._entries_directory = directory / ENTRIES_DIRECTORY
+        self._entries_directory.mkdir(parents=True, exist_ok=True)
+        self._pending_lock = threading.Lock()
+        self._pending_stats = {"hits": 0, "misses": 0}
+        self._pending_pid = os.getpid()
+        self._last_flush = time.monotonic()
+        atexit.register(self._flush_stats_at_exit)
+
+    @property
+    def stats(self) -> dict[str, int]:
+        with file_lock(self.directory / LOCK_FILE):
+            stats = self._read_stats()
+            if self._take_pending_stats(stats):
+                self._write_stats(stats)
+            return stats
+
+    def flush_stats(self) -> None:
+        """Add the hits and misses counted by this process to the stats file."""
+        with file_lock(self.directory / LOCK_FILE):
+            stats = self._read_stats()
+            if self._take_pending_stats(stats):
+                self._write_stats(stats)
+
+    def get_issues(self, key: str, base_path: Path | None = None) -> list[BaseIssue] | None:
+        """Get the cached issues or None if there is no entry with this key."""
+        entry_path = self._get_entry_path(key)
+        try:
+            issues = [
+                convert_json_dict_to_issue(data, base_path) for data in json.loads(entry_path.read_text())
+            ]
+            # The modification time is used to find the least recently used entries
+            os.utime(entry_path)
+        except FileNotFoundError:
+            issues = None
+        except (OSError, ValueError, TypeError) as error:
+            logger.warning(f"The issue cache entry {entry_path} is corrupted: {error}")
+            self._remove_entry(entry_path)
+            issues = None
+
+        self._count_lookup(is_hit=issues is not None)
+        return issues
+
+    def save_issues(self, key: str, issues: list[BaseIssue], base_path: Path | None = None) -> None:
+        entry_path = self._get_entry_path(key)
+        content = json.dumps([convert_issue_to_json_dict(issue, base_path) for issue in issues])
+
+        entry_path.parent.mkdir(exist_ok=True)
+        file_descriptor, temp_path = tempfile.mkstemp(dir=entry_path.parent)
+        with os.fdopen(file_descriptor, "w") as temp_file:
+            temp_file.write(content)
+
+        with file_lock(self.directory / LOCK_FILE):
+            stats = self._read_stats()
+            old_size = entry_path.stat().st_size if entry_path.exists() else 0
+            Path(temp_path).replace(entry_path)
+            stats["size"] += len(content.encode()) - old_size
+            if stats["size"] > self.max_size:
+                stats["size"] = self._evict()
+            self._take_pending_stats(stats)
+            self._write_stats(stats)
+
+    @contextmanager
+    def lock_key(self, key: str) -> Iterator[None]:
+        """Lock the entry, so the processes that inspect the same content wait for each other.
+
+        The locks are striped over a fixed number of files by the prefix of the key,
+        so the lock files don't pile up, and the different keys rarely wait for each other.
+        """
+        lock_path = self.directory / KEY_LOCKS_DIRECTORY / key[:2] / f"{key[2:4]}.lock"
+        lock_path.parent.mkdir(parents=True, exist_ok=True)
+        with file_lock(lock_path):
+            yield
+
+    def _get_entry_path(self, key: str) -> Path:
+        return self._entries_directory / key[:2] / f"{key}{ENTRY_EXTENSION}"
+
+    def _remove_entry(self, entry_path: Path) -> None:
+        with file_lock(self.directory / LOCK_FILE):
+            stats = self._read_stats()
+            try:
+                entry_size = entry_path.stat().st_size
+                entry_path.unlink()
+            except FileNotFoundError:
+                # The entry is already removed by another process
+                return
+
+            stats["size"] = max(stats["size"] - entry_size, 0)
+            self._take_pending_stats(stats)
+            self._write_stats(stats)
+
+    def _count_lookup(self, is_hit: bool) -> None:
+        with self._pending_lock:
+            if self._pending_pid != os.getpid():
+                # The counters of a forked process are flushed by its parent
+                self._pending_pid = os.getpid()
+                self._pending_stats = {"hits": 0, "misses": 0}
+                self._last_flush = time.monotonic()
+
+            self._pending_stats["hits" if is_hit else "misses"] += 1
+            should_flush = (
+                sum(self._pending_stats.values()) >= STATS_FLUSH_INTERVAL
+                or time.monotonic() - self._last_flush >= STATS_FLUSH_PERIOD
+            )
+
+        if should_flush:
+            self.flush_stats()
+
+    def _take_pending_stats(self, stats: dict[str, int]) -> bool:
+        """Add the counters of this process to the stats and reset them. Return whether there were any."""
+        with self._pending_lock:
+            if self._pending_pid != os.getpid():
+                return False
+
+            has_pending_stats = any(self._pending_stats.values())
+            for name, value in self._pending_stats.items():
+                stats[name] += value
+            self._pending_stats = {"hits": 0, "misses": 0}
+            self._last_flush = time.monotonic()
+
+        return has_pending_stats
+
+    def _flush_stats_at_exit(self) -> None:
+        with self._pending_lock:
+            if self._pending_pid != os.getpid() or not any(self._pending_stats.values()):
+                return
+
+        try:
+            self.flush_stats()
+        except OSError as error:
+            logger.debug(f"The issue cache stats are not saved: {error}")
+
+    def _read_stats(self) -> dict[str, int]:
+        stats_path = self.directory / STATS_FILE
+        try:
+            return json.loads(stats_path.read_text())
+        except (OSError, ValueError):
+            return {"hits": 0, "misses": 0, "size": self._get_size()}
+
+    def _write_stats(self, stats: dict[str, int]) -> None:
+        (self.directory / STATS_FILE).write_text(json.dumps(stats))
+
+    def _get_entries(self) -> list[tuple[float, int, Path]]:
+        entries = []
+        for entry_path in self._entries_directory.glob(f"*/*{ENTRY_EXTENSION}"):
+            try:
+                stat = entry_path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry_path))
+
+        return entries
+
+    def _get_size(self) -> int:
+        return sum(size for _, size, _ in self._get_entries())
+
+    def _evict(self) -> int:
+        """Remove the least recently used entries and return the new size of the cache."""
+        entries = sorted(self._get_entries())
+        size = sum(entry_size for _, entry_size, _ in entries)
+
+        target_size = self.max_size * EVICTION_TARGET
+        for _, entry_size, entry_path in entries:
+            if size <= target_size:
+                break
+
+            entry_path.unlink(missing_ok=True)
+            size -= entry_size
+
+        logger.info(f"The issue cache is cleaned up to {size} bytes")
+        return size
+
+
+@functools.cache
+def get_issue_cache(directory: Path, max_size: int | None = None) -> IssueCache:
+    """Get the cache with the given directory. The same object is reused by all reviews in the process."""
+    return IssueCache(directory, max_size)
@@ -58,6 +58,16 @@ EXTENSION_TO_LANGUAGE = {
 }
 
 
+def get_language_extension(language: Language) -> Extension:
+    """Get the main extension of the language. For example, for Kotlin it is `.kt`, not `.kts`."""
+    for extension, extension_language in EXTENSION_TO_LANGUAGE.items():
+        if extension_language == language:
+            return extension
+
+    msg = f"There is no extension for the {language.value} language"
+    raise ValueError(msg)
+
+
 def guess_file_language(file_path: Path) -> Language:
     extension = Extension.from_file(file_path)
 
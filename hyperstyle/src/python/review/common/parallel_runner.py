@@ -1,34 +1,132 @@
 from __future__ import annotations
 
+import asyncio
+import contextvars
 import functools
-import itertools
+import hashlib
 import logging
-import multiprocessing
+import os
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
 from typing import Any, TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterator
     from pathlib import Path
 
     from hyperstyle.src.python.review.application_config import ApplicationConfig
+    from hyperstyle.src.python.review.inspectors.common.inspector.inspector_type import InspectorType
     from hyperstyle.src.python.review.inspectors.common.issue.issue import BaseIssue
 
+    # The issues of each file-local inspector found by the packed inspection of several submissions,
+    # grouped by the submission paths (see ``submission_packing``). Such inspectors are not run again for these paths
+    PackedIssues = dict[InspectorType, dict[Path, list[BaseIssue]]]
+
+from hyperstyle.src.python.review.common.file_system import get_content_hash
+from hyperstyle.src.python.review.common.issue_cache import create_cache_key, get_issue_cache
+from hyperstyle.src.python.review.common.process_pool import can_have_worker_processes, INSPECTOR_PROCESS_POOL
+from hyperstyle.src.python.review.common.subprocess_runner import (
+    resource_limits,
+    ResourceLimits,
+    run_subprocesses_in_event_loop,
+)
 from hyperstyle.src.python.review.inspectors.common.inspector.base_inspector import (
     BaseIJInspector,
     BaseInspector,
 )
+from hyperstyle.src.python.review.reviewers.exceptions import InspectorTimeoutError
 
 logger = logging.getLogger(__name__)
 
+# The inspectors mostly wait for the linter subprocesses or the IJ server rather than use the cpu of the current process,
+# so several inspectors are run at the same time per cpu
+INSPECTORS_PER_CPU = 4
+
+# The linter subprocesses are killed when the wall time is over. The inspector is abandoned a bit later,
+# so it has time to report the timeout itself. The Python linters are not run inside the process under the limits
+# (see ``get_python_linter_backend``), so only an inspector that ignores its deadline is abandoned
+ABANDON_DELAY = 1
+
+_packed_issues: ContextVar[PackedIssues | None] = ContextVar("packed_issues", default=None)
+
+
+@dataclass
+class InspectionResult:
+    issues: list[BaseIssue] = field(default_factory=list)
+    # The inspectors that did not finish in time. Their issues are missing, so the review is partial
+    timed_out_inspectors: list[InspectorType] = field(default_factory=list)
+
+
+@contextmanager
+def use_packed_issues(packed_issues: PackedIssues) -> Iterator[None]:
+    """Use the issues of the packed inspection instead of running the inspectors on the packed submissions."""
+    token = _packed_issues.set(packed_issues)
+    try:
+        yield
+    finally:
+        _packed_issues.reset(token)
+
 
 def run_inspector(path: Path, config: ApplicationConfig, inspector: BaseInspector) -> list[BaseIssue]:
-    return _run_inspector(inspector.inspect, path, config, inspector)
+    packed_issues = _packed_issues.get()
+    if packed_issues is not None and path in packed_issues.get(inspector.inspector_type, {}):
+        return list(packed_issues[inspector.inspector_type][path])
+
+    run = functools.partial(_run_inspector, inspector.inspect, path, config, inspector)
+    if not _is_cache_enabled(config, inspector):
+        return run()
+
+    key = create_cache_key(inspector, config, get_content_hash(path), in_memory=False)
+    return _run_inspector_with_cache(run, key, path, config)
 
 
 def run_inspector_in_memory(
     code: str, config: ApplicationConfig, inspector: BaseInspector
 ) -> list[BaseIssue]:
-    return _run_inspector(inspector.inspect_in_memory, code, config, inspector)
+    run = functools.partial(_run_inspector, inspector.inspect_in_memory, code, config, inspector)
+    if not _is_cache_enabled(config, inspector):
+        return run()
+
+    key = create_cache_key(inspector, config, hashlib.sha256(code.encode()).hexdigest(), in_memory=True)
+    return _run_inspector_with_cache(run, key, None, config)
+
+
+def _is_cache_enabled(config: ApplicationConfig, inspector: BaseInspector) -> bool:
+    return config.cache_dir is not None and inspector.is_cacheable
+
+
+def _run_inspector_with_cache(
+    run: Callable[[], list[BaseIssue]],
+    key: str,
+    base_path: Path | None,
+    config: ApplicationConfig,
+) -> list[BaseIssue]:
+    """Get the issues from the cache or run the inspector and save its issues to the cache.
+
+    The entry is locked while the inspector runs, so the concurrent reviews of the same content
+    in other processes (e.g. in other daemon workers) wait for this run and reuse its issues.
+    """
+    cache = get_issue_cache(config.cache_dir, config.cache_size)
+
+    with cache.lock_key(key):
+        issues = cache.get_issues(key, base_path)
+        if issues is not None:
+            return issues
+
+        issues = run()
+        try:
+            cache.save_issues(key, issues, base_path)
+        except OSError as error:
+            logger.warning(f"Failed to save issues to the cache: {error}")
+
+    return issues
+
+
+def get_max_concurrent_inspectors(n_cpu: int) -> int:
+    return max(n_cpu, 1) * INSPECTORS_PER_CPU
 
 
 def _run_inspector(
@@ -37,8 +135,15 @@ def _run_inspector(
     config: ApplicationConfig,
     inspector: BaseInspector,
 ) -> list[BaseIssue]:
+    limits = config.inspector_limits.get(inspector.inspector_type, ResourceLimits())
     try:
-        return inspect_function(data, config.inspectors_config)
+        with resource_limits(limits):
+            if _can_run_in_worker_process(config, inspector, limits):
+                return _run_in_worker_process(inspect_function, data, config)
+            return inspect_function(data, config.inspectors_config)
+    except InspectorTimeoutError as error:
+        logger.warning(f"Inspector {inspector.inspector_type} timed out: {error}")
+        raise
     except Exception:
         if isinstance(inspector, BaseIJInspector):
             logger.exception(f"Inspector {inspector.inspector_type} failed. Returning empty result.")
@@ -47,25 +152,132 @@ def _run_inspector(
         raise
 
 
+def _can_run_in_worker_process(
+    config: ApplicationConfig, inspector: BaseInspector, limits: ResourceLimits
+) -> bool:
+    """Check whether the inspector should be run in a worker process, so it does not share the GIL with the others.
+
+    The worker processes can't be stopped in the middle of an inspection, so the inspectors with the limits
+    are run in the current process.
+    """
+    return (
+        config.n_cpu > 1
+        and limits == ResourceLimits()
+        and inspector.is_cpu_bound()
+        and can_have_worker_processes()
+    )
+
+
+def _run_in_worker_process(
+    inspect_function: Callable[[Any, dict[str, Any]], list[BaseIssue]],
+    data: Any,
+    config: ApplicationConfig,
+) -> list[BaseIssue]:
+    process_pool = INSPECTOR_PROCESS_POOL.get(config.n_cpu)
+    # The inspectors in the worker processes don't start their own ones
+    inspectors_config = {**config.inspectors_config, "n_cpu": 1}
+    try:
+        return process_pool.submit(
+            _inspect_in_worker_process, inspect_function, data, inspectors_config, dict(os.environ)
+        ).result()
+    except BrokenProcessPool:
+        logger.warning(
+            "The worker process of the inspectors died, the inspector is run in the current process"
+        )
+        INSPECTOR_PROCESS_POOL.reset(process_pool)
+        return inspect_function(data, config.inspectors_config)
+
+
+def _inspect_in_worker_process(
+    inspect_function: Callable[[Any, dict[str, Any]], list[BaseIssue]],
+    data: Any,
+    inspectors_config: dict[str, Any],
+    environment: dict[str, str],
+) -> list[BaseIssue]:
+    # The workers are reused between the reviews, so they get the current environment (e.g. the linter backends)
+    if os.environ != environment:
+        os.environ.clear()
+        os.environ.update(environment)
+
+    return inspect_function(data, inspectors_config)
+
+
 def inspect_in_parallel(
     inspector_runner: Callable[[Any, ApplicationConfig, BaseInspector], list[BaseIssue]],
     data: Any,
     config: ApplicationConfig,
     inspectors: list[BaseInspector],
-) -> list[BaseIssue]:
-    inspectors_to_run = filter(lambda i: i.inspector_type not in config.disabled_inspectors, inspectors)
-
-    if config.n_cpu == 1:
-        issues = []
-        for inspector in inspectors_to_run:
-            inspector_issues = inspector_runner(data, config, inspector)
-            issues.extend(inspector_issues)
-        return issues
-
-    with multiprocessing.Pool(config.n_cpu) as pool:
-        issues = pool.map(
-            functools.partial(inspector_runner, data, config),
-            inspectors_to_run,
-        )
+) -> InspectionResult:
+    """Run the inspectors concurrently and return their issues in the order of the inspectors.
+
+    The linter subprocesses are run by the event loop with asyncio, and the requests to the IJ server
+    are performed at the same time, so the output of each linter is parsed as soon as it finishes.
+    The inspectors that use the cpu of the current process (see ``BaseInspector.is_cpu_bound``) are run
+    in a pool of ``n_cpu`` worker processes. The number of inspectors running at the same time is limited
+    by a semaphore of ``INSPECTORS_PER_CPU`` inspectors per cpu.
+
+    An inspector that exceeds its resource limits (see ``ApplicationConfig.inspector_limits``) does not fail
+    the inspection: it is reported in ``InspectionResult.timed_out_inspectors`` instead.
+    """
+    inspectors_to_run = [
+        inspector for inspector in inspectors if inspector.inspector_type not in config.disabled_inspectors
+    ]
+    if not inspectors_to_run:
+        return InspectionResult()
+
+    issues = asyncio.run(_inspect_concurrently(inspector_runner, data, config, inspectors_to_run))
+
+    result = InspectionResult()
+    for inspector, inspector_issues in zip(inspectors_to_run, issues, strict=True):
+        if inspector_issues is None:
+            result.timed_out_inspectors.append(inspector.inspector_type)
+        else:
+            result.issues.extend(inspector_issues)
+
+    return result
+
+
+async def _inspect_concurrently(
+    inspector_runner: Callable[[Any, ApplicationConfig, BaseInspector], list[BaseIssue]],
+    data: Any,
+    config: ApplicationConfig,
+    inspectors: list[BaseInspector],
+) -> list[list[BaseIssue] | None]:
+    loop = asyncio.get_running_loop()
+    max_concurrent_inspectors = get_max_concurrent_inspectors(config.n_cpu)
+    semaphore = asyncio.Semaphore(max_concurrent_inspectors)
+    # The default executor is joined at the end of asyncio.run, so the abandoned inspectors would block the review
+    executor = ThreadPoolExecutor(max_concurrent_inspectors, thread_name_prefix="inspector")
+
+    async def run(inspector: BaseInspector) -> list[BaseIssue] | None:
+        wall_time = config.inspector_limits.get(inspector.inspector_type, ResourceLimits()).wall_time
+        abandon_timeout = None if wall_time is None else wall_time + ABANDON_DELAY
+        async with semaphore:
+            context = contextvars.copy_context()
+            future = loop.run_in_executor(
+                executor,
+                functools.partial(context.run, inspector_runner, data, config, inspector),
+            )
+            try:
+                return await asyncio.wait_for(future, abandon_timeout)
+            except InspectorTimeoutError:
+                return None
+            except asyncio.TimeoutError:
+                logger.warning(f"Inspector {inspector.inspector_type} timed out and is abandoned")
+                return None
+
+    try:
+        # The inspectors wait in their threads for the subprocesses run by the event loop. All inspectors finish
+        # before the loop is left, so it doesn't stop while some of them wait for it
+        async with run_subprocesses_in_event_loop():
+            results = await asyncio.gather(
+                *(run(inspector) for inspector in inspectors), return_exceptions=True
+            )
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
 
-    return list(itertools.chain(*issues))
+    return results
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+
+def can_have_worker_processes() -> bool:
+    # The daemonic processes (e.g. the workers of the review daemon) are not allowed to have children
+    return not multiprocessing.current_process().daemon
+
+
+class ReusableProcessPool:
+    """A pool of worker processes of the current process, which is created on the first use and reused later.
+
+    The workers keep their state (e.g. the configured linters) between the tasks, so it is set up only once.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._process_pool: ProcessPoolExecutor | None = None
+        # The process that created the pool and the number of its workers
+        self._key: tuple[int, int] | None = None
+
+    def get(self, n_cpu: int) -> ProcessPoolExecutor:
+        """Get the pool of ``n_cpu`` worker processes, creating it on the first call."""
+        with self._lock:
+            key = (os.getpid(), n_cpu)
+            if self._process_pool is None or self._key != key:
+                # The pool of the parent process can't be used after a fork. The pool of another size
+                # finishes the tasks that use it and stops
+                if self._process_pool is not None and self._key[0] == key[0]:
+                    self._process_pool.shutdown(wait=False)
+
+                # The pool is used from the threads of the inspectors, and the workers forked from
+                # a multithreaded process can inherit the locks held by the other threads, so they are started
+                # by the fork server
+                self._process_pool = ProcessPoolExecutor(
+                    n_cpu, mp_context=multiprocessing.get_context("forkserver")
+                )
+                self._key = key
+
+            return self._process_pool
+
+    def reset(self, process_pool: ProcessPoolExecutor) -> None:
+        """Stop the broken pool (e.g. one of its workers died), so the next call of ``get`` creates a new one."""
+        with self._lock:
+            if self._process_pool is process_pool:
+                self._process_pool, self._key = None, None
+
+        process_pool.shutdown(wait=False, cancel_futures=True)
+
+
+# The worker processes of the inspectors that use the cpu of the current process (see ``BaseInspector.is_cpu_bound``)
+INSPECTOR_PROCESS_POOL = ReusableProcessPool()
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import threading
+from concurrent.futures import Future
+from typing import Generic, TYPE_CHECKING, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable
+
+T = TypeVar("T")
+
+
+class SingleFlight(Generic[T]):
+    """Coalesces the concurrent calls with the same key into one call.
+
+    The first caller runs the function, and the callers that come with the same key while it is running
+    wait for it and get the same result (or the same exception). The result is not kept after the call,
+    so the next caller with this key runs the function again.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, Future[T]] = {}
+
+    def do(self, key: Hashable, function: Callable[[], T]) -> tuple[T, bool]:
+        """Run the function or wait for the running call with the same key.
+
+        :return: The result and whether it is shared with another caller.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            is_leader = call is None
+            if is_leader:
+                call = Future()
+                self._calls[key] = call
+
+        if not is_leader:
+            return call.result(), True
+
+        try:
+            call.set_result(function())
+        except BaseException as error:
+            call.set_exception(error)
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+        return call.result(), False
@@ -1,32 +1,222 @@
 from __future__ import annotations
 
+import asyncio
+import functools
 import logging
+import os
+import signal
 import subprocess
-from typing import TYPE_CHECKING
+import threading
+import time
+from concurrent.futures import Future
+from contextlib import asynccontextmanager, contextmanager, suppress
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, TYPE_CHECKING
+
+from hyperstyle.src.python.review.reviewers.exceptions import InspectionError, InspectorTimeoutError
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Coroutine, Iterator
     from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# The signals that the kernel sends to a process which exceeded its cpu time limit.
+# A shell script (e.g. run.sh of PMD) exits with 128 + the signal number of its killed child
+CPU_TIME_LIMIT_SIGNALS = (signal.SIGXCPU, signal.SIGKILL)
+CPU_TIME_LIMIT_RETURN_CODES = {
+    return_code for sig in CPU_TIME_LIMIT_SIGNALS for return_code in (-sig, 128 + sig)
+}
+
+
+@dataclass(frozen=True)
+class ResourceLimits:
+    """Limits of an inspector run. None means that there is no limit.
+
+    ``wall_time`` is the number of seconds the inspector can run,
+    ``cpu_time`` is the number of cpu seconds each linter process can use.
+    """
+
+    wall_time: float | None = None
+    cpu_time: int | None = None
+
+
+@dataclass(frozen=True)
+class _ActiveLimits:
+    deadline: float | None
+    cpu_time: int | None
+
+
+_active_limits: ContextVar[_ActiveLimits | None] = ContextVar("active_limits", default=None)
+
+
+class _SubprocessLoop:
+    """The event loop that runs the subprocesses of the inspector threads.
+
+    When the loop is closed, it stops accepting new subprocesses, and the running ones are killed.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        self.loop = loop
+        self._lock = threading.Lock()
+        self._is_closing = False
+        self._tasks: set[asyncio.Task] = set()
+
+    def run(self, coroutine: Coroutine[Any, Any, tuple[str, str]], command: list[str]) -> tuple[str, str]:
+        """Run the coroutine in the loop and wait for its result. It must be called from another thread."""
+        result: Future[tuple[str, str]] = Future()
+        with self._lock:
+            if self._is_closing:
+                coroutine.close()
+                msg = f"The inspection is finished, {command[0]} is not run"
+                raise InspectionError(msg)
+
+            self.loop.call_soon_threadsafe(self._start, coroutine, result, command)
+
+        return result.result()
+
+    def _start(
+        self,
+        coroutine: Coroutine[Any, Any, tuple[str, str]],
+        result: Future[tuple[str, str]],
+        command: list[str],
+    ) -> None:
+        task = self.loop.create_task(coroutine)
+        self._tasks.add(task)
+        task.add_done_callback(functools.partial(self._finish, result=result, command=command))
+
+    def _finish(self, task: asyncio.Task, *, result: Future[tuple[str, str]], command: list[str]) -> None:
+        self._tasks.discard(task)
+        if task.cancelled():
+            msg = f"The inspection is finished, {command[0]} is killed"
+            result.set_exception(InspectionError(msg))
+        elif task.exception() is not None:
+            result.set_exception(task.exception())
+        else:
+            result.set_result(task.result())
+
+    async def close(self) -> None:
+        with self._lock:
+            self._is_closing = True
+
+        # The callbacks are called in order, so the subprocesses submitted before are started when this one is called
+        all_started = self.loop.create_future()
+        self.loop.call_soon(all_started.set_result, None)
+        await all_started
+
+        # A cancelled coroutine kills its subprocess (see ``_run_async``)
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+
+_subprocess_loop: ContextVar[_SubprocessLoop | None] = ContextVar("subprocess_loop", default=None)
+
+
+@contextmanager
+def resource_limits(limits: ResourceLimits) -> Iterator[None]:
+    """Apply the limits to all subprocesses started by ``run_in_subprocess`` in the current context.
+
+    The wall time is shared: if the inspector runs several subprocesses, they all must finish in time.
+    """
+    deadline = None if limits.wall_time is None else time.monotonic() + limits.wall_time
+    token = _active_limits.set(_ActiveLimits(deadline, limits.cpu_time))
+    try:
+        yield
+    finally:
+        _active_limits.reset(token)
+
+
+def get_remaining_wall_time() -> float | None:
+    """Get the number of seconds left before the deadline of the active limits or None if there is no deadline.
+
+    :raises InspectorTimeoutError: If the deadline has passed.
+    """
+    limits = _active_limits.get()
+    if limits is None or limits.deadline is None:
+        return None
+
+    remaining_time = limits.deadline - time.monotonic()
+    if remaining_time <= 0:
+        msg = "There is no time left to run the inspector"
+        raise InspectorTimeoutError(msg)
+
+    return remaining_time
+
+
+@asynccontextmanager
+async def run_subprocesses_in_event_loop() -> AsyncIterator[None]:
+    """Run the subprocesses started by ``run_in_subprocess`` in the current context with asyncio in the running loop.
+
+    ``run_in_subprocess`` must be called from another thread than the one of the event loop, it waits for the result.
+    On exit, the subprocesses that are still running (e.g. of the abandoned inspectors) are killed,
+    and ``run_in_subprocess`` raises ``InspectionError`` instead of starting new ones.
+    """
+    subprocess_loop = _SubprocessLoop(asyncio.get_running_loop())
+    token = _subprocess_loop.set(subprocess_loop)
+    try:
+        yield
+    finally:
+        _subprocess_loop.reset(token)
+        await subprocess_loop.close()
+
+
+def has_resource_limits() -> bool:
+    limits = _active_limits.get()
+    return limits is not None and (limits.deadline is not None or limits.cpu_time is not None)
+
+
+def is_cpu_time_limited() -> bool:
+    limits = _active_limits.get()
+    return limits is not None and limits.cpu_time is not None
+
+
+def _limit_cpu_time(command: list[str], cpu_time: int) -> list[str]:
+    # The limit is set by the shell before exec, so all children of the linter (e.g. JVM) inherit it
+    return ["/bin/sh", "-c", 'ulimit -t "$0" && exec "$@"', str(cpu_time), *command]
+
 
 def run_in_subprocess(
     command: list[str],
     working_directory: str | Path | None = None,
     encoding: str = "utf-8",
     subprocess_input: str | None = None,
+    environment: dict[str, str] | None = None,
 ) -> str:
-    process = subprocess.run(
-        command,
-        capture_output=True,
-        cwd=working_directory,
-        encoding=encoding,
-        input=subprocess_input,
-        check=False,
-    )
+    """Run the command and return its stdout.
+
+    ``environment`` contains the variables that are added to the environment of the current process.
 
-    stdout = process.stdout
-    stderr = process.stderr
+    If resource limits are active (see ``resource_limits``), the command is run in a new process group,
+    and the whole group is killed when the wall time is over.
+    If an event loop is set (see ``run_subprocesses_in_event_loop``), the command is run by the event loop.
+
+    :raises InspectorTimeoutError: If the command exceeded the wall time or the cpu time limit.
+    :raises InspectionError: If the event loop is closed.
+    """
+    env = None if environment is None else {**os.environ, **environment}
+    limits = _active_limits.get()
+    subprocess_loop = _subprocess_loop.get()
+    if subprocess_loop is not None:
+        stdout, stderr = subprocess_loop.run(
+            _run_async(command, limits, subprocess_input, encoding, cwd=working_directory, env=env), command
+        )
+    elif limits is None:
+        process = subprocess.run(
+            command,
+            capture_output=True,
+            cwd=working_directory,
+            encoding=encoding,
+            input=subprocess_input,
+            env=env,
+            check=False,
+        )
+        stdout, stderr = process.stdout, process.stderr
+    else:
+        stdout, stderr = _run_with_limits(
+            command, limits, subprocess_input, cwd=working_directory, encoding=encoding, env=env
+        )
 
     if stdout:
         logger.debug(f"{command[0]}'s stdout:\n{stdout}")
@@ -34,3 +224,119 @@ def run_in_subprocess(
         logger.debug(f"{command[0]}'s stderr:\n{stderr}")
 
     return stdout
+
+
+def _get_timeout(command: list[str], limits: _ActiveLimits) -> float | None:
+    if limits.deadline is None:
+        return None
+
+    timeout = limits.deadline - time.monotonic()
+    if timeout <= 0:
+        msg = f"There is no time left to run {command[0]}"
+        raise InspectorTimeoutError(msg)
+
+    return timeout
+
+
+def _check_cpu_time(command: list[str], limits: _ActiveLimits, return_code: int | None) -> None:
+    if limits.cpu_time is not None and return_code in CPU_TIME_LIMIT_RETURN_CODES:
+        msg = f"{command[0]} exceeded the cpu time limit of {limits.cpu_time} seconds"
+        raise InspectorTimeoutError(msg)
+
+
+def _run_with_limits(
+    command: list[str],
+    limits: _ActiveLimits,
+    subprocess_input: str | None,
+    **popen_kwargs: Any,
+) -> tuple[str, str]:
+    timeout = _get_timeout(command, limits)
+    full_command = command if limits.cpu_time is None else _limit_cpu_time(command, limits.cpu_time)
+    process = subprocess.Popen(
+        full_command,
+        stdin=subprocess.PIPE if subprocess_input is not None else subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        start_new_session=True,
+        **popen_kwargs,
+    )
+
+    try:
+        stdout, stderr = process.communicate(subprocess_input, timeout=timeout)
+    except subprocess.TimeoutExpired:
+        _kill_process_group(process)
+        msg = f"{command[0]} did not finish in {timeout:.1f} seconds"
+        raise InspectorTimeoutError(msg) from None
+    except BaseException:
+        _kill_process_group(process)
+        raise
+
+    _check_cpu_time(command, limits, process.returncode)
+    return stdout, stderr
+
+
+def _kill_process_group(process: subprocess.Popen) -> None:
+    # The process is the leader of its own group, so the group contains all its children
+    with suppress(ProcessLookupError):
+        os.killpg(process.pid, signal.SIGKILL)
+    process.communicate()
+
+
+def _decode(output: bytes, encoding: str) -> str:
+    # The same decoding as the one of subprocess.run in the text mode
+    return output.decode(encoding).replace("\r\n", "\n").replace("\r", "\n")
+
+
+async def _run_async(
+    command: list[str],
+    limits: _ActiveLimits | None,
+    subprocess_input: str | None,
+    encoding: str,
+    **subprocess_kwargs: Any,
+) -> tuple[str, str]:
+    """Run the command with asyncio, the same way as ``subprocess.run`` or ``_run_with_limits`` does."""
+    timeout = None if limits is None else _get_timeout(command, limits)
+    full_command = command
+    if limits is not None and limits.cpu_time is not None:
+        full_command = _limit_cpu_time(command, limits.cpu_time)
+
+    if subprocess_input is not None:
+        stdin = subprocess.PIPE
+    else:
+        stdin = None if limits is None else subprocess.DEVNULL
+
+    process = await asyncio.create_subprocess_exec(
+        *full_command,
+        stdin=stdin,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        start_new_session=limits is not None,
+        **subprocess_kwargs,
+    )
+
+    try:
+        stdout, stderr = await asyncio.wait_for(
+            process.communicate(None if subprocess_input is None else subprocess_input.encode(encoding)),
+            timeout,
+        )
+    except asyncio.TimeoutError:
+        await _kill_async_process(process, is_group_leader=True)
+        msg = f"{command[0]} did not finish in {timeout:.1f} seconds"
+        raise InspectorTimeoutError(msg) from None
+    except BaseException:
+        await _kill_async_process(process, is_group_leader=limits is not None)
+        raise
+
+    if limits is not None:
+        _check_cpu_time(command, limits, process.returncode)
+
+    return _decode(stdout, encoding), _decode(stderr, encoding)
+
+
+async def _kill_async_process(process: asyncio.subprocess.Process, *, is_group_leader: bool) -> None:
+    with suppress(ProcessLookupError):
+        if is_group_leader:
+            os.killpg(process.pid, signal.SIGKILL)
+        else:
+            process.kill()
+    await process.wait()
@@ -0,0 +1,246 @@
+from __future__ import annotations
+
+import dataclasses
+import json
+import logging
+import multiprocessing
+import threading
+from dataclasses import dataclass
+from typing import Any, TYPE_CHECKING
+
+from hyperstyle.src.python.review.application_config import ApplicationConfig
+from hyperstyle.src.python.review.common.issue_cache import get_issue_cache
+from hyperstyle.src.python.review.common.language import Language
+from hyperstyle.src.python.review.common.language_version import LanguageVersion
+from hyperstyle.src.python.review.inspectors.common.inspector.ij_pool import (
+    EndpointCounters,
+    take_ij_server_counters,
+)
+from hyperstyle.src.python.review.inspectors.common.inspector.inspector_type import InspectorType
+from hyperstyle.src.python.review.reviewers.perform_review import (
+    perform_code_review_as_json,
+    perform_review_as_json,
+)
+from hyperstyle.src.python.review.run_tool import create_inspector_limits, parse_inspector_limits
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+class AdmissionError(Exception):
+    pass
+
+
+@dataclass(frozen=True)
+class ReviewRequest:
+    """A review request accepted by the daemon.
+
+    Exactly one of ``path`` and ``code`` must be specified. The inline code is reviewed as a single file,
+    so the language must be specified in the config.
+    """
+
+    config: ApplicationConfig
+    path: Path | None = None
+    code: str | None = None
+
+    @classmethod
+    def from_json_dict(cls, data: dict[str, Any], root: Path | None = None) -> ReviewRequest:
+        """Create a request from a JSON dictionary.
+
+        The dictionary contains ``path`` or ``code`` and the same options as the ``review`` command:
+        ``disable``, ``allow_duplicates``, ``language``, ``language_version``, ``n_cpu``, ``start_line``,
+        ``end_line``, ``new_format``, ``history``, ``with_all_categories``, ``group_by_difficulty``, ``ij_config``,
+        ``manifest``, ``timeout`` and ``cpu_time_limit``.
+
+        The ``path`` and the ``manifest`` must be inside the ``root`` directory. If the root is not specified,
+        the request can't refer to any files.
+
+        :raises ValueError: If the dictionary is not a correct request.
+        """
+        path = data.get("path")
+        code = data.get("code")
+        if (path is None) == (code is None):
+            msg = "Exactly one of 'path' and 'code' must be specified."
+            raise ValueError(msg)
+
+        language = None
+        if data.get("language") is not None:
+            language = Language(data["language"].upper())
+
+        if code is not None and language is None:
+            msg = "The language must be specified for the inline code."
+            raise ValueError(msg)
+
+        language_version = None
+        if data.get("language_version") is not None:
+            language_version = LanguageVersion(data["language_version"])
+
+        n_cpu = int(data.get("n_cpu", 1))
+        if n_cpu <= 0:
+            msg = "The number of cpu must be positive."
+            raise ValueError(msg)
+
+        ij_config = data.get("ij_config")
+        if isinstance(ij_config, dict):
+            ij_config = json.dumps(ij_config)
+
+        timeouts = None
+        if data.get("timeout") is not None:
+            timeouts = parse_inspector_limits(str(data["timeout"]))
+
+        cpu_time_limits = None
+        if data.get("cpu_time_limit") is not None:
+            cpu_time_limits = parse_inspector_limits(str(data["cpu_time_limit"]))
+
+        history = data.get("history")
+        if isinstance(history, dict):
+            history = json.dumps(history)
+
+        config = ApplicationConfig(
+            disabled_inspectors={InspectorType(name.upper()) for name in data.get("disable", [])},
+            allow_duplicates=bool(data.get("allow_duplicates", False)),
+            n_cpu=n_cpu,
+            inspectors_config={"language_version": language_version, "n_cpu": n_cpu},
+            with_all_categories=bool(data.get("with_all_categories", False)),
+            start_line=max(int(data.get("start_line", 1)), 1),
+            language=language,
+            end_line=data.get("end_line"),
+            new_format=bool(data.get("new_format", False)),
+            history=history,
+            group_by_difficulty=bool(data.get("group_by_difficulty", False)),
+            ij_config=ij_config,
+            manifest_path=_resolve_in_root(data.get("manifest"), root),
+            inspector_limits=create_inspector_limits(timeouts, cpu_time_limits),
+        )
+
+        return cls(config, _resolve_in_root(path, root), code)
+
+
+def _resolve_in_root(path: str | None, root: Path | None) -> Path | None:
+    # The paths are resolved, so neither ".." nor symbolic links lead outside the root
+    if path is None:
+        return None
+
+    if root is None:
+        msg = "The daemon does not accept paths: the root directory is not configured."
+        raise ValueError(msg)
+
+    resolved_root = root.resolve()
+    resolved_path = (resolved_root / path).resolve()
+    if not resolved_path.is_relative_to(resolved_root):
+        msg = f"The path {path} is outside the root directory."
+        raise ValueError(msg)
+
+    return resolved_path
+
+
+def run_review_request(request: ReviewRequest) -> dict[str, object]:
+    """Run the review of the request and return the same JSON as the ``review`` command prints."""
+    if request.code is None:
+        return perform_review_as_json(request.path, request.config)
+
+    return perform_code_review_as_json(request.code, request.config)
+
+
+def _run_review_request_in_worker(
+    request: ReviewRequest,
+) -> tuple[dict[str, object], dict[str, EndpointCounters]]:
+    # The counters of the IJ servers are collected in the workers, so they are sent with each result
+    return run_review_request(request), take_ij_server_counters()
+
+
+class ReviewPool:
+    """A pool of long-lived worker processes that run reviews.
+
+    The workers keep all imported inspectors, caches and linter state between the reviews,
+    and each worker is recycled after ``max_jobs_per_worker`` reviews to limit memory growth.
+
+    At most ``workers + max_queue`` reviews can be accepted at the same time: a burst of requests waits
+    in the queue for a free worker, and the requests that do not fit into the queue are rejected.
+
+    If ``root`` is specified, the requests can review the files inside this directory (see ``ReviewRequest``).
+    If ``cache_dir`` is specified, all workers share the issue cache in this directory.
+    The request and error counters of the IJ servers are summed over all workers.
+    """
+
+    def __init__(  # noqa: PLR0913, PLR0917
+        self,
+        workers: int = 1,
+        max_jobs_per_worker: int = 100,
+        max_queue: int = 100,
+        cache_dir: Path | None = None,
+        cache_size: int | None = None,
+        root: Path | None = None,
+    ) -> None:
+        # The workers are recycled while the server threads are running, and the workers forked from
+        # a multithreaded process can inherit the locks held by the other threads, so they are started
+        # by the fork server
+        self._pool = multiprocessing.get_context("forkserver").Pool(
+            workers, maxtasksperchild=max_jobs_per_worker
+        )
+        self.root = root
+        self._cache_dir = cache_dir
+        self._cache_size = cache_size
+        self._slots = threading.BoundedSemaphore(workers + max_queue)
+        self._stats_lock = threading.Lock()
+        self._stats = {"accepted": 0, "rejected": 0, "completed": 0, "failed": 0}
+        self._ij_server_counters: dict[str, EndpointCounters] = {}
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        with self._stats_lock:
+            stats: dict[str, Any] = dict(self._stats)
+            if self._ij_server_counters:
+                stats["ij_servers"] = {
+                    endpoint: counters.to_json_dict()
+                    for endpoint, counters in self._ij_server_counters.items()
+                }
+
+        if self._cache_dir is not None:
+            stats["cache"] = get_issue_cache(self._cache_dir, self._cache_size).stats
+
+        return stats
+
+    def _increment(self, counter: str) -> None:
+        with self._stats_lock:
+            self._stats[counter] += 1
+
+    def review(self, request: ReviewRequest) -> dict[str, object]:
+        """Run the review in a worker and wait for its result.
+
+        :raises AdmissionError: If the queue is full.
+        """
+        if not self._slots.acquire(blocking=False):
+            self._increment("rejected")
+            msg = "The review queue is full."
+            raise AdmissionError(msg)
+
+        self._increment("accepted")
+        if self._cache_dir is not None:
+            config = dataclasses.replace(
+                request.config, cache_dir=self._cache_dir, cache_size=self._cache_size
+            )
+            request = dataclasses.replace(request, config=config)
+
+        try:
+            result, ij_server_counters = self._pool.apply_async(
+                _run_review_request_in_worker, (request,)
+            ).get()
+        except Exception:
+            self._increment("failed")
+            raise
+        finally:
+            self._slots.release()
+
+        self._increment("completed")
+        with self._stats_lock:
+            for endpoint, counters in ij_server_counters.items():
+                self._ij_server_counters.setdefault(endpoint, EndpointCounters()).add(counters)
+
+        return result
+
+    def close(self) -> None:
+        self._pool.close()
+        self._pool.join()
@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+import argparse
+import functools
+import json
+import logging
+import socketserver
+import sys
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+
+sys.path.append("")
+sys.path.append("../../../../..")
+
+from hyperstyle.src.python.common.tool_arguments import DaemonArgument, RunToolArgument, VerbosityLevel
+from hyperstyle.src.python.review.daemon.review_pool import AdmissionError, ReviewPool, ReviewRequest
+from hyperstyle.src.python.review.reviewers.exceptions import PathNotExistsError, UnsupportedLanguageError
+from hyperstyle.src.python.review.run_tool import (
+    configure_cache_arguments,
+    configure_logging,
+    MEGABYTE,
+    positive_int,
+)
+
+logger = logging.getLogger(__name__)
+
+REVIEW_ENDPOINT = "/review"
+HEALTH_ENDPOINT = "/health"
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8000
+
+
+class ReviewRequestHandler(BaseHTTPRequestHandler):
+    """Handles requests to the review daemon.
+
+    - ``POST /review`` accepts a JSON review request (see ``ReviewRequest.from_json_dict``) and returns
+      the same JSON that the ``review`` command prints.
+    - ``GET /health`` returns the status of the daemon and the counters of the review pool and the issue cache.
+    """
+
+    def __init__(self, *args, review_pool: ReviewPool, **kwargs) -> None:
+        self.review_pool = review_pool
+        super().__init__(*args, **kwargs)
+
+    def address_string(self) -> str:
+        # Clients of a UNIX socket have no address
+        return str(self.client_address[0]) if self.client_address else "unix"
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+        logger.debug(format, *args)
+
+    def _send_json(self, status: HTTPStatus, data: dict[str, object]) -> None:
+        body = json.dumps(data).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_error(self, status: HTTPStatus, message: str) -> None:
+        self._send_json(status, {"error": message})
+
+    def do_GET(self) -> None:  # noqa: N802
+        if self.path != HEALTH_ENDPOINT:
+            self._send_error(HTTPStatus.NOT_FOUND, f"Unknown endpoint: {self.path}")
+            return
+
+        self._send_json(HTTPStatus.OK, {"status": "ok", **self.review_pool.stats})
+
+    def do_POST(self) -> None:  # noqa: N802
+        if self.path != REVIEW_ENDPOINT:
+            self._send_error(HTTPStatus.NOT_FOUND, f"Unknown endpoint: {self.path}")
+            return
+
+        try:
+            content_length = int(self.headers.get("Content-Length", 0))
+            request = ReviewRequest.from_json_dict(
+                json.loads(self.rfile.read(content_length)), self.review_pool.root
+            )
+        except (AttributeError, KeyError, TypeError, ValueError) as error:
+            self._send_error(HTTPStatus.BAD_REQUEST, f"Incorrect request: {error}")
+            return
+
+        try:
+            result = self.review_pool.review(request)
+        except AdmissionError as error:
+            self._send_error(HTTPStatus.SERVICE_UNAVAILABLE, str(error))
+        except PathNotExistsError:
+            self._send_error(HTTPStatus.BAD_REQUEST, "Path not exists")
+        except UnsupportedLanguageError:
+            self._send_error(HTTPStatus.BAD_REQUEST, "Unsupported language")
+        except Exception as error:
+            logger.exception("An unexpected error")
+            self._send_error(HTTPStatus.INTERNAL_SERVER_ERROR, str(error))
+        else:
+            self._send_json(HTTPStatus.OK, result)
+
+
+class ThreadingUnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def create_server(
+    review_pool: ReviewPool,
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    socket_path: Path | None = None,
+) -> socketserver.BaseServer:
+    handler = functools.partial(ReviewRequestHandler, review_pool=review_pool)
+
+    if socket_path is not None:
+        socket_path.unlink(missing_ok=True)
+        return ThreadingUnixHTTPServer(str(socket_path), handler)
+
+    return ThreadingHTTPServer((host, port), handler)
+
+
+def configure_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        RunToolArgument.VERBOSITY.value.short_name,
+        RunToolArgument.VERBOSITY.value.long_name,
+        help=RunToolArgument.VERBOSITY.value.description,
+        default=VerbosityLevel.DISABLE.value,
+        choices=VerbosityLevel.values(),
+        type=int,
+    )
+
+    parser.add_argument(
+        DaemonArgument.HOST.value.long_name,
+        help=DaemonArgument.HOST.value.description,
+        default=DEFAULT_HOST,
+        type=str,
+    )
+
+    parser.add_argument(
+        DaemonArgument.PORT.value.long_name,
+        help=DaemonArgument.PORT.value.description,
+        default=DEFAULT_PORT,
+        type=int,
+    )
+
+    parser.add_argument(
+        DaemonArgument.SOCKET.value.long_name,
+        help=DaemonArgument.SOCKET.value.description,
+        default=None,
+        type=lambda value: Path(value).absolute(),
+    )
+
+    parser.add_argument(
+        DaemonArgument.WORKERS.value.long_name,
+        help=DaemonArgument.WORKERS.value.description,
+        default=1,
+        type=positive_int,
+    )
+
+    parser.add_argument(
+        DaemonArgument.MAX_JOBS_PER_WORKER.value.long_name,
+        help=DaemonArgument.MAX_JOBS_PER_WORKER.value.description,
+        default=100,
+        type=positive_int,
+    )
+
+    parser.add_argument(
+        DaemonArgument.MAX_QUEUE.value.long_name,
+        help=DaemonArgument.MAX_QUEUE.value.description,
+        default=100,
+        type=int,
+    )
+
+    parser.add_argument(
+        DaemonArgument.ROOT.value.long_name,
+        help=DaemonArgument.ROOT.value.description,
+        default=None,
+        type=lambda value: Path(value).absolute(),
+    )
+
+    configure_cache_arguments(parser)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    configure_arguments(parser)
+    args = parser.parse_args()
+    configure_logging(VerbosityLevel(args.verbosity))
+
+    review_pool = ReviewPool(
+        args.workers,
+        args.max_jobs_per_worker,
+        max(args.max_queue, 0),
+        args.cache_dir,
+        args.cache_size * MEGABYTE,
+        args.root,
+    )
+    server = create_server(review_pool, args.host, args.port, args.socket)
+    logger.info(f"The review daemon is listening on {args.socket or f'{args.host}:{args.port}'}")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        logger.info("The review daemon is stopped")
+    finally:
+        server.server_close()
+        review_pool.close()
+        if args.socket is not None:
+            args.socket.unlink(missing_ok=True)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,13 +6,23 @@ from pathlib import Path
 from typing import Any
 
 from hyperstyle.src.python.review.common.file_system import check_set_up_env_variable, new_temp_dir
+from hyperstyle.src.python.review.common.language import Language
 from hyperstyle.src.python.review.common.subprocess_runner import run_in_subprocess
 from hyperstyle.src.python.review.inspectors.checkstyle.issue_configs import ISSUE_CONFIGS
 from hyperstyle.src.python.review.inspectors.checkstyle.issue_types import CHECK_CLASS_NAME_TO_ISSUE_TYPE
+from hyperstyle.src.python.review.inspectors.common.cds import (
+    build_cds_archive,
+    CdsWarmupResult,
+    create_cds_command,
+    JvmTool,
+)
+from hyperstyle.src.python.review.inspectors.common.in_memory_workspace import inspect_in_workspace
 from hyperstyle.src.python.review.inspectors.common.inspector.base_inspector import BaseInspector
 from hyperstyle.src.python.review.inspectors.common.inspector.inspector_type import InspectorType
 from hyperstyle.src.python.review.inspectors.common.issue.issue import BaseIssue, IssueDifficulty, IssueType
-from hyperstyle.src.python.review.inspectors.common.issue.issue_configs import IssueConfigsHandler
+from hyperstyle.src.python.review.inspectors.common.issue.issue_registry import IssueRegistry
+from hyperstyle.src.python.review.inspectors.common.jvm_sidecar.jvm_sidecar import run_in_jvm_sidecar
+from hyperstyle.src.python.review.inspectors.common.utils import get_env_version
 from hyperstyle.src.python.review.inspectors.common.xml_parser import parse_xml_file_result
 from hyperstyle.src.python.review.reviewers.exceptions import InspectionError
 
@@ -24,25 +34,31 @@ CHECKSTYLE_VERSION_ENV = "CHECKSTYLE_VERSION"
 PATH_TOOLS_CHECKSTYLE_FILES = Path(__file__).parent / "files"
 PATH_TOOLS_CHECKSTYLE_CONFIG = PATH_TOOLS_CHECKSTYLE_FILES / "config.xml"
 
+CHECKSTYLE_MAIN_CLASS = "com.puppycrawl.tools.checkstyle.Main"
+
 
 class CheckstyleInspector(BaseInspector):
     inspector_type = InspectorType.CHECKSTYLE
+    is_file_local = True
+    config_files = (PATH_TOOLS_CHECKSTYLE_CONFIG,)
 
-    # We don't support in-memory inspection for Checkstyle yet
     @classmethod
-    def inspect_in_memory(cls, code: str, config: dict[str, Any]) -> list[BaseIssue]:
-        raise NotImplementedError
+    def get_version(cls) -> str:
+        return get_env_version(CHECKSTYLE_VERSION_ENV)
+
+    def inspect_in_memory(self, code: str, config: dict[str, Any]) -> list[BaseIssue]:
+        return inspect_in_workspace(self.inspect, code, config, Language.JAVA)
 
     @classmethod
-    def _create_command(cls, path: Path, output_path: Path) -> list[str]:
-        path_checkstyle_jar = (
+    def _get_jar_path(cls) -> Path:
+        return (
             Path(os.environ[CHECKSTYLE_DIRECTORY_ENV])
             / f"checkstyle-{os.environ[CHECKSTYLE_VERSION_ENV]}-all.jar"
         )
+
+    @classmethod
+    def _create_arguments(cls, path: Path, output_path: Path) -> list[str]:
         return [
-            "java",
-            "-jar",
-            str(path_checkstyle_jar),
             "-c",
             str(PATH_TOOLS_CHECKSTYLE_CONFIG),
             "-f",
@@ -52,6 +68,24 @@ class CheckstyleInspector(BaseInspector):
             str(path),
         ]
 
+    @classmethod
+    def get_jvm_tool(cls) -> JvmTool:
+        return JvmTool("checkstyle", cls.get_version(), CHECKSTYLE_MAIN_CLASS, (cls._get_jar_path(),))
+
+    @classmethod
+    def _create_command(cls, path: Path, output_path: Path) -> list[str]:
+        arguments = cls._create_arguments(path, output_path)
+        cds_command = create_cds_command(cls.get_jvm_tool(), arguments)
+        if cds_command is not None:
+            return cds_command
+
+        return ["java", "-jar", str(cls._get_jar_path()), *arguments]
+
+    @classmethod
+    def warm_up(cls, sample_path: Path, output_path: Path) -> CdsWarmupResult:
+        """Build the AppCDS archive of Checkstyle by running it on the sample."""
+        return build_cds_archive(cls.get_jvm_tool(), cls._create_arguments(sample_path, output_path))
+
     def inspect(self, path: Path, config: dict[str, Any]) -> list[BaseIssue]:
         if not (
             check_set_up_env_variable(CHECKSTYLE_DIRECTORY_ENV)
@@ -60,16 +94,18 @@ class CheckstyleInspector(BaseInspector):
             msg = "Checkstyle is not set up"
             raise InspectionError(msg)
 
-        issue_configs_handler = IssueConfigsHandler(*ISSUE_CONFIGS)
+        issue_configs_handler = ISSUE_REGISTRY.issue_configs_handler
         with new_temp_dir() as temp_dir:
             output_path = temp_dir / "output.xml"
-            command = self._create_command(path, output_path)
-            run_in_subprocess(command)
+            arguments = self._create_arguments(path, output_path)
+            tool = self.get_jvm_tool()
+            if not run_in_jvm_sidecar(tool.main_class, list(tool.classpath), arguments):
+                run_in_subprocess(self._create_command(path, output_path))
 
             return parse_xml_file_result(
                 Path(output_path),
                 self.inspector_type,
-                self.choose_issue_type,
+                ISSUE_REGISTRY.get_issue_type,
                 IssueDifficulty.get_by_issue_type,
                 issue_configs_handler,
             )
@@ -85,3 +121,6 @@ class CheckstyleInspector(BaseInspector):
             return IssueType.BEST_PRACTICES
 
         return issue_type
+
+
+ISSUE_REGISTRY = IssueRegistry(CheckstyleInspector.choose_issue_type, ISSUE_CONFIGS)
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import logging
+import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from hyperstyle.src.python.review.common.subprocess_runner import run_in_subprocess
+from hyperstyle.src.python.review.reviewers.exceptions import InspectionError
+
+logger = logging.getLogger(__name__)
+
+CDS_DIRECTORY_ENV = "CDS_DIRECTORY"
+DEFAULT_CDS_DIRECTORY = Path.home() / ".cache" / "hyperstyle" / "cds"
+
+ARCHIVE_EXTENSION = ".jsa"
+CLASS_LIST_EXTENSION = ".classlist"
+
+# The linters run for a short time, so the JIT compiler and the garbage collector of the short-living JVMs
+# are tuned for the start-up time rather than for the peak performance
+TUNED_JVM_OPTIONS = ["-XX:TieredStopAtLevel=1", "-XX:+UseSerialGC"]
+
+
+def get_cds_directory() -> Path:
+    directory = os.environ.get(CDS_DIRECTORY_ENV)
+    return Path(directory) if directory else DEFAULT_CDS_DIRECTORY
+
+
+@dataclass(frozen=True)
+class JvmTool:
+    """A JVM linter that can be started directly with ``java`` from its classpath and main class.
+
+    The AppCDS archive of the tool is stored in the CDS directory (``CDS_DIRECTORY``) and depends on the tool version.
+    The classpath at runtime must be the same as at the archive creation, so the classpath is fixed by the tool.
+    """
+
+    name: str
+    version: str
+    main_class: str
+    classpath: tuple[Path, ...]
+
+    @property
+    def archive_path(self) -> Path:
+        return get_cds_directory() / f"{self.name}-{self.version}{ARCHIVE_EXTENSION}"
+
+    @property
+    def class_list_path(self) -> Path:
+        return get_cds_directory() / f"{self.name}-{self.version}{CLASS_LIST_EXTENSION}"
+
+    def create_command(self, arguments: list[str], jvm_options: list[str]) -> list[str]:
+        classpath = os.pathsep.join(map(str, self.classpath))
+        return ["java", *jvm_options, "-cp", classpath, self.main_class, *arguments]
+
+
+def create_cds_command(tool: JvmTool, arguments: list[str]) -> list[str] | None:
+    """Create the command that starts the tool from its AppCDS archive or None if there is no archive.
+
+    The archive is used with ``-Xshare:auto``, so the JVM starts without it if it can't be mapped
+    (e.g. the archive is created by another version of Java).
+    """
+    if not tool.archive_path.is_file():
+        return None
+
+    return tool.create_command(
+        arguments, [f"-XX:SharedArchiveFile={tool.archive_path}", "-Xshare:auto", *TUNED_JVM_OPTIONS]
+    )
+
+
+@dataclass(frozen=True)
+class CdsWarmupResult:
+    tool: JvmTool
+    # The time of the tool run on the sample without and with the archive in seconds
+    time_without_archive: float
+    time_with_archive: float
+
+
+def _measure_run(command: list[str]) -> float:
+    start = time.perf_counter()
+    run_in_subprocess(command)
+    return time.perf_counter() - start
+
+
+def build_cds_archive(tool: JvmTool, arguments: list[str]) -> CdsWarmupResult:
+    """Run the tool with the arguments to find the loaded classes and build the AppCDS archive of them.
+
+    The tool is also run without and with the archive to compare the start-up time.
+
+    :raises InspectionError: If the archive is not created.
+    """
+    tool.archive_path.parent.mkdir(parents=True, exist_ok=True)
+    tool.archive_path.unlink(missing_ok=True)
+
+    time_without_archive = _measure_run(tool.create_command(arguments, []))
+
+    run_in_subprocess(
+        tool.create_command(arguments, ["-Xshare:off", f"-XX:DumpLoadedClassList={tool.class_list_path}"]),
+    )
+    # The archive is dumped to a temporary file, so the concurrent reviews never map a partially written archive
+    temp_archive_path = tool.archive_path.with_name(f"{tool.archive_path.name}.{os.getpid()}.tmp")
+    run_in_subprocess(
+        [
+            "java",
+            "-Xshare:dump",
+            f"-XX:SharedClassListFile={tool.class_list_path}",
+            f"-XX:SharedArchiveFile={temp_archive_path}",
+            "-cp",
+            os.pathsep.join(map(str, tool.classpath)),
+        ],
+    )
+    if temp_archive_path.is_file():
+        temp_archive_path.replace(tool.archive_path)
+
+    command = create_cds_command(tool, arguments)
+    if command is None:
+        msg = f"The AppCDS archive of {tool.name} {tool.version} is not created"
+        raise InspectionError(msg)
+
+    time_with_archive = _measure_run(command)
+    logger.info(
+        f"{tool.name} {tool.version}: {time_without_archive:.2f}s without the AppCDS archive, "
+        f"{time_with_archive:.2f}s with it",
+    )
+
+    return CdsWarmupResult(tool, time_without_archive, time_with_archive)
@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+import atexit
+import dataclasses
+import logging
+import os
+import queue
+import re
+import shutil
+import tempfile
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, TYPE_CHECKING
+
+from hyperstyle.src.python.review.common.language import get_language_extension, Language
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+    from hyperstyle.src.python.review.inspectors.common.issue.issue import BaseIssue
+
+logger = logging.getLogger(__name__)
+
+WORKSPACE_DIRECTORY_ENV = "HYPERSTYLE_WORKSPACE_DIRECTORY"
+
+# The files in the shared memory are never written to the disk
+SHARED_MEMORY_DIRECTORY = Path("/dev/shm")  # noqa: S108
+
+WORKSPACES_PREFIX = "hyperstyle-workspaces-"
+
+IN_MEMORY_FILE_NAME = "main"
+
+# The file of a public top-level Java type must be named after it
+JAVA_PUBLIC_TYPE_PATTERN = re.compile(
+    r"^public\s+(?:(?:abstract|final|sealed|non-sealed|strictfp|static)\s+)*(?:class|interface|enum|record|@interface)"
+    r"\s+(\w+)",
+    re.MULTILINE,
+)
+
+# Detekt expects the file with a single top-level class or object to be named after it
+KOTLIN_TOP_LEVEL_TYPE_PATTERN = re.compile(
+    r"^(?:(?:public|internal|private|abstract|open|final|sealed|data|enum|annotation|inline|value|fun)\s+)*"
+    r"(?:class|interface|object)\s+(\w+)",
+    re.MULTILINE,
+)
+
+
+def get_in_memory_file_name(code: str, language: Language) -> str:
+    """Get the name of the file with the code, which the linters of the language expect for this code.
+
+    Only the declarations at the start of a line are considered top-level, as they are in the formatted code.
+    """
+    name = IN_MEMORY_FILE_NAME
+    if language == Language.JAVA:
+        match = JAVA_PUBLIC_TYPE_PATTERN.search(code)
+        if match is not None:
+            name = match.group(1)
+    elif language == Language.KOTLIN:
+        names = KOTLIN_TOP_LEVEL_TYPE_PATTERN.findall(code)
+        if len(names) == 1:
+            name = names[0]
+
+    return f"{name}{get_language_extension(language).value}"
+
+
+class WorkspacePool:
+    """A pool of the scratch directories to write the in-memory code for the linters that need files.
+
+    A workspace is taken from the pool for one inspection and is cleared and returned to the pool after it,
+    so the directories are created only when there are more concurrent inspections than ever before.
+    """
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self._free_workspaces: queue.SimpleQueue[Path] = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._n_workspaces = 0
+
+    @contextmanager
+    def use(self) -> Iterator[Path]:
+        try:
+            workspace = self._free_workspaces.get_nowait()
+        except queue.Empty:
+            workspace = self._create_workspace()
+
+        try:
+            yield workspace
+        finally:
+            self._release(workspace)
+
+    def close(self) -> None:
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def _create_workspace(self) -> Path:
+        with self._lock:
+            self._n_workspaces += 1
+            workspace = self.root / str(self._n_workspaces)
+
+        workspace.mkdir(parents=True)
+        return workspace
+
+    def _release(self, workspace: Path) -> None:
+        try:
+            for item in workspace.iterdir():
+                if item.is_dir() and not item.is_symlink():
+                    shutil.rmtree(item)
+                else:
+                    item.unlink()
+        except OSError:
+            # The workspace is not reused, so the next inspection gets a new clean one
+            logger.warning(f"The workspace {workspace} can't be cleared", exc_info=True)
+            shutil.rmtree(workspace, ignore_errors=True)
+            return
+
+        self._free_workspaces.put(workspace)
+
+
+def _get_workspaces_directory() -> Path:
+    directory = os.environ.get(WORKSPACE_DIRECTORY_ENV)
+    if directory:
+        return Path(directory)
+
+    if SHARED_MEMORY_DIRECTORY.is_dir() and os.access(SHARED_MEMORY_DIRECTORY, os.W_OK):
+        return SHARED_MEMORY_DIRECTORY
+
+    return Path(tempfile.gettempdir())
+
+
+def _is_process_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+
+    return True
+
+
+def _remove_stale_workspaces(directory: Path) -> None:
+    """Remove the workspaces of the processes that were killed before they could remove them."""
+    for root in directory.glob(f"{WORKSPACES_PREFIX}*"):
+        pid = root.name[len(WORKSPACES_PREFIX) :].split("-")[0]
+        if pid.isdigit() and not _is_process_alive(int(pid)):
+            shutil.rmtree(root, ignore_errors=True)
+
+
+_workspace_pool: WorkspacePool | None = None
+_workspace_pool_pid: int | None = None
+_workspace_pool_lock = threading.Lock()
+
+
+def _close_workspace_pool(pool: WorkspacePool, pid: int) -> None:
+    # The forked processes inherit the exit handlers, but the workspaces belong to the parent
+    if os.getpid() == pid:
+        pool.close()
+
+
+def get_workspace_pool() -> WorkspacePool:
+    """Get the workspace pool of the current process.
+
+    The workspaces are created in ``HYPERSTYLE_WORKSPACE_DIRECTORY`` if it is set, otherwise in ``/dev/shm``
+    if it is available, otherwise in the temporary directory. Each process gets its own pool,
+    which is removed at the exit of the process.
+    """
+    global _workspace_pool, _workspace_pool_pid
+
+    with _workspace_pool_lock:
+        pid = os.getpid()
+        if _workspace_pool is None or _workspace_pool_pid != pid:
+            directory = _get_workspaces_directory()
+            directory.mkdir(parents=True, exist_ok=True)
+            _remove_stale_workspaces(directory)
+
+            pool = WorkspacePool(Path(tempfile.mkdtemp(prefix=f"{WORKSPACES_PREFIX}{pid}-", dir=directory)))
+            atexit.register(_close_workspace_pool, pool, pid)
+            _workspace_pool, _workspace_pool_pid = pool, pid
+
+        return _workspace_pool
+
+
+def inspect_in_workspace(
+    inspect: Callable[[Path, dict[str, Any]], list[BaseIssue]],
+    code: str,
+    config: dict[str, Any],
+    language: Language,
+) -> list[BaseIssue]:
+    """Inspect the code with the inspector that needs a file: write it to a pooled workspace and run ``inspect`` on it.
+
+    The issues get the empty file path, like the issues of the in-memory inspectors.
+    """
+    with get_workspace_pool().use() as workspace:
+        file_path = workspace / get_in_memory_file_name(code, language)
+        file_path.write_text(code)
+        issues = inspect(file_path, config)
+
+    return [dataclasses.replace(issue, file_path=Path()) for issue in issues]
@@ -1,25 +1,33 @@
 from __future__ import annotations
 
+import functools
 import logging
 from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Any, TYPE_CHECKING
 
-from hyperstyle.src.python.review.common.file_system import get_content_from_file
-from hyperstyle.src.python.review.inspectors.common.inspector.ij_client import IJClient
+from hyperstyle.src.python.review.common.file_system import get_all_file_system_items, get_content_from_file
+from hyperstyle.src.python.review.common.language import filter_paths_by_language, Language
+from hyperstyle.src.python.review.inspectors.common.inspector.ij_pool import (
+    create_ij_server_pool,
+    IJServerPool,
+)
 from hyperstyle.src.python.review.inspectors.common.inspector.proto import model_pb2
-from hyperstyle.src.python.review.inspectors.common.issue.base_issue_converter import convert_base_issue
 from hyperstyle.src.python.review.inspectors.common.issue.issue import BaseIssue, IssueDifficulty, IssueType
-from hyperstyle.src.python.review.inspectors.common.issue.issue_configs import (
-    IssueConfig,
-    IssueConfigsHandler,
-)
+from hyperstyle.src.python.review.inspectors.common.issue.issue_registry import IssueRegistry
 
 if TYPE_CHECKING:
     from hyperstyle.src.python.review.inspectors.common.inspector.inspector_type import InspectorType
+    from hyperstyle.src.python.review.inspectors.common.issue.issue_configs import IssueConfig
 
 logger = logging.getLogger(__name__)
 
+LANGUAGE_ID_TO_LANGUAGE = {
+    model_pb2.LanguageId.python: Language.PYTHON,
+    model_pb2.LanguageId.kotlin: Language.KOTLIN,
+    model_pb2.LanguageId.java: Language.JAVA,
+}
+
 
 class BaseInspector(ABC):
     """Each external inspector contains a dictionary in which the IssueType corresponds to the original linter classes.
@@ -38,8 +46,33 @@ class BaseInspector(ABC):
     Some inspectors (internal) do not require creating a dictionary with IssueType.
     This is connected to the fact that they do not launch an additional analysis tool and work with the code directly,
     for example, the python AST inspector.
+
+    The issues found by the inspector can be stored in the issue cache. To keep the cache correct,
+    specify the linter configuration files in <config_files> and return the linter version from <get_version>.
     """
 
+    # Files that configure the linter. Their content is a part of the key of the cached issues
+    config_files: tuple[Path, ...] = ()
+
+    # Whether the issues found by the inspector can be stored in the issue cache
+    is_cacheable = True
+
+    # Whether the issues in a file depend only on this file. Such inspectors are run
+    # only on the changed files during the incremental review of a project
+    is_file_local = False
+
+    @classmethod
+    def get_version(cls) -> str:
+        """Get the version of the linter. It is a part of the key of the cached issues."""
+        return ""
+
+    @classmethod
+    def is_cpu_bound(cls) -> bool:
+        """Whether the inspector uses the cpu of the current process (e.g. runs a linter through its API)
+        instead of waiting for a linter subprocess or the IJ server.
+        """
+        return False
+
     # Type of inspection for analyzing, e.g. pylint, detekt and etc
     @property
     @abstractmethod
@@ -67,11 +100,17 @@ class BaseIJInspector(BaseInspector):
     specify issue configs and implement the `choose_issue_type` function.
 
     Before running the inspector, you should set up connection parameters
-    using the `setup_connection_parameters` function.
+    using the `setup_connection_parameters` function or set up a pool of several IJ servers
+    using the `setup_server_pool` function.
+
+    All files of a project (or a batch of submissions) are sent to the IJ server over one stream,
+    so the review does not make a round trip per file.
     """
 
-    host: str
-    port: int
+    server_pool: IJServerPool | None = None
+
+    # The issues depend on the IJ server, so they are not cached
+    is_cacheable = False
 
     @property
     @abstractmethod
@@ -97,22 +136,44 @@ class BaseIJInspector(BaseInspector):
         msg = "ij_message_to_issue_type property is not implemented yet"
         raise NotImplementedError(msg)
 
+    @functools.cached_property
+    def issue_registry(self) -> IssueRegistry:
+        """The classification of the issues by their inspections, which is built on the first use."""
+        return IssueRegistry(self._choose_issue_type_by_inspection, self.issue_configs)
+
     def setup_connection_parameters(self, host: str, port: int) -> None:
-        self.host = host
-        self.port = port
+        self.server_pool = create_ij_server_pool({"host": host, "port": port})
+
+    def setup_server_pool(self, server_pool: IJServerPool) -> None:
+        self.server_pool = server_pool
 
     def inspect(self, path: Path, config: dict[str, Any]) -> list[BaseIssue]:
+        if path.is_dir():
+            file_paths = filter_paths_by_language(
+                get_all_file_system_items(path), LANGUAGE_ID_TO_LANGUAGE[self.language_id]
+            )
+            return [issue for issues in self.inspect_files(file_paths).values() for issue in issues]
+
         code = get_content_from_file(path)
         return self._get_inspection_result(code, path)
 
     def inspect_in_memory(self, code: str, config: dict[str, Any]) -> list[BaseIssue]:
         return self._get_inspection_result(code, Path())
 
+    def inspect_files(self, file_paths: list[Path]) -> dict[Path, list[BaseIssue]]:
+        """Inspect the files in one batch and return the issues of each file."""
+        codes = [get_content_from_file(file_path) for file_path in file_paths]
+        issues = self._get_batch_inspection_result(codes, file_paths)
+        return dict(zip(file_paths, issues, strict=True))
+
+    def inspect_in_memory_batch(self, codes: list[str]) -> list[list[BaseIssue]]:
+        """Inspect the codes (e.g. several submissions) in one batch and return the issues in the same order."""
+        return self._get_batch_inspection_result(codes, [Path()] * len(codes))
+
     def convert_to_base_issues(
         self, inspection_result: model_pb2.InspectionResult, file_path: Path
     ) -> list[BaseIssue]:
         base_issues = []
-        issue_configs_handler = IssueConfigsHandler(*self.issue_configs)
         for problem in inspection_result.problems:
             issue_type = self.choose_issue_type(problem)
             base_issue = BaseIssue(
@@ -126,7 +187,7 @@ class BaseIJInspector(BaseInspector):
                 difficulty=IssueDifficulty.get_by_issue_type(issue_type),
             )
 
-            issue = convert_base_issue(base_issue, issue_configs_handler)
+            issue = self.issue_registry.convert(base_issue)
             if issue is None:
                 logger.error(
                     f"{self.inspector_type.value}: an error occurred during converting a base issue."
@@ -137,29 +198,58 @@ class BaseIJInspector(BaseInspector):
 
         return base_issues
 
-    def _get_inspection_result(self, code_text: str, file_path: Path) -> list[BaseIssue]:
-        if self.host is None or self.port is None:
+    def _get_server_pool(self) -> IJServerPool:
+        if self.server_pool is None:
             msg = "Connection parameters is not set up."
             raise Exception(msg)
 
-        client = IJClient(self.host, self.port)
+        return self.server_pool
+
+    def _get_inspection_result(self, code_text: str, file_path: Path) -> list[BaseIssue]:
+        server_pool = self._get_server_pool()
 
         code = model_pb2.Code()
         code.languageId = self.language_id
         code.text = code_text
 
-        inspection_result = client.inspect(code)
+        inspection_result = server_pool.inspect(code)
 
         return self.convert_to_base_issues(inspection_result, file_path)
 
+    def _get_batch_inspection_result(
+        self, code_texts: list[str], file_paths: list[Path]
+    ) -> list[list[BaseIssue]]:
+        if not code_texts:
+            return []
+
+        server_pool = self._get_server_pool()
+
+        # The index of the code is used as its id to map the results back to the files
+        codes = [
+            model_pb2.Code(text=code_text, languageId=self.language_id, id=str(index))
+            for index, code_text in enumerate(code_texts)
+        ]
+
+        inspection_results = server_pool.inspect_batch(codes)
+
+        return [
+            self.convert_to_base_issues(inspection_results[code.id], file_path)
+            for code, file_path in zip(codes, file_paths, strict=True)
+        ]
+
     def choose_issue_type(self, problem: model_pb2.Problem) -> IssueType:
-        if problem.inspector in self.ij_message_to_issue_type:
-            for key, value in self.ij_message_to_issue_type[problem.inspector].items():
+        # Only a few inspections have the message rules, so the messages of the others are not scanned
+        message_to_issue_type = self.ij_message_to_issue_type.get(problem.inspector)
+        if message_to_issue_type is not None:
+            for key, value in message_to_issue_type.items():
                 if problem.name in key:
                     return value
 
-        if problem.inspector in self.ij_inspection_to_issue_type:
-            return self.ij_inspection_to_issue_type[problem.inspector]
+        return self.issue_registry.get_issue_type(problem.inspector)
+
+    def _choose_issue_type_by_inspection(self, inspection: str) -> IssueType:
+        if inspection in self.ij_inspection_to_issue_type:
+            return self.ij_inspection_to_issue_type[inspection]
 
         # PEP-8 inspection
         return IssueType.CODE_STYLE
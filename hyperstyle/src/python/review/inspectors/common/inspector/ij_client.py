@@ -1,10 +1,88 @@
 from __future__ import annotations
 
+import logging
+import os
+import threading
+
 import grpc
 
 from hyperstyle.src.python.review.inspectors.common.inspector.proto import model_pb2, model_pb2_grpc
 
+logger = logging.getLogger(__name__)
+
 TIMEOUT = 3
+# The timeout of a batch grows with the number of files in it
+BATCH_TIMEOUT_PER_CODE = 1
+
+# Keep the connections alive between the reviews and detect dead servers without waiting for a request
+CHANNEL_OPTIONS = [
+    ("grpc.keepalive_time_ms", 30_000),
+    ("grpc.keepalive_timeout_ms", 10_000),
+    ("grpc.keepalive_permit_without_calls", 1),
+    ("grpc.http2.max_pings_without_data", 0),
+    ("grpc.initial_reconnect_backoff_ms", 500),
+    ("grpc.max_reconnect_backoff_ms", 5_000),
+]
+
+UNAVAILABLE_STATES = {grpc.ChannelConnectivity.TRANSIENT_FAILURE, grpc.ChannelConnectivity.SHUTDOWN}
+
+
+class IJConnectionError(Exception):
+    pass
+
+
+class ChannelPool:
+    """Process-wide pool of persistent gRPC channels to the IJ code servers keyed by (host, port).
+
+    A channel is created once and reused by all clients, so a review does not pay for a new TCP and HTTP/2
+    handshake per file. gRPC reconnects the channel transparently after the server restarts.
+    The connectivity state of each channel is tracked, so requests to an unreachable server fail immediately.
+
+    The channels can't be shared with forked processes, so the pool is recreated in a child process.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+        self._channels: dict[tuple[str, int], grpc.Channel] = {}
+        self._states: dict[tuple[str, int], grpc.ChannelConnectivity] = {}
+
+    def get_channel(self, host: str, port: int) -> grpc.Channel:
+        address = (host, port)
+        with self._lock:
+            if self._pid != os.getpid():
+                self._pid = os.getpid()
+                self._channels.clear()
+                self._states.clear()
+
+            channel = self._channels.get(address)
+            if channel is None:
+                channel = grpc.insecure_channel(f"{host}:{port}", options=CHANNEL_OPTIONS)
+                channel.subscribe(lambda state: self._update_state(address, state), try_to_connect=True)
+                self._channels[address] = channel
+
+            return channel
+
+    def is_available(self, host: str, port: int) -> bool:
+        """Check whether the last connection attempt to the server succeeded or is still in progress."""
+        with self._lock:
+            return self._states.get((host, port)) not in UNAVAILABLE_STATES
+
+    def close(self) -> None:
+        with self._lock:
+            for channel in self._channels.values():
+                channel.close()
+            self._channels.clear()
+            self._states.clear()
+
+    def _update_state(self, address: tuple[str, int], state: grpc.ChannelConnectivity) -> None:
+        logger.debug(f"The channel to the IJ code server {address[0]}:{address[1]} is {state.name}")
+        with self._lock:
+            if address in self._channels:
+                self._states[address] = state
+
+
+channel_pool = ChannelPool()
 
 
 class IJClient:
@@ -12,20 +90,55 @@ class IJClient:
         self.host = host
         self.port = port
 
-        # instantiate a channel
-        self.channel = grpc.insecure_channel(f"{self.host}:{self.port}")
+        if not channel_pool.is_available(host, port):
+            msg = f"Failed to connect to ij code server: {host}:{port} is unavailable"
+            raise IJConnectionError(msg)
 
-        # bind the client and the server
+        self.channel = channel_pool.get_channel(host, port)
+        self.stub = model_pb2_grpc.CodeInspectionServiceStub(self.channel)
+
+    def inspect(self, code: model_pb2.Code) -> model_pb2.InspectionResult:
         try:
-            grpc.channel_ready_future(self.channel).result(timeout=TIMEOUT)
-        except grpc.FutureTimeoutError as e:
+            return self.stub.inspect(code, timeout=TIMEOUT)
+        except grpc.RpcError as e:
+            if e.code() != grpc.StatusCode.UNAVAILABLE:
+                raise
             msg = "Failed to connect to ij code server"
-            raise Exception(msg) from e
-        else:
-            self.stub = model_pb2_grpc.CodeInspectionServiceStub(self.channel)
+            raise IJConnectionError(msg) from e
 
-    def inspect(self, code: model_pb2.Code) -> model_pb2.InspectionResult:
-        return self.stub.inspect(code, timeout=TIMEOUT)
+    def inspect_batch(self, codes: list[model_pb2.Code]) -> dict[str, model_pb2.InspectionResult]:
+        """Inspect all codes over one stream and return the results by the ids of the codes.
+
+        The ids must be unique. If the server does not support the batch inspection,
+        the codes are inspected one by one.
+        """
+        if len({code.id for code in codes}) != len(codes):
+            msg = "The ids of the codes in a batch must be unique"
+            raise ValueError(msg)
+
+        if not codes:
+            return {}
+
+        timeout = TIMEOUT + BATCH_TIMEOUT_PER_CODE * len(codes)
+        try:
+            results = {result.id: result for result in self.stub.inspectBatch(iter(codes), timeout=timeout)}
+        except grpc.RpcError as e:
+            if e.code() == grpc.StatusCode.UNIMPLEMENTED:
+                logger.info(
+                    f"The IJ code server {self.host}:{self.port} does not support the batch inspection"
+                )
+                return {code.id: self.inspect(code) for code in codes}
+            if e.code() != grpc.StatusCode.UNAVAILABLE:
+                raise
+            msg = "Failed to connect to ij code server"
+            raise IJConnectionError(msg) from e
+
+        missing_ids = [code.id for code in codes if code.id not in results]
+        if missing_ids:
+            msg = f"The ij code server did not return the results for the codes: {', '.join(missing_ids)}"
+            raise Exception(msg)
+
+        return results
 
     def init(self, service: model_pb2.Service) -> model_pb2.InitResult:
         return self.stub.init(service, timeout=TIMEOUT)
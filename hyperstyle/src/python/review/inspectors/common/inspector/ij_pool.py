@@ -0,0 +1,349 @@
+from __future__ import annotations
+
+import logging
+import os
+import statistics
+import threading
+import time
+from collections import deque
+from concurrent import futures
+from dataclasses import dataclass, field
+from typing import Any, TYPE_CHECKING, TypeVar
+
+import grpc
+
+from hyperstyle.src.python.review.inspectors.common.inspector.ij_client import IJClient, IJConnectionError
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from hyperstyle.src.python.review.inspectors.common.inspector.proto import model_pb2
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# The circuit of an endpoint is opened after this number of consecutive failures,
+# and the endpoint gets no requests during the cooldown. Then the circuit is half-open:
+# one request at a time is sent to check the endpoint, and the circuit is closed after the first success
+CIRCUIT_BREAKER_THRESHOLD = 3
+CIRCUIT_BREAKER_COOLDOWN = 30
+
+# The latencies of the recent single-file requests are used to find the hedging delay
+LATENCY_WINDOW = 100
+MIN_HEDGING_SAMPLES = 20
+
+HEDGING_WORKERS = 8
+
+# The errors that mean that the endpoint is unhealthy, so the request is retried on another endpoint
+ENDPOINT_ERRORS = (grpc.RpcError, IJConnectionError)
+
+
+@dataclass(frozen=True)
+class IJEndpoint:
+    host: str
+    port: int
+
+    def __str__(self) -> str:
+        return f"{self.host}:{self.port}"
+
+
+@dataclass
+class EndpointCounters:
+    requests: int = 0
+    errors: int = 0
+    hedged: int = 0
+    circuit_opened: int = 0
+    # Total time of the successful requests in seconds
+    latency: float = 0
+
+    def add(self, other: EndpointCounters) -> None:
+        self.requests += other.requests
+        self.errors += other.errors
+        self.hedged += other.hedged
+        self.circuit_opened += other.circuit_opened
+        self.latency += other.latency
+
+    def to_json_dict(self) -> dict[str, Any]:
+        successful_requests = self.requests - self.errors
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "hedged": self.hedged,
+            "circuit_opened": self.circuit_opened,
+            "mean_latency": self.latency / successful_requests if successful_requests else None,
+        }
+
+
+@dataclass
+class _EndpointState:
+    in_flight: int = 0
+    consecutive_failures: int = 0
+    open_until: float = 0
+    # Whether a request checks the endpoint with the half-open circuit
+    is_probing: bool = False
+    counters: EndpointCounters = field(default_factory=EndpointCounters)
+
+
+class IJServerPool:
+    """Routes the requests of the IJ inspectors to several IJ code servers of one language.
+
+    Each request goes to the least-loaded healthy endpoint (the one with the fewest requests in flight),
+    and is retried on the next endpoint if the server is unavailable or fails.
+    After ``CIRCUIT_BREAKER_THRESHOLD`` consecutive failures the circuit of the endpoint is opened,
+    and no requests are routed to it for ``CIRCUIT_BREAKER_COOLDOWN`` seconds. After that, a single probe
+    request is routed to it at a time: a success closes the circuit, a failure opens it for another cooldown.
+
+    If ``hedge_percentile`` is specified, a duplicate of a single-file request is sent to another endpoint
+    when the first one does not answer within this percentile of the recent latencies.
+    The first successful answer is used.
+    """
+
+    def __init__(self, endpoints: tuple[IJEndpoint, ...], hedge_percentile: float | None = None) -> None:
+        if not endpoints:
+            msg = "At least one IJ server endpoint must be specified"
+            raise ValueError(msg)
+
+        if hedge_percentile is not None and not 0 < hedge_percentile < 100:
+            msg = f"The hedge percentile must be between 0 and 100, got {hedge_percentile}"
+            raise ValueError(msg)
+
+        self.endpoints = endpoints
+        self.hedge_percentile = hedge_percentile
+        self._lock = threading.Lock()
+        self._states = {endpoint: _EndpointState() for endpoint in endpoints}
+        self._latencies: deque[float] = deque(maxlen=LATENCY_WINDOW)
+        self._next_index = 0
+        self._pid = os.getpid()
+        self._executor: futures.ThreadPoolExecutor | None = None
+
+    @property
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Get the counters, the load and the circuit state of each endpoint."""
+        now = time.monotonic()
+        with self._lock:
+            return {
+                str(endpoint): {
+                    **state.counters.to_json_dict(),
+                    "in_flight": state.in_flight,
+                    "circuit_open": self._is_circuit_open(state, now),
+                }
+                for endpoint, state in self._states.items()
+            }
+
+    def take_counters(self) -> dict[IJEndpoint, EndpointCounters]:
+        """Get the counters collected since the previous call."""
+        with self._lock:
+            counters = {endpoint: state.counters for endpoint, state in self._states.items()}
+            for state in self._states.values():
+                state.counters = EndpointCounters()
+
+        return counters
+
+    def inspect(self, code: model_pb2.Code) -> model_pb2.InspectionResult:
+        return self._call(lambda client: client.inspect(code), hedge=True)
+
+    def inspect_batch(self, codes: list[model_pb2.Code]) -> dict[str, model_pb2.InspectionResult]:
+        # The latency of a batch depends on its size, so the batches are not hedged
+        return self._call(lambda client: client.inspect_batch(codes), hedge=False)
+
+    def _call(self, request: Callable[[IJClient], T], hedge: bool) -> T:
+        endpoints = self._get_endpoints_by_load()
+        if not endpoints:
+            msg = (
+                "Failed to connect to ij code server: "
+                f"all servers are unavailable ({', '.join(map(str, self.endpoints))})"
+            )
+            raise IJConnectionError(msg)
+
+        hedging_delay = self._get_hedging_delay() if hedge and len(endpoints) > 1 else None
+        return self._call_with_failover(request, endpoints, hedging_delay, record_latency=hedge)
+
+    def _call_with_failover(
+        self,
+        request: Callable[[IJClient], T],
+        endpoints: list[IJEndpoint],
+        hedging_delay: float | None,
+        record_latency: bool,
+    ) -> T:
+        endpoint, *other_endpoints = endpoints
+        try:
+            if hedging_delay is not None:
+                return self._call_with_hedging(request, endpoint, other_endpoints[0], hedging_delay)
+            return self._call_endpoint(request, endpoint, record_latency)
+        except ENDPOINT_ERRORS as error:
+            logger.warning(f"The request to the IJ code server {endpoint} failed: {error}")
+            if not other_endpoints:
+                raise
+
+        return self._call_with_failover(request, other_endpoints, None, record_latency)
+
+    def _call_with_hedging(
+        self, request: Callable[[IJClient], T], primary: IJEndpoint, secondary: IJEndpoint, delay: float
+    ) -> T:
+        executor = self._get_executor()
+        primary_future = executor.submit(self._call_endpoint, request, primary, record_latency=True)
+        done, _ = futures.wait([primary_future], timeout=delay)
+        if done:
+            return primary_future.result()
+
+        logger.debug(
+            f"The request to the IJ code server {primary} takes more than {delay:.3f}s, it is hedged"
+        )
+        with self._lock:
+            self._states[secondary].counters.hedged += 1
+
+        pending = {
+            primary_future,
+            executor.submit(self._call_endpoint, request, secondary, record_latency=True),
+        }
+        while pending:
+            done, pending = futures.wait(pending, return_when=futures.FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    return future.result()
+
+        return primary_future.result()
+
+    def _call_endpoint(
+        self, request: Callable[[IJClient], T], endpoint: IJEndpoint, record_latency: bool
+    ) -> T:
+        with self._lock:
+            state = self._states[endpoint]
+            if not self._is_available(state, time.monotonic()):
+                # Another request has taken the probe of the half-open circuit since the endpoints were chosen
+                msg = f"The circuit of the IJ code server {endpoint} is open"
+                raise IJConnectionError(msg)
+
+            if state.consecutive_failures >= CIRCUIT_BREAKER_THRESHOLD:
+                state.is_probing = True
+            state.in_flight += 1
+            state.counters.requests += 1
+
+        start = time.monotonic()
+        try:
+            result = request(IJClient(endpoint.host, endpoint.port))
+        except ENDPOINT_ERRORS:
+            self._record_failure(endpoint)
+            raise
+        finally:
+            with self._lock:
+                state.in_flight -= 1
+
+        latency = time.monotonic() - start
+        with self._lock:
+            if state.consecutive_failures >= CIRCUIT_BREAKER_THRESHOLD:
+                logger.info(f"The IJ code server {endpoint} is available again")
+            state.consecutive_failures = 0
+            state.is_probing = False
+            state.counters.latency += latency
+            if record_latency:
+                self._latencies.append(latency)
+
+        return result
+
+    def _record_failure(self, endpoint: IJEndpoint) -> None:
+        with self._lock:
+            state = self._states[endpoint]
+            state.counters.errors += 1
+            state.consecutive_failures += 1
+            state.is_probing = False
+            if state.consecutive_failures >= CIRCUIT_BREAKER_THRESHOLD:
+                state.open_until = time.monotonic() + CIRCUIT_BREAKER_COOLDOWN
+                state.counters.circuit_opened += 1
+                logger.warning(
+                    f"The IJ code server {endpoint} failed {state.consecutive_failures} times in a row, "
+                    f"it gets no requests for {CIRCUIT_BREAKER_COOLDOWN}s",
+                )
+
+    @staticmethod
+    def _is_circuit_open(state: _EndpointState, now: float) -> bool:
+        return state.consecutive_failures >= CIRCUIT_BREAKER_THRESHOLD and now < state.open_until
+
+    @classmethod
+    def _is_available(cls, state: _EndpointState, now: float) -> bool:
+        """Check whether the closed circuit or the half-open one, whose probe is not taken, lets a request through."""
+        if state.consecutive_failures < CIRCUIT_BREAKER_THRESHOLD:
+            return True
+
+        return not cls._is_circuit_open(state, now) and not state.is_probing
+
+    def _get_endpoints_by_load(self) -> list[IJEndpoint]:
+        """Get the available endpoints from the least loaded one. The equally loaded endpoints take turns."""
+        now = time.monotonic()
+        with self._lock:
+            start = self._next_index
+            self._next_index = (self._next_index + 1) % len(self.endpoints)
+            healthy = [
+                (state.in_flight, (index - start) % len(self.endpoints), endpoint)
+                for index, (endpoint, state) in enumerate(self._states.items())
+                if self._is_available(state, now)
+            ]
+
+        return [endpoint for *_, endpoint in sorted(healthy)]
+
+    def _get_hedging_delay(self) -> float | None:
+        if self.hedge_percentile is None:
+            return None
+
+        with self._lock:
+            if len(self._latencies) < MIN_HEDGING_SAMPLES:
+                return None
+            latencies = list(self._latencies)
+
+        return statistics.quantiles(latencies, n=100, method="inclusive")[round(self.hedge_percentile) - 1]
+
+    def _get_executor(self) -> futures.ThreadPoolExecutor:
+        with self._lock:
+            # The threads of the executor are not copied to a forked process
+            if self._executor is None or self._pid != os.getpid():
+                self._pid = os.getpid()
+                self._executor = futures.ThreadPoolExecutor(max_workers=HEDGING_WORKERS)
+            return self._executor
+
+
+_pools: dict[tuple[tuple[IJEndpoint, ...], float | None], IJServerPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_ij_server_pool(
+    endpoints: tuple[IJEndpoint, ...], hedge_percentile: float | None = None
+) -> IJServerPool:
+    """Get the pool with the given endpoints. The same object is reused by all reviews in the process,
+    so the load, the latencies and the circuit states are kept between the reviews.
+    """
+    with _pools_lock:
+        key = (endpoints, hedge_percentile)
+        if key not in _pools:
+            _pools[key] = IJServerPool(endpoints, hedge_percentile)
+        return _pools[key]
+
+
+def create_ij_server_pool(connection_parameters: dict[str, Any]) -> IJServerPool:
+    """Create the pool from the connection parameters of a language in the IJ config.
+
+    The parameters are either a single endpoint: ``{"host": "localhost", "port": 8080}``,
+    or several endpoints with the optional hedge percentile:
+    ``{"endpoints": [{"host": "localhost", "port": 8080}, ...], "hedge_percentile": 95}``.
+    """
+    if "endpoints" in connection_parameters:
+        endpoints = tuple(
+            IJEndpoint(endpoint["host"], endpoint["port"]) for endpoint in connection_parameters["endpoints"]
+        )
+    else:
+        endpoints = (IJEndpoint(connection_parameters["host"], connection_parameters["port"]),)
+
+    return get_ij_server_pool(endpoints, connection_parameters.get("hedge_percentile"))
+
+
+def take_ij_server_counters() -> dict[str, EndpointCounters]:
+    """Get the counters of all endpoints used in this process since the previous call."""
+    with _pools_lock:
+        pools = list(_pools.values())
+
+    counters: dict[str, EndpointCounters] = {}
+    for pool in pools:
+        for endpoint, endpoint_counters in pool.take_counters().items():
+            counters.setdefault(str(endpoint), EndpointCounters()).add(endpoint_counters)
+
+    return counters
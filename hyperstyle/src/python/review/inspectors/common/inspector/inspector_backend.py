@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import logging
+import os
+from enum import Enum, unique
+
+from hyperstyle.src.python.review.common.subprocess_runner import has_resource_limits
+
+logger = logging.getLogger(__name__)
+
+
+@unique
+class InspectorBackend(Enum):
+    """The way to run a linter.
+
+    ``SUBPROCESS`` runs the linter in a new process for each review,
+    ``IN_PROCESS`` runs the linter (written in Python) through its API inside the current process
+    and reuses it between the reviews,
+    ``SERVER`` runs the linter in a long-lived worker process which is reused between the reviews.
+    """
+
+    SUBPROCESS = "subprocess"
+    IN_PROCESS = "in_process"
+    SERVER = "server"
+
+    @classmethod
+    def values(cls) -> list[str]:
+        return [member.value for member in cls]
+
+
+def get_inspector_backend(variable_name: str, default: InspectorBackend) -> InspectorBackend:
+    """Get the backend from the environment variable, so it can be selected per deployment."""
+    value = os.environ.get(variable_name)
+    if value is None:
+        return default
+
+    try:
+        return InspectorBackend(value.strip().lower())
+    except ValueError:
+        logger.warning(
+            f"{variable_name} has an unknown value {value}. "
+            f"Available values: {', '.join(InspectorBackend.values())}. The {default.value} backend is used.",
+        )
+        return default
+
+
+def get_python_linter_backend(variable_name: str, default: InspectorBackend) -> InspectorBackend:
+    """Get the backend of a Python linter that can be run inside the current process.
+
+    An in-process linter can't be stopped, so if any resource limits are active (see ``resource_limits``),
+    the linter is run in a subprocess instead, which is killed when it exceeds the limits.
+    """
+    backend = get_inspector_backend(variable_name, default)
+    if backend == InspectorBackend.IN_PROCESS and has_resource_limits():
+        return InspectorBackend.SUBPROCESS
+
+    return backend
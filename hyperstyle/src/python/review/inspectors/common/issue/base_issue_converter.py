@@ -17,7 +17,11 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
-def convert_base_issue(base_issue: BaseIssue, issue_configs_handler: IssueConfigsHandler) -> BaseIssue | None:
+def convert_base_issue(
+    base_issue: BaseIssue,
+    issue_configs_handler: IssueConfigsHandler,
+    issue_class: type[BaseIssue] | None = None,
+) -> BaseIssue | None:
     """Convert the ``base_issue`` to a code issue or measurable one.
 
     If necessary, the old description is replaced by the new one and the measure is parsed using the
@@ -25,6 +29,7 @@ def convert_base_issue(base_issue: BaseIssue, issue_configs_handler: IssueConfig
 
     :param base_issue: A base issue to be converted.
     :param issue_configs_handler: A handler of issue configurations.
+    :param issue_class: A class of the new issue. If it is not passed, it is chosen by the issue type.
     :return:
     """
     origin_class = base_issue.origin_class
@@ -35,7 +40,8 @@ def convert_base_issue(base_issue: BaseIssue, issue_configs_handler: IssueConfig
     issue_data = vars(base_issue)  # Get all the fields from BaseIssue, so we can change them
     issue_data[IssueData.DESCRIPTION.value] = issue_configs_handler.get_description(origin_class, description)
 
-    issue_class = get_issue_class_by_issue_type(issue_type)
+    if issue_class is None:
+        issue_class = get_issue_class_by_issue_type(issue_type)
     if issubclass(issue_class, Measurable):
         measure = issue_configs_handler.parse_measure(origin_class, description)
         if measure is None:
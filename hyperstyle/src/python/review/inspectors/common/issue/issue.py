@@ -155,36 +155,38 @@ class IssueDifficulty(Enum):
 
     @classmethod
     def get_by_issue_type(cls, issue_type: IssueType) -> IssueDifficulty:
-        issue_type_to_difficulty = {
-            # Easy
-            IssueType.CODE_STYLE: cls.EASY,
-            IssueType.LINE_LEN: cls.EASY,
-            IssueType.FUNC_LEN: cls.EASY,
-            IssueType.BOOL_EXPR_LEN: cls.EASY,
-            IssueType.INFO: cls.EASY,  # Because INFO should always be shown on the platforms
-            # Medium
-            IssueType.BEST_PRACTICES: cls.MEDIUM,
-            # Hard
-            IssueType.CLASS_RESPONSE: cls.HARD,
-            IssueType.METHOD_NUMBER: cls.HARD,
-            IssueType.ERROR_PRONE: cls.HARD,
-            IssueType.COMPLEXITY: cls.HARD,
-            IssueType.CYCLOMATIC_COMPLEXITY: cls.HARD,
-            IssueType.INHERITANCE_DEPTH: cls.HARD,
-            IssueType.CHILDREN_NUMBER: cls.HARD,
-            IssueType.WEIGHTED_METHOD: cls.HARD,
-            IssueType.COUPLING: cls.HARD,
-            IssueType.COHESION: cls.HARD,
-            IssueType.MAINTAINABILITY: cls.HARD,
-            IssueType.UNDEFINED: cls.HARD,
-            IssueType.ARCHITECTURE: cls.HARD,
-        }
-
-        if issue_type not in issue_type_to_difficulty:
+        difficulty = ISSUE_TYPE_TO_DIFFICULTY.get(issue_type)
+        if difficulty is None:
             logger.warning(f"IssueDifficulty: {issue_type} - unknown issue type.")
             return cls.HARD
 
-        return issue_type_to_difficulty[issue_type]
+        return difficulty
+
+
+ISSUE_TYPE_TO_DIFFICULTY = {
+    # Easy
+    IssueType.CODE_STYLE: IssueDifficulty.EASY,
+    IssueType.LINE_LEN: IssueDifficulty.EASY,
+    IssueType.FUNC_LEN: IssueDifficulty.EASY,
+    IssueType.BOOL_EXPR_LEN: IssueDifficulty.EASY,
+    IssueType.INFO: IssueDifficulty.EASY,  # Because INFO should always be shown on the platforms
+    # Medium
+    IssueType.BEST_PRACTICES: IssueDifficulty.MEDIUM,
+    # Hard
+    IssueType.CLASS_RESPONSE: IssueDifficulty.HARD,
+    IssueType.METHOD_NUMBER: IssueDifficulty.HARD,
+    IssueType.ERROR_PRONE: IssueDifficulty.HARD,
+    IssueType.COMPLEXITY: IssueDifficulty.HARD,
+    IssueType.CYCLOMATIC_COMPLEXITY: IssueDifficulty.HARD,
+    IssueType.INHERITANCE_DEPTH: IssueDifficulty.HARD,
+    IssueType.CHILDREN_NUMBER: IssueDifficulty.HARD,
+    IssueType.WEIGHTED_METHOD: IssueDifficulty.HARD,
+    IssueType.COUPLING: IssueDifficulty.HARD,
+    IssueType.COHESION: IssueDifficulty.HARD,
+    IssueType.MAINTAINABILITY: IssueDifficulty.HARD,
+    IssueType.UNDEFINED: IssueDifficulty.HARD,
+    IssueType.ARCHITECTURE: IssueDifficulty.HARD,
+}
 
 
 @dataclass(frozen=True, eq=True)
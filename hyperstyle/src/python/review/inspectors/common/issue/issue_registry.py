@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Generic, TYPE_CHECKING, TypeVar
+
+from hyperstyle.src.python.review.inspectors.common.issue.base_issue_converter import convert_base_issue
+from hyperstyle.src.python.review.inspectors.common.issue.issue import (
+    BaseIssue,
+    get_issue_class_by_issue_type,
+    IssueDifficulty,
+    IssueType,
+)
+from hyperstyle.src.python.review.inspectors.common.issue.issue_configs import IssueConfigsHandler
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Mapping
+
+    from hyperstyle.src.python.review.inspectors.common.issue.issue_configs import IssueConfig
+
+T = TypeVar("T")
+
+
+# The key of the value in a trie node, it never clashes with the keys of the children, which are single characters
+_VALUE_KEY = ""
+
+
+class PrefixTrie(Generic[T]):
+    """A trie that finds the value of the longest prefix of a string in one pass over the string."""
+
+    def __init__(self, prefix_to_value: Mapping[str, T]) -> None:
+        self._root: dict[str, Any] = {}
+        for prefix, value in prefix_to_value.items():
+            node = self._root
+            for char in prefix:
+                node = node.setdefault(char, {})
+            node[_VALUE_KEY] = value
+
+    def find(self, text: str) -> T | None:
+        """Get the value of the longest prefix of the text or ``None`` if no prefix matches."""
+        node = self._root
+        value = node.get(_VALUE_KEY)
+        for char in text:
+            node = node.get(char)
+            if node is None:
+                break
+
+            value = node.get(_VALUE_KEY, value)
+
+        return value
+
+
+@dataclass(frozen=True)
+class IssueClassification:
+    """Everything that an inspector needs to know about its issues with the same origin class."""
+
+    issue_type: IssueType
+    difficulty: IssueDifficulty
+    issue_class: type[BaseIssue]
+
+
+class IssueRegistry:
+    """The classification of the issues of an inspector by their origin classes.
+
+    The issue type is chosen by the ``issue_type_selector`` of the inspector only once per origin class,
+    so each next issue with the same origin class is classified with a single dictionary lookup.
+    The issue configs are also handled by the same handler for all the issues of the inspector.
+
+    **Note**: The selector logs an unknown origin class only the first time it is met by the process.
+    """
+
+    def __init__(
+        self, issue_type_selector: Callable[[str], IssueType], issue_configs: Iterable[IssueConfig] = ()
+    ) -> None:
+        self.issue_type_selector = issue_type_selector
+        self.issue_configs_handler = IssueConfigsHandler(*issue_configs)
+        self._origin_class_to_classification: dict[str, IssueClassification] = {}
+
+    def classify(self, origin_class: str) -> IssueClassification:
+        classification = self._origin_class_to_classification.get(origin_class)
+        if classification is not None:
+            return classification
+
+        issue_type = self.issue_type_selector(origin_class)
+        classification = IssueClassification(
+            issue_type=issue_type,
+            difficulty=IssueDifficulty.get_by_issue_type(issue_type),
+            issue_class=get_issue_class_by_issue_type(issue_type),
+        )
+        return self._origin_class_to_classification.setdefault(origin_class, classification)
+
+    def get_issue_type(self, origin_class: str) -> IssueType:
+        return self.classify(origin_class).issue_type
+
+    def convert(self, base_issue: BaseIssue) -> BaseIssue | None:
+        """Convert the base issue of the inspector to a code issue or measurable one (see ``convert_base_issue``)."""
+        classification = self.classify(base_issue.origin_class)
+        # The issue type may also be chosen by other rules, e.g. by the message of an IJ inspection
+        issue_class = classification.issue_class if base_issue.type == classification.issue_type else None
+        return convert_base_issue(base_issue, self.issue_configs_handler, issue_class)
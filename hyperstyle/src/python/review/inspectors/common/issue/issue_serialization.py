@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import dataclasses
+from enum import Enum
+from pathlib import Path
+from typing import Any
+
+from hyperstyle.src.python.review.inspectors.common.inspector.inspector_type import InspectorType
+from hyperstyle.src.python.review.inspectors.common.issue.issue import (
+    BaseIssue,
+    IssueData,
+    IssueDifficulty,
+    IssueType,
+)
+
+ISSUE_CLASS_KEY = "class"
+RELATIVE_PATH_KEY = "relative_path"
+
+FIELD_TO_CONVERTER = {
+    IssueData.FILE_PATH.value: Path,
+    IssueData.ISSUE_TYPE.value: IssueType,
+    IssueData.INSPECTOR_TYPE.value: InspectorType,
+    IssueData.DIFFICULTY.value: IssueDifficulty,
+}
+
+
+def _get_issue_classes(issue_class: type[BaseIssue] = BaseIssue) -> dict[str, type[BaseIssue]]:
+    classes = {issue_class.__name__: issue_class}
+    for subclass in issue_class.__subclasses__():
+        classes.update(_get_issue_classes(subclass))
+    return classes
+
+
+def convert_issue_to_json_dict(issue: BaseIssue, base_path: Path | None = None) -> dict[str, Any]:
+    """Convert the issue with all its fields (including measures) to a JSON-serializable dictionary.
+
+    If ``base_path`` is specified, the file path inside it is stored relative to it,
+    so the issue can be restored for a copy of the files at another path.
+    """
+    data: dict[str, Any] = {ISSUE_CLASS_KEY: type(issue).__name__}
+    if base_path is not None and issue.file_path.is_relative_to(base_path):
+        issue = dataclasses.replace(issue, file_path=issue.file_path.relative_to(base_path))
+        data[RELATIVE_PATH_KEY] = True
+
+    for field in dataclasses.fields(issue):
+        value = getattr(issue, field.name)
+        if isinstance(value, Enum):
+            value = value.value
+        elif isinstance(value, Path):
+            value = str(value)
+        data[field.name] = value
+
+    return data
+
+
+def convert_json_dict_to_issue(data: dict[str, Any], base_path: Path | None = None) -> BaseIssue:
+    """Restore the issue from the dictionary created by ``convert_issue_to_json_dict``.
+
+    The relative file path is resolved against ``base_path``.
+
+    :raises ValueError: If the dictionary does not describe a known issue.
+    """
+    fields = dict(data)
+    is_relative = fields.pop(RELATIVE_PATH_KEY, False)
+    issue_class = _get_issue_classes().get(fields.pop(ISSUE_CLASS_KEY, None))
+    if issue_class is None:
+        msg = f"Unknown issue class: {data.get(ISSUE_CLASS_KEY)}"
+        raise ValueError(msg)
+
+    for name, converter in FIELD_TO_CONVERTER.items():
+        if name in fields:
+            fields[name] = converter(fields[name])
+
+    file_path_field = IssueData.FILE_PATH.value
+    if is_relative and base_path is not None and file_path_field in fields:
+        fields[file_path_field] = base_path / fields[file_path_field]
+
+    try:
+        return issue_class(**fields)
+    except TypeError as error:
+        raise ValueError(str(error)) from error
@@ -0,0 +1,377 @@
+import java.io.BufferedReader;
+import java.io.File;
+import java.io.FileOutputStream;
+import java.io.IOException;
+import java.io.InputStreamReader;
+import java.io.OutputStream;
+import java.io.OutputStreamWriter;
+import java.io.Writer;
+import java.lang.reflect.InvocationTargetException;
+import java.lang.reflect.Method;
+import java.net.InetAddress;
+import java.net.MalformedURLException;
+import java.net.ServerSocket;
+import java.net.Socket;
+import java.net.URL;
+import java.net.URLClassLoader;
+import java.nio.charset.StandardCharsets;
+import java.util.ArrayList;
+import java.util.Arrays;
+import java.util.HashSet;
+import java.util.List;
+import java.util.Map;
+import java.util.Properties;
+import java.util.concurrent.ConcurrentHashMap;
+import java.util.concurrent.ExecutionException;
+import java.util.concurrent.ExecutorService;
+import java.util.concurrent.Executors;
+import java.util.concurrent.FutureTask;
+import java.util.concurrent.TimeUnit;
+import java.util.concurrent.TimeoutException;
+import java.util.concurrent.atomic.AtomicBoolean;
+import java.util.concurrent.locks.ReentrantLock;
+
+/**
+ * A long-lived JVM that runs the JVM linters of hyperstyle (Checkstyle, PMD and Detekt),
+ * so a review does not pay for the JVM start-up and the class loading of the linter.
+ *
+ * <p>The linters and their classpaths are fixed at the start-up, a classpath entry {@code <directory>/*} means
+ * all jars of the directory, as for {@code java -cp}:
+ *
+ * <pre>
+ * java JvmSidecar.java &lt;port&gt; checkstyle=&lt;classpath&gt; pmd=&lt;classpath&gt; detekt=&lt;classpath&gt;
+ * </pre>
+ *
+ * <p>The sidecar listens on a loopback port. A request runs a linter with the same arguments as the CLI does,
+ * so the linter writes the same report file:
+ *
+ * <pre>
+ * RUN
+ * &lt;main class&gt;
+ * &lt;classpath&gt;
+ * &lt;timeout in milliseconds, 0 if there is no timeout&gt;
+ * &lt;number of arguments&gt;
+ * &lt;argument&gt;
+ * ...
+ * </pre>
+ *
+ * <p>The response is {@code OK <exit code>} or {@code ERROR <message>}. The requests with the main class
+ * or the classpath of a linter the sidecar is not started with are rejected.
+ *
+ * <p>The CLIs of the linters call {@code System.exit} with their exit codes, so the linters are run through
+ * the entry points that return the exit code instead. If a linter version does not have such an entry point,
+ * its requests fail, and the linter is run from the CLI.
+ *
+ * <p>Each linter has its own class loader which is reused by all requests, and the runs of the same linter
+ * are serialized because the linters keep a global state. The run is interrupted when the timeout is exceeded.
+ * If the linter does not stop, it keeps its class loader, and the next runs get a new one.
+ */
+public class JvmSidecar {
+    private static final String CHECKSTYLE_PACKAGE = "com.puppycrawl.tools.checkstyle";
+
+    // PMD stores the exit code in the status property instead of calling System.exit if the no-exit property is set
+    private static final String PMD_NO_EXIT_PROPERTY = "net.sourceforge.pmd.cli.noExit";
+    private static final String PMD_STATUS_PROPERTY = "net.sourceforge.pmd.cli.status";
+
+    // The exit code of Detekt when the issues exceed the maxIssues of the config
+    private static final int DETEKT_MAX_ISSUES_EXIT_CODE = 2;
+
+    private enum Linter {
+        CHECKSTYLE("checkstyle", CHECKSTYLE_PACKAGE + ".Main") {
+            @Override
+            int run(ClassLoader classLoader, String[] arguments) throws Exception {
+                return runCheckstyle(classLoader, arguments);
+            }
+        },
+        PMD("pmd", "net.sourceforge.pmd.PMD") {
+            @Override
+            int run(ClassLoader classLoader, String[] arguments) throws Exception {
+                return runPmd(classLoader, arguments);
+            }
+        },
+        DETEKT("detekt", "io.gitlab.arturbosch.detekt.cli.Main") {
+            @Override
+            int run(ClassLoader classLoader, String[] arguments) throws Exception {
+                return runDetekt(classLoader, arguments);
+            }
+        };
+
+        private final String toolName;
+        private final String mainClass;
+
+        Linter(String toolName, String mainClass) {
+            this.toolName = toolName;
+            this.mainClass = mainClass;
+        }
+
+        abstract int run(ClassLoader classLoader, String[] arguments) throws Exception;
+
+        static Linter byName(String toolName) {
+            for (Linter linter : values()) {
+                if (linter.toolName.equals(toolName)) {
+                    return linter;
+                }
+            }
+            throw new IllegalArgumentException("Unknown linter: " + toolName);
+        }
+    }
+
+    private static final class Tool {
+        private final Linter linter;
+        private final List<File> classpath;
+        private final ClassLoader classLoader;
+        private final ReentrantLock lock = new ReentrantLock();
+
+        Tool(Linter linter, List<File> classpath) {
+            this.linter = linter;
+            this.classpath = classpath;
+            this.classLoader = createClassLoader(classpath);
+        }
+
+        boolean hasClasspath(List<File> otherClasspath) {
+            return new HashSet<>(classpath).equals(new HashSet<>(otherClasspath));
+        }
+
+        int run(String[] arguments, long timeout) throws Exception {
+            AtomicBoolean isRunning = new AtomicBoolean(false);
+            FutureTask<Integer> task = new FutureTask<>(() -> {
+                lock.lockInterruptibly();
+                Thread.currentThread().setContextClassLoader(classLoader);
+                isRunning.set(true);
+                try {
+                    return linter.run(classLoader, arguments);
+                } catch (InvocationTargetException e) {
+                    Throwable cause = e.getCause();
+                    throw cause instanceof Exception ? (Exception) cause : e;
+                } finally {
+                    isRunning.set(false);
+                    lock.unlock();
+                }
+            });
+
+            Thread thread = new Thread(task, "JvmSidecar-" + linter.toolName);
+            thread.setDaemon(true);
+            thread.start();
+
+            try {
+                return timeout > 0 ? task.get(timeout, TimeUnit.MILLISECONDS) : task.get();
+            } catch (ExecutionException e) {
+                Throwable cause = e.getCause();
+                throw cause instanceof Exception ? (Exception) cause : e;
+            } catch (TimeoutException e) {
+                task.cancel(true);
+                if (isRunning.get()) {
+                    // The linter can't be stopped if it ignores the interruption, so it keeps its class loader
+                    // and lock, and the next runs get new ones
+                    TOOLS.replace(linter.mainClass, this, new Tool(linter, classpath));
+                }
+                throw new TimeoutException(linter.toolName + " did not finish in " + timeout + " ms");
+            }
+        }
+    }
+
+    // The linters the sidecar is started with by their main classes
+    private static final Map<String, Tool> TOOLS = new ConcurrentHashMap<>();
+
+    public static void main(String[] args) throws IOException {
+        if (args.length < 2) {
+            throw new IllegalArgumentException(
+                "Usage: java JvmSidecar.java <port> <linter>=<classpath>..., the linters are checkstyle, pmd and detekt"
+            );
+        }
+
+        int port = Integer.parseInt(args[0]);
+        for (String argument : Arrays.asList(args).subList(1, args.length)) {
+            String[] parts = argument.split("=", 2);
+            if (parts.length != 2) {
+                throw new IllegalArgumentException("Expected <linter>=<classpath>, got " + argument);
+            }
+            Linter linter = Linter.byName(parts[0]);
+            TOOLS.put(linter.mainClass, new Tool(linter, parseClasspath(parts[1])));
+        }
+
+        System.setProperty(PMD_NO_EXIT_PROPERTY, "true");
+
+        ExecutorService executor = Executors.newCachedThreadPool();
+        try (ServerSocket serverSocket = new ServerSocket(port, 50, InetAddress.getLoopbackAddress())) {
+            System.err.println("The JVM sidecar is listening on port " + serverSocket.getLocalPort());
+            while (true) {
+                Socket socket = serverSocket.accept();
+                executor.submit(() -> handle(socket));
+            }
+        }
+    }
+
+    private static void handle(Socket socket) {
+        try (socket;
+             BufferedReader reader = new BufferedReader(
+                 new InputStreamReader(socket.getInputStream(), StandardCharsets.UTF_8));
+             Writer writer = new OutputStreamWriter(socket.getOutputStream(), StandardCharsets.UTF_8)) {
+            String response;
+            try {
+                response = "OK " + run(reader);
+            } catch (Exception e) {
+                response = "ERROR " + String.valueOf(e).replace('\n', ' ');
+            }
+            writer.write(response + "\n");
+            writer.flush();
+        } catch (IOException e) {
+            e.printStackTrace();
+        }
+    }
+
+    private static int run(BufferedReader reader) throws Exception {
+        String command = reader.readLine();
+        if (!"RUN".equals(command)) {
+            throw new IllegalArgumentException("Unknown command: " + command);
+        }
+
+        String mainClass = reader.readLine();
+        List<File> classpath = parseClasspath(reader.readLine());
+        long timeout = Long.parseLong(reader.readLine());
+        String[] arguments = new String[Integer.parseInt(reader.readLine())];
+        for (int i = 0; i < arguments.length; i++) {
+            arguments[i] = reader.readLine();
+        }
+
+        Tool tool = TOOLS.get(mainClass);
+        if (tool == null || !tool.hasClasspath(classpath)) {
+            throw new IllegalArgumentException("The sidecar is not started with " + mainClass + " and this classpath");
+        }
+
+        return tool.run(arguments, timeout);
+    }
+
+    private static int runCheckstyle(ClassLoader classLoader, String[] arguments) throws Exception {
+        String configPath = null;
+        String outputPath = null;
+        List<File> files = new ArrayList<>();
+        for (int i = 0; i < arguments.length; i++) {
+            switch (arguments[i]) {
+                case "-c":
+                    configPath = arguments[++i];
+                    break;
+                case "-o":
+                    outputPath = arguments[++i];
+                    break;
+                case "-f":
+                    if (!"xml".equals(arguments[++i])) {
+                        throw new IllegalArgumentException("Only the xml format of Checkstyle is supported");
+                    }
+                    break;
+                default:
+                    if (arguments[i].startsWith("-")) {
+                        throw new IllegalArgumentException("Unsupported Checkstyle option: " + arguments[i]);
+                    }
+                    listFiles(new File(arguments[i]), files);
+            }
+        }
+        if (configPath == null || outputPath == null) {
+            throw new IllegalArgumentException("The config and the output of Checkstyle must be specified");
+        }
+
+        // The same as the CLI does, but the number of errors is returned instead of passed to System.exit
+        Class<?> resolverClass = loadClass(classLoader, CHECKSTYLE_PACKAGE + ".PropertyResolver");
+        Object resolver = loadClass(classLoader, CHECKSTYLE_PACKAGE + ".PropertiesExpander")
+            .getConstructor(Properties.class)
+            .newInstance(System.getProperties());
+        Object configuration = loadClass(classLoader, CHECKSTYLE_PACKAGE + ".ConfigurationLoader")
+            .getMethod("loadConfiguration", String.class, resolverClass)
+            .invoke(null, configPath, resolver);
+
+        Class<?> checkerClass = loadClass(classLoader, CHECKSTYLE_PACKAGE + ".Checker");
+        Object checker = checkerClass.getConstructor().newInstance();
+        checkerClass.getMethod("setModuleClassLoader", ClassLoader.class).invoke(checker, classLoader);
+        checkerClass.getMethod("configure", loadClass(classLoader, CHECKSTYLE_PACKAGE + ".api.Configuration"))
+            .invoke(checker, configuration);
+
+        Class<?> optionsClass = loadClass(classLoader, CHECKSTYLE_PACKAGE + ".api.AutomaticBean$OutputStreamOptions");
+        Object listener = loadClass(classLoader, CHECKSTYLE_PACKAGE + ".XMLLogger")
+            .getConstructor(OutputStream.class, optionsClass)
+            .newInstance(new FileOutputStream(outputPath), optionsClass.getField("CLOSE").get(null));
+        checkerClass.getMethod("addListener", loadClass(classLoader, CHECKSTYLE_PACKAGE + ".api.AuditListener"))
+            .invoke(checker, listener);
+
+        try {
+            return (Integer) checkerClass.getMethod("process", List.class).invoke(checker, files);
+        } finally {
+            checkerClass.getMethod("destroy").invoke(checker);
+        }
+    }
+
+    private static int runPmd(ClassLoader classLoader, String[] arguments) throws Exception {
+        System.clearProperty(PMD_STATUS_PROPERTY);
+        loadClass(classLoader, Linter.PMD.mainClass).getMethod("main", String[].class).invoke(null, (Object) arguments);
+
+        String status = System.getProperty(PMD_STATUS_PROPERTY);
+        return status == null ? 0 : Integer.parseInt(status);
+    }
+
+    private static int runDetekt(ClassLoader classLoader, String[] arguments) throws Exception {
+        // The same runner as the CLI uses, but its result is returned instead of passed to System.exit
+        Class<?> runnerClass = loadClass(classLoader, "io.gitlab.arturbosch.detekt.cli.CliRunner");
+        Method run = runnerClass.getMethod("run", String[].class);
+        Object result = run.invoke(runnerClass.getConstructor().newInstance(), (Object) arguments);
+
+        Object error = run.getReturnType().getMethod("getError").invoke(result);
+        if (error == null) {
+            return 0;
+        }
+        if (error.getClass().getSimpleName().equals("MaxIssuesReached")) {
+            return DETEKT_MAX_ISSUES_EXIT_CODE;
+        }
+        throw new IllegalStateException("Detekt failed: " + error);
+    }
+
+    private static Class<?> loadClass(ClassLoader classLoader, String name) throws ClassNotFoundException {
+        return Class.forName(name, true, classLoader);
+    }
+
+    private static void listFiles(File file, List<File> files) {
+        if (file.isDirectory()) {
+            File[] children = file.listFiles();
+            if (children != null) {
+                Arrays.sort(children);
+                for (File child : children) {
+                    listFiles(child, files);
+                }
+            }
+        } else if (file.isFile()) {
+            files.add(file);
+        }
+    }
+
+    private static List<File> parseClasspath(String classpath) throws IOException {
+        List<File> entries = new ArrayList<>();
+        for (String entry : classpath.split(File.pathSeparator)) {
+            File file = new File(entry);
+            if (!file.getName().equals("*")) {
+                entries.add(file.getCanonicalFile());
+                continue;
+            }
+
+            File directory = file.getAbsoluteFile().getParentFile();
+            File[] jars = directory.listFiles((parent, name) -> name.toLowerCase().endsWith(".jar"));
+            if (jars == null) {
+                throw new IllegalArgumentException("Not a directory: " + directory);
+            }
+            Arrays.sort(jars);
+            for (File jar : jars) {
+                entries.add(jar.getCanonicalFile());
+            }
+        }
+        return entries;
+    }
+
+    private static ClassLoader createClassLoader(List<File> classpath) {
+        URL[] urls = new URL[classpath.size()];
+        for (int i = 0; i < urls.length; i++) {
+            try {
+                urls[i] = classpath.get(i).toURI().toURL();
+            } catch (MalformedURLException e) {
+                throw new IllegalArgumentException(e);
+            }
+        }
+        return new URLClassLoader(urls, ClassLoader.getPlatformClassLoader());
+    }
+}
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import logging
+import math
+import os
+import socket
+import threading
+import time
+from pathlib import Path
+
+from hyperstyle.src.python.review.common.subprocess_runner import get_remaining_wall_time, is_cpu_time_limited
+from hyperstyle.src.python.review.reviewers.exceptions import InspectorTimeoutError
+
+logger = logging.getLogger(__name__)
+
+JVM_SIDECAR_PORT_ENV = "JVM_SIDECAR_PORT"
+
+PATH_JVM_SIDECAR_SOURCE = Path(__file__).parent / "files" / "JvmSidecar.java"
+
+HOST = "127.0.0.1"
+CONNECT_TIMEOUT = 1
+
+# After the sidecar is found unavailable, the CLI is used for this number of seconds without connection attempts
+RETRY_DELAY = 30
+
+RUN_COMMAND = "RUN"
+OK_RESPONSE = "OK"
+ERROR_RESPONSE = "ERROR"
+
+
+class _SidecarState:
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.unavailable_until = 0.0
+
+
+_state = _SidecarState()
+
+
+def _create_request(
+    main_class: str, classpath: list[Path], arguments: list[str], timeout: float | None
+) -> str:
+    # The sidecar interrupts the linter after the timeout in milliseconds, 0 means no timeout
+    timeout_ms = 0 if timeout is None else max(math.ceil(timeout * 1000), 1)
+    lines = [
+        RUN_COMMAND,
+        main_class,
+        os.pathsep.join(map(str, classpath)),
+        str(timeout_ms),
+        str(len(arguments)),
+        *arguments,
+    ]
+    return "".join(f"{line}\n" for line in lines)
+
+
+def _mark_unavailable(reason: str) -> None:
+    logger.warning(f"The JVM sidecar is unavailable ({reason}), the linters are run from the CLI")
+    with _state.lock:
+        _state.unavailable_until = time.monotonic() + RETRY_DELAY
+
+
+def _can_use_sidecar(main_class: str, classpath: list[Path], arguments: list[str]) -> bool:
+    if is_cpu_time_limited():
+        return False
+
+    with _state.lock:
+        if time.monotonic() < _state.unavailable_until:
+            return False
+
+    if any("\n" in argument for argument in [main_class, *map(str, classpath), *arguments]):
+        logger.warning(
+            "The JVM sidecar can't pass line breaks in the arguments, the linter is run from the CLI"
+        )
+        return False
+
+    return True
+
+
+def _send_request(port: str, request: str, main_class: str, timeout: float | None) -> str | None:
+    """Send the request to the sidecar and return its response or None if the sidecar is unavailable."""
+    try:
+        sidecar_socket = socket.create_connection((HOST, int(port)), timeout=CONNECT_TIMEOUT)
+    except (OSError, ValueError) as error:
+        _mark_unavailable(str(error))
+        return None
+
+    with sidecar_socket:
+        sidecar_socket.settimeout(timeout)
+        try:
+            sidecar_socket.sendall(request.encode("utf-8"))
+            with sidecar_socket.makefile("r", encoding="utf-8") as response_file:
+                return response_file.readline().rstrip("\n")
+        except TimeoutError:
+            msg = f"{main_class} did not finish in the JVM sidecar in {timeout:.1f} seconds"
+            raise InspectorTimeoutError(msg) from None
+        except OSError as error:
+            _mark_unavailable(str(error))
+            return None
+
+
+def run_in_jvm_sidecar(main_class: str, classpath: list[Path], arguments: list[str]) -> bool:
+    """Run the main class of a JVM linter with the arguments in the long-lived JVM sidecar.
+
+    The sidecar is used if ``JVM_SIDECAR_PORT`` is set. It runs the linter with the same arguments as the CLI does,
+    so the linter writes the same report, and the report is parsed as usual.
+
+    If the sidecar is not set up, unavailable, is not started with this linter and classpath or fails to run
+    the linter, False is returned, and the linter should be run from the CLI. The CLI is also used when the cpu time
+    is limited, because the limit can't be applied to a shared JVM.
+
+    :raises InspectorTimeoutError: If the linter did not finish before the deadline of the active limits.
+        The sidecar interrupts the linter at the same deadline.
+    """
+    port = os.environ.get(JVM_SIDECAR_PORT_ENV)
+    if port is None or not _can_use_sidecar(main_class, classpath, arguments):
+        return False
+
+    timeout = get_remaining_wall_time()
+    response = _send_request(
+        port, _create_request(main_class, classpath, arguments, timeout), main_class, timeout
+    )
+    if response is None:
+        return False
+
+    status, _, details = response.partition(" ")
+    if status == OK_RESPONSE:
+        logger.debug(f"{main_class} finished in the JVM sidecar with the exit code {details}")
+        return True
+
+    if status == ERROR_RESPONSE:
+        logger.warning(
+            f"The JVM sidecar failed to run {main_class}: {details}. The linter is run from the CLI"
+        )
+    else:
+        _mark_unavailable(f"unexpected response: {response!r}")
+
+    return False
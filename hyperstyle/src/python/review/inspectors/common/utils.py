@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import logging
+import os
+from importlib import metadata
 from math import floor
 from string import Formatter
 from typing import TYPE_CHECKING
@@ -64,3 +66,22 @@ def contains_named_format_fields(input_string: str) -> bool:
     :return: Whether the input string contains named format fields or not.
     """
     return any(field and not field.isdigit() for field in _get_format_fields(input_string))
+
+
+def _get_package_version(package_name: str) -> str:
+    try:
+        return metadata.version(package_name)
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def get_package_versions(*package_names: str) -> str:
+    """Get the versions of the installed python packages, for example, "pylint==2.13.9, pylint-django==2.5.3"."""
+    return ", ".join(
+        f"{package_name}=={_get_package_version(package_name)}" for package_name in package_names
+    )
+
+
+def get_env_version(variable_name: str) -> str:
+    """Get the version of the linter from the environment variable which is used to install the linter."""
+    return os.environ.get(variable_name, "unknown")
@@ -54,9 +54,45 @@ def parse_xml_file_result(
 
     # Parse result XML
     tree = ET.parse(file_path)
+    return _parse_root(
+        tree.getroot(), inspector_type, issue_type_selector, difficulty_selector, issue_configs_handler
+    )
+
+
+def parse_xml_result(
+    content: str,
+    inspector_type: InspectorType,
+    issue_type_selector: Callable[[str], IssueType],
+    difficulty_selector: Callable[[IssueType], IssueDifficulty],
+    issue_configs_handler: IssueConfigsHandler,
+) -> list[BaseIssue]:
+    """Parse the output, which is a xml string (e.g. received from a linter server), and returns a list of the issues.
+
+    The parameters are the same as in ``parse_xml_file_result``.
+    """
+    if not content.strip():
+        msg = f"{inspector_type.value}: error - empty output"
+        raise InspectionError(msg)
+
+    return _parse_root(
+        ET.fromstring(content),
+        inspector_type,
+        issue_type_selector,
+        difficulty_selector,
+        issue_configs_handler,
+    )
+
+
+def _parse_root(
+    root: Element,
+    inspector_type: InspectorType,
+    issue_type_selector: Callable[[str], IssueType],
+    difficulty_selector: Callable[[IssueType], IssueDifficulty],
+    issue_configs_handler: IssueConfigsHandler,
+) -> list[BaseIssue]:
     issues: list[BaseIssue] = []
 
-    for element in tree.getroot():
+    for element in root:
         if __should_handle_element(element):
             issues.extend(
                 process_inner_elements(
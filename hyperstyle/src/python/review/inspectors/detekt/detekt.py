@@ -6,11 +6,21 @@ from pathlib import Path
 from typing import Any
 
 from hyperstyle.src.python.review.common.file_system import check_set_up_env_variable, new_temp_dir
+from hyperstyle.src.python.review.common.language import Language
 from hyperstyle.src.python.review.common.subprocess_runner import run_in_subprocess
+from hyperstyle.src.python.review.inspectors.common.cds import (
+    build_cds_archive,
+    CdsWarmupResult,
+    create_cds_command,
+    JvmTool,
+)
+from hyperstyle.src.python.review.inspectors.common.in_memory_workspace import inspect_in_workspace
 from hyperstyle.src.python.review.inspectors.common.inspector.base_inspector import BaseInspector
 from hyperstyle.src.python.review.inspectors.common.inspector.inspector_type import InspectorType
 from hyperstyle.src.python.review.inspectors.common.issue.issue import BaseIssue, IssueDifficulty, IssueType
-from hyperstyle.src.python.review.inspectors.common.issue.issue_configs import IssueConfigsHandler
+from hyperstyle.src.python.review.inspectors.common.issue.issue_registry import IssueRegistry
+from hyperstyle.src.python.review.inspectors.common.jvm_sidecar.jvm_sidecar import run_in_jvm_sidecar
+from hyperstyle.src.python.review.inspectors.common.utils import get_env_version
 from hyperstyle.src.python.review.inspectors.common.xml_parser import parse_xml_file_result
 from hyperstyle.src.python.review.inspectors.detekt.issue_configs import ISSUE_CONFIGS
 from hyperstyle.src.python.review.inspectors.detekt.issue_types import DETEKT_CLASS_NAME_TO_ISSUE_TYPE
@@ -24,29 +34,36 @@ DETEKT_VERSION_ENV = "DETEKT_VERSION"
 PATH_TOOLS_PMD_FILES = Path(__file__).parent / "files"
 PATH_DETEKT_CONFIG = PATH_TOOLS_PMD_FILES / "detekt-config.yml"
 
+DETEKT_MAIN_CLASS = "io.gitlab.arturbosch.detekt.cli.Main"
+
 
 class DetektInspector(BaseInspector):
     inspector_type = InspectorType.DETEKT
+    config_files = (PATH_DETEKT_CONFIG,)
 
-    # We don't support in-memory inspection for Detekt yet
     @classmethod
-    def inspect_in_memory(cls, code: str, config: dict[str, Any]) -> list[BaseIssue]:
-        raise NotImplementedError
+    def get_version(cls) -> str:
+        return get_env_version(DETEKT_VERSION_ENV)
+
+    def inspect_in_memory(self, code: str, config: dict[str, Any]) -> list[BaseIssue]:
+        return inspect_in_workspace(self.inspect, code, config, Language.KOTLIN)
 
     @classmethod
-    def _create_command(cls, path: Path, output_path: Path) -> list[str]:
-        path_to_detekt_cli = (
-            Path(os.environ[DETEKT_DIRECTORY_ENV])
-            / f"detekt-cli-{os.environ[DETEKT_VERSION_ENV]}"
-            / "bin"
-            / "detekt-cli"
-        )
+    def _get_cli_directory(cls) -> Path:
+        return Path(os.environ[DETEKT_DIRECTORY_ENV]) / f"detekt-cli-{os.environ[DETEKT_VERSION_ENV]}"
+
+    @classmethod
+    def get_jvm_tool(cls) -> JvmTool:
+        classpath = tuple(sorted((cls._get_cli_directory() / "lib").glob("*.jar")))
+        return JvmTool("detekt", cls.get_version(), DETEKT_MAIN_CLASS, classpath)
+
+    @classmethod
+    def _create_arguments(cls, path: Path, output_path: Path) -> list[str]:
         path_detekt_plugin = (
             Path(os.environ[DETEKT_DIRECTORY_ENV]) / f"detekt-formatting-{os.environ[DETEKT_VERSION_ENV]}.jar"
         )
 
         return [
-            str(path_to_detekt_cli),
             "--config",
             str(PATH_DETEKT_CONFIG),
             "--plugins",
@@ -57,6 +74,21 @@ class DetektInspector(BaseInspector):
             str(path),
         ]
 
+    @classmethod
+    def _create_command(cls, path: Path, output_path: Path) -> list[str]:
+        arguments = cls._create_arguments(path, output_path)
+        cds_command = create_cds_command(cls.get_jvm_tool(), arguments)
+        if cds_command is not None:
+            return cds_command
+
+        path_to_detekt_cli = cls._get_cli_directory() / "bin" / "detekt-cli"
+        return [str(path_to_detekt_cli), *arguments]
+
+    @classmethod
+    def warm_up(cls, sample_path: Path, output_path: Path) -> CdsWarmupResult:
+        """Build the AppCDS archive of Detekt by running it on the sample."""
+        return build_cds_archive(cls.get_jvm_tool(), cls._create_arguments(sample_path, output_path))
+
     def inspect(self, path: Path, config: dict[str, Any]) -> list[BaseIssue]:
         if not (
             check_set_up_env_variable(DETEKT_DIRECTORY_ENV) and check_set_up_env_variable(DETEKT_VERSION_ENV)
@@ -64,16 +96,18 @@ class DetektInspector(BaseInspector):
             msg = "Detekt is not set up"
             raise InspectionError(msg)
 
-        issue_configs_handler = IssueConfigsHandler(*ISSUE_CONFIGS)
+        issue_configs_handler = ISSUE_REGISTRY.issue_configs_handler
         with new_temp_dir() as temp_dir:
             output_path = temp_dir / "output.xml"
-            command = self._create_command(path, output_path)
+            arguments = self._create_arguments(path, output_path)
+            tool = self.get_jvm_tool()
+            if not run_in_jvm_sidecar(tool.main_class, list(tool.classpath), arguments):
+                run_in_subprocess(self._create_command(path, output_path))
 
-            run_in_subprocess(command)
             return parse_xml_file_result(
                 output_path,
                 self.inspector_type,
-                self.choose_issue_type,
+                ISSUE_REGISTRY.get_issue_type,
                 IssueDifficulty.get_by_issue_type,
                 issue_configs_handler,
             )
@@ -85,3 +119,6 @@ class DetektInspector(BaseInspector):
             logger.info(f"{cls.inspector_type.value}: {issue_class} - unknown origin class")
             return IssueType.BEST_PRACTICES
         return issue_type
+
+
+ISSUE_REGISTRY = IssueRegistry(DetektInspector.choose_issue_type, ISSUE_CONFIGS)
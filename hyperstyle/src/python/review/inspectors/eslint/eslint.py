@@ -6,26 +6,50 @@ from typing import Any
 from hyperstyle.src.python.review.common.file_system import new_temp_dir
 from hyperstyle.src.python.review.common.subprocess_runner import run_in_subprocess
 from hyperstyle.src.python.review.inspectors.common.inspector.base_inspector import BaseInspector
+from hyperstyle.src.python.review.inspectors.common.inspector.inspector_backend import (
+    get_inspector_backend,
+    InspectorBackend,
+)
 from hyperstyle.src.python.review.inspectors.common.inspector.inspector_type import InspectorType
 from hyperstyle.src.python.review.inspectors.common.issue.issue import BaseIssue, IssueDifficulty, IssueType
-from hyperstyle.src.python.review.inspectors.common.issue.issue_configs import IssueConfigsHandler
-from hyperstyle.src.python.review.inspectors.common.xml_parser import parse_xml_file_result
+from hyperstyle.src.python.review.inspectors.common.issue.issue_registry import IssueRegistry
+from hyperstyle.src.python.review.inspectors.common.utils import get_env_version
+from hyperstyle.src.python.review.inspectors.common.xml_parser import parse_xml_file_result, parse_xml_result
+from hyperstyle.src.python.review.inspectors.eslint.eslint_server import get_eslint_server
 from hyperstyle.src.python.review.inspectors.eslint.issue_configs import ISSUE_CONFIGS
 from hyperstyle.src.python.review.inspectors.eslint.issue_types import ESLINT_CLASS_NAME_TO_ISSUE_TYPE
 
+ESLINT_VERSION_ENV = "ESLINT_VERSION"
+
+ESLINT_BACKEND_ENV = "ESLINT_BACKEND"
+DEFAULT_ESLINT_BACKEND = InspectorBackend.SUBPROCESS
+
 PATH_ESLINT_CONFIG = Path(__file__).parent / ".eslintrc"
 
 
 class ESLintInspector(BaseInspector):
     inspector_type = InspectorType.ESLINT
+    is_file_local = True
+    config_files = (PATH_ESLINT_CONFIG,)
+
+    @classmethod
+    def get_version(cls) -> str:
+        return get_env_version(ESLINT_VERSION_ENV)
 
-    # We don't support in-memory inspection for ESLint yet
     @classmethod
     def inspect_in_memory(cls, code: str, config: dict[str, Any]) -> list[BaseIssue]:
-        raise NotImplementedError
+        output = cls._lint_in_server(code=code)
+        if output is not None:
+            return cls._parse_output(output)
+
+        with new_temp_dir() as temp_dir:
+            output_path = temp_dir / "output.xml"
+            run_in_subprocess(cls._create_command(None, output_path), subprocess_input=code)
+            return cls._parse_output_file(output_path)
 
     @classmethod
-    def _create_command(cls, path: Path, output_path: Path) -> list[str]:
+    def _create_command(cls, path: Path | None, output_path: Path) -> list[str]:
+        """Create the command to lint the path or the code from stdin if the path is None."""
         local_path = Path("node_modules/.bin/eslint")  # used only in local dev environment
         eslint_command = local_path if local_path.exists() else Path("eslint")
         return [
@@ -36,28 +60,54 @@ class ESLintInspector(BaseInspector):
             "checkstyle",
             "-o",
             str(output_path),
-            str(path),
+            "--stdin" if path is None else str(path),
         ]
 
+    @classmethod
+    def _lint_in_server(cls, path: Path | None = None, code: str | None = None) -> str | None:
+        """Lint the path or the code in the ESLint server and return the report or None if the server is not used."""
+        if get_inspector_backend(ESLINT_BACKEND_ENV, DEFAULT_ESLINT_BACKEND) != InspectorBackend.SERVER:
+            return None
+
+        server = get_eslint_server(PATH_ESLINT_CONFIG)
+        if server is None:
+            return None
+
+        return server.lint_file(path) if code is None else server.lint_code(code)
+
     def inspect(self, path: Path, config: dict[str, Any]) -> list[BaseIssue]:
-        issue_configs_handler = IssueConfigsHandler(*ISSUE_CONFIGS)
+        output = self._lint_in_server(path=path)
+        if output is not None:
+            return self._parse_output(output)
+
         with new_temp_dir() as temp_dir:
             output_path = temp_dir / "output.xml"
-            command = self._create_command(path, output_path)
-            run_in_subprocess(command)
-
-            issues = parse_xml_file_result(
-                output_path,
-                self.inspector_type,
-                self.choose_issue_type,
-                IssueDifficulty.get_by_issue_type,
-                issue_configs_handler,
-            )
+            run_in_subprocess(self._create_command(path, output_path))
+            return self._parse_output_file(output_path)
 
-            output_path.unlink()
+    @classmethod
+    def _parse_output(cls, output: str) -> list[BaseIssue]:
+        return parse_xml_result(
+            output,
+            cls.inspector_type,
+            ISSUE_REGISTRY.get_issue_type,
+            IssueDifficulty.get_by_issue_type,
+            ISSUE_REGISTRY.issue_configs_handler,
+        )
 
-            return issues
+    @classmethod
+    def _parse_output_file(cls, output_path: Path) -> list[BaseIssue]:
+        return parse_xml_file_result(
+            output_path,
+            cls.inspector_type,
+            ISSUE_REGISTRY.get_issue_type,
+            IssueDifficulty.get_by_issue_type,
+            ISSUE_REGISTRY.issue_configs_handler,
+        )
 
     @classmethod
     def choose_issue_type(cls, issue_class: str) -> IssueType:
         return ESLINT_CLASS_NAME_TO_ISSUE_TYPE.get(issue_class, IssueType.CODE_STYLE)
+
+
+ISSUE_REGISTRY = IssueRegistry(ESLintInspector.choose_issue_type, ISSUE_CONFIGS)
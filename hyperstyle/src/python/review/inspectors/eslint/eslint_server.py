@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import functools
+import json
+import logging
+import os
+import select
+import shutil
+import subprocess
+import threading
+from pathlib import Path
+from typing import Any
+
+from hyperstyle.src.python.review.common.subprocess_runner import get_remaining_wall_time, is_cpu_time_limited
+from hyperstyle.src.python.review.reviewers.exceptions import InspectorTimeoutError
+
+logger = logging.getLogger(__name__)
+
+PATH_ESLINT_SERVER_SOURCE = Path(__file__).parent / "files" / "eslint_server.js"
+LOCAL_ESLINT_MODULE = Path("node_modules/eslint")  # used only in local dev environment
+
+
+def find_eslint_module() -> Path | None:
+    """Find the directory of the ESLint module which is used by the ``eslint`` command."""
+    if LOCAL_ESLINT_MODULE.exists():
+        return LOCAL_ESLINT_MODULE.absolute()
+
+    eslint_command = shutil.which("eslint")
+    if eslint_command is None:
+        return None
+
+    # The command is a link to <module>/bin/eslint.js
+    return Path(eslint_command).resolve().parent.parent
+
+
+class ESLintServer:
+    """A long-lived Node worker that loads ESLint with the config once and lints files or code on request.
+
+    The worker is started on the first request and restarted if it exits. The requests are serialized,
+    because the worker handles them one by one. The reports are returned in the checkstyle format,
+    the same as the CLI writes.
+    """
+
+    def __init__(self, node_command: str, eslint_module: Path, config_path: Path) -> None:
+        self.node_command = node_command
+        self.eslint_module = eslint_module
+        self.config_path = config_path
+        self._lock = threading.Lock()
+        self._process: subprocess.Popen | None = None
+        self._process_owner: int | None = None
+
+    def lint_file(self, path: Path) -> str | None:
+        return self._send_request({"path": str(path.absolute())})
+
+    def lint_code(self, code: str) -> str | None:
+        return self._send_request({"code": code})
+
+    def stop(self) -> None:
+        with self._lock:
+            self._stop_process()
+
+    def _get_process(self) -> subprocess.Popen:
+        # The worker of a parent process can't be shared with a forked child
+        if self._process is None or self._process.poll() is not None or self._process_owner != os.getpid():
+            self._process = subprocess.Popen(
+                [
+                    self.node_command,
+                    str(PATH_ESLINT_SERVER_SOURCE),
+                    str(self.eslint_module),
+                    str(self.config_path),
+                ],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                encoding="utf-8",
+            )
+            self._process_owner = os.getpid()
+            logger.info(f"The ESLint server is started with the pid {self._process.pid}")
+
+        return self._process
+
+    def _stop_process(self) -> None:
+        if self._process is not None and self._process_owner == os.getpid():
+            self._process.kill()
+            self._process.wait()
+        self._process = None
+
+    def _send_request(self, request: dict[str, Any]) -> str | None:
+        """Send the request to the worker and return the report or None if the worker failed.
+
+        :raises InspectorTimeoutError: If the worker did not answer before the deadline of the active limits.
+            The worker is killed in this case.
+        """
+        with self._lock:
+            timeout = get_remaining_wall_time()
+            try:
+                process = self._get_process()
+                process.stdin.write(f"{json.dumps(request)}\n")
+                process.stdin.flush()
+
+                ready, _, _ = select.select([process.stdout], [], [], timeout)
+                if not ready:
+                    self._stop_process()
+                    msg = f"The ESLint server did not answer in {timeout:.1f} seconds"
+                    raise InspectorTimeoutError(msg)
+
+                line = process.stdout.readline()
+            except OSError as error:
+                logger.warning(f"The ESLint server failed: {error}")
+                self._stop_process()
+                return None
+
+            try:
+                response = json.loads(line)
+            except json.JSONDecodeError:
+                logger.warning(f"The ESLint server exited or sent an unexpected response: {line!r}")
+                self._stop_process()
+                return None
+
+        if "error" in response:
+            logger.warning(f"The ESLint server failed to lint: {response['error']}")
+            return None
+
+        return response["output"]
+
+
+@functools.cache
+def _create_eslint_server(config_path: Path) -> ESLintServer | None:
+    node_command = shutil.which("node")
+    eslint_module = find_eslint_module()
+    if node_command is None or eslint_module is None:
+        logger.warning("Node or the ESLint module is not found, ESLint is run from the CLI")
+        return None
+
+    return ESLintServer(node_command, eslint_module, config_path)
+
+
+def get_eslint_server(config_path: Path) -> ESLintServer | None:
+    """Get the ESLint server of the current process or None if it can't be used.
+
+    The server is not used when the cpu time is limited, because the limit can't be applied to a shared worker.
+    """
+    if is_cpu_time_limited():
+        return None
+
+    return _create_eslint_server(config_path)
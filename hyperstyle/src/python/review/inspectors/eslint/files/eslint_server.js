@@ -0,0 +1,43 @@
+/**
+ * A long-lived Node worker that runs ESLint for hyperstyle, so a review does not pay
+ * for the Node start-up and the loading of ESLint and its config.
+ *
+ * Usage: node eslint_server.js <path to eslint module> <path to config>
+ *
+ * The worker reads one JSON request per line from stdin and writes one JSON response per line to stdout.
+ * A request lints files ({"path": "<path>"}) or a buffer ({"code": "<code>"}),
+ * the response contains the report in the checkstyle format ({"output": "<xml>"}) or an error ({"error": "<message>"}).
+ * The requests are handled one by one.
+ */
+"use strict";
+
+const readline = require("readline");
+
+// stdout is reserved for the responses
+console.log = console.error;
+console.info = console.error;
+
+const [eslintModule, configPath] = process.argv.slice(2);
+const { ESLint } = require(eslintModule);
+
+// The same options as the CLI with "-c <config>"
+const eslint = new ESLint({ overrideConfigFile: configPath });
+const formatterPromise = eslint.loadFormatter("checkstyle");
+
+async function handle(request) {
+  const results =
+    request.code === undefined ? await eslint.lintFiles([request.path]) : await eslint.lintText(request.code);
+  const formatter = await formatterPromise;
+  return { output: formatter.format(results) };
+}
+
+let queue = Promise.resolve();
+
+readline.createInterface({ input: process.stdin }).on("line", (line) => {
+  queue = queue
+    .then(() => handle(JSON.parse(line)))
+    .catch((error) => ({ error: String(error && error.stack ? error.stack : error) }))
+    .then((response) => {
+      process.stdout.write(`${JSON.stringify(response)}\n`);
+    });
+});
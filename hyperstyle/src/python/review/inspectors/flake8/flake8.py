@@ -1,22 +1,77 @@
 from __future__ import annotations
 
+import functools
+import io
 import logging
 import re
 import sys
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from importlib import metadata
 from pathlib import Path
-from typing import Any
+from typing import Any, TYPE_CHECKING
+
+import pycodestyle
+from flake8 import utils as flake8_utils
+from flake8.checker import FileChecker, Manager
+from flake8.defaults import EXCLUDE
+from flake8.formatting.base import BaseFormatter
+from flake8.main.application import Application
+from flake8.options.config import ConfigFileFinder
+from flake8.processor import FileProcessor
 
 from hyperstyle.src.python.review.common.subprocess_runner import run_in_subprocess
 from hyperstyle.src.python.review.inspectors.common.inspector.base_inspector import BaseInspector
+from hyperstyle.src.python.review.inspectors.common.inspector.inspector_backend import (
+    get_python_linter_backend,
+    InspectorBackend,
+)
 from hyperstyle.src.python.review.inspectors.common.inspector.inspector_type import InspectorType
-from hyperstyle.src.python.review.inspectors.common.issue.base_issue_converter import convert_base_issue
-from hyperstyle.src.python.review.inspectors.common.issue.issue import BaseIssue, IssueDifficulty, IssueType
-from hyperstyle.src.python.review.inspectors.common.issue.issue_configs import IssueConfigsHandler
+from hyperstyle.src.python.review.inspectors.common.issue.issue import (
+    BaseIssue,
+    CohesionIssue,
+    CyclomaticComplexityIssue,
+    IssueData,
+    IssueType,
+)
+from hyperstyle.src.python.review.inspectors.common.issue.issue_registry import IssueRegistry
+from hyperstyle.src.python.review.inspectors.common.issue.tips import (
+    get_cohesion_tip,
+    get_cyclomatic_complexity_tip,
+)
+from hyperstyle.src.python.review.inspectors.common.utils import (
+    convert_percentage_of_value_to_lack_of_value,
+    get_package_versions,
+)
 from hyperstyle.src.python.review.inspectors.flake8.issue_configs import ISSUE_CONFIGS
 from hyperstyle.src.python.review.inspectors.flake8.issue_types import (
     CODE_PREFIX_TO_ISSUE_TYPE,
     CODE_TO_ISSUE_TYPE,
 )
+from hyperstyle.src.python.review.inspectors.flake8.ruff import (
+    Flake8RulesBackend,
+    get_flake8_rules_backend,
+    is_replaced_plugin,
+    REPLACED_CODE_PREFIXES,
+    RUFF_PACKAGE_NAME,
+    run_ruff,
+    run_ruff_in_memory,
+)
+from hyperstyle.src.python.review.inspectors.pyast.metrics import (
+    get_python_metrics_backend,
+    PythonMetricsBackend,
+)
+from hyperstyle.src.python.review.inspectors.pyast.python_ast import get_python_file_paths, get_python_metrics
+
+if TYPE_CHECKING:
+    from argparse import Namespace
+    from collections.abc import Callable, Iterator
+
+    from flake8.style_guide import Violation
+
+    from hyperstyle.src.python.review.inspectors.flake8.ruff import RuffViolation
+    from hyperstyle.src.python.review.inspectors.pyast.metrics import PythonMetrics
 
 logger = logging.getLogger(__name__)
 
@@ -27,70 +82,452 @@ PATH_FLAKE8_CONFIG = Path(__file__).parent / ".flake8"
 PATH_FLAKE8_SPELLCHECK_WHITELIST = Path(__file__).parent / "whitelist.txt"
 FORMAT = "%(path)s:%(row)d:%(col)d:%(code)s:%(text)s"
 INSPECTOR_NAME = "flake8"
-BASE_COMMAND = [
-    sys.executable,
-    "-m",
-    "flake8",
-    f"--format={FORMAT}",
+
+FLAKE8_BACKEND_ENV = "FLAKE8_BACKEND"
+DEFAULT_FLAKE8_BACKEND = InspectorBackend.IN_PROCESS
+
+# The file path of the issues found in the code read from stdin
+STDIN_FILE_PATH = Path("stdin")
+
+CYCLOMATIC_COMPLEXITY_ORIGIN_CLASS = "C901"
+COHESION_ORIGIN_CLASS = "H601"
+
+OPTIONS = [
     f"--config={PATH_FLAKE8_CONFIG}",
     f"--whitelist={PATH_FLAKE8_SPELLCHECK_WHITELIST}",
+]
+
+# The options of the mccabe and cohesion plugins, which compute the metrics with the linters metrics backend
+METRICS_OPTIONS = [
     "--max-complexity",
     "0",
     "--cohesion-below",
     "100",
 ]
 
+# With the native metrics backend, the plugins are not loaded by the in-process backend,
+# but they can't be removed from the command, so they are run with the thresholds that report nothing
+DISABLED_METRICS_OPTIONS = [
+    "--max-complexity",
+    "-1",
+    "--cohesion-below",
+    "-1",
+]
+
+# The entry points of the mccabe and cohesion plugins
+METRICS_PLUGIN_NAMES = ("C90", "H60")
+
+# With the Ruff rules backend, the plugins replaced by Ruff can't be removed from the command,
+# so their codes are ignored
+RUFF_OPTIONS = [f"--extend-ignore={','.join(REPLACED_CODE_PREFIXES)}"]
+
+# Some plugins (e.g. flake8-broken-line) report codes like "N400:", so the extra colon is skipped
+ROW_RE = re.compile(r"^(.*):(\d+):(\d+):([A-Z]+\d{3}):?:(.*)$", re.MULTILINE)
+CODE_RE = re.compile(r"^([A-Z]+)(\d)\d*$", re.IGNORECASE)
+
+BASE_COMMAND = [
+    sys.executable,
+    "-m",
+    "flake8",
+    f"--format={FORMAT}",
+    *OPTIONS,
+]
+
+
+class ViolationCollector(BaseFormatter):
+    """Flake8 formatter that collects the violations instead of printing them."""
+
+    def after_init(self) -> None:
+        self.violations: list[Violation] = []
+
+    def handle(self, error: Violation) -> None:
+        self.violations.append(error)
+
+
+class CodeFileChecker(FileChecker):
+    """Flake8 file checker that checks the given code instead of the code read from stdin.
+
+    The code gets the same file name as the code read from stdin, so the issues are the same.
+    """
+
+    def __init__(self, code: str, checks: dict[str, Any], options: Namespace) -> None:
+        self.code = code
+        super().__init__("-", checks, options)
+
+    def _make_processor(self) -> FileProcessor:
+        return FileProcessor(
+            self.options.stdin_display_name, self.options, lines=list(io.StringIO(self.code))
+        )
+
+
+class CodeCheckerManager(Manager):
+    """Flake8 checker manager that checks only the given code."""
+
+    def __init__(self, code: str, **kwargs: Any) -> None:
+        self.code = code
+        super().__init__(**kwargs)
+
+    def make_checkers(self, paths: list[str] | None = None) -> None:
+        checker = CodeFileChecker(self.code, self.checks.to_dictionary(), self.options)
+        self._all_checkers = [checker]
+        self.checkers = [checker] if checker.should_process else []
+
+
+# Some plugins (e.g. flake8-import-order and flake8-builtins) read the code on their own
+# with the stdin helpers of flake8 and pycodestyle when the file name is "stdin".
+# The helpers are wrapped to return the code checked in the current thread, so stdin itself is never replaced.
+_checked_code: ContextVar[str | None] = ContextVar("checked_code", default=None)
+
+
+def _wrap_stdin_helper(get_stdin_value: Callable[[], str]) -> Callable[[], str]:
+    @functools.wraps(get_stdin_value)
+    def get_checked_code_or_stdin_value() -> str:
+        code = _checked_code.get()
+        return get_stdin_value() if code is None else code
+
+    get_checked_code_or_stdin_value.returns_checked_code = True
+    return get_checked_code_or_stdin_value
+
+
+def _wrap_stdin_helpers() -> None:
+    for module in (flake8_utils, pycodestyle):
+        if not getattr(module.stdin_get_value, "returns_checked_code", False):
+            module.stdin_get_value = _wrap_stdin_helper(module.stdin_get_value)
+
+
+@contextmanager
+def _check_code(code: str) -> Iterator[None]:
+    token = _checked_code.set(code)
+    try:
+        yield
+    finally:
+        _checked_code.reset(token)
+
+
+def _get_command(metrics_backend: PythonMetricsBackend, rules_backend: Flake8RulesBackend) -> list[str]:
+    command = [*BASE_COMMAND]
+    if metrics_backend == PythonMetricsBackend.NATIVE:
+        command.extend(DISABLED_METRICS_OPTIONS)
+    else:
+        command.extend(METRICS_OPTIONS)
+
+    if rules_backend == Flake8RulesBackend.RUFF:
+        command.extend(RUFF_OPTIONS)
+
+    return command
+
+
+def _is_removed_plugin(
+    plugin_name: str, metrics_backend: PythonMetricsBackend, rules_backend: Flake8RulesBackend
+) -> bool:
+    if metrics_backend == PythonMetricsBackend.NATIVE and plugin_name in METRICS_PLUGIN_NAMES:
+        return True
+
+    return rules_backend == Flake8RulesBackend.RUFF and is_replaced_plugin(plugin_name)
+
+
+@functools.cache
+def _get_application(metrics_backend: PythonMetricsBackend, rules_backend: Flake8RulesBackend) -> Application:
+    """Create the application once per process: the same steps as ``Application.initialize`` does.
+
+    Plugin discovery, option registration and plugin option parsing (e.g. loading the spellcheck dictionaries)
+    happen here only once. The checks are always run serially, because the application is reused in worker processes.
+    With the native metrics backend, the mccabe and cohesion plugins are not loaded,
+    and with the Ruff rules backend, the plugins replaced by Ruff are not loaded.
+    """
+    # Flake8 logs are not a part of the review output, the same as with the subprocess backend
+    logging.getLogger(INSPECTOR_NAME).propagate = False
+
+    options = [*OPTIONS, "--jobs=1"]
+    if metrics_backend == PythonMetricsBackend.LINTERS:
+        options.extend(METRICS_OPTIONS)
+
+    application = Application()
+    preliminary_options, remaining_args = application.parse_preliminary_options(options)
+    config_finder = ConfigFileFinder(
+        application.program,
+        preliminary_options.append_config,
+        config_file=preliminary_options.config,
+        ignore_config_files=preliminary_options.isolated,
+    )
+    application.find_plugins(config_finder)
+    plugin_manager = application.check_plugins.manager
+    for plugin_name in list(plugin_manager.names):
+        if _is_removed_plugin(plugin_name, metrics_backend, rules_backend):
+            del plugin_manager.plugins[plugin_name]
+            plugin_manager.names.remove(plugin_name)
+
+    application.register_plugin_options()
+    application.parse_configuration_and_cli(config_finder, remaining_args)
+    # The plugins may replace the helpers while they are loaded, so they are wrapped after that
+    _wrap_stdin_helpers()
+    return application
+
+
+# The application is stateful, so only one inspection can be run at the same time
+_application_lock = threading.Lock()
+
+
+@functools.cache
+def _get_plugin_package_names() -> list[str]:
+    return sorted(
+        {
+            distribution.metadata["Name"]
+            for distribution in metadata.distributions()
+            if any(entry_point.group == "flake8.extension" for entry_point in distribution.entry_points)
+        },
+    )
+
 
 class Flake8Inspector(BaseInspector):
     inspector_type = InspectorType.FLAKE8
+    is_file_local = True
+    config_files = (PATH_FLAKE8_CONFIG, PATH_FLAKE8_SPELLCHECK_WHITELIST)
+
+    @classmethod
+    def get_version(cls) -> str:
+        rules_backend = get_flake8_rules_backend()
+        package_names = [INSPECTOR_NAME, *_get_plugin_package_names()]
+        if rules_backend == Flake8RulesBackend.RUFF:
+            package_names.append(RUFF_PACKAGE_NAME)
+
+        versions = get_package_versions(*package_names)
+        return f"{versions}, metrics={get_python_metrics_backend().value}, rules={rules_backend.value}"
+
+    @classmethod
+    def is_cpu_bound(cls) -> bool:
+        return (
+            get_python_linter_backend(FLAKE8_BACKEND_ENV, DEFAULT_FLAKE8_BACKEND)
+            == InspectorBackend.IN_PROCESS
+            or get_python_metrics_backend() == PythonMetricsBackend.NATIVE
+        )
 
     @classmethod
     def inspect_in_memory(cls, code: str, config: dict[str, Any]) -> list[BaseIssue]:
-        output = run_in_subprocess([*BASE_COMMAND, "-"], subprocess_input=code)
-        return cls.parse(output)
+        metrics_backend = get_python_metrics_backend()
+        rules_backend = get_flake8_rules_backend()
+        if (
+            get_python_linter_backend(FLAKE8_BACKEND_ENV, DEFAULT_FLAKE8_BACKEND)
+            == InspectorBackend.IN_PROCESS
+        ):
+            issues = cls._inspect_in_process(metrics_backend, rules_backend, code=code)
+        else:
+            output = run_in_subprocess(
+                [*_get_command(metrics_backend, rules_backend), "-"], subprocess_input=code
+            )
+            issues = cls.parse(output)
+
+        if rules_backend == Flake8RulesBackend.RUFF:
+            issues.extend(
+                cls._convert_violations(run_ruff_in_memory(code, PATH_FLAKE8_CONFIG, STDIN_FILE_PATH))
+            )
+
+        if metrics_backend == PythonMetricsBackend.NATIVE:
+            # The Python AST inspector gets the in-memory code metrics with the empty file path
+            issues.extend(cls._create_metrics_issues(get_python_metrics(code, Path()), STDIN_FILE_PATH))
+
+        return issues
 
     @classmethod
     def inspect(cls, path: Path, config: dict[str, Any]) -> list[BaseIssue]:
-        output = run_in_subprocess([*BASE_COMMAND, str(path)])
-        return cls.parse(output)
+        metrics_backend = get_python_metrics_backend()
+        rules_backend = get_flake8_rules_backend()
+        if (
+            get_python_linter_backend(FLAKE8_BACKEND_ENV, DEFAULT_FLAKE8_BACKEND)
+            == InspectorBackend.IN_PROCESS
+        ):
+            issues = cls._inspect_in_process(metrics_backend, rules_backend, path=path)
+        else:
+            output = run_in_subprocess([*_get_command(metrics_backend, rules_backend), str(path)])
+            issues = cls.parse(output)
+
+        if rules_backend == Flake8RulesBackend.RUFF:
+            issues.extend(cls._convert_violations(run_ruff(path, PATH_FLAKE8_CONFIG)))
+
+        if metrics_backend == PythonMetricsBackend.NATIVE:
+            issues.extend(cls._inspect_metrics(path))
+
+        return issues
 
     @classmethod
-    def parse(cls, output: str) -> list[BaseIssue]:
-        row_re = re.compile(r"^(.*):(\d+):(\d+):([A-Z]+\d{3}):(.*)$", re.MULTILINE)
-        issue_configs_handler = IssueConfigsHandler(*ISSUE_CONFIGS)
+    def _inspect_in_process(
+        cls,
+        metrics_backend: PythonMetricsBackend,
+        rules_backend: Flake8RulesBackend,
+        path: Path | None = None,
+        code: str | None = None,
+    ) -> list[BaseIssue]:
+        with _application_lock:
+            application = _get_application(metrics_backend, rules_backend)
+
+            collector = ViolationCollector(application.options)
+            application.formatter = collector
+            application.make_guide()
+
+            if code is None:
+                application.make_file_checker_manager()
+                application.run_checks([str(path)])
+            else:
+                application.file_checker_manager = CodeCheckerManager(
+                    code,
+                    style_guide=application.guide,
+                    arguments=application.args,
+                    checker_plugins=application.check_plugins,
+                )
+                with _check_code(code):
+                    application.run_checks(["-"])
+
+            application.report()
+
+        issues = []
+        for violation in collector.violations:
+            base_issue = cls.create_base_issue(
+                # Some plugins (e.g. flake8-broken-line) report codes like "N400:"
+                origin_class=violation.code.rstrip(":"),
+                description=violation.text,
+                file_path=Path(violation.filename),
+                line_no=violation.line_number,
+                column_no=violation.column_number,
+            )
+
+            issue = cls.convert_to_issue(base_issue)
+            if issue is not None:
+                issues.append(issue)
+
+        return issues
+
+    @classmethod
+    def _convert_violations(cls, violations: list[RuffViolation]) -> list[BaseIssue]:
+        issues = []
+        for violation in violations:
+            base_issue = cls.create_base_issue(
+                origin_class=violation.code,
+                description=violation.description,
+                file_path=violation.file_path,
+                line_no=violation.line_no,
+                column_no=violation.column_no,
+            )
+
+            issue = cls.convert_to_issue(base_issue)
+            if issue is not None:
+                issues.append(issue)
 
+        return issues
+
+    @classmethod
+    def _inspect_metrics(cls, path: Path) -> list[BaseIssue]:
+        """Create the issues of the cyclomatic complexity and of the cohesion of the Python files that Flake8 checks."""
+        issues = []
+        for file_path in get_python_file_paths(path, EXCLUDE):
+            try:
+                code = file_path.read_text()
+            except (OSError, UnicodeDecodeError):
+                # Flake8 reports the files it can't read
+                continue
+
+            issues.extend(cls._create_metrics_issues(get_python_metrics(code, file_path), file_path))
+
+        return issues
+
+    @classmethod
+    def _create_metrics_issues(cls, metrics: PythonMetrics, file_path: Path) -> list[BaseIssue]:
+        """Create the same issues as the mccabe and cohesion plugins do. Their columns start from 1 as in Flake8."""
         issues: list[BaseIssue] = []
-        for groups in row_re.findall(output):
-            origin_class = groups[3]
-            issue_type = cls.choose_issue_type(origin_class)
+        for complexity in metrics.complexities:
+            issue_data = cls._get_metric_issue_data(
+                CYCLOMATIC_COMPLEXITY_ORIGIN_CLASS, file_path, complexity.line_no, complexity.col_offset + 1
+            )
+            issue_data[IssueData.DESCRIPTION.value] = get_cyclomatic_complexity_tip().format(
+                complexity.complexity
+            )
+            issue_data[IssueData.CYCLOMATIC_COMPLEXITY.value] = complexity.complexity
+            issues.append(CyclomaticComplexityIssue(**issue_data))
+
+        for cohesion in metrics.cohesions:
+            cohesion_lack = convert_percentage_of_value_to_lack_of_value(cohesion.percentage)
+
+            issue_data = cls._get_metric_issue_data(
+                COHESION_ORIGIN_CLASS, file_path, cohesion.line_no, cohesion.col_offset + 1
+            )
+            issue_data[IssueData.DESCRIPTION.value] = get_cohesion_tip().format(cohesion_lack)
+            issue_data[IssueData.COHESION_LACK.value] = cohesion_lack
+            issues.append(CohesionIssue(**issue_data))
+
+        return issues
 
-            base_issue = BaseIssue(
-                origin_class=origin_class,
-                type=issue_type,
+    @classmethod
+    def _get_metric_issue_data(
+        cls, origin_class: str, file_path: Path, line_no: int, column_no: int
+    ) -> dict[str, Any]:
+        issue_data = IssueData.get_base_issue_data_dict(
+            file_path,
+            cls.inspector_type,
+            line_number=line_no,
+            column_number=column_no,
+            origin_class=origin_class,
+        )
+
+        classification = ISSUE_REGISTRY.classify(origin_class)
+        issue_data[IssueData.ISSUE_TYPE.value] = classification.issue_type
+        issue_data[IssueData.DIFFICULTY.value] = classification.difficulty
+
+        return issue_data
+
+    @classmethod
+    def parse(cls, output: str) -> list[BaseIssue]:
+        issues: list[BaseIssue] = []
+        for groups in ROW_RE.findall(output):
+            base_issue = cls.create_base_issue(
+                origin_class=groups[3],
                 description=groups[4],
                 file_path=Path(groups[0]),
                 line_no=int(groups[1]),
-                column_no=int(groups[2]) if int(groups[2]) > 0 else 1,
-                inspector_type=cls.inspector_type,
-                difficulty=IssueDifficulty.get_by_issue_type(issue_type),
+                column_no=int(groups[2]),
             )
 
-            issue = convert_base_issue(base_issue, issue_configs_handler)
-            if issue is None:
-                logger.error(f"{cls.inspector_type.value}: an error occurred during converting base issue.")
-                continue
-
-            issues.append(issue)
+            issue = cls.convert_to_issue(base_issue)
+            if issue is not None:
+                issues.append(issue)
 
         return issues
 
+    @classmethod
+    def create_base_issue(
+        cls,
+        origin_class: str,
+        description: str,
+        file_path: Path,
+        line_no: int,
+        column_no: int,
+    ) -> BaseIssue:
+        classification = ISSUE_REGISTRY.classify(origin_class)
+
+        return BaseIssue(
+            origin_class=origin_class,
+            type=classification.issue_type,
+            description=description,
+            file_path=file_path,
+            line_no=line_no,
+            column_no=column_no if column_no > 0 else 1,
+            inspector_type=cls.inspector_type,
+            difficulty=classification.difficulty,
+        )
+
+    @classmethod
+    def convert_to_issue(cls, base_issue: BaseIssue) -> BaseIssue | None:
+        issue = ISSUE_REGISTRY.convert(base_issue)
+        if issue is None:
+            logger.error(f"{cls.inspector_type.value}: an error occurred during converting base issue.")
+
+        return issue
+
     @staticmethod
     def choose_issue_type(code: str) -> IssueType:
         # Handling individual codes
         if code in CODE_TO_ISSUE_TYPE:
             return CODE_TO_ISSUE_TYPE[code]
 
-        regex_match = re.match(r"^([A-Z]+)(\d)\d*$", code, re.IGNORECASE)
+        regex_match = CODE_RE.match(code)
         code_prefix = regex_match.group(1)
         first_code_number = regex_match.group(2)
 
@@ -103,3 +540,7 @@ class Flake8Inspector(BaseInspector):
             return IssueType.BEST_PRACTICES
 
         return issue_type
+
+
+# The issue types are chosen only once per code
+ISSUE_REGISTRY = IssueRegistry(Flake8Inspector.choose_issue_type, ISSUE_CONFIGS)
@@ -0,0 +1,269 @@
+from __future__ import annotations
+
+import configparser
+import functools
+import importlib.util
+import json
+import logging
+import os
+import re
+import sys
+from dataclasses import dataclass
+from enum import Enum, unique
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from flake8.defaults import EXCLUDE
+from flake8.utils import parse_comma_separated_list
+
+from hyperstyle.src.python.review.common.subprocess_runner import run_in_subprocess
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+logger = logging.getLogger(__name__)
+
+FLAKE8_RULES_BACKEND_ENV = "FLAKE8_RULES_BACKEND"
+
+FLAKE8_CONFIG_SECTION = "flake8"
+DEFAULT_MAX_LINE_LENGTH = 79
+
+RUFF_PACKAGE_NAME = "ruff"
+
+# The Ruff rules that replace the pycodestyle, pyflakes, bugbear, builtins, comprehensions, commas,
+# return, pep8-naming and eradicate plugins of Flake8
+RUFF_SELECT = ("E", "W", "F", "B", "A", "C4", "COM", "RET", "N", "ERA")
+
+# The Ruff code prefixes which differ from the codes of the Flake8 plugins, the other codes are the same
+RUFF_TO_FLAKE8_CODE_PREFIXES = {
+    "ERA001": "E800",
+    "COM": "C",
+    "RET": "R",
+}
+
+# The entry points of the Flake8 plugins that Ruff replaces and the prefix of the pycodestyle entry points
+REPLACED_PLUGIN_NAMES = ("A00", "B", "C4", "C81", "E8", "F", "N8", "R50")
+REPLACED_PLUGIN_NAME_PREFIX = "pycodestyle."
+
+# The codes that the replaced plugins report by default. E9 codes are reported by Flake8 itself,
+# and the opinionated B9 codes of bugbear are disabled in Flake8
+REPLACED_CODE_PREFIXES = (
+    "A00",
+    "B0",
+    "C4",
+    "C81",
+    "E1",
+    "E2",
+    "E3",
+    "E4",
+    "E5",
+    "E7",
+    "E8",
+    "F",
+    "N8",
+    "R50",
+    "W",
+)
+
+# Ruff quotes the names with backticks, Flake8 plugins use single quotes
+RUFF_QUOTE = "`"
+FLAKE8_QUOTE = "'"
+
+# pycodestyle, pyflakes, pep8-naming and flake8-commas start their messages with a lowercase letter
+LOWERCASE_MESSAGE_CODE_PREFIXES = ("C81", "E", "F", "N8", "W")
+
+# The messages that differ from the Flake8 ones, some of them must be the same to be parsed by the issue configs
+MESSAGE_ADAPTERS: dict[str, tuple[re.Pattern, str]] = {
+    "E501": (re.compile(r"^line too long \((\d+) > (\d+)\)$"), r"line too long (\1 > \2 characters)"),
+    "C812": (re.compile(r"^trailing comma missing$"), "missing trailing comma"),
+    "B007": (re.compile(r"not used within loop body"), "not used within the loop body"),
+}
+
+
+@unique
+class Flake8RulesBackend(Enum):
+    """The way to check the rules of the pycodestyle, pyflakes, bugbear and the other plugins that Ruff implements.
+
+    ``FLAKE8`` runs the plugins in Flake8, ``RUFF`` runs Ruff instead of them and maps its codes and messages
+    onto the Flake8 ones. Flake8 still runs the plugins that Ruff doesn't cover, e.g. wps-light and spellcheck.
+    """
+
+    FLAKE8 = "flake8"
+    RUFF = "ruff"
+
+    @classmethod
+    def values(cls) -> list[str]:
+        return [member.value for member in cls]
+
+
+DEFAULT_FLAKE8_RULES_BACKEND = Flake8RulesBackend.FLAKE8
+
+
+def get_flake8_rules_backend() -> Flake8RulesBackend:
+    """Get the backend from the environment variable, so it can be selected per deployment.
+
+    Ruff is an optional dependency, so the Flake8 backend is used if it is not installed.
+    """
+    value = os.environ.get(FLAKE8_RULES_BACKEND_ENV)
+    if value is None:
+        return DEFAULT_FLAKE8_RULES_BACKEND
+
+    try:
+        backend = Flake8RulesBackend(value.strip().lower())
+    except ValueError:
+        logger.warning(
+            f"{FLAKE8_RULES_BACKEND_ENV} has an unknown value {value}. "
+            f"Available values: {', '.join(Flake8RulesBackend.values())}. "
+            f"The {DEFAULT_FLAKE8_RULES_BACKEND.value} backend is used.",
+        )
+        return DEFAULT_FLAKE8_RULES_BACKEND
+
+    if backend == Flake8RulesBackend.RUFF and not is_ruff_installed():
+        logger.warning(
+            f"{FLAKE8_RULES_BACKEND_ENV} is {value}, but {RUFF_PACKAGE_NAME} is not installed. "
+            f"The {Flake8RulesBackend.FLAKE8.value} backend is used.",
+        )
+        return Flake8RulesBackend.FLAKE8
+
+    return backend
+
+
+@functools.cache
+def is_ruff_installed() -> bool:
+    return importlib.util.find_spec(RUFF_PACKAGE_NAME) is not None
+
+
+def is_replaced_plugin(plugin_name: str) -> bool:
+    return plugin_name in REPLACED_PLUGIN_NAMES or plugin_name.startswith(REPLACED_PLUGIN_NAME_PREFIX)
+
+
+@dataclass(frozen=True)
+class RuffViolation:
+    """The Ruff violation with the Flake8 code and message. The columns start from 1 as in Flake8."""
+
+    code: str
+    description: str
+    file_path: Path
+    line_no: int
+    column_no: int
+
+
+def get_flake8_code(ruff_code: str) -> str:
+    for ruff_prefix, flake8_prefix in RUFF_TO_FLAKE8_CODE_PREFIXES.items():
+        if ruff_code.startswith(ruff_prefix):
+            return flake8_prefix + ruff_code[len(ruff_prefix) :]
+
+    return ruff_code
+
+
+def get_flake8_description(code: str, ruff_message: str) -> str:
+    description = ruff_message.replace(RUFF_QUOTE, FLAKE8_QUOTE)
+    if code.startswith(LOWERCASE_MESSAGE_CODE_PREFIXES):
+        description = description[:1].lower() + description[1:]
+
+    adapter = MESSAGE_ADAPTERS.get(code)
+    if adapter is not None:
+        pattern, replacement = adapter
+        description = pattern.sub(replacement, description)
+
+    return description
+
+
+@functools.cache
+def _read_flake8_config(config_path: Path) -> configparser.RawConfigParser:
+    parser = configparser.RawConfigParser()
+    parser.read(config_path)
+    return parser
+
+
+@functools.cache
+def get_ignored_code_prefixes(config_path: Path) -> tuple[str, ...]:
+    """Get the ignored codes from the Flake8 config the same way as Flake8 parses them."""
+    config = _read_flake8_config(config_path)
+    return tuple(parse_comma_separated_list(config.get(FLAKE8_CONFIG_SECTION, "ignore", fallback="")))
+
+
+def is_reported_by_flake8(code: str, config_path: Path) -> bool:
+    """Check that Flake8 with the replaced plugins would report the code: it is selected and not ignored."""
+    return code.startswith(REPLACED_CODE_PREFIXES) and not code.startswith(
+        get_ignored_code_prefixes(config_path)
+    )
+
+
+def _get_command(config_path: Path) -> list[str]:
+    config = _read_flake8_config(config_path)
+    line_length = config.getint(FLAKE8_CONFIG_SECTION, "max-line-length", fallback=DEFAULT_MAX_LINE_LENGTH)
+    return [
+        sys.executable,
+        "-m",
+        RUFF_PACKAGE_NAME,
+        "check",
+        # The rules are configured only by the options, so the configs of the inspected projects are not used
+        "--isolated",
+        # Some of the pycodestyle rules (e.g. the whitespaces) are still in preview
+        "--preview",
+        "--no-cache",
+        "--ignore-noqa",
+        "--no-respect-gitignore",
+        "--config",
+        "include = ['*.py']",
+        f"--exclude={','.join(EXCLUDE)}",
+        f"--line-length={line_length}",
+        f"--select={','.join(RUFF_SELECT)}",
+        "--output-format=json",
+        "--exit-zero",
+    ]
+
+
+def _get_file_path(file_name: str, path: Path) -> Path:
+    """Get the path of the file in the same form as Flake8 reports it: relative to the inspected path."""
+    if path.is_file():
+        return path
+
+    try:
+        return path / Path(file_name).relative_to(path.resolve())
+    except ValueError:
+        return Path(file_name)
+
+
+def _parse(output: str, config_path: Path, get_file_path: Callable[[str], Path]) -> list[RuffViolation]:
+    if not output:
+        logger.error(f"{RUFF_PACKAGE_NAME}: the output is empty")
+        return []
+
+    violations = []
+    for diagnostic in json.loads(output):
+        ruff_code = diagnostic["code"]
+        # The syntax errors have no code, Flake8 reports them itself
+        if ruff_code is None:
+            continue
+
+        code = get_flake8_code(ruff_code)
+        if not is_reported_by_flake8(code, config_path):
+            continue
+
+        violations.append(
+            RuffViolation(
+                code=code,
+                description=get_flake8_description(code, diagnostic["message"]),
+                file_path=get_file_path(diagnostic["filename"]),
+                line_no=diagnostic["location"]["row"],
+                column_no=diagnostic["location"]["column"],
+            ),
+        )
+
+    return violations
+
+
+def run_ruff(path: Path, config_path: Path) -> list[RuffViolation]:
+    """Check the file or the directory with the Ruff rules of the plugins enabled in the Flake8 config."""
+    output = run_in_subprocess([*_get_command(config_path), str(path)])
+    return _parse(output, config_path, functools.partial(_get_file_path, path=path))
+
+
+def run_ruff_in_memory(code: str, config_path: Path, file_path: Path) -> list[RuffViolation]:
+    """Check the code with the Ruff rules, the violations are reported with the given file path."""
+    output = run_in_subprocess(
+        [*_get_command(config_path), "--stdin-filename=stdin", "-"], subprocess_input=code
+    )
+    return _parse(output, config_path, lambda _: file_path)
@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+import fcntl
+import logging
+import os
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, TYPE_CHECKING
+
+from hyperstyle.src.python.review.common.file_system import file_lock
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+logger = logging.getLogger(__name__)
+
+GO_CACHE_DIRECTORY_ENV = "GO_CACHE_DIRECTORY"
+GO_CACHE_SIZE_ENV = "GO_CACHE_SIZE"
+
+MEGABYTE = 1024 * 1024
+DEFAULT_GO_CACHE_SIZE = 2048 * MEGABYTE
+
+BUILD_CACHE_DIRECTORY = "build"
+LINT_CACHE_DIRECTORY = "lint"
+MODULE_CACHE_DIRECTORY = "mod"
+LOCK_FILE = "go-cache.lock"
+GATE_LOCK_FILE = "go-cache-gate.lock"
+TRIM_FILE = "trim.txt"
+
+# The size of the caches is checked at most once in this number of seconds, because it requires a walk over the caches
+TRIM_INTERVAL = 60 * 60
+
+# The trimming waits for the reviews that use the caches at most this number of seconds,
+# and if they are not finished by then, it is tried again after the retry interval
+TRIM_LOCK_TIMEOUT = 30
+TRIM_RETRY_INTERVAL = 60
+TRIM_LOCK_POLL_INTERVAL = 0.05
+
+# The eviction removes the least recently used files until the caches take this fraction of their maximum size
+EVICTION_TARGET = 0.9
+
+
+class GoCacheManager:
+    """A directory with the persistent Go build caches (``GOCACHE``) and golangci-lint caches (``GOLANGCI_LINT_CACHE``).
+
+    Each version of Go and golangci-lint gets its own pair of caches, so the reviews with the same versions
+    reuse the type-checking results of the standard library and the modules instead of starting cold.
+    Go and golangci-lint lock their cache entries themselves, so the caches are shared by the concurrent reviews.
+
+    The module cache (``GOMODCACHE``) is shared by all versions and is used only if it is created by the warm-up,
+    otherwise the default module cache of Go (with the modules downloaded at the deployment) is used.
+
+    The reviews hold a shared lock while they use the caches. When the total size of the caches of a version exceeds
+    ``max_size``, the least recently used files are removed under the exclusive lock, so no review sees a trimmed cache.
+    The reviews take the shared lock through a gate lock, which the trimming holds while it waits for the exclusive one,
+    so the trimming is not starved by the overlapping reviews: the new reviews wait until it is done.
+    """
+
+    def __init__(self, directory: Path, max_size: int = DEFAULT_GO_CACHE_SIZE) -> None:
+        self.directory = directory
+        self.max_size = max_size
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def get_version_directory(self, versions_key: str) -> Path:
+        return self.directory / versions_key
+
+    def get_environment(self, versions_key: str) -> dict[str, str]:
+        version_directory = self.get_version_directory(versions_key)
+        environment = {
+            "GOCACHE": str(version_directory / BUILD_CACHE_DIRECTORY),
+            "GOLANGCI_LINT_CACHE": str(version_directory / LINT_CACHE_DIRECTORY),
+        }
+
+        module_cache = self.directory / MODULE_CACHE_DIRECTORY
+        if module_cache.is_dir():
+            environment["GOMODCACHE"] = str(module_cache)
+
+        return environment
+
+    @contextmanager
+    def use(self, versions_key: str) -> Iterator[dict[str, str]]:
+        """Yield the environment variables with the caches of the versions. After the review, the caches are trimmed.
+
+        :param versions_key: The key of the Go and golangci-lint versions, e.g. ``go1.18-golangci-lint1.49.0``.
+        """
+        version_directory = self.get_version_directory(versions_key)
+        version_directory.mkdir(parents=True, exist_ok=True)
+
+        with (version_directory / LOCK_FILE).open("a") as lock_file:
+            # The gate is held only for a moment, unless the caches are being trimmed
+            with file_lock(version_directory / GATE_LOCK_FILE):
+                fcntl.flock(lock_file, fcntl.LOCK_SH)
+
+            try:
+                yield self.get_environment(versions_key)
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+        self._trim(version_directory)
+
+    def _trim(self, version_directory: Path) -> None:
+        trim_path = version_directory / TRIM_FILE
+        if not _is_trim_due(trim_path):
+            return
+
+        with (
+            file_lock(version_directory / GATE_LOCK_FILE),
+            (version_directory / LOCK_FILE).open("a") as lock_file,
+        ):
+            # Another review could trim the caches while this one waited at the gate
+            if not _is_trim_due(trim_path):
+                return
+
+            if not _lock_exclusively(lock_file, TRIM_LOCK_TIMEOUT):
+                logger.info(f"The Go caches in {version_directory} are in use, they are trimmed later")
+                retry_time = time.time() - TRIM_INTERVAL + TRIM_RETRY_INTERVAL
+                trim_path.touch()
+                os.utime(trim_path, (retry_time, retry_time))
+                return
+
+            try:
+                trim_path.touch()
+                self._evict(version_directory)
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _evict(self, version_directory: Path) -> None:
+        cache_files = []
+        for cache_name in (BUILD_CACHE_DIRECTORY, LINT_CACHE_DIRECTORY):
+            for root, _, file_names in os.walk(version_directory / cache_name):
+                for file_name in file_names:
+                    stat = (Path(root) / file_name).stat()
+                    cache_files.append((stat.st_mtime, stat.st_size, Path(root) / file_name))
+
+        size = sum(file_size for _, file_size, _ in cache_files)
+        if size <= self.max_size:
+            return
+
+        target_size = self.max_size * EVICTION_TARGET
+        for _, file_size, cache_path in sorted(cache_files):
+            if size <= target_size:
+                break
+
+            cache_path.unlink(missing_ok=True)
+            size -= file_size
+
+        logger.info(f"The Go caches in {version_directory} are cleaned up to {size} bytes")
+
+
+def _is_trim_due(trim_path: Path) -> bool:
+    try:
+        return time.time() - trim_path.stat().st_mtime >= TRIM_INTERVAL
+    except FileNotFoundError:
+        return True
+
+
+def _try_lock_exclusively(lock_file: IO) -> bool:
+    try:
+        fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        return False
+    return True
+
+
+def _lock_exclusively(lock_file: IO, timeout: float) -> bool:
+    """Take the exclusive lock of the file within the timeout. Return whether the lock is taken."""
+    deadline = time.monotonic() + timeout
+    while not _try_lock_exclusively(lock_file):
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(TRIM_LOCK_POLL_INTERVAL)
+
+    return True
+
+
+def get_go_cache_manager() -> GoCacheManager | None:
+    """Get the cache manager from the environment variables or None if the managed caches are not set up.
+
+    ``GO_CACHE_DIRECTORY`` is the directory of the caches, ``GO_CACHE_SIZE`` is the maximum size of the caches
+    of each Go version in megabytes.
+    """
+    directory = os.environ.get(GO_CACHE_DIRECTORY_ENV)
+    if not directory:
+        return None
+
+    size = os.environ.get(GO_CACHE_SIZE_ENV)
+    try:
+        max_size = DEFAULT_GO_CACHE_SIZE if size is None else int(size) * MEGABYTE
+    except ValueError:
+        logger.warning(f"{GO_CACHE_SIZE_ENV} is not a number: {size}. The default size is used.")
+        max_size = DEFAULT_GO_CACHE_SIZE
+
+    return GoCacheManager(Path(directory), max_size)
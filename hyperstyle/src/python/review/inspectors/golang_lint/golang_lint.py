@@ -4,17 +4,26 @@ import json
 import logging
 import os
 import re
+import shutil
+import time
+from contextlib import nullcontext
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 from hyperstyle.src.python.review.common.file_system import check_set_up_env_variable, new_temp_dir
+from hyperstyle.src.python.review.common.language import Language
 from hyperstyle.src.python.review.common.subprocess_runner import run_in_subprocess
+from hyperstyle.src.python.review.inspectors.common.in_memory_workspace import inspect_in_workspace
 from hyperstyle.src.python.review.inspectors.common.inspector.base_inspector import BaseInspector
 from hyperstyle.src.python.review.inspectors.common.inspector.inspector_type import InspectorType
-from hyperstyle.src.python.review.inspectors.common.issue.base_issue_converter import convert_base_issue
-from hyperstyle.src.python.review.inspectors.common.issue.issue import BaseIssue, IssueDifficulty, IssueType
-from hyperstyle.src.python.review.inspectors.common.issue.issue_configs import IssueConfigsHandler
-from hyperstyle.src.python.review.inspectors.common.utils import is_result_file_correct
+from hyperstyle.src.python.review.inspectors.common.issue.issue import BaseIssue, IssueType
+from hyperstyle.src.python.review.inspectors.common.issue.issue_registry import IssueRegistry, PrefixTrie
+from hyperstyle.src.python.review.inspectors.common.utils import get_env_version, is_result_file_correct
+from hyperstyle.src.python.review.inspectors.golang_lint.go_cache import (
+    get_go_cache_manager,
+    MODULE_CACHE_DIRECTORY,
+)
 from hyperstyle.src.python.review.inspectors.golang_lint.issue_configs import ISSUE_CONFIGS
 from hyperstyle.src.python.review.inspectors.golang_lint.issue_types import (
     CODE_PREFIX_TO_ISSUE_TYPE,
@@ -23,18 +32,41 @@ from hyperstyle.src.python.review.inspectors.golang_lint.issue_types import (
 from hyperstyle.src.python.review.reviewers.exceptions import InspectionError
 
 GOLANG_LINT_DIRECTORY_ENV = "GOLANG_LINT_DIRECTORY"
+GOLANG_LINT_VERSION_ENV = "GOLANG_LINT_VERSION"
 GOLANG_LINT_CONFIG_PATH = Path(__file__).parent / "config.yml"
+# The directory with the go.mod and go.sum of the pinned modules that are available to the submissions
+GO_MODULE_DIRECTORY_ENV = "GO_MODULE_DIRECTORY"
+
+GO_VERSION = "1.18"
+
+# The linters that report the issues of several checks, the code of the check is a part of the description
+METALINTERS = frozenset({"govet", "revive", "gocritic", "gosimple", "staticcheck", "stylecheck"})
+METALINTER_DESCRIPTION_RE = re.compile(r"^([A-Za-z\-]+\d*): (.*)$")
+
+# None of the prefixes is a prefix of another one, so the longest prefix is the only matching one
+CODE_PREFIX_TRIE = PrefixTrie(CODE_PREFIX_TO_ISSUE_TYPE)
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class GoWarmupResult:
+    versions_key: str
+    # The time of the golangci-lint runs on the sample in seconds
+    time_cold: float
+    time_warm: float
+
+
 class GolangLintInspector(BaseInspector):
     inspector_type = InspectorType.GOLANG_LINT
+    config_files = (GOLANG_LINT_CONFIG_PATH,)
 
-    # We don't support in-memory inspection for Golang yet
     @classmethod
-    def inspect_in_memory(cls, code: str, config: dict[str, Any]) -> list[BaseIssue]:
-        raise NotImplementedError
+    def get_version(cls) -> str:
+        return get_env_version(GOLANG_LINT_VERSION_ENV)
+
+    def inspect_in_memory(self, code: str, config: dict[str, Any]) -> list[BaseIssue]:
+        return inspect_in_workspace(self.inspect, code, config, Language.GO)
 
     @classmethod
     def _create_command(
@@ -55,7 +87,7 @@ class GolangLintInspector(BaseInspector):
             "-c",
             str(GOLANG_LINT_CONFIG_PATH),
             "--go",
-            "1.18",
+            GO_VERSION,
             "--concurrency",
             str(n_cpu),
             "--allow-parallel-runners",
@@ -66,15 +98,69 @@ class GolangLintInspector(BaseInspector):
             msg = "Golang Lint is not set up"
             raise InspectionError(msg)
 
-        with new_temp_dir() as temp_dir:
+        # Without the managed caches golangci-lint uses the default caches of the user
+        cache_manager = get_go_cache_manager()
+        cache_context = (
+            nullcontext({}) if cache_manager is None else cache_manager.use(self._get_versions_key())
+        )
+
+        with new_temp_dir() as temp_dir, cache_context as environment:
             output_path = temp_dir / "output.json"
             working_directory = path.parent if path.is_file() else path
 
             command = self._create_command(path, output_path, working_directory, config["n_cpu"])
-            run_in_subprocess(command, working_directory)
+            run_in_subprocess(command, working_directory, environment=environment)
 
             return self.parse(output_path)
 
+    @classmethod
+    def _get_versions_key(cls) -> str:
+        return f"go{GO_VERSION}-golangci-lint{cls.get_version()}"
+
+    def warm_up(self, sample_directory: Path) -> GoWarmupResult:
+        """Fill the Go caches, so the first review after the deployment does not start cold.
+
+        The standard library and the pinned modules (see ``GO_MODULE_DIRECTORY``) are built,
+        then golangci-lint is run twice on the sample project to compare the cold and the warm runs.
+        """
+        cache_manager = get_go_cache_manager()
+        cache_context = (
+            nullcontext({}) if cache_manager is None else cache_manager.use(self._get_versions_key())
+        )
+
+        with new_temp_dir() as temp_dir, cache_context as cache_environment:
+            environment = dict(cache_environment)
+            module_directory = os.environ.get(GO_MODULE_DIRECTORY_ENV)
+            if module_directory and cache_manager is not None:
+                # The module cache is used by the reviews only after it is filled by the warm-up
+                environment["GOMODCACHE"] = str(cache_manager.directory / MODULE_CACHE_DIRECTORY)
+                run_in_subprocess(["go", "mod", "download"], module_directory, environment=environment)
+
+            run_in_subprocess(["go", "build", "std"], environment=environment)
+            if module_directory:
+                module_patterns = run_in_subprocess(
+                    ["go", "list", "-m", "-f", "{{if not .Main}}{{.Path}}/...{{end}}", "all"],
+                    module_directory,
+                    environment=environment,
+                ).split()
+                run_in_subprocess(
+                    ["go", "build", *module_patterns], module_directory, environment=environment
+                )
+
+            project_directory = temp_dir / "project"
+            shutil.copytree(sample_directory, project_directory)
+            output_path = temp_dir / "output.json"
+            command = self._create_command(project_directory, output_path, project_directory, n_cpu=1)
+
+            times = []
+            for _ in range(2):
+                start = time.perf_counter()
+                run_in_subprocess(command, project_directory, environment=environment)
+                times.append(time.perf_counter() - start)
+
+        logger.info(f"golangci-lint: {times[0]:.2f}s on the cold caches, {times[1]:.2f}s on the warm caches")
+        return GoWarmupResult(self._get_versions_key(), *times)
+
     @classmethod
     def parse(cls, output_path: Path) -> list[BaseIssue]:
         if not is_result_file_correct(output_path, cls.inspector_type):
@@ -84,9 +170,6 @@ class GolangLintInspector(BaseInspector):
         with output_path.open(encoding="utf-8") as file:
             data = json.load(file)
 
-        metalinter_description_re = re.compile(r"^([A-Za-z\-]+\d*): (.*)$")
-        issue_configs_handler = IssueConfigsHandler(*ISSUE_CONFIGS)
-
         issues = []
         files_with_typecheck_issues = set()
         for issue_json_data in data["Issues"]:
@@ -113,26 +196,26 @@ class GolangLintInspector(BaseInspector):
             # If the issue is from the metalinter, we need to extract
             # the issue code from the description and add it to origin_class.
             if cls._is_metalinter_issue(origin_class):
-                matches = metalinter_description_re.search(description)
+                matches = METALINTER_DESCRIPTION_RE.search(description)
                 if matches:
                     issue_code, description = matches.groups()
                     description = description[:1].upper() + description[1:]
                     origin_class += f"-{issue_code}"
 
-            issue_type = cls.choose_issue_type(origin_class)
+            classification = ISSUE_REGISTRY.classify(origin_class)
 
             base_issue = BaseIssue(
                 origin_class=origin_class,
-                type=issue_type,
+                type=classification.issue_type,
                 description=description,
                 file_path=file_path,
                 line_no=issue_json_data["Pos"]["Line"],
                 column_no=issue_json_data["Pos"]["Column"] if issue_json_data["Pos"]["Column"] > 0 else 1,
                 inspector_type=cls.inspector_type,
-                difficulty=IssueDifficulty.get_by_issue_type(issue_type),
+                difficulty=classification.difficulty,
             )
 
-            issue = convert_base_issue(base_issue, issue_configs_handler)
+            issue = ISSUE_REGISTRY.convert(base_issue)
             if issue is None:
                 logger.error(f"{cls.inspector_type.value}: an error occurred during converting base issue.")
                 continue
@@ -146,13 +229,17 @@ class GolangLintInspector(BaseInspector):
         if code in CODE_TO_ISSUE_TYPE:
             return CODE_TO_ISSUE_TYPE[code]
 
-        for code_prefix, issue_type in CODE_PREFIX_TO_ISSUE_TYPE.items():
-            if code.startswith(code_prefix):
-                return issue_type
+        issue_type = CODE_PREFIX_TRIE.find(code)
+        if issue_type is not None:
+            return issue_type
 
         logger.warning(f"{cls.inspector_type.value}: {code} - unknown error code")
         return IssueType.BEST_PRACTICES
 
     @staticmethod
     def _is_metalinter_issue(origin_class: str) -> bool:
-        return origin_class in {"govet", "revive", "gocritic", "gosimple", "staticcheck", "stylecheck"}
+        return origin_class in METALINTERS
+
+
+# The issue types are chosen only once per linter and check
+ISSUE_REGISTRY = IssueRegistry(GolangLintInspector.choose_issue_type, ISSUE_CONFIGS)
@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+import fcntl
+import functools
+import hashlib
+import logging
+import os
+import shutil
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, TYPE_CHECKING
+
+from hyperstyle.src.python.review.common.file_system import file_lock
+from hyperstyle.src.python.review.common.language import get_language_extension, Language
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+logger = logging.getLogger(__name__)
+
+PMD_CACHE_DIRECTORY_ENV = "PMD_CACHE_DIRECTORY"
+PMD_CACHE_SIZE_ENV = "PMD_CACHE_SIZE"
+
+MEGABYTE = 1024 * 1024
+DEFAULT_PMD_CACHE_SIZE = 256 * MEGABYTE
+
+CACHE_EXTENSION = ".cache"
+LOCK_FILE = "pmd-cache.lock"
+STAGES_DIRECTORY = "stages"
+STAGE_LOCKS_DIRECTORY = "locks"
+
+# The number of the parallel PMD runs of the same task that get the cache, the other runs are not cached
+MAX_STAGES_PER_TASK = 4
+
+# The eviction removes the least recently used cache files until the cache takes this fraction of its maximum size
+EVICTION_TARGET = 0.9
+
+
+@functools.cache
+def _hash_file(path: Path, mtime_ns: int, size: int) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def _get_file_hash(path: Path) -> str:
+    # The modification time and the size are a part of the key, so the changed file is hashed again
+    stat = path.stat()
+    return _hash_file(path, stat.st_mtime_ns, stat.st_size)
+
+
+def get_task_fingerprint(path: Path) -> str:
+    """Get the fingerprint of the task of the inspected path: the paths of its Java files relative to it.
+
+    The submissions of the same task are usually reviewed in new temporary directories, but their files are laid out
+    in the same way, so they share the cache.
+    """
+    if path.is_file():
+        file_names = [path.name]
+    else:
+        extension = get_language_extension(Language.JAVA).value
+        file_names = sorted(str(file_path.relative_to(path)) for file_path in path.rglob(f"*{extension}"))
+
+    return hashlib.sha256("\n".join(file_names).encode()).hexdigest()
+
+
+def _try_lock(lock_file: IO) -> bool:
+    try:
+        fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        return False
+    return True
+
+
+class PMDAnalysisCache:
+    """A directory with the incremental analysis caches of PMD.
+
+    PMD stores the results of each file in its cache and reanalyzes only the changed files, but it keys the results
+    by the file paths and drops the whole cache when the rule set or the Java version changes. So each task
+    (see ``get_task_fingerprint``) gets its own cache files, keyed by the fingerprint of the task, the hash
+    of the rule set, the PMD version and the Java version, and PMD inspects a copy of the Java files
+    in a stage directory of the cache file, so it sees the same file paths in each review of the task.
+
+    Each stage is used by one PMD run at a time, so up to ``MAX_STAGES_PER_TASK`` parallel runs of the same task
+    get their own stages and cache files. PMD works with a private copy of the cache file, and the copy atomically
+    replaces the cache file after PMD finishes, so a failed run never leaves a partially written cache.
+    When the total size of the cache files exceeds ``max_size``, the least recently used files are removed.
+    """
+
+    def __init__(self, directory: Path, max_size: int = DEFAULT_PMD_CACHE_SIZE) -> None:
+        self.directory = directory.absolute()
+        self.max_size = max_size
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def get_cache_key(task_fingerprint: str, rule_set: Path, pmd_version: str, java_version: str) -> str:
+        fingerprint = "\n".join((task_fingerprint, _get_file_hash(rule_set), pmd_version, java_version))
+        return hashlib.sha256(fingerprint.encode()).hexdigest()
+
+    @contextmanager
+    def use(self, path: Path, cache_key: str) -> Iterator[tuple[Path, Path] | None]:
+        """Yield the staged copy of the path and the path of a private copy of the cache file for a PMD run.
+
+        If all the stages of the key are used by other runs, None is yielded, and the path should be inspected
+        without the cache.
+        """
+        for stage_index in range(MAX_STAGES_PER_TASK):
+            stage_name = f"{cache_key}-{stage_index}"
+            # The locks are striped by the prefix of the key, so the lock files don't pile up
+            lock_path = self.directory / STAGE_LOCKS_DIRECTORY / cache_key[:2] / f"{stage_index}.lock"
+            lock_path.parent.mkdir(parents=True, exist_ok=True)
+            with lock_path.open("a") as lock_file:
+                if not _try_lock(lock_file):
+                    continue
+
+                try:
+                    with (
+                        self._stage(path, self.directory / STAGES_DIRECTORY / stage_name) as staged_path,
+                        self._use_cache_file(self.directory / f"{stage_name}{CACHE_EXTENSION}") as work_path,
+                    ):
+                        yield staged_path, work_path
+                finally:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+                return
+
+        logger.info(f"All the PMD cache stages of {path} are in use, it is inspected without the cache")
+        yield None
+
+    @staticmethod
+    @contextmanager
+    def _stage(path: Path, stage_directory: Path) -> Iterator[Path]:
+        """Yield the staged path: the copy of the Java files of the path in the stage directory."""
+        shutil.rmtree(stage_directory, ignore_errors=True)
+        stage_directory.mkdir(parents=True)
+
+        if path.is_file():
+            staged_path = stage_directory / path.name
+            shutil.copyfile(path, staged_path)
+        else:
+            staged_path = stage_directory
+            extension = get_language_extension(Language.JAVA).value
+            for file_path in path.rglob(f"*{extension}"):
+                staged_file_path = staged_path / file_path.relative_to(path)
+                staged_file_path.parent.mkdir(parents=True, exist_ok=True)
+                shutil.copyfile(file_path, staged_file_path)
+
+        try:
+            yield staged_path
+        finally:
+            shutil.rmtree(stage_directory, ignore_errors=True)
+
+    @contextmanager
+    def _use_cache_file(self, cache_path: Path) -> Iterator[Path]:
+        """Yield the path of a private copy of the cache file. After PMD finishes, the copy replaces the cache file.
+
+        If PMD fails, the copy is removed and the cache file is not changed.
+        """
+        file_descriptor, work_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        os.close(file_descriptor)
+        work_path = Path(work_path)
+
+        try:
+            shutil.copyfile(cache_path, work_path)
+            # The modification time is used to find the least recently used cache files
+            os.utime(cache_path)
+        except FileNotFoundError:
+            # PMD creates a new cache, and it fails to read an empty file
+            work_path.unlink()
+
+        try:
+            yield work_path
+        except BaseException:
+            work_path.unlink(missing_ok=True)
+            raise
+
+        if work_path.exists():
+            work_path.replace(cache_path)
+            self._evict()
+
+    def _evict(self) -> None:
+        with file_lock(self.directory / LOCK_FILE):
+            cache_files = []
+            for cache_path in self.directory.glob(f"*{CACHE_EXTENSION}"):
+                try:
+                    stat = cache_path.stat()
+                except FileNotFoundError:
+                    continue
+                cache_files.append((stat.st_mtime, stat.st_size, cache_path))
+
+            size = sum(file_size for _, file_size, _ in cache_files)
+            if size <= self.max_size:
+                return
+
+            target_size = self.max_size * EVICTION_TARGET
+            for _, file_size, cache_path in sorted(cache_files):
+                if size <= target_size:
+                    break
+
+                cache_path.unlink(missing_ok=True)
+                size -= file_size
+
+            logger.info(f"The PMD cache is cleaned up to {size} bytes")
+
+
+def get_pmd_analysis_cache() -> PMDAnalysisCache | None:
+    """Get the cache from the environment variables or None if the cache is not set up.
+
+    ``PMD_CACHE_DIRECTORY`` is the directory of the cache, ``PMD_CACHE_SIZE`` is its maximum size in megabytes.
+    """
+    directory = os.environ.get(PMD_CACHE_DIRECTORY_ENV)
+    if not directory:
+        return None
+
+    size = os.environ.get(PMD_CACHE_SIZE_ENV)
+    try:
+        max_size = DEFAULT_PMD_CACHE_SIZE if size is None else int(size) * MEGABYTE
+    except ValueError:
+        logger.warning(f"{PMD_CACHE_SIZE_ENV} is not a number: {size}. The default size is used.")
+        max_size = DEFAULT_PMD_CACHE_SIZE
+
+    return PMDAnalysisCache(Path(directory), max_size)
@@ -1,19 +1,34 @@
 from __future__ import annotations
 
 import csv
+import dataclasses
 import logging
 import os
+from contextlib import nullcontext
 from pathlib import Path
 from typing import Any
 
 from hyperstyle.src.python.review.common.file_system import check_set_up_env_variable, new_temp_dir
+from hyperstyle.src.python.review.common.language import Language
 from hyperstyle.src.python.review.common.language_version import LanguageVersion
 from hyperstyle.src.python.review.common.subprocess_runner import run_in_subprocess
+from hyperstyle.src.python.review.inspectors.common.cds import (
+    build_cds_archive,
+    CdsWarmupResult,
+    create_cds_command,
+    JvmTool,
+)
+from hyperstyle.src.python.review.inspectors.common.in_memory_workspace import inspect_in_workspace
 from hyperstyle.src.python.review.inspectors.common.inspector.base_inspector import BaseInspector
 from hyperstyle.src.python.review.inspectors.common.inspector.inspector_type import InspectorType
-from hyperstyle.src.python.review.inspectors.common.issue.base_issue_converter import convert_base_issue
-from hyperstyle.src.python.review.inspectors.common.issue.issue import BaseIssue, IssueDifficulty, IssueType
-from hyperstyle.src.python.review.inspectors.common.issue.issue_configs import IssueConfigsHandler
+from hyperstyle.src.python.review.inspectors.common.issue.issue import BaseIssue, IssueType
+from hyperstyle.src.python.review.inspectors.common.issue.issue_registry import IssueRegistry
+from hyperstyle.src.python.review.inspectors.common.jvm_sidecar.jvm_sidecar import run_in_jvm_sidecar
+from hyperstyle.src.python.review.inspectors.common.utils import get_env_version
+from hyperstyle.src.python.review.inspectors.pmd.analysis_cache import (
+    get_pmd_analysis_cache,
+    get_task_fingerprint,
+)
 from hyperstyle.src.python.review.inspectors.pmd.issue_configs import ISSUE_CONFIGS
 from hyperstyle.src.python.review.inspectors.pmd.issue_types import PMD_RULE_TO_ISSUE_TYPE
 from hyperstyle.src.python.review.reviewers.exceptions import InspectionError
@@ -27,37 +42,43 @@ PATH_TOOLS_PMD_FILES = Path(__file__).parent / "files"
 PATH_TOOLS_PMD_RULES_SET = PATH_TOOLS_PMD_FILES / "config.xml"
 DEFAULT_JAVA_VERSION = LanguageVersion.JAVA_11
 
+PMD_MAIN_CLASS = "net.sourceforge.pmd.PMD"
+
 
 class PMDInspector(BaseInspector):
     inspector_type = InspectorType.PMD
+    config_files = (PATH_TOOLS_PMD_RULES_SET,)
     has_access = False
 
-    # We don't support in-memory inspection for PMD yet
     @classmethod
-    def inspect_in_memory(cls, code: str, config: dict[str, Any]) -> list[BaseIssue]:
-        raise NotImplementedError
+    def get_version(cls) -> str:
+        return get_env_version(PMD_VERSION_ENV)
+
+    def inspect_in_memory(self, code: str, config: dict[str, Any]) -> list[BaseIssue]:
+        return inspect_in_workspace(self.inspect, code, config, Language.JAVA)
+
+    @classmethod
+    def _get_pmd_directory(cls) -> Path:
+        return Path(os.environ[PMD_DIRECTORY_ENV]) / f"pmd-bin-{os.environ[PMD_VERSION_ENV]}"
 
-    def _create_command(
-        self, path: Path, output_path: Path, language_version: LanguageVersion, n_cpu: int
+    @classmethod
+    def get_jvm_tool(cls) -> JvmTool:
+        classpath = tuple(sorted((cls._get_pmd_directory() / "lib").glob("*.jar")))
+        return JvmTool("pmd", cls.get_version(), PMD_MAIN_CLASS, classpath)
+
+    def _create_arguments(
+        self, path: Path, output_path: Path, java_version: str, n_cpu: int, cache_path: Path | None
     ) -> list[str]:
-        path_tools_pmd_shell = Path(
-            f"{os.environ[PMD_DIRECTORY_ENV]}/pmd-bin-{os.environ[PMD_VERSION_ENV]}/bin/run.sh"
-        )
-        if not self.has_access:
-            path_tools_pmd_shell.chmod(0o777)
-            self.has_access = True
         return [
-            str(path_tools_pmd_shell),
-            "pmd",
             "-d",
             str(path),
-            "-no-cache",
+            *(["-no-cache"] if cache_path is None else ["-cache", str(cache_path)]),
             "-R",
             str(PATH_TOOLS_PMD_RULES_SET),
             "-language",
             "java",
             "-version",
-            self._get_java_version(language_version),
+            java_version,
             "-f",
             "csv",
             "-r",
@@ -66,24 +87,62 @@ class PMDInspector(BaseInspector):
             str(n_cpu),
         ]
 
+    def _create_command(self, arguments: list[str]) -> list[str]:
+        cds_command = create_cds_command(self.get_jvm_tool(), arguments)
+        if cds_command is not None:
+            return cds_command
+
+        path_tools_pmd_shell = self._get_pmd_directory() / "bin" / "run.sh"
+        if not self.has_access:
+            path_tools_pmd_shell.chmod(0o777)
+            self.has_access = True
+        return [str(path_tools_pmd_shell), "pmd", *arguments]
+
     def inspect(self, path: Path, config: dict[str, Any]) -> list[BaseIssue]:
         if not (check_set_up_env_variable(PMD_DIRECTORY_ENV) and check_set_up_env_variable(PMD_VERSION_ENV)):
             msg = "PMD is not set up"
             raise InspectionError(msg)
 
-        with new_temp_dir() as temp_dir:
+        language_version = config.get("language_version")
+        if language_version is None:
+            logger.info(
+                f"The version of Java is not passed. The version to be used is: {DEFAULT_JAVA_VERSION.value}.",
+            )
+            language_version = DEFAULT_JAVA_VERSION
+        java_version = self._get_java_version(language_version)
+
+        # Without the managed cache PMD reanalyzes all files on each run
+        analysis_cache = get_pmd_analysis_cache()
+        cache_context = (
+            nullcontext()
+            if analysis_cache is None
+            else analysis_cache.use(
+                path,
+                analysis_cache.get_cache_key(
+                    get_task_fingerprint(path), PATH_TOOLS_PMD_RULES_SET, self.get_version(), java_version
+                ),
+            )
+        )
+
+        with new_temp_dir() as temp_dir, cache_context as cache_run:
+            inspected_path, cache_path = (path, None) if cache_run is None else cache_run
             output_path = Path(temp_dir / "out.csv")
+            arguments = self._create_arguments(
+                inspected_path, output_path, java_version, config["n_cpu"], cache_path
+            )
+            tool = self.get_jvm_tool()
+            if not run_in_jvm_sidecar(tool.main_class, list(tool.classpath), arguments):
+                run_in_subprocess(self._create_command(arguments))
+            issues = self.parse_output(output_path)
 
-            language_version = config.get("language_version")
-            if language_version is None:
-                logger.info(
-                    f"The version of Java is not passed. The version to be used is: {DEFAULT_JAVA_VERSION.value}.",
-                )
-                language_version = DEFAULT_JAVA_VERSION
+        return [_relocate_issue(issue, inspected_path, path) for issue in issues]
 
-            command = self._create_command(path, output_path, language_version, config["n_cpu"])
-            run_in_subprocess(command)
-            return self.parse_output(output_path)
+    def warm_up(self, sample_path: Path, output_path: Path) -> CdsWarmupResult:
+        """Build the AppCDS archive of PMD by running it on the sample."""
+        arguments = self._create_arguments(
+            sample_path, output_path, self._get_java_version(DEFAULT_JAVA_VERSION), n_cpu=1, cache_path=None
+        )
+        return build_cds_archive(self.get_jvm_tool(), arguments)
 
     def parse_output(self, output_path: Path) -> list[BaseIssue]:
         """Parses the PMD output, which is a csv file, and returns a list of the issues found there.
@@ -95,27 +154,26 @@ class PMDInspector(BaseInspector):
             msg = f"{self.inspector_type.value}: error - no output file"
             raise InspectionError(msg)
 
-        issue_configs_handler = IssueConfigsHandler(*ISSUE_CONFIGS)
         with output_path.open(encoding="utf-8") as out_file:
             reader = csv.DictReader(out_file)
 
             issues = []
             for row in reader:
                 origin_class = row["Rule"]
-                issue_type = self.choose_issue_type(origin_class)
+                classification = ISSUE_REGISTRY.classify(origin_class)
 
                 base_issue = BaseIssue(
                     origin_class=origin_class,
-                    type=issue_type,
+                    type=classification.issue_type,
                     description=row["Description"],
                     file_path=Path(row["File"]),
                     line_no=int(row["Line"]),
                     column_no=1,
                     inspector_type=self.inspector_type,
-                    difficulty=IssueDifficulty.get_by_issue_type(issue_type),
+                    difficulty=classification.difficulty,
                 )
 
-                issue = convert_base_issue(base_issue, issue_configs_handler)
+                issue = ISSUE_REGISTRY.convert(base_issue)
                 if issue is None:
                     logger.error(
                         f"{self.inspector_type.value}: an error occurred during converting base issue."
@@ -151,3 +209,20 @@ class PMDInspector(BaseInspector):
             java_version = DEFAULT_JAVA_VERSION.value
 
         return java_version.removeprefix("java")
+
+
+def _relocate_issue(issue: BaseIssue, staged_path: Path, path: Path) -> BaseIssue:
+    """Move the issue found in the staged copy of the path (see ``PMDAnalysisCache.use``) to the path."""
+    if staged_path == path:
+        return issue
+
+    if issue.file_path == staged_path:
+        return dataclasses.replace(issue, file_path=path)
+
+    try:
+        return dataclasses.replace(issue, file_path=path / issue.file_path.relative_to(staged_path))
+    except ValueError:
+        return issue
+
+
+ISSUE_REGISTRY = IssueRegistry(PMDInspector.choose_issue_type, ISSUE_CONFIGS)
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import ast
+import itertools
+import logging
+import os
+from dataclasses import dataclass, field
+from enum import Enum, unique
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from hyperstyle.src.python.review.inspectors.common.issue.issue import BaseIssue
+
+logger = logging.getLogger(__name__)
+
+PYTHON_METRICS_BACKEND_ENV = "PYTHON_METRICS_BACKEND"
+
+BOUND_METHOD_ARGUMENT_NAME = "self"
+
+
+@unique
+class PythonMetricsBackend(Enum):
+    """The way to compute the cyclomatic complexity, the cohesion and the maintainability index of the Python code.
+
+    ``NATIVE`` computes them during the traversal of the tree by the Python AST inspector, and the result is shared
+    by Flake8, Radon and the Python AST inspector, ``LINTERS`` gets them from the mccabe and cohesion plugins
+    of Flake8 and from the ``radon mi`` command.
+    """
+
+    NATIVE = "native"
+    LINTERS = "linters"
+
+    @classmethod
+    def values(cls) -> list[str]:
+        return [member.value for member in cls]
+
+
+DEFAULT_PYTHON_METRICS_BACKEND = PythonMetricsBackend.NATIVE
+
+
+def get_python_metrics_backend() -> PythonMetricsBackend:
+    """Get the backend from the environment variable, so it can be selected per deployment."""
+    value = os.environ.get(PYTHON_METRICS_BACKEND_ENV)
+    if value is None:
+        return DEFAULT_PYTHON_METRICS_BACKEND
+
+    try:
+        return PythonMetricsBackend(value.strip().lower())
+    except ValueError:
+        logger.warning(
+            f"{PYTHON_METRICS_BACKEND_ENV} has an unknown value {value}. "
+            f"Available values: {', '.join(PythonMetricsBackend.values())}. "
+            f"The {DEFAULT_PYTHON_METRICS_BACKEND.value} backend is used.",
+        )
+        return DEFAULT_PYTHON_METRICS_BACKEND
+
+
+@dataclass(frozen=True)
+class FunctionComplexity:
+    """The cyclomatic complexity of a function or of a compound statement outside of the functions."""
+
+    line_no: int
+    col_offset: int
+    complexity: int
+
+
+@dataclass(frozen=True)
+class ClassCohesion:
+    """The percentage of the class variables used by an average method of the class."""
+
+    line_no: int
+    col_offset: int
+    percentage: float
+
+
+@dataclass(frozen=True)
+class PythonMetrics:
+    """The metrics of the Python code.
+
+    ``issues`` are the issues of the Python AST inspector. The maintainability index is ``None``
+    if the code can't be parsed or if it was not requested.
+    """
+
+    issues: tuple[BaseIssue, ...]
+    complexities: tuple[FunctionComplexity, ...] = ()
+    cohesions: tuple[ClassCohesion, ...] = ()
+    maintainability_index: float | None = None
+
+
+class PathGraph:
+    """The control flow graph of mccabe, which keeps only the number of the outgoing edges of each node.
+
+    As in mccabe, connecting to a node drops its outgoing edges, and the nodes are created on the first connection.
+    """
+
+    def __init__(self, line_no: int, col_offset: int) -> None:
+        self.line_no = line_no
+        self.col_offset = col_offset
+        self._node_ids = itertools.count(1)
+        self._n_outgoing_edges: dict[int | None, int] = {}
+
+    def create_node(self) -> int:
+        return next(self._node_ids)
+
+    def connect(self, source: int | None, destination: int) -> None:
+        self._n_outgoing_edges[source] = self._n_outgoing_edges.get(source, 0) + 1
+        self._n_outgoing_edges[destination] = 0
+
+    def complexity(self) -> int:
+        return sum(self._n_outgoing_edges.values()) - len(self._n_outgoing_edges) + 2
+
+
+_NAME_FIELDS = {
+    ast.Name: "id",
+    ast.Attribute: "attr",
+    ast.Call: "func",
+    ast.FunctionDef: "name",
+    ast.ClassDef: "name",
+    ast.Subscript: "value",
+    ast.arg: "arg",
+}
+
+
+def get_object_name(node: ast.AST) -> str | None:
+    """Get the name of the node as the cohesion plugin does or ``None`` if the plugin fails on it."""
+    name: ast.AST | str = node
+    while not isinstance(name, str):
+        name_field = _NAME_FIELDS.get(type(name))
+        if name_field is None:
+            return None
+        name = getattr(name, name_field)
+
+    return name
+
+
+@dataclass
+class CohesionScope:
+    """The instance variables and the names of the called functions in a class or in a method."""
+
+    attributes: set[str] = field(default_factory=set)
+    call_names: set[str] = field(default_factory=set)
+    # The cohesion plugin fails on the calls of the unnamed objects, e.g. lambdas
+    is_measurable: bool = True
+
+    def get_instance_variables(self) -> set[str]:
+        return self.attributes - self.call_names
+
+
+@dataclass
+class ClassCohesionScope(CohesionScope):
+    node: ast.ClassDef | None = None
+    class_variables: set[str] = field(default_factory=set)
+    methods: dict[str, CohesionScope] = field(default_factory=dict)
+
+    def get_cohesion(self) -> ClassCohesion:
+        """Compute the cohesion with the same formula and rounding as the cohesion plugin."""
+        n_method_variables = sum(len(method.get_instance_variables()) for method in self.methods.values())
+        n_class_variables = len(self.class_variables | self.get_instance_variables()) * len(self.methods)
+
+        percentage = 0.0
+        if n_class_variables != 0:
+            percentage = round((n_method_variables / n_class_variables) * 100, 2)
+
+        return ClassCohesion(self.node.lineno, self.node.col_offset, percentage)
@@ -1,47 +1,176 @@
 from __future__ import annotations
 
 import ast
-from collections import Counter, defaultdict
+import fnmatch
+import functools
+import logging
+from concurrent import futures
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
 from typing import Any, TYPE_CHECKING
 
+from radon.metrics import h_visit_ast, mi_compute
+from radon.raw import analyze
+from radon.visitors import ComplexityVisitor
+
 from hyperstyle.src.python.review.common import language
 from hyperstyle.src.python.review.common.file_system import get_all_file_system_items
 from hyperstyle.src.python.review.common.language import Language
+from hyperstyle.src.python.review.common.process_pool import can_have_worker_processes, INSPECTOR_PROCESS_POOL
+from hyperstyle.src.python.review.common.single_flight import SingleFlight
+from hyperstyle.src.python.review.common.subprocess_runner import get_remaining_wall_time
 from hyperstyle.src.python.review.inspectors.common.inspector.base_inspector import BaseInspector
 from hyperstyle.src.python.review.inspectors.common.inspector.inspector_type import InspectorType
 from hyperstyle.src.python.review.inspectors.common.issue.issue import (
     BaseIssue,
     BoolExprLenIssue,
     FuncLenIssue,
-    IssueDifficulty,
     IssueType,
 )
+from hyperstyle.src.python.review.inspectors.common.issue.issue_registry import IssueRegistry
 from hyperstyle.src.python.review.inspectors.common.issue.tips import get_bool_expr_len_tip, get_func_len_tip
+from hyperstyle.src.python.review.inspectors.pyast.metrics import (
+    BOUND_METHOD_ARGUMENT_NAME,
+    ClassCohesion,
+    ClassCohesionScope,
+    CohesionScope,
+    FunctionComplexity,
+    get_object_name,
+    get_python_metrics_backend,
+    PathGraph,
+    PythonMetrics,
+    PythonMetricsBackend,
+)
+from hyperstyle.src.python.review.reviewers.exceptions import InspectorTimeoutError
 
 if TYPE_CHECKING:
-    from pathlib import Path
+    from collections.abc import Iterable, Iterator
+
+logger = logging.getLogger(__name__)
 
 BOOL_EXPR_LEN_ORIGIN_CLASS = "C001"
 FUNC_LEN_ORIGIN_CLASS = "C002"
 
+# The files of a directory are inspected in the worker processes if there are at least this number of them
+MIN_FILES_TO_INSPECT_IN_PARALLEL = 100
+
+# The number of files sent to a worker process at once
+FILES_CHUNK_SIZE = 32
+
+# The statements that mccabe builds the graphs of, all other statements are the simple nodes of the graphs
+CONTROL_FLOW_STATEMENTS = frozenset(
+    {
+        ast.FunctionDef,
+        ast.AsyncFunctionDef,
+        ast.ClassDef,
+        ast.If,
+        ast.For,
+        ast.AsyncFor,
+        ast.While,
+        ast.Try,
+        ast.With,
+        ast.AsyncWith,
+    },
+)
+
+# The same thresholds as the options of Flake8 with the linters backend: ``--max-complexity 0 --cohesion-below 100``
+MAX_UNREPORTED_COMPLEXITY = 0
+MAX_REPORTED_COHESION = 100
+
+# The number of the recently inspected pieces of code whose metrics are kept for the other inspectors
+PYTHON_METRICS_CACHE_SIZE = 128
+
+
+class PythonAstMetricsGatherer(ast.NodeVisitor):
+    """Gathers the metrics of the Python code in one traversal of the tree.
+
+    The length of a boolean expression is the number of its boolean operators including the nested expressions,
+    which are not reported separately. The length of a function is the number of lines after its definition line
+    up to its last line. The functions nested in other functions are not reported.
+
+    The cyclomatic complexity is computed from the control flow graphs built in the same way as mccabe does,
+    and the cohesion of the classes is computed in the same way as the cohesion plugin of Flake8 does.
+    """
 
-class BoolExpressionLensGatherer(ast.NodeVisitor):
     def __init__(self, file_path: Path, inspector_type: InspectorType) -> None:
         self._inspector_type = inspector_type
         self._file_path = file_path
+        # The number of the boolean operators of the outermost boolean expression that is being visited
+        self._bool_expr_len: int | None = None
+        self._function_depth = 0
         self.bool_expression_lens: list[BoolExprLenIssue] = []
+        self.function_lens: list[FuncLenIssue] = []
+
+        self._root: ast.AST | None = None
+        # The graph that is being built and its last node
+        self._graph: PathGraph | None = None
+        self._tail: int | None = None
+        self._class_name = ""
+        self._graphs: dict[str, PathGraph] = {}
+        # mccabe doesn't look into the simple statements (e.g. ``match``) and into the ``finally`` blocks
+        self._follows_control_flow = True
+
+        self._classes: list[ClassCohesionScope] = []
+        self._method_scopes: dict[ast.FunctionDef, CohesionScope] = {}
+        # The classes and the methods that are being visited
+        self._cohesion_scopes: list[CohesionScope] = []
+
+    @property
+    def complexities(self) -> list[FunctionComplexity]:
+        """The complexities of the functions and of the compound statements outside of them, as mccabe reports them."""
+        complexities = []
+        for graph in self._graphs.values():
+            complexity = graph.complexity()
+            if complexity > MAX_UNREPORTED_COMPLEXITY:
+                complexities.append(FunctionComplexity(graph.line_no, graph.col_offset, complexity))
+
+        return complexities
+
+    @property
+    def cohesions(self) -> list[ClassCohesion]:
+        """The cohesions of the classes, as the cohesion plugin reports them.
+
+        The plugin walks the tree breadth-first, and a class replaces the previous class with the same name.
+        The classes the plugin fails on are skipped.
+        """
+        classes = self._classes
+        if self._root is not None and len({scope.node.name for scope in classes}) < len(classes):
+            walk_order = {
+                node: index
+                for index, node in enumerate(
+                    node for node in ast.walk(self._root) if isinstance(node, ast.ClassDef)
+                )
+            }
+            classes = sorted(classes, key=lambda scope: walk_order[scope.node])
+
+        name_to_class = {scope.node.name: scope for scope in classes}
+
+        cohesions = []
+        for scope in name_to_class.values():
+            if not scope.is_measurable:
+                continue
+
+            cohesion = scope.get_cohesion()
+            if cohesion.percentage <= MAX_REPORTED_COHESION:
+                cohesions.append(cohesion)
 
-    def visit(self, node: ast.AST) -> None:
-        if not isinstance(node, ast.BoolOp):
-            super().visit(node)
+        return cohesions
+
+    def visit_Module(self, node: ast.Module) -> None:  # noqa: N802
+        self._root = node
+        self._visit_statements(node.body)
+
+    def visit_BoolOp(self, node: ast.BoolOp) -> None:  # noqa: N802
+        if self._bool_expr_len is not None:
+            self._bool_expr_len += len(node.values) - 1
+            self.generic_visit(node)
             return
 
-        length = 0
-        for inner_node in ast.walk(node):
-            if isinstance(inner_node, ast.BoolOp):
-                length += len(inner_node.values) - 1
+        self._bool_expr_len = len(node.values) - 1
+        self.generic_visit(node)
+        length, self._bool_expr_len = self._bool_expr_len, None
 
-        issue_type = PythonAstInspector.choose_issue_type(BOOL_EXPR_LEN_ORIGIN_CLASS)
+        classification = ISSUE_REGISTRY.classify(BOOL_EXPR_LEN_ORIGIN_CLASS)
 
         self.bool_expression_lens.append(
             BoolExprLenIssue(
@@ -52,118 +181,297 @@ class BoolExpressionLensGatherer(ast.NodeVisitor):
                 origin_class=BOOL_EXPR_LEN_ORIGIN_CLASS,
                 inspector_type=self._inspector_type,
                 bool_expr_len=length,
-                type=issue_type,
-                difficulty=IssueDifficulty.get_by_issue_type(issue_type),
+                type=classification.issue_type,
+                difficulty=classification.difficulty,
             )
         )
 
+    def visit_FunctionDef(self, node: ast.FunctionDef | ast.AsyncFunctionDef) -> None:  # noqa: N802
+        if self._function_depth == 0:
+            func_length = node.end_lineno - node.lineno
 
-class FunctionLensGatherer(ast.NodeVisitor):
-    def __init__(self, content: str, file_path: Path, inspector_type: InspectorType) -> None:
-        self._inspector_type = inspector_type
-        self._file_path = file_path
-        self._content = content
-        self._line_no_to_sym_no_map = create_line_no_to_sym_no_map(content)
-        self._n_lines = Counter(content)["\n"] + 1
-        self._previous_node: ast.AST | None = None
-        self._function_lens: list[FuncLenIssue] = []
-
-    def visit(self, node: ast.AST) -> None:
-        if isinstance(self._previous_node, ast.FunctionDef | ast.AsyncFunctionDef):
-            func_length = self._find_func_len(
-                self._previous_node.lineno,
-                node.lineno,
-            )
+            classification = ISSUE_REGISTRY.classify(FUNC_LEN_ORIGIN_CLASS)
 
-            issue_type = PythonAstInspector.choose_issue_type(FUNC_LEN_ORIGIN_CLASS)
-
-            self._function_lens.append(
+            self.function_lens.append(
                 FuncLenIssue(
                     file_path=self._file_path,
-                    line_no=self._previous_node.lineno,
-                    column_no=self._previous_node.col_offset,
+                    line_no=node.lineno,
+                    column_no=node.col_offset,
                     description=get_func_len_tip().format(func_length),
                     origin_class=FUNC_LEN_ORIGIN_CLASS,
                     inspector_type=self._inspector_type,
                     func_len=func_length,
-                    type=issue_type,
-                    difficulty=IssueDifficulty.get_by_issue_type(issue_type),
+                    type=classification.issue_type,
+                    difficulty=classification.difficulty,
                 )
             )
 
-        self._previous_node = node
-        if not isinstance(node, ast.FunctionDef | ast.AsyncFunctionDef):
-            super().visit(node)
-
-    @property
-    def function_lens(self) -> list[FuncLenIssue]:
-        if isinstance(self._previous_node, ast.FunctionDef | ast.AsyncFunctionDef):
-            func_length = self._find_func_len(
-                self._previous_node.lineno,
-                self._n_lines + 1,
-            )
-
-            issue_type = PythonAstInspector.choose_issue_type(FUNC_LEN_ORIGIN_CLASS)
+        method_scope = self._method_scopes.pop(node, None)
+        if method_scope is not None:
+            self._cohesion_scopes.append(method_scope)
+
+        self._function_depth += 1
+        self.visit(node.args)
+        self._visit_function_body(node)
+        for decorator in node.decorator_list:
+            self.visit(decorator)
+        if node.returns is not None:
+            self.visit(node.returns)
+        self._function_depth -= 1
+
+        if method_scope is not None:
+            self._cohesion_scopes.pop()
+
+    visit_AsyncFunctionDef = visit_FunctionDef  # noqa: N815
+
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:  # noqa: N802
+        self._cohesion_scopes.append(self._create_class_scope(node))
+
+        for child in (*node.bases, *node.keywords):
+            self.visit(child)
+
+        class_name, self._class_name = self._class_name, f"{self._class_name}{node.name}."
+        self._visit_statements(node.body)
+        self._class_name = class_name
+
+        for decorator in node.decorator_list:
+            self.visit(decorator)
+
+        self._cohesion_scopes.pop()
+
+    def visit_If(self, node: ast.If) -> None:  # noqa: N802
+        self.visit(node.test)
+        self._visit_branches(node, f"If {node.lineno}", [node.body])
+
+    def visit_For(self, node: ast.For | ast.AsyncFor) -> None:  # noqa: N802
+        self.visit(node.target)
+        self.visit(node.iter)
+        self._visit_branches(node, f"Loop {node.lineno}", [node.body])
+
+    visit_AsyncFor = visit_For  # noqa: N815
+
+    def visit_While(self, node: ast.While) -> None:  # noqa: N802
+        self.visit(node.test)
+        self._visit_branches(node, f"Loop {node.lineno}", [node.body])
+
+    def visit_Try(self, node: ast.Try) -> None:  # noqa: N802
+        self._visit_branches(node, f"TryExcept {node.lineno}", [node.body, *node.handlers])
+        self._visit_outside_control_flow(node.finalbody)
+
+    def visit_With(self, node: ast.With | ast.AsyncWith) -> None:  # noqa: N802
+        for item in node.items:
+            self.visit(item)
+
+        # The statement is a node of the graph, but it doesn't get its own graph outside of the functions
+        self._append_path_node()
+        self._visit_statements(node.body)
+
+    visit_AsyncWith = visit_With  # noqa: N815
+
+    def visit_Attribute(self, node: ast.Attribute) -> None:  # noqa: N802
+        if (
+            self._cohesion_scopes
+            and isinstance(node.value, ast.Name)
+            and node.value.id == BOUND_METHOD_ARGUMENT_NAME
+        ):
+            for scope in self._cohesion_scopes:
+                scope.attributes.add(node.attr)
+
+        self.generic_visit(node)
+
+    def visit_Call(self, node: ast.Call) -> None:  # noqa: N802
+        if self._cohesion_scopes:
+            name = get_object_name(node)
+            for scope in self._cohesion_scopes:
+                if name is None:
+                    scope.is_measurable = False
+                else:
+                    scope.call_names.add(name)
+
+        self.generic_visit(node)
+
+    def _visit_statements(self, statements: list[ast.stmt]) -> None:
+        for statement in statements:
+            if not self._follows_control_flow or type(statement) in CONTROL_FLOW_STATEMENTS:
+                self.visit(statement)
+                continue
+
+            # A simple statement is a node of the graph
+            self._append_path_node()
+            self._visit_outside_control_flow([statement])
+
+    def _visit_outside_control_flow(self, nodes: list[ast.AST]) -> None:
+        follows_control_flow, self._follows_control_flow = self._follows_control_flow, False
+        for node in nodes:
+            self.visit(node)
+        self._follows_control_flow = follows_control_flow
+
+    def _visit_block(self, block: list[ast.stmt] | ast.ExceptHandler) -> None:
+        if isinstance(block, ast.ExceptHandler):
+            if block.type is not None:
+                self.visit(block.type)
+            block = block.body
+
+        self._visit_statements(block)
+
+    def _visit_function_body(self, node: ast.FunctionDef | ast.AsyncFunctionDef) -> None:
+        if not self._follows_control_flow:
+            self._visit_statements(node.body)
+            return
 
-            self._function_lens.append(
-                FuncLenIssue(
-                    file_path=self._file_path,
-                    line_no=self._previous_node.lineno,
-                    column_no=self._previous_node.col_offset,
-                    description=get_func_len_tip().format(func_length),
-                    origin_class=FUNC_LEN_ORIGIN_CLASS,
-                    inspector_type=self._inspector_type,
-                    func_len=func_length,
-                    type=issue_type,
-                    difficulty=IssueDifficulty.get_by_issue_type(issue_type),
-                )
-            )
+        if self._graph is None:
+            self._graph = PathGraph(node.lineno, node.col_offset)
+            self._tail = self._graph.create_node()
+            self._visit_statements(node.body)
+            self._graphs[f"{self._class_name}{node.name}"] = self._graph
+            self._graph, self._tail = None, None
+            return
 
-        self._previous_node = None
-        return self._function_lens
+        # A nested function is a branch of the graph of the outer function
+        path_node = self._append_path_node()
+        self._tail = path_node
+        self._visit_statements(node.body)
+        bottom = self._graph.create_node()
+        self._graph.connect(self._tail, bottom)
+        self._graph.connect(path_node, bottom)
+        self._tail = bottom
+
+    def _visit_branches(
+        self,
+        node: ast.If | ast.For | ast.AsyncFor | ast.While | ast.Try,
+        name: str,
+        blocks: list[list[ast.stmt] | ast.ExceptHandler],
+    ) -> None:
+        """Visit the blocks and the ``else`` block of the compound statement, which are the branches of its subgraph."""
+        if not self._follows_control_flow:
+            for block in blocks:
+                self._visit_block(block)
+            self._visit_statements(node.orelse)
+            return
 
-    def _find_func_len(self, start_line_no: int, end_line_no: int) -> int:
-        func_body = self._content[
-            self._line_no_to_sym_no_map[start_line_no] : self._line_no_to_sym_no_map[end_line_no]
-        ]
-        func_body = func_body.strip()
+        if self._graph is not None:
+            self._visit_subgraph(self._append_path_node(), blocks, node.orelse)
+            return
 
-        return Counter(func_body)["\n"]
+        # A compound statement outside of the functions gets its own graph
+        self._graph = PathGraph(node.lineno, node.col_offset)
+        self._visit_subgraph(self._graph.create_node(), blocks, node.orelse)
+        self._graphs[f"{self._class_name}{name}"] = self._graph
+        self._graph, self._tail = None, None
+
+    def _visit_subgraph(
+        self, path_node: int | None, blocks: list[list[ast.stmt] | ast.ExceptHandler], orelse: list[ast.stmt]
+    ) -> None:
+        loose_ends = []
+        for block in blocks:
+            self._tail = path_node
+            self._visit_block(block)
+            loose_ends.append(self._tail)
+
+        if orelse:
+            self._tail = path_node
+            self._visit_statements(orelse)
+            loose_ends.append(self._tail)
+        else:
+            loose_ends.append(path_node)
+
+        if path_node is not None:
+            bottom = self._graph.create_node()
+            for loose_end in loose_ends:
+                self._graph.connect(loose_end, bottom)
+            self._tail = bottom
+
+    def _append_path_node(self) -> int | None:
+        if not self._follows_control_flow or self._tail is None:
+            return None
+
+        path_node = self._graph.create_node()
+        self._graph.connect(self._tail, path_node)
+        self._tail = path_node
+        return path_node
+
+    def _create_class_scope(self, node: ast.ClassDef) -> ClassCohesionScope:
+        class_scope = ClassCohesionScope(node=node)
+        for statement in node.body:
+            if isinstance(statement, ast.Assign):
+                for target in statement.targets:
+                    name = get_object_name(target)
+                    if name is None:
+                        class_scope.is_measurable = False
+                    else:
+                        class_scope.class_variables.add(name)
+
+            elif isinstance(statement, ast.FunctionDef):
+                if any(get_object_name(decorator) is None for decorator in statement.decorator_list):
+                    class_scope.is_measurable = False
+
+                method_scope = CohesionScope()
+                class_scope.methods[statement.name] = method_scope
+                self._method_scopes[statement] = method_scope
+
+        self._classes.append(class_scope)
+        return class_scope
 
 
 class PythonAstInspector(BaseInspector):
     inspector_type = InspectorType.PYTHON_AST
+    is_file_local = True
+
+    @classmethod
+    def is_cpu_bound(cls) -> bool:
+        return True
 
-    # We don't support in-memory inspection for PythonAst yet
     @classmethod
     def inspect_in_memory(cls, code: str, config: dict[str, Any]) -> list[BaseIssue]:
-        raise NotImplementedError
+        return cls._inspect_code(code, Path())
 
     @classmethod
     def inspect(cls, path: Path, config: dict[str, Any]) -> list[BaseIssue]:
+        """Inspect the Python files of the path.
+
+        The files of a big directory are inspected by a pool of ``n_cpu`` worker processes, which is reused
+        by the next inspections. A file that can't be parsed has no issues, its errors are reported by Pylint and Flake8.
+        """
         path_to_files = [path] if path.is_file() else get_all_file_system_items(path)
 
         path_to_files = language.filter_paths_by_language(path_to_files, Language.PYTHON)
 
+        n_cpu = config.get("n_cpu", 1)
+        if (
+            n_cpu <= 1
+            or len(path_to_files) < MIN_FILES_TO_INSPECT_IN_PARALLEL
+            or not can_have_worker_processes()
+        ):
+            return cls._inspect_files(path_to_files)
+
+        return list(_inspect_files_in_parallel(path_to_files, n_cpu))
+
+    @classmethod
+    def _inspect_files(cls, path_to_files: list[Path], *, share_metrics: bool = True) -> list[BaseIssue]:
         metrics = []
         for path_to_file in path_to_files:
-            file_content = path_to_file.read_text()
-            tree = ast.parse(file_content, path_to_file.name)
+            try:
+                code = path_to_file.read_text()
+            except UnicodeDecodeError:
+                logger.debug(f"{path_to_file} can't be decoded, it is not inspected")
+                continue
 
-            bool_gatherer = BoolExpressionLensGatherer(path_to_file, cls.inspector_type)
-            bool_gatherer.visit(tree)
-            metrics.extend(
-                bool_gatherer.bool_expression_lens,
-            )
-
-            func_gatherer = FunctionLensGatherer(file_content, path_to_file, cls.inspector_type)
-            func_gatherer.visit(tree)
-            metrics.extend(
-                func_gatherer.function_lens,
-            )
+            metrics.extend(cls._inspect_code(code, path_to_file, share_metrics=share_metrics))
 
         return metrics
 
+    @classmethod
+    def _inspect_code(cls, code: str, file_path: Path, *, share_metrics: bool = True) -> list[BaseIssue]:
+        """Inspect the code.
+
+        With the native metrics backend, the metrics of the code are kept for Flake8 and Radon,
+        unless they can't get them (e.g. in the worker processes).
+        """
+        if share_metrics and get_python_metrics_backend() == PythonMetricsBackend.NATIVE:
+            return list(get_python_metrics(code, file_path).issues)
+
+        return list(gather_python_metrics(code, file_path, with_maintainability_index=False).issues)
+
     @staticmethod
     def choose_issue_type(code: str) -> IssueType:
         if code == BOOL_EXPR_LEN_ORIGIN_CLASS:
@@ -175,12 +483,119 @@ class PythonAstInspector(BaseInspector):
         return IssueType.BEST_PRACTICES
 
 
-def create_line_no_to_sym_no_map(content: str) -> dict[int, int]:
-    mapping = defaultdict(lambda: len(content), {1: 0})
-    line_no = 2
-    for sym_no, sym in enumerate(content):
-        if sym == "\n":
-            mapping[line_no] = sym_no + 1
-            line_no += 1
+ISSUE_REGISTRY = IssueRegistry(PythonAstInspector.choose_issue_type)
+
 
-    return mapping
+def gather_python_metrics(
+    code: str, file_path: Path, *, with_maintainability_index: bool = True
+) -> PythonMetrics:
+    """Gather the metrics of the code in one traversal of its tree.
+
+    The maintainability index is computed from the same tree with the Halstead volume, the complexity
+    and the raw metrics of radon, so it is the same as the one shown by the ``radon mi`` command.
+    """
+    try:
+        tree = ast.parse(code, file_path.name)
+    except (SyntaxError, ValueError):
+        # The syntax errors are reported by Pylint and Flake8
+        return PythonMetrics(issues=())
+
+    gatherer = PythonAstMetricsGatherer(file_path, PythonAstInspector.inspector_type)
+    gatherer.visit(tree)
+
+    return PythonMetrics(
+        issues=(*gatherer.bool_expression_lens, *gatherer.function_lens),
+        complexities=tuple(gatherer.complexities),
+        cohesions=tuple(gatherer.cohesions),
+        maintainability_index=_compute_maintainability_index(code, tree)
+        if with_maintainability_index
+        else None,
+    )
+
+
+def _compute_maintainability_index(code: str, tree: ast.Module) -> float | None:
+    try:
+        raw_metrics = analyze(code)
+    except SyntaxError:
+        return None
+
+    # The multiline strings are counted as comments, as the command does by default
+    comment_lines = raw_metrics.comments + raw_metrics.multi
+    comments = comment_lines / float(raw_metrics.sloc) * 100 if raw_metrics.sloc != 0 else 0
+    maintainability_index = mi_compute(
+        h_visit_ast(tree).total.volume,
+        ComplexityVisitor.from_ast(tree).total_complexity,
+        raw_metrics.lloc,
+        comments,
+    )
+
+    # The command shows the index rounded to two decimals
+    return round(maintainability_index, 2)
+
+
+_python_metrics_flight: SingleFlight[PythonMetrics] = SingleFlight()
+
+
+@functools.lru_cache(maxsize=PYTHON_METRICS_CACHE_SIZE)
+def get_python_metrics(code: str, file_path: Path) -> PythonMetrics:
+    """Get the metrics of the code, which are gathered once for all the inspectors that review it.
+
+    The inspectors of a review are run at the same time, so the concurrent calls for the same code are coalesced.
+    """
+    metrics, _ = _python_metrics_flight.do((code, file_path), lambda: gather_python_metrics(code, file_path))
+    return metrics
+
+
+def get_python_file_paths(path: Path, excluded_patterns: Iterable[str] = ()) -> list[Path]:
+    """Get the path itself if it is a file, otherwise the Python files of the directory.
+
+    The files with a file or a directory name that matches one of the patterns are skipped.
+    """
+    if path.is_file():
+        return [path]
+
+    return [
+        file_path
+        for file_path in language.filter_paths_by_language(get_all_file_system_items(path), Language.PYTHON)
+        if not any(
+            fnmatch.fnmatch(part, pattern)
+            for part in file_path.relative_to(path).parts
+            for pattern in excluded_patterns
+        )
+    ]
+
+
+def _inspect_files_in_parallel(path_to_files: list[Path], n_cpu: int) -> Iterator[BaseIssue]:
+    """Inspect the files in the worker processes in chunks and yield the issues of each chunk in the file order.
+
+    The deadline of the inspector limits (see ``ApplicationConfig.inspector_limits``) applies to the whole inspection.
+    If a worker dies, the pool is recreated by the next inspection, and the rest of the files are inspected here.
+
+    Yields:
+        The issues of the files in the order of the files.
+    """
+    process_pool = INSPECTOR_PROCESS_POOL.get(n_cpu)
+    chunks = [
+        path_to_files[start : start + FILES_CHUNK_SIZE]
+        for start in range(0, len(path_to_files), FILES_CHUNK_SIZE)
+    ]
+    n_inspected_chunks = 0
+    try:
+        # The metrics gathered in the worker processes can't be shared with the other inspectors
+        for issues in process_pool.map(
+            functools.partial(PythonAstInspector._inspect_files, share_metrics=False),
+            chunks,
+            timeout=get_remaining_wall_time(),
+        ):
+            yield from issues
+            n_inspected_chunks += 1
+    except futures.TimeoutError as error:
+        msg = "The Python files were not inspected in time"
+        raise InspectorTimeoutError(msg) from error
+    except BrokenProcessPool:
+        logger.warning(
+            "The worker process of the Python AST inspector died, the files are inspected sequentially"
+        )
+        INSPECTOR_PROCESS_POOL.reset(process_pool)
+        for chunk in chunks[n_inspected_chunks:]:
+            yield from PythonAstInspector._inspect_files(chunk)
@@ -1,47 +1,158 @@
 from __future__ import annotations
 
+import functools
 import logging
 import re
 import sys
+import threading
 from pathlib import Path
-from typing import Any
+from typing import Any, TYPE_CHECKING
+
+from astroid import MANAGER
+from pylint.__pkginfo__ import numversion
+from pylint.lint import PyLinter
+from pylint.lint.utils import fix_import_path
+from pylint.reporters import BaseReporter
 
 from hyperstyle.src.python.review.common.subprocess_runner import run_in_subprocess
 from hyperstyle.src.python.review.inspectors.common.inspector.base_inspector import BaseInspector
+from hyperstyle.src.python.review.inspectors.common.inspector.inspector_backend import (
+    get_python_linter_backend,
+    InspectorBackend,
+)
 from hyperstyle.src.python.review.inspectors.common.inspector.inspector_type import InspectorType
-from hyperstyle.src.python.review.inspectors.common.issue.base_issue_converter import convert_base_issue
-from hyperstyle.src.python.review.inspectors.common.issue.issue import BaseIssue, IssueDifficulty, IssueType
-from hyperstyle.src.python.review.inspectors.common.issue.issue_configs import IssueConfigsHandler
+from hyperstyle.src.python.review.inspectors.common.issue.issue import BaseIssue, IssueType
+from hyperstyle.src.python.review.inspectors.common.issue.issue_registry import IssueRegistry
+from hyperstyle.src.python.review.inspectors.common.utils import get_package_versions
 from hyperstyle.src.python.review.inspectors.pylint.issue_configs import ISSUE_CONFIGS
 from hyperstyle.src.python.review.inspectors.pylint.issue_types import (
     CATEGORY_TO_ISSUE_TYPE,
     CODE_TO_ISSUE_TYPE,
 )
 
+if TYPE_CHECKING:
+    from pylint.message import Message
+
+
 logger = logging.getLogger(__name__)
 
 MSG_TEMPLATE = "{abspath}:{line}:{column}:{msg_id}:{msg}"
 PATH_PYLINT_CONFIG = Path(__file__).parent / "pylintrc"
 
+# Pylint needs a file name to lint the code from stdin
+IN_MEMORY_FILE_NAME = "main.py"
+
+# The major version of pylint whose private methods are used to lint the code in memory
+IN_MEMORY_PYLINT_MAJOR_VERSION = 2
+
 FATAL_CATEGORY = "F"
 INFO_CATEGORY = "I"
 
+ROW_RE = re.compile(r"^(.*):(\d+):(\d+):([IRCWEF]\d+):(.*)$", re.MULTILINE)
+
+PYLINT_BACKEND_ENV = "PYLINT_BACKEND"
+DEFAULT_PYLINT_BACKEND = InspectorBackend.IN_PROCESS
+
+PLUGINS = ["pylint_django"]
+
+OPTIONS = [
+    # TODO: ask about django settings via an cli argument?
+    "--disable=django-not-configured",
+    "--recursive=true",
+]
+
 BASE_COMMAND = [
     sys.executable,
     "-m",
     "pylint",
     "--load-plugins",
-    "pylint_django",
-    # TODO: ask about django settings via an cli argument?
-    "--disable=django-not-configured",
+    ",".join(PLUGINS),
     f"--rcfile={PATH_PYLINT_CONFIG}",
     f"--msg-template={MSG_TEMPLATE}",
-    "--recursive=true",
+    *OPTIONS,
 ]
 
 
+class IssueReporter(BaseReporter):
+    """Pylint reporter that converts the messages into issues as soon as pylint emits them."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.issues: list[BaseIssue] = []
+        self.has_fatal_error = False
+
+    def handle_message(self, msg: Message) -> None:
+        if self.has_fatal_error or msg.C == INFO_CATEGORY:
+            return
+
+        if msg.C == FATAL_CATEGORY:
+            logger.error("pylint encountered fatal error")
+            self.has_fatal_error = True
+            return
+
+        base_issue = PylintInspector.create_base_issue(
+            origin_class=msg.msg_id,
+            description=msg.msg,
+            file_path=Path(msg.abspath),
+            line_no=msg.line,
+            column_no=msg.column + 1,
+        )
+        if base_issue is None:
+            return
+
+        issue = PylintInspector.convert_to_issue(base_issue)
+        if issue is not None:
+            self.issues.append(issue)
+
+    def _display(self, layout: Any) -> None:
+        pass
+
+
+@functools.cache
+def _get_linter() -> PyLinter:
+    """Create the linter once per process: the same steps as ``pylint.lint.Run`` does, but without linting."""
+    linter = PyLinter(pylintrc=str(PATH_PYLINT_CONFIG))
+    linter.load_default_plugins()
+    linter.load_plugin_modules(PLUGINS)
+    linter.disable(INFO_CATEGORY)
+    linter.read_config_file()
+    linter.load_config_file()
+    linter.load_command_line_configuration(OPTIONS)
+    linter.load_plugin_configuration()
+    return linter
+
+
+# The linter is stateful, so only one inspection can be run at the same time
+_linter_lock = threading.Lock()
+
+
+def _forget_checked_modules(path: Path) -> None:
+    """Remove the checked modules from the astroid cache.
+
+    The cache is kept between the reviews to avoid building the standard library and third-party modules again,
+    but the checked files may be changed before the next review.
+    """
+    for module_name, module in list(MANAGER.astroid_cache.items()):
+        if module.file is not None and Path(module.file).is_relative_to(path):
+            del MANAGER.astroid_cache[module_name]
+
+
+def _can_check_code_in_process() -> bool:
+    """Check if the linter of the current process can get the code directly.
+
+    The code is passed through the private methods of ``PyLinter``, which pylint 3 changed,
+    so with other major versions the code is linted in a subprocess.
+    """
+    return (
+        numversion[0] == IN_MEMORY_PYLINT_MAJOR_VERSION
+        and hasattr(PyLinter, "_check_files")
+        and hasattr(PyLinter, "_get_file_descr_from_stdin")
+    )
+
+
 class PylintInspector(BaseInspector):
     inspector_type = InspectorType.PYLINT
+    config_files = (PATH_PYLINT_CONFIG,)
 
     supported_issue_types = (
         IssueType.CODE_STYLE,
@@ -49,23 +160,73 @@ class PylintInspector(BaseInspector):
         IssueType.ERROR_PRONE,
     )
 
+    @classmethod
+    def get_version(cls) -> str:
+        return get_package_versions("pylint", "astroid", "pylint-django")
+
+    @classmethod
+    def is_cpu_bound(cls) -> bool:
+        return (
+            get_python_linter_backend(PYLINT_BACKEND_ENV, DEFAULT_PYLINT_BACKEND)
+            == InspectorBackend.IN_PROCESS
+        )
+
     @classmethod
     def inspect_in_memory(cls, code: str, config: dict[str, Any]) -> list[BaseIssue]:
-        output = run_in_subprocess([*BASE_COMMAND, "--from-stdin"], subprocess_input=code)
+        if (
+            get_python_linter_backend(PYLINT_BACKEND_ENV, DEFAULT_PYLINT_BACKEND)
+            == InspectorBackend.IN_PROCESS
+            and _can_check_code_in_process()
+        ):
+            return cls._inspect_in_process(Path(IN_MEMORY_FILE_NAME), code)
+
+        output = run_in_subprocess(
+            [*BASE_COMMAND, "--from-stdin", IN_MEMORY_FILE_NAME],
+            subprocess_input=code,
+        )
         return cls.parse(output)
 
     @classmethod
     def inspect(cls, path: Path, config: dict[str, Any]) -> list[BaseIssue]:
+        if (
+            get_python_linter_backend(PYLINT_BACKEND_ENV, DEFAULT_PYLINT_BACKEND)
+            == InspectorBackend.IN_PROCESS
+        ):
+            return cls._inspect_in_process(path)
+
         output = run_in_subprocess([*BASE_COMMAND, str(path)])
         return cls.parse(output)
 
     @classmethod
-    def parse(cls, output: str) -> list[BaseIssue]:
-        row_re = re.compile(r"^(.*):(\d+):(\d+):([IRCWEF]\d+):(.*)$", re.MULTILINE)
-        issue_configs_handler = IssueConfigsHandler(*ISSUE_CONFIGS)
+    def _inspect_in_process(cls, path: Path, code: str | None = None) -> list[BaseIssue]:
+        reporter = IssueReporter()
+
+        with _linter_lock:
+            linter = _get_linter()
+            linter.set_reporter(reporter)
+
+            try:
+                if code is None:
+                    linter.check([str(path)])
+                else:
+                    # The same as "pylint --from-stdin", but the code is taken from the argument
+                    linter.initialize()
+                    with fix_import_path([str(path)]):
+                        linter._check_files(
+                            functools.partial(linter.get_ast, data=code),
+                            [linter._get_file_descr_from_stdin(str(path))],
+                        )
+            finally:
+                # The module of the code is cached by its path as well, so the next code with the same path
+                # is not linted against it
+                _forget_checked_modules(path.absolute())
 
+        return reporter.issues
+
+    @classmethod
+    def parse(cls, output: str) -> list[BaseIssue]:
         issues = []
-        for groups in row_re.findall(output):
+        for groups in ROW_RE.findall(output):
             if groups[1] == INFO_CATEGORY:
                 continue
 
@@ -73,32 +234,56 @@ class PylintInspector(BaseInspector):
                 logger.error("pylint encountered fatal error")
                 return issues
 
-            origin_class = groups[3]
-            issue_type = cls.choose_issue_type(origin_class)
-            if issue_type not in cls.supported_issue_types:
-                logger.error("pylint: unsupported issue type %s", issue_type.__name__)
-                continue
-
-            base_issue = BaseIssue(
-                origin_class=origin_class,
-                type=issue_type,
+            base_issue = cls.create_base_issue(
+                origin_class=groups[3],
                 description=groups[4],
                 file_path=Path(groups[0]),
                 line_no=int(groups[1]),
                 column_no=int(groups[2]) + 1,
-                inspector_type=cls.inspector_type,
-                difficulty=IssueDifficulty.get_by_issue_type(issue_type),
             )
-
-            issue = convert_base_issue(base_issue, issue_configs_handler)
-            if issue is None:
-                logger.error(f"{cls.inspector_type.value}: an error occurred during converting a base issue.")
+            if base_issue is None:
                 continue
 
-            issues.append(issue)
+            issue = cls.convert_to_issue(base_issue)
+            if issue is not None:
+                issues.append(issue)
 
         return issues
 
+    @classmethod
+    def create_base_issue(
+        cls,
+        origin_class: str,
+        description: str,
+        file_path: Path,
+        line_no: int,
+        column_no: int,
+    ) -> BaseIssue | None:
+        classification = ISSUE_REGISTRY.classify(origin_class)
+        issue_type = classification.issue_type
+        if issue_type not in cls.supported_issue_types:
+            logger.error("pylint: unsupported issue type %s", issue_type.__name__)
+            return None
+
+        return BaseIssue(
+            origin_class=origin_class,
+            type=issue_type,
+            description=description,
+            file_path=file_path,
+            line_no=line_no,
+            column_no=column_no,
+            inspector_type=cls.inspector_type,
+            difficulty=classification.difficulty,
+        )
+
+    @classmethod
+    def convert_to_issue(cls, base_issue: BaseIssue) -> BaseIssue | None:
+        issue = ISSUE_REGISTRY.convert(base_issue)
+        if issue is None:
+            logger.error(f"{cls.inspector_type.value}: an error occurred during converting a base issue.")
+
+        return issue
+
     @staticmethod
     def choose_issue_type(code: str) -> IssueType:
         if code in CODE_TO_ISSUE_TYPE:
@@ -110,3 +295,7 @@ class PylintInspector(BaseInspector):
             return IssueType.BEST_PRACTICES
 
         return issue_type
+
+
+# The issue types are chosen only once per message id
+ISSUE_REGISTRY = IssueRegistry(PylintInspector.choose_issue_type, ISSUE_CONFIGS)
@@ -5,32 +5,70 @@ import sys
 from pathlib import Path
 from typing import Any
 
+from radon.metrics import mi_visit
+
 from hyperstyle.src.python.review.common.subprocess_runner import run_in_subprocess
 from hyperstyle.src.python.review.inspectors.common.inspector.base_inspector import BaseInspector
 from hyperstyle.src.python.review.inspectors.common.inspector.inspector_type import InspectorType
 from hyperstyle.src.python.review.inspectors.common.issue.issue import (
     BaseIssue,
     IssueData,
-    IssueDifficulty,
     IssueType,
     MaintainabilityLackIssue,
 )
+from hyperstyle.src.python.review.inspectors.common.issue.issue_registry import IssueRegistry
 from hyperstyle.src.python.review.inspectors.common.issue.tips import get_maintainability_index_tip
-from hyperstyle.src.python.review.inspectors.common.utils import convert_percentage_of_value_to_lack_of_value
+from hyperstyle.src.python.review.inspectors.common.utils import (
+    convert_percentage_of_value_to_lack_of_value,
+    get_package_versions,
+)
+from hyperstyle.src.python.review.inspectors.pyast.metrics import (
+    get_python_metrics_backend,
+    PythonMetricsBackend,
+)
+from hyperstyle.src.python.review.inspectors.pyast.python_ast import get_python_file_paths, get_python_metrics
 
 MAINTAINABILITY_ORIGIN_CLASS = "RAD100"
 
+MI_ROW_RE = re.compile(r"^(.*) - \w \((.*)\)$", re.MULTILINE)
+
+# The 'mi' command skips the hidden files and directories
+EXCLUDED_PATTERNS = (".*",)
+
 
 class RadonInspector(BaseInspector):
     inspector_type = InspectorType.RADON
+    is_file_local = True
+
+    @classmethod
+    def get_version(cls) -> str:
+        return f"{get_package_versions('radon')}, metrics={get_python_metrics_backend().value}"
+
+    @classmethod
+    def is_cpu_bound(cls) -> bool:
+        return get_python_metrics_backend() == PythonMetricsBackend.NATIVE
 
-    # We don't support in-memory inspection for Radon yet
     @classmethod
     def inspect_in_memory(cls, code: str, config: dict[str, Any]) -> list[BaseIssue]:
-        raise NotImplementedError
+        if get_python_metrics_backend() == PythonMetricsBackend.NATIVE:
+            return cls._create_maintainability_issues(
+                get_python_metrics(code, Path()).maintainability_index, Path()
+            )
+
+        # The same computation as in the 'mi' command, which skips the files with syntax errors
+        try:
+            maintainability_index = mi_visit(code, multi=True)
+        except SyntaxError:
+            return []
+
+        # The command shows the index rounded to two decimals
+        return [cls._create_maintainability_issue(Path(), round(maintainability_index, 2))]
 
     @classmethod
     def inspect(cls, path: Path, config: dict[str, Any]) -> list[BaseIssue]:
+        if get_python_metrics_backend() == PythonMetricsBackend.NATIVE:
+            return cls._inspect_metrics(path)
+
         mi_command = [
             sys.executable,
             "-m",
@@ -45,6 +83,35 @@ class RadonInspector(BaseInspector):
         mi_output = run_in_subprocess(mi_command)
         return cls.mi_parse(mi_output)
 
+    @classmethod
+    def _inspect_metrics(cls, path: Path) -> list[BaseIssue]:
+        """Create the issues from the maintainability index of the Python files that the 'mi' command analyzes."""
+        issues = []
+        for file_path in get_python_file_paths(path, EXCLUDED_PATTERNS):
+            try:
+                code = file_path.read_text()
+            except (OSError, UnicodeDecodeError):
+                # The command skips the files it can't read
+                continue
+
+            issues.extend(
+                cls._create_maintainability_issues(
+                    get_python_metrics(code, file_path).maintainability_index, file_path
+                )
+            )
+
+        return issues
+
+    @classmethod
+    def _create_maintainability_issues(
+        cls, maintainability_index: float | None, file_path: Path
+    ) -> list[BaseIssue]:
+        # The index is missing if the code can't be parsed
+        if maintainability_index is None:
+            return []
+
+        return [cls._create_maintainability_issue(file_path, maintainability_index)]
+
     @classmethod
     def mi_parse(cls, mi_output: str) -> list[BaseIssue]:
         """Parses the results of the 'mi' command.
@@ -54,28 +121,28 @@ class RadonInspector(BaseInspector):
         :param mi_output: 'mi' command output.
         :return: list of issues.
         """
-        row_re = re.compile(r"^(.*) - \w \((.*)\)$", re.MULTILINE)
+        return [
+            cls._create_maintainability_issue(Path(groups[0]), float(groups[1]))
+            for groups in MI_ROW_RE.findall(mi_output)
+        ]
 
-        issues: list[BaseIssue] = []
-        for groups in row_re.findall(mi_output):
-            file_path = Path(groups[0])
-            maintainability_lack = convert_percentage_of_value_to_lack_of_value(float(groups[1]))
+    @classmethod
+    def _create_maintainability_issue(cls, file_path: Path, maintainability_index: float) -> BaseIssue:
+        maintainability_lack = convert_percentage_of_value_to_lack_of_value(maintainability_index)
 
-            issue_type = cls.choose_issue_type(MAINTAINABILITY_ORIGIN_CLASS)
+        classification = ISSUE_REGISTRY.classify(MAINTAINABILITY_ORIGIN_CLASS)
 
-            issue_data = IssueData.get_base_issue_data_dict(
-                file_path,
-                cls.inspector_type,
-                origin_class=MAINTAINABILITY_ORIGIN_CLASS,
-            )
-            issue_data[IssueData.DESCRIPTION.value] = get_maintainability_index_tip()
-            issue_data[IssueData.MAINTAINABILITY_LACK.value] = maintainability_lack
-            issue_data[IssueData.ISSUE_TYPE.value] = issue_type
-            issue_data[IssueData.DIFFICULTY.value] = IssueDifficulty.get_by_issue_type(issue_type)
+        issue_data = IssueData.get_base_issue_data_dict(
+            file_path,
+            cls.inspector_type,
+            origin_class=MAINTAINABILITY_ORIGIN_CLASS,
+        )
+        issue_data[IssueData.DESCRIPTION.value] = get_maintainability_index_tip()
+        issue_data[IssueData.MAINTAINABILITY_LACK.value] = maintainability_lack
+        issue_data[IssueData.ISSUE_TYPE.value] = classification.issue_type
+        issue_data[IssueData.DIFFICULTY.value] = classification.difficulty
 
-            issues.append(MaintainabilityLackIssue(**issue_data))
-
-        return issues
+        return MaintainabilityLackIssue(**issue_data)
 
     @staticmethod
     def choose_issue_type(code: str) -> IssueType:
@@ -83,3 +150,6 @@ class RadonInspector(BaseInspector):
             return IssueType.MAINTAINABILITY
 
         return IssueType.BEST_PRACTICES
+
+
+ISSUE_REGISTRY = IssueRegistry(RadonInspector.choose_issue_type)
@@ -0,0 +1,305 @@
+from __future__ import annotations
+
+import dataclasses
+import functools
+import itertools
+import json
+import logging
+import multiprocessing
+import queue
+from collections import defaultdict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, TYPE_CHECKING
+
+from hyperstyle.src.python.review.common.file_system import new_temp_dir
+from hyperstyle.src.python.review.common.language import Language
+from hyperstyle.src.python.review.common.parallel_runner import use_packed_issues
+from hyperstyle.src.python.review.reviewers.perform_review import (
+    perform_code_review_as_json,
+    perform_review_as_json,
+)
+from hyperstyle.src.python.review.reviewers.utils.submission_packing import (
+    get_packed_inspectors,
+    get_submission_language,
+    inspect_pack,
+    write_submission,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+    from hyperstyle.src.python.review.application_config import ApplicationConfig
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_IN_FLIGHT = 100
+
+
+@dataclass(frozen=True)
+class BatchItem:
+    """A submission of a batch review.
+
+    Exactly one of ``path`` and ``code`` must be specified. The code is reviewed as a single file,
+    so the language must be specified for it. The language and the history override the ones of the batch config.
+    """
+
+    id: str
+    path: Path | None = None
+    code: str | None = None
+    language: Language | None = None
+    history: str | None = None
+
+    @classmethod
+    def from_json_dict(cls, data: dict[str, Any]) -> BatchItem:
+        """Create an item from a JSON dictionary with ``id``, ``path`` or ``code``, ``language`` and ``history``.
+
+        :raises ValueError: If the dictionary is not a correct item.
+        """
+        if data.get("id") is None:
+            msg = "The id must be specified."
+            raise ValueError(msg)
+
+        path = data.get("path")
+        code = data.get("code")
+        if (path is None) == (code is None):
+            msg = "Exactly one of 'path' and 'code' must be specified."
+            raise ValueError(msg)
+
+        language = None
+        if data.get("language") is not None:
+            language = Language(data["language"].upper())
+
+        if code is not None and language is None:
+            msg = "The language must be specified for the inline code."
+            raise ValueError(msg)
+
+        history = data.get("history")
+        if history is not None and not isinstance(history, str):
+            history = json.dumps(history)
+
+        return cls(
+            id=str(data["id"]),
+            path=Path(path).absolute() if path is not None else None,
+            code=code,
+            language=language,
+            history=history,
+        )
+
+
+@dataclass(frozen=True)
+class BatchResult:
+    """The result of a batch item: the same JSON as the ``review`` command prints or the error message."""
+
+    id: str | None
+    review: dict[str, object] | None = None
+    error: str | None = None
+
+    def to_json_dict(self) -> dict[str, object]:
+        if self.error is not None:
+            return {"id": self.id, "error": self.error}
+
+        return {"id": self.id, "review": self.review}
+
+
+def _review_item(item: BatchItem, config: ApplicationConfig) -> BatchResult:
+    config = dataclasses.replace(
+        config,
+        language=item.language if item.language is not None else config.language,
+        history=item.history if item.history is not None else config.history,
+    )
+
+    try:
+        if item.code is None:
+            review = perform_review_as_json(item.path, config)
+        else:
+            review = perform_code_review_as_json(item.code, config)
+    except Exception as error:
+        logger.exception(f"The review of the item {item.id} failed")
+        return BatchResult(item.id, error=f"{type(error).__name__}: {error}")
+
+    return BatchResult(item.id, review=review)
+
+
+def _review_pack(items: list[BatchItem], config: ApplicationConfig) -> list[BatchResult]:
+    """Review the items and return their results in the same order.
+
+    The single-file submissions of each language are packed into one directory, so each file-local inspector
+    is run once over the whole pack instead of once per submission. Its issues are split back by the submissions,
+    and the other inspectors are run on each submission as usual.
+    """
+    if len(items) == 1:
+        return [_review_item(items[0], config)]
+
+    results: list[BatchResult | None] = [None] * len(items)
+    language_to_indices = defaultdict(list)
+    for index, item in enumerate(items):
+        language = get_submission_language(item.path, item.language)
+        if get_packed_inspectors(language, config):
+            language_to_indices[language].append(index)
+
+    with new_temp_dir() as pack_directory:
+        for language, indices in language_to_indices.items():
+            if len(indices) > 1:
+                _review_language_pack(
+                    items, indices, language, pack_directory, config=config, results=results
+                )
+
+    return [
+        _review_item(item, config) if result is None else result
+        for item, result in zip(items, results, strict=True)
+    ]
+
+
+def _review_language_pack(  # noqa: PLR0913
+    items: list[BatchItem],
+    indices: list[int],
+    language: Language,
+    pack_directory: Path,
+    *,
+    config: ApplicationConfig,
+    results: list[BatchResult | None],
+) -> None:
+    language_directory = pack_directory / language.value.lower()
+    index_to_packed_item = {}
+    for index in indices:
+        item = items[index]
+        try:
+            file_path = write_submission(item.path, item.code, language, language_directory / str(index))
+        except OSError as error:
+            # The submission is reviewed separately and gets its own error
+            logger.warning(f"The item {item.id} is not packed: {error}")
+            continue
+
+        index_to_packed_item[index] = dataclasses.replace(item, path=file_path, code=None, language=language)
+
+    packed_issues = inspect_pack(
+        language_directory,
+        [packed_item.path for packed_item in index_to_packed_item.values()],
+        config,
+        language,
+    )
+    with use_packed_issues(packed_issues):
+        for index, packed_item in index_to_packed_item.items():
+            results[index] = _review_item(packed_item, config)
+
+
+def _put_results(results: queue.SimpleQueue, pack_results: list[BatchResult]) -> None:
+    for result in pack_results:
+        results.put(result)
+
+
+def _on_worker_error(results: queue.SimpleQueue, item_ids: list[str], error: BaseException) -> None:
+    for item_id in item_ids:
+        results.put(BatchResult(item_id, error=f"{type(error).__name__}: {error}"))
+
+
+def _split_into_packs(items: Iterable[BatchItem], pack_size: int) -> Iterator[list[BatchItem]]:
+    iterator = iter(items)
+    while pack := list(itertools.islice(iterator, pack_size)):
+        yield pack
+
+
+def perform_review_batch(
+    items: Iterable[BatchItem],
+    config: ApplicationConfig,
+    workers: int = 1,
+    max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+    pack_size: int = 1,
+) -> Iterator[BatchResult]:
+    """Review the items and yield their results in the order of completion.
+
+    With one worker, the items are reviewed one by one in the current process. Otherwise, they are reviewed
+    by a pool of worker processes, which keep the imported inspectors and the linter state between the items.
+    The items are taken from the iterable lazily: at most ``max_in_flight`` items (rounded up to a whole pack)
+    are submitted and not yet yielded, so the memory does not grow with the size of the batch.
+
+    With ``pack_size`` greater than one, the items are reviewed in packs of this size (see ``_review_pack``),
+    so a linter that accepts many files is run once per pack rather than once per item.
+
+    A failed item does not stop the batch: its result contains the error.
+
+    Yields:
+        The result of each item as soon as it is reviewed.
+    """
+    packs = _split_into_packs(items, pack_size)
+    if workers <= 1:
+        for pack in packs:
+            yield from _review_pack(pack, config)
+        return
+
+    results: queue.SimpleQueue[BatchResult] = queue.SimpleQueue()
+    pool = multiprocessing.Pool(workers)
+    try:
+        in_flight = 0
+        for pack in packs:
+            while in_flight >= max_in_flight:
+                yield results.get()
+                in_flight -= 1
+
+            pool.apply_async(
+                _review_pack,
+                (pack, config),
+                callback=functools.partial(_put_results, results),
+                error_callback=functools.partial(_on_worker_error, results, [item.id for item in pack]),
+            )
+            in_flight += len(pack)
+
+        for _ in range(in_flight):
+            yield results.get()
+    finally:
+        pool.terminate()
+        pool.join()
+
+
+def _print_result(result: BatchResult) -> None:
+    print(json.dumps(result.to_json_dict()), flush=True)
+
+
+def _read_batch_items(input_path: Path, invalid_items: list[BatchResult]) -> Iterator[BatchItem]:
+    with input_path.open(encoding="utf-8") as input_file:
+        for line_number, line in enumerate(input_file, start=1):
+            if not line.strip():
+                continue
+
+            item = _parse_batch_item(line, line_number)
+            if isinstance(item, BatchItem):
+                yield item
+            else:
+                invalid_items.append(item)
+                _print_result(item)
+
+
+def _parse_batch_item(line: str, line_number: int) -> BatchItem | BatchResult:
+    data = None
+    try:
+        data = json.loads(line)
+        return BatchItem.from_json_dict(data)
+    except (AttributeError, TypeError, ValueError) as error:
+        item_id = str(data["id"]) if isinstance(data, dict) and data.get("id") is not None else None
+        return BatchResult(item_id, error=f"Incorrect item on line {line_number}: {error}")
+
+
+def perform_and_print_review_batch(
+    input_path: Path,
+    config: ApplicationConfig,
+    workers: int = 1,
+    max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+    pack_size: int = 1,
+) -> int:
+    """Review the items from the JSONL file and print their results as NDJSON in the order of completion.
+
+    Each line of the file is a JSON item (see ``BatchItem.from_json_dict``). Each output line contains the id
+    of the item and its review, which is the same JSON as the ``review`` command prints, or the error.
+
+    :return: The number of the items that were not reviewed.
+    """
+    invalid_items: list[BatchResult] = []
+    n_failed = 0
+    for result in perform_review_batch(
+        _read_batch_items(input_path, invalid_items), config, workers, max_in_flight, pack_size
+    ):
+        _print_result(result)
+        n_failed += result.error is not None
+
+    return n_failed + len(invalid_items)
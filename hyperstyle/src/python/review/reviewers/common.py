@@ -1,20 +1,27 @@
 from __future__ import annotations
 
+import dataclasses
+import hashlib
 import json
+import logging
 from collections import defaultdict
 from typing import TYPE_CHECKING
 
+from hyperstyle.src.python.review.common.file_system import get_content_hash
 from hyperstyle.src.python.review.common.language import Language
 from hyperstyle.src.python.review.common.parallel_runner import (
     inspect_in_parallel,
+    InspectionResult,
     run_inspector,
     run_inspector_in_memory,
 )
+from hyperstyle.src.python.review.common.single_flight import SingleFlight
 from hyperstyle.src.python.review.inspectors.checkstyle.checkstyle import CheckstyleInspector
 from hyperstyle.src.python.review.inspectors.common.inspector.base_inspector import (
     BaseIJInspector,
     BaseInspector,
 )
+from hyperstyle.src.python.review.inspectors.common.inspector.ij_pool import create_ij_server_pool
 from hyperstyle.src.python.review.inspectors.detekt.detekt import DetektInspector
 from hyperstyle.src.python.review.inspectors.eslint.eslint import ESLintInspector
 from hyperstyle.src.python.review.inspectors.flake8.flake8 import Flake8Inspector
@@ -31,22 +38,27 @@ from hyperstyle.src.python.review.quality.model import Quality
 from hyperstyle.src.python.review.quality.penalty import categorize, get_previous_issues_by_language, Punisher
 from hyperstyle.src.python.review.reviewers.review_result import FileReviewResult, GeneralReviewResult
 from hyperstyle.src.python.review.reviewers.utils.code_statistics import gather_code_statistics
+from hyperstyle.src.python.review.reviewers.utils.incremental_review import inspect_project_incrementally
 from hyperstyle.src.python.review.reviewers.utils.issues_filter import (
     filter_duplicate_issues,
     filter_low_measure_issues,
     group_issues_by_difficulty,
 )
 from hyperstyle.src.python.review.reviewers.utils.metadata_exploration import (
-    FileMetadata,
+    IN_MEMORY_FILE_PATH,
     InMemoryMetadata,
     Metadata,
     ProjectMetadata,
 )
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
     from hyperstyle.src.python.review.application_config import ApplicationConfig
     from hyperstyle.src.python.review.inspectors.common.issue.issue import BaseIssue
 
+logger = logging.getLogger(__name__)
+
 LANGUAGE_TO_INSPECTORS: dict[Language, list[BaseInspector]] = {
     Language.PYTHON: [
         PylintInspector(),
@@ -73,9 +85,7 @@ LANGUAGE_TO_INSPECTORS: dict[Language, list[BaseInspector]] = {
 }
 
 
-def _inspect_code(
-    metadata: Metadata, config: ApplicationConfig, language: Language
-) -> list[BaseIssue] | None:
+def _inspect_code(metadata: Metadata, config: ApplicationConfig, language: Language) -> InspectionResult:
     inspectors = LANGUAGE_TO_INSPECTORS[language]
     ij_inspectors = list(
         filter(
@@ -91,40 +101,115 @@ def _inspect_code(
     if ij_inspectors and connection_parameters is None:
         msg = f"Connection parameters for {language.value} inspectors are not provided"
         raise ValueError(msg)
-    for inspector in ij_inspectors:
-        inspector.setup_connection_parameters(connection_parameters["host"], connection_parameters["port"])
+    if ij_inspectors:
+        server_pool = create_ij_server_pool(connection_parameters)
+        for inspector in ij_inspectors:
+            inspector.setup_server_pool(server_pool)
 
     if isinstance(metadata, InMemoryMetadata):
         return inspect_in_parallel(run_inspector_in_memory, metadata.code, config, inspectors)
 
+    if isinstance(metadata, ProjectMetadata) and config.manifest_path is not None:
+        return inspect_project_incrementally(
+            metadata.path, metadata.language_to_files[language], config, inspectors
+        )
+
     return inspect_in_parallel(run_inspector, metadata.path, config, inspectors)
 
 
+# The concurrent reviews of the same code share one inspection
+_inspections: SingleFlight[tuple[InspectionResult, Path | None]] = SingleFlight()
+
+
+def _get_inspection_key(metadata: Metadata, config: ApplicationConfig, language: Language) -> str | None:
+    """Get the key of the code and of the options that change the inspection or None if it can't be shared.
+
+    The history and the grading options are not a part of the key, because they are applied after the inspection.
+    """
+    if isinstance(metadata, InMemoryMetadata):
+        content_hash = hashlib.sha256(metadata.code.encode()).hexdigest()
+    elif config.manifest_path is None:
+        content_hash = get_content_hash(metadata.path)
+    else:
+        # The incremental review updates the manifest of the project, so it is always run by itself
+        return None
+
+    language_version = config.inspectors_config.get("language_version")
+    key_data = {
+        "language": language.value,
+        "in_memory": isinstance(metadata, InMemoryMetadata),
+        "content": content_hash,
+        "disabled_inspectors": sorted(inspector_type.value for inspector_type in config.disabled_inspectors),
+        "language_version": None if language_version is None else language_version.value,
+        "n_cpu": config.inspectors_config.get("n_cpu"),
+        "ij_config": config.ij_config,
+        "inspector_limits": {
+            inspector_type.value: dataclasses.astuple(limits)
+            for inspector_type, limits in config.inspector_limits.items()
+        },
+    }
+    return hashlib.sha256(json.dumps(key_data, sort_keys=True).encode()).hexdigest()
+
+
+def _relocate_issue(issue: BaseIssue, from_path: Path | None, to_path: Path | None) -> BaseIssue:
+    if from_path is None or to_path is None or from_path == to_path:
+        return issue
+
+    try:
+        relative_path = issue.file_path.relative_to(from_path)
+    except ValueError:
+        return issue
+
+    return dataclasses.replace(issue, file_path=to_path / relative_path)
+
+
+def _inspect_code_once(metadata: Metadata, config: ApplicationConfig, language: Language) -> InspectionResult:
+    """Inspect the code or wait for the concurrent inspection of the same code with the same options.
+
+    The shared issues are moved to the path of this review, and each review applies its own penalty to them.
+    """
+    key = _get_inspection_key(metadata, config, language)
+    if key is None:
+        return _inspect_code(metadata, config, language)
+
+    base_path = None if isinstance(metadata, InMemoryMetadata) else metadata.path
+    (result, result_base_path), is_shared = _inspections.do(
+        key, lambda: (_inspect_code(metadata, config, language), base_path)
+    )
+    if not is_shared:
+        return result
+
+    logger.info(f"The inspection of {language.value} code is shared with a concurrent review")
+    return InspectionResult(
+        [_relocate_issue(issue, result_base_path, base_path) for issue in result.issues],
+        list(result.timed_out_inspectors),
+    )
+
+
 def perform_language_review(
     metadata: Metadata, config: ApplicationConfig, language: Language
 ) -> GeneralReviewResult:
-    issues = _inspect_code(metadata, config, language)
+    inspection_result = _inspect_code_once(metadata, config, language)
+    issues = inspection_result.issues
+    code = metadata.code if isinstance(metadata, InMemoryMetadata) else None
+    if code is not None:
+        issues = [dataclasses.replace(issue, file_path=IN_MEMORY_FILE_PATH) for issue in issues]
     if issues:
         issues = filter_low_measure_issues(issues, language)
 
         if not config.allow_duplicates:
             issues = filter_duplicate_issues(issues)
 
-    current_files = None
-    if isinstance(metadata, FileMetadata):
-        current_files = [metadata.path]
-        issues = filter_out_of_range_issues(issues, config.start_line, config.end_line)
-    elif isinstance(metadata, ProjectMetadata):
+    if isinstance(metadata, ProjectMetadata):
         current_files = metadata.language_to_files[language]
+    else:
+        current_files = [IN_MEMORY_FILE_PATH if code is not None else metadata.path]
+        issues = filter_out_of_range_issues(issues, config.start_line, config.end_line)
 
     file_path_to_issues = defaultdict(list)
     for issue in issues:
         file_path_to_issues[issue.file_path].append(issue)
 
-    if current_files is None:
-        files = file_path_to_issues.keys()
-        current_files = [] if len(files) == 0 else files
-
     previous_issues = get_previous_issues_by_language(config.history, language)
     categorize(previous_issues, issues)
 
@@ -142,7 +227,7 @@ def perform_language_review(
         file_issues_by_difficulty = group_issues_by_difficulty(file_issues)
 
         code_statistics_by_difficulty = {
-            difficulty: gather_code_statistics(file_issues, file)
+            difficulty: gather_code_statistics(file_issues, file, code)
             for difficulty, file_issues in file_issues_by_difficulty.items()
         }
 
@@ -176,6 +261,8 @@ def perform_language_review(
         general_punisher_by_difficulty,
         issues,
         file_review_results,
+        inspection_result.timed_out_inspectors,
+        code,
     )
 
 
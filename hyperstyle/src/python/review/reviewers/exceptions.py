@@ -9,5 +9,9 @@ class InspectionError(Exception):
     pass
 
 
+class InspectorTimeoutError(InspectionError):
+    pass
+
+
 class PathNotExistsError(Exception):
     pass
@@ -5,7 +5,8 @@ import logging
 from functools import partial
 from typing import Final, TYPE_CHECKING
 
-from hyperstyle.src.python.review.common.language import Language
+from hyperstyle.src.python.review.common.file_system import new_temp_dir
+from hyperstyle.src.python.review.common.language import get_language_extension, Language
 from hyperstyle.src.python.review.inspectors.common.issue.issue import IssueType
 from hyperstyle.src.python.review.reviewers.common import perform_language_review
 from hyperstyle.src.python.review.reviewers.exceptions import PathNotExistsError, UnsupportedLanguageError
@@ -19,6 +20,7 @@ from hyperstyle.src.python.review.reviewers.utils.metadata_exploration import (
     ProjectMetadata,
 )
 from hyperstyle.src.python.review.reviewers.utils.print_review import (
+    get_review_result_as_json,
     print_review_result_as_json,
     print_review_result_as_multi_file_json,
     print_review_result_as_text,
@@ -33,6 +35,11 @@ if TYPE_CHECKING:
 
 logger: Final = logging.getLogger(__name__)
 
+INLINE_CODE_FILE_NAME = "main"
+
+# The languages whose inspectors can all inspect the code in memory
+IN_MEMORY_LANGUAGES = {Language.PYTHON, Language.JAVA, Language.KOTLIN, Language.JS, Language.GO}
+
 language_to_reviewer: dict[Language, Callable[[Metadata, ApplicationConfig], GeneralReviewResult]] = {
     Language.PYTHON: perform_python_review,
     Language.JAVA: partial(perform_language_review, language=Language.JAVA),
@@ -59,9 +66,7 @@ class OutputFormat(enum.Enum):
 
 def perform_and_print_review(path: Path, output_format: OutputFormat, config: ApplicationConfig) -> int:
     review_result = perform_review(path, config)
-
-    for file_review_result in review_result.file_review_results:
-        file_review_result.file_path = file_review_result.file_path.relative_to(path)
+    make_file_paths_relative(review_result, path)
 
     if output_format == OutputFormat.JSON:
         if config.new_format:
@@ -75,6 +80,34 @@ def perform_and_print_review(path: Path, output_format: OutputFormat, config: Ap
     return len(list(filter(lambda issue: issue.type != IssueType.INFO, review_result.issues)))
 
 
+def perform_review_as_json(path: Path, config: ApplicationConfig) -> dict[str, object]:
+    """Perform the review and return the same JSON that is printed by ``perform_and_print_review``."""
+    review_result = perform_review(path, config)
+    make_file_paths_relative(review_result, path)
+    return get_review_result_as_json(review_result, config)
+
+
+def perform_code_review_as_json(code: str, config: ApplicationConfig) -> dict[str, object]:
+    """Review the code as a single file in the language of the config and return the same JSON as for a file.
+
+    The code in the languages whose inspectors can all inspect the code in memory is reviewed without any files.
+    """
+    if config.language in IN_MEMORY_LANGUAGES:
+        review_result = preform_review_in_memory(code, config.language, config)
+        return get_review_result_as_json(review_result, config)
+
+    extension = get_language_extension(config.language)
+    with new_temp_dir() as temp_dir:
+        file_path = temp_dir / f"{INLINE_CODE_FILE_NAME}{extension.value}"
+        file_path.write_text(code)
+        return perform_review_as_json(file_path, config)
+
+
+def make_file_paths_relative(review_result: GeneralReviewResult, path: Path) -> None:
+    for file_review_result in review_result.file_review_results:
+        file_review_result.file_path = file_review_result.file_path.relative_to(path)
+
+
 def perform_review(path: Path, config: ApplicationConfig) -> GeneralReviewResult:
     if not path.exists():
         raise PathNotExistsError
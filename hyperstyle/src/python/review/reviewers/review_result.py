@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from pathlib import Path
 
+    from hyperstyle.src.python.review.inspectors.common.inspector.inspector_type import InspectorType
     from hyperstyle.src.python.review.inspectors.common.issue.issue import BaseIssue, IssueDifficulty
     from hyperstyle.src.python.review.quality.model import Quality
     from hyperstyle.src.python.review.quality.penalty import Punisher
@@ -32,3 +33,11 @@ class GeneralReviewResult(ReviewResult):
     """GeneralReviewResult contains the information needed to output about the entire inspected project."""
 
     file_review_results: list[FileReviewResult]
+    # The inspectors that did not finish in time. If there are any, the review is partial
+    timed_out_inspectors: list[InspectorType] = field(default_factory=list)
+    # The code reviewed in memory. The lines of the issues are taken from it instead of the files
+    code: str | None = None
+
+    @property
+    def is_partial(self) -> bool:
+        return bool(self.timed_out_inspectors)
@@ -4,7 +4,10 @@ from collections import Counter
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
-from hyperstyle.src.python.review.common.file_system import get_total_code_lines_from_file
+from hyperstyle.src.python.review.common.file_system import (
+    get_total_code_lines_from_code,
+    get_total_code_lines_from_file,
+)
 from hyperstyle.src.python.review.inspectors.common.issue.issue import BaseIssue, IssueType
 
 if TYPE_CHECKING:
@@ -70,7 +73,8 @@ def __get_max_measure_by_issue_type(issue_type: IssueType, issues: list[BaseIssu
 
 
 # TODO: Need testing
-def gather_code_statistics(issues: list[BaseIssue], path: Path) -> CodeStatistics:
+def gather_code_statistics(issues: list[BaseIssue], path: Path, code: str | None = None) -> CodeStatistics:
+    """Gather the statistics of the file. If the code is reviewed in memory, the lines are counted in the code."""
     issue_type_counter = Counter([issue.type for issue in issues])
 
     bool_expr_lens = __get_max_measure_by_issue_type(IssueType.BOOL_EXPR_LEN, issues)
@@ -86,7 +90,10 @@ def gather_code_statistics(issues: list[BaseIssue], path: Path) -> CodeStatistic
     weighted_method_complexities = __get_max_measure_by_issue_type(IssueType.WEIGHTED_METHOD, issues)
     method_numbers = __get_max_measure_by_issue_type(IssueType.METHOD_NUMBER, issues)
 
-    total_lines = get_total_code_lines_from_file(path) if path.exists() else 0
+    if code is not None:
+        total_lines = get_total_code_lines_from_code(code)
+    else:
+        total_lines = get_total_code_lines_from_file(path) if path.exists() else 0
 
     return CodeStatistics(
         n_code_style_issues=issue_type_counter[IssueType.CODE_STYLE],
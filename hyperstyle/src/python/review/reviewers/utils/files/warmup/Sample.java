@@ -0,0 +1,23 @@
+import java.util.ArrayList;
+import java.util.List;
+import java.util.Scanner;
+
+class Main {
+    private static final int LIMIT = 10;
+
+    public static void main(String[] args) {
+        Scanner scanner = new Scanner(System.in);
+        List<Integer> numbers = new ArrayList<>();
+        while (scanner.hasNextInt() && numbers.size() < LIMIT) {
+            numbers.add(scanner.nextInt());
+        }
+
+        int sum = 0;
+        for (int number : numbers) {
+            if (number % 2 == 0) {
+                sum += number;
+            }
+        }
+        System.out.println(sum);
+    }
+}
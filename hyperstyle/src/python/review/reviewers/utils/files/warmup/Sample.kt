@@ -0,0 +1,16 @@
+const val LIMIT = 10
+
+fun sumOfEven(numbers: List<Int>): Int {
+    var sum = 0
+    for (number in numbers) {
+        if (number % 2 == 0) {
+            sum += number
+        }
+    }
+    return sum
+}
+
+fun main() {
+    val numbers = readLine().orEmpty().split(" ").mapNotNull { it.toIntOrNull() }.take(LIMIT)
+    println(sumOfEven(numbers))
+}
@@ -0,0 +1 @@
+module main
@@ -0,0 +1,27 @@
+package main
+
+import (
+	"bufio"
+	"fmt"
+	"os"
+	"sort"
+	"strconv"
+	"strings"
+)
+
+const limit = 10
+
+func main() {
+	scanner := bufio.NewScanner(os.Stdin)
+	var numbers []int
+	for scanner.Scan() && len(numbers) < limit {
+		number, err := strconv.Atoi(strings.TrimSpace(scanner.Text()))
+		if err != nil {
+			continue
+		}
+		numbers = append(numbers, number)
+	}
+
+	sort.Ints(numbers)
+	fmt.Println(numbers)
+}
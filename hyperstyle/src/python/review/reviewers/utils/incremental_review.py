@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import tempfile
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from hyperstyle.src.python.review.common.file_system import get_file_hashes
+from hyperstyle.src.python.review.common.issue_cache import create_cache_key
+from hyperstyle.src.python.review.common.parallel_runner import (
+    inspect_in_parallel,
+    InspectionResult,
+    run_inspector,
+)
+from hyperstyle.src.python.review.inspectors.common.inspector.inspector_type import InspectorType
+from hyperstyle.src.python.review.inspectors.common.issue.issue_serialization import (
+    convert_issue_to_json_dict,
+    convert_json_dict_to_issue,
+)
+
+if TYPE_CHECKING:
+    from hyperstyle.src.python.review.application_config import ApplicationConfig
+    from hyperstyle.src.python.review.inspectors.common.inspector.base_inspector import BaseInspector
+    from hyperstyle.src.python.review.inspectors.common.issue.issue import BaseIssue
+
+logger = logging.getLogger(__name__)
+
+# Increase it when the format of the manifest is changed
+MANIFEST_FORMAT_VERSION = 1
+
+# Each changed file is inspected separately, so if many files are changed, it is faster to inspect the whole project
+MAX_CHANGED_FILES = 10
+
+
+@dataclass
+class InspectorManifest:
+    # The key of the inspector settings (see ``create_cache_key``). If it is changed, the issues can't be reused
+    key: str
+    issues: list[BaseIssue] = field(default_factory=list)
+
+
+@dataclass
+class ReviewManifest:
+    """The hashes of the project files and the raw issues of each inspector from the previous review."""
+
+    file_hashes: dict[str, str] = field(default_factory=dict)
+    inspectors: dict[InspectorType, InspectorManifest] = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, manifest_path: Path, project_path: Path) -> ReviewManifest:
+        """Load the manifest. If it does not exist or is corrupted, the empty manifest is returned."""
+        try:
+            data = json.loads(manifest_path.read_text())
+            if data["format"] != MANIFEST_FORMAT_VERSION:
+                return cls()
+
+            return cls(
+                file_hashes=data["files"],
+                inspectors={
+                    InspectorType(inspector_type): InspectorManifest(
+                        inspector_data["key"],
+                        [
+                            convert_json_dict_to_issue(issue, project_path)
+                            for issue in inspector_data["issues"]
+                        ],
+                    )
+                    for inspector_type, inspector_data in data["inspectors"].items()
+                },
+            )
+        except FileNotFoundError:
+            return cls()
+        except (OSError, KeyError, TypeError, ValueError) as error:
+            logger.warning(f"The review manifest {manifest_path} is corrupted: {error}")
+            return cls()
+
+    def save(self, manifest_path: Path, project_path: Path) -> None:
+        data = {
+            "format": MANIFEST_FORMAT_VERSION,
+            "files": self.file_hashes,
+            "inspectors": {
+                inspector_type.value: {
+                    "key": inspector_manifest.key,
+                    "issues": [
+                        convert_issue_to_json_dict(issue, project_path) for issue in inspector_manifest.issues
+                    ],
+                }
+                for inspector_type, inspector_manifest in self.inspectors.items()
+            },
+        }
+
+        manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        file_descriptor, temp_path = tempfile.mkstemp(dir=manifest_path.parent)
+        with os.fdopen(file_descriptor, "w") as temp_file:
+            json.dump(data, temp_file)
+        Path(temp_path).replace(manifest_path)
+
+
+def run_inspector_on_paths(
+    inspector_to_paths: dict[InspectorType, list[Path]],
+    config: ApplicationConfig,
+    inspector: BaseInspector,
+) -> list[BaseIssue]:
+    issues = []
+    for path in inspector_to_paths[inspector.inspector_type]:
+        issues.extend(run_inspector(path, config, inspector))
+    return issues
+
+
+def inspect_project_incrementally(
+    project_path: Path,
+    language_files: list[Path],
+    config: ApplicationConfig,
+    inspectors: list[BaseInspector],
+) -> InspectionResult:
+    """Inspect the project reusing the issues from the manifest of the previous review.
+
+    The project-wide inspectors are run again only if some file of the project is changed, added or removed.
+    The file-local inspectors are run only on the changed files of the language,
+    and their issues in the other files are taken from the manifest.
+    The result is the same as if all inspectors were run on the whole project.
+    The issues of the timed out inspectors are not saved, so they are run again next time.
+    """
+    previous_manifest = ReviewManifest.load(config.manifest_path, project_path)
+    manifest = ReviewManifest(get_file_hashes(project_path))
+
+    changed_files = {
+        project_path / file
+        for file, file_hash in manifest.file_hashes.items()
+        if previous_manifest.file_hashes.get(file) != file_hash
+    }
+    is_project_changed = (
+        bool(changed_files) or manifest.file_hashes.keys() != previous_manifest.file_hashes.keys()
+    )
+    changed_language_files = [file for file in language_files if file in changed_files]
+    existing_files = {project_path / file for file in manifest.file_hashes}
+
+    inspector_to_paths = {}
+    for inspector in inspectors:
+        if inspector.inspector_type in config.disabled_inspectors:
+            continue
+
+        if not inspector.is_cacheable:
+            inspector_to_paths[inspector.inspector_type] = [project_path]
+            continue
+
+        key = create_cache_key(inspector, config, "", in_memory=False)
+        previous_inspector_manifest = previous_manifest.inspectors.get(inspector.inspector_type)
+        inspector_manifest = InspectorManifest(key)
+        manifest.inspectors[inspector.inspector_type] = inspector_manifest
+
+        if previous_inspector_manifest is None or previous_inspector_manifest.key != key:
+            inspector_to_paths[inspector.inspector_type] = [project_path]
+        elif not is_project_changed:
+            inspector_manifest.issues = previous_inspector_manifest.issues
+        elif inspector.is_file_local and len(changed_language_files) <= MAX_CHANGED_FILES:
+            inspector_manifest.issues = [
+                issue
+                for issue in previous_inspector_manifest.issues
+                if issue.file_path in existing_files and issue.file_path not in changed_files
+            ]
+            inspector_to_paths[inspector.inspector_type] = changed_language_files
+        else:
+            inspector_to_paths[inspector.inspector_type] = [project_path]
+
+    logger.info(
+        f"Incremental review: {len(changed_files)} changed files, "
+        f"inspectors to run: {', '.join(inspector_type.value for inspector_type in inspector_to_paths)}",
+    )
+
+    inspectors_to_run = [
+        inspector for inspector in inspectors if inspector_to_paths.get(inspector.inspector_type)
+    ]
+    result = inspect_in_parallel(run_inspector_on_paths, inspector_to_paths, config, inspectors_to_run)
+    for inspector_type in result.timed_out_inspectors:
+        manifest.inspectors.pop(inspector_type, None)
+
+    issues = [
+        issue for inspector_manifest in manifest.inspectors.values() for issue in inspector_manifest.issues
+    ]
+    for issue in result.issues:
+        inspector_manifest = manifest.inspectors.get(issue.inspector_type)
+        if inspector_manifest is not None:
+            inspector_manifest.issues.append(issue)
+
+    manifest.save(config.manifest_path, project_path)
+    return InspectionResult(issues + result.issues, result.timed_out_inspectors)
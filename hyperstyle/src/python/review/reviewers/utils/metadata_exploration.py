@@ -2,14 +2,11 @@ from __future__ import annotations
 
 from collections import defaultdict
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from pathlib import Path
 
 from hyperstyle.src.python.review.common.file_system import get_all_file_system_items, get_extension_from_file
 from hyperstyle.src.python.review.common.language import guess_file_language, Language
 
-if TYPE_CHECKING:
-    from pathlib import Path
-
 
 @dataclass
 class FileMetadata:
@@ -56,6 +53,10 @@ class ProjectMetadata:
         return set(self.extension_to_files)
 
 
+# The inspectors name the code reviewed in memory differently, so all its issues are moved to this path
+IN_MEMORY_FILE_PATH = Path()
+
+
 @dataclass
 class InMemoryMetadata:
     code: str
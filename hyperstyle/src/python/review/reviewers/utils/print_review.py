@@ -1,12 +1,11 @@
 from __future__ import annotations
 
 import json
-import linecache
 from enum import Enum, unique
 from pathlib import Path
 from typing import Any, TYPE_CHECKING
 
-from hyperstyle.src.python.review.common.file_system import get_file_line
+from hyperstyle.src.python.review.common.file_system import get_code_line, get_file_line
 from hyperstyle.src.python.review.inspectors.common.inspector.inspector_type import InspectorType
 from hyperstyle.src.python.review.inspectors.common.issue.issue import BaseIssue, IssueDifficulty, IssueType
 from hyperstyle.src.python.review.quality.penalty import PenaltyIssue
@@ -27,6 +26,7 @@ def print_review_result_as_text(
     heading = f"\nReview of {path!s} ({len(review_result.issues)} violations)"
     print(heading)
 
+    code_lines = _get_code_lines(review_result)
     if len(review_result.issues) == 0:
         print("There is no issues found")
     else:
@@ -38,10 +38,7 @@ def print_review_result_as_text(
 
             sorted_issues = sorted(file_review_result.issues, key=lambda issue: issue.line_no)
             for issue in sorted_issues:
-                line_text = linecache.getline(
-                    str(issue.file_path),
-                    issue.line_no,
-                ).strip()
+                line_text = _get_line_text(issue, code_lines)
 
                 issue_type = issue.type
                 if not config.with_all_categories:
@@ -61,6 +58,9 @@ def print_review_result_as_text(
             print(file_review_result.quality_by_difficulty[IssueDifficulty.HARD])
 
     print("*" * len(heading))
+    if review_result.is_partial:
+        timed_out_inspectors = ", ".join(inspector.value for inspector in review_result.timed_out_inspectors)
+        print(f"The review is partial: {timed_out_inspectors} did not finish in time")
     print("General quality:")
     print(review_result.quality_by_difficulty[IssueDifficulty.HARD], end="")
 
@@ -120,7 +120,7 @@ def get_influence_on_penalty_json_dict(
 
 
 def convert_review_result_to_json_dict(
-    review_result: ReviewResult, config: ApplicationConfig
+    review_result: ReviewResult, config: ApplicationConfig, code_lines: list[str] | None = None
 ) -> dict[str, object]:
     issues = review_result.issues
     issues.sort(key=lambda issue: issue.line_no)
@@ -136,7 +136,7 @@ def convert_review_result_to_json_dict(
     output_json[OutputJsonFields.ISSUES.value] = []
 
     for issue in issues:
-        json_issue = convert_issue_to_json(issue, config)
+        json_issue = convert_issue_to_json(issue, config, code_lines)
 
         json_issue[OutputJsonFields.INFLUENCE_ON_PENALTY.value] = get_influence_on_penalty_json_dict(
             issue.origin_class,
@@ -146,11 +146,32 @@ def convert_review_result_to_json_dict(
 
         output_json[OutputJsonFields.ISSUES.value].append(json_issue)
 
+    if isinstance(review_result, GeneralReviewResult):
+        _add_partial_review_fields(output_json, review_result)
+
     return output_json
 
 
+def _add_partial_review_fields(output_json: dict[str, object], review_result: GeneralReviewResult) -> None:
+    # The fields are added only to the partial review, so the output of the complete review is not changed
+    if review_result.is_partial:
+        output_json[OutputJsonFields.PARTIAL.value] = True
+        output_json[OutputJsonFields.TIMED_OUT_INSPECTORS.value] = [
+            inspector.value for inspector in review_result.timed_out_inspectors
+        ]
+
+
+def get_review_result_as_json(review_result: GeneralReviewResult, config: ApplicationConfig) -> dict:
+    if config.new_format:
+        return get_review_result_as_multi_file_json(review_result, config)
+
+    return convert_review_result_to_json_dict(review_result, config, _get_code_lines(review_result))
+
+
 def print_review_result_as_json(review_result: GeneralReviewResult, config: ApplicationConfig) -> None:
-    print(json.dumps(convert_review_result_to_json_dict(review_result, config)))
+    print(
+        json.dumps(convert_review_result_to_json_dict(review_result, config, _get_code_lines(review_result)))
+    )
 
 
 def print_review_result_as_multi_file_json(
@@ -165,17 +186,21 @@ def get_review_result_as_multi_file_json(
 ) -> dict:
     review_result.file_review_results.sort(key=lambda result: result.file_path)
 
+    code_lines = _get_code_lines(review_result)
     file_review_result_jsons = [
-        convert_review_result_to_json_dict(file_review_result, config)
+        convert_review_result_to_json_dict(file_review_result, config, code_lines)
         for file_review_result in review_result.file_review_results
     ]
 
     quality_with_penalty = _get_quality_with_penalty(review_result)
 
-    return {
+    output_json = {
         OutputJsonFields.QUALITY.value: get_quality_json_dict(quality_with_penalty, config),
         OutputJsonFields.FILE_REVIEW_RESULTS.value: file_review_result_jsons,
     }
+    _add_partial_review_fields(output_json, review_result)
+
+    return output_json
 
 
 @unique
@@ -184,6 +209,8 @@ class OutputJsonFields(Enum):
     ISSUES = "issues"
     FILE_REVIEW_RESULTS = "file_review_results"
     FILE_NAME = "file_name"
+    PARTIAL = "partial"
+    TIMED_OUT_INSPECTORS = "timed_out_inspectors"
 
     CODE = "code"
     TEXT = "text"
@@ -195,8 +222,22 @@ class OutputJsonFields(Enum):
     DIFFICULTY = "difficulty"
 
 
-def convert_issue_to_json(issue: BaseIssue, config: ApplicationConfig) -> dict[str, Any]:
-    line_text = get_file_line(issue.file_path, issue.line_no)
+def _get_code_lines(review_result: GeneralReviewResult) -> list[str] | None:
+    return None if review_result.code is None else review_result.code.splitlines()
+
+
+def _get_line_text(issue: BaseIssue, code_lines: list[str] | None) -> str:
+    if code_lines is not None:
+        return get_code_line(code_lines, issue.line_no)
+
+    return get_file_line(issue.file_path, issue.line_no)
+
+
+def convert_issue_to_json(
+    issue: BaseIssue, config: ApplicationConfig, code_lines: list[str] | None = None
+) -> dict[str, Any]:
+    """Convert the issue to JSON. If the code is reviewed in memory, its lines are passed in ``code_lines``."""
+    line_text = _get_line_text(issue, code_lines)
 
     issue_type = issue.type
     if not config.with_all_categories:
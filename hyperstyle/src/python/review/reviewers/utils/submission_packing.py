@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import dataclasses
+import functools
+import logging
+import shutil
+from typing import TYPE_CHECKING
+
+from hyperstyle.src.python.review.common.language import get_language_extension, guess_file_language, Language
+from hyperstyle.src.python.review.common.parallel_runner import inspect_in_parallel, run_inspector
+from hyperstyle.src.python.review.reviewers.common import LANGUAGE_TO_INSPECTORS
+from hyperstyle.src.python.review.reviewers.perform_review import INLINE_CODE_FILE_NAME
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from hyperstyle.src.python.review.application_config import ApplicationConfig
+    from hyperstyle.src.python.review.common.parallel_runner import PackedIssues
+    from hyperstyle.src.python.review.inspectors.common.inspector.base_inspector import BaseInspector
+    from hyperstyle.src.python.review.inspectors.common.inspector.inspector_type import InspectorType
+    from hyperstyle.src.python.review.inspectors.common.issue.issue import BaseIssue
+
+logger = logging.getLogger(__name__)
+
+
+def get_submission_language(path: Path | None, language: Language | None) -> Language:
+    """Get the language of a single-file submission or ``Language.UNKNOWN`` if the submission can't be packed."""
+    if language is not None:
+        return language
+
+    if path is None or not path.is_file():
+        return Language.UNKNOWN
+
+    return guess_file_language(path)
+
+
+def write_submission(path: Path | None, code: str | None, language: Language, directory: Path) -> Path:
+    """Write a single-file submission to its own directory of the pack and return the path of the file.
+
+    The file keeps its name, so the review of the packed file is the same as the review of the original one.
+    """
+    directory.mkdir(parents=True)
+    if code is not None:
+        file_path = directory / f"{INLINE_CODE_FILE_NAME}{get_language_extension(language).value}"
+        file_path.write_text(code)
+        return file_path
+
+    file_path = directory / path.name
+    shutil.copyfile(path, file_path)
+    return file_path
+
+
+def get_packed_inspectors(language: Language, config: ApplicationConfig) -> list[BaseInspector]:
+    return [
+        inspector
+        for inspector in LANGUAGE_TO_INSPECTORS.get(language, [])
+        if inspector.is_file_local and inspector.inspector_type not in config.disabled_inspectors
+    ]
+
+
+def _run_packed_inspector(
+    failed_inspectors: set[InspectorType], path: Path, config: ApplicationConfig, inspector: BaseInspector
+) -> list[BaseIssue]:
+    try:
+        return run_inspector(path, config, inspector)
+    except Exception:  # noqa: BLE001
+        # The inspector is run on each submission during its review, so the error is reported there if it repeats
+        logger.warning(f"Inspector {inspector.inspector_type} failed on the pack {path}", exc_info=True)
+        failed_inspectors.add(inspector.inspector_type)
+        return []
+
+
+def inspect_pack(
+    pack_directory: Path, file_paths: list[Path], config: ApplicationConfig, language: Language
+) -> PackedIssues:
+    """Run each file-local inspector of the language once over the pack and split its issues by the submissions.
+
+    The pack directory contains the files of the submissions, each one in its own subdirectory.
+    The inspectors that fail or time out on the pack are missing from the result,
+    so they are run on each submission separately during its review.
+    """
+    failed_inspectors: set[InspectorType] = set()
+    inspectors = get_packed_inspectors(language, config)
+    # The issues of the whole pack are not worth caching: they are never reused
+    pack_config = dataclasses.replace(config, cache_dir=None)
+    result = inspect_in_parallel(
+        functools.partial(_run_packed_inspector, failed_inspectors),
+        pack_directory,
+        pack_config,
+        inspectors,
+    )
+    failed_inspectors.update(result.timed_out_inspectors)
+
+    resolved_paths = {file_path.resolve(): file_path for file_path in file_paths}
+    packed_issues: PackedIssues = {
+        inspector.inspector_type: {file_path: [] for file_path in file_paths} for inspector in inspectors
+    }
+    for issue in result.issues:
+        if issue.inspector_type in failed_inspectors:
+            continue
+
+        file_path = resolved_paths.get(issue.file_path.resolve())
+        if file_path is None:
+            logger.warning(
+                f"Inspector {issue.inspector_type} found an issue outside of the packed submissions: {issue.file_path}"
+            )
+            failed_inspectors.add(issue.inspector_type)
+            continue
+
+        packed_issues[issue.inspector_type][file_path].append(dataclasses.replace(issue, file_path=file_path))
+
+    for inspector_type in failed_inspectors:
+        packed_issues.pop(inspector_type, None)
+
+    return packed_issues
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import logging
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from hyperstyle.src.python.review.common.file_system import new_temp_dir
+from hyperstyle.src.python.review.inspectors.checkstyle.checkstyle import (
+    CHECKSTYLE_DIRECTORY_ENV,
+    CHECKSTYLE_VERSION_ENV,
+    CheckstyleInspector,
+)
+from hyperstyle.src.python.review.inspectors.detekt.detekt import (
+    DETEKT_DIRECTORY_ENV,
+    DETEKT_VERSION_ENV,
+    DetektInspector,
+)
+from hyperstyle.src.python.review.inspectors.golang_lint.golang_lint import (
+    GOLANG_LINT_DIRECTORY_ENV,
+    GolangLintInspector,
+    GoWarmupResult,
+)
+from hyperstyle.src.python.review.inspectors.pmd.pmd import PMD_DIRECTORY_ENV, PMD_VERSION_ENV, PMDInspector
+
+if TYPE_CHECKING:
+    from hyperstyle.src.python.review.inspectors.common.cds import CdsWarmupResult
+
+logger = logging.getLogger(__name__)
+
+# The samples are shipped with the package, because the warm-up is run on the installed tool
+WARMUP_SAMPLES_DIRECTORY = Path(__file__).parent / "files" / "warmup"
+JAVA_SAMPLE = WARMUP_SAMPLES_DIRECTORY / "Sample.java"
+KOTLIN_SAMPLE = WARMUP_SAMPLES_DIRECTORY / "Sample.kt"
+GO_SAMPLE = WARMUP_SAMPLES_DIRECTORY / "go"
+
+JVM_LINTERS = [
+    (CheckstyleInspector, (CHECKSTYLE_DIRECTORY_ENV, CHECKSTYLE_VERSION_ENV), JAVA_SAMPLE),
+    (PMDInspector, (PMD_DIRECTORY_ENV, PMD_VERSION_ENV), JAVA_SAMPLE),
+    (DetektInspector, (DETEKT_DIRECTORY_ENV, DETEKT_VERSION_ENV), KOTLIN_SAMPLE),
+]
+
+
+def warm_up_jvm_linters() -> list[CdsWarmupResult]:
+    """Build the AppCDS archives of the JVM linters that are set up by running each of them on a canned sample.
+
+    After the warm-up, the linters are started from their archives, which cuts the start-up time of each run.
+    """
+    results = []
+    for inspector_class, env_variables, sample_path in JVM_LINTERS:
+        if not all(os.environ.get(variable) for variable in env_variables):
+            logger.info(f"{inspector_class.inspector_type.value} is not set up, its warm-up is skipped")
+            continue
+
+        with new_temp_dir() as temp_dir:
+            results.append(inspector_class().warm_up(sample_path, temp_dir / "output"))
+
+    return results
+
+
+def warm_up_go_linter() -> GoWarmupResult | None:
+    """Fill the Go caches by building the standard library and the pinned modules and linting a canned sample.
+
+    None is returned if golangci-lint is not set up.
+    """
+    if not os.environ.get(GOLANG_LINT_DIRECTORY_ENV):
+        logger.info(f"{GolangLintInspector.inspector_type.value} is not set up, its warm-up is skipped")
+        return None
+
+    return GolangLintInspector().warm_up(GO_SAMPLE)
+
+
+def format_warmup_results(jvm_results: list[CdsWarmupResult], go_result: GoWarmupResult | None) -> str:
+    """Format the run times of the linters on the samples before and after the warm-up as a table.
+
+    The JVM linters are compared without and with the AppCDS archives, golangci-lint on the cold and the warm caches.
+    """
+    rows = [
+        (f"{result.tool.name} {result.tool.version}", result.time_without_archive, result.time_with_archive)
+        for result in jvm_results
+    ]
+    if go_result is not None:
+        rows.append((go_result.versions_key, go_result.time_cold, go_result.time_warm))
+
+    lines = [f"{'Linter':<35}{'Before warm-up, s':>20}{'After warm-up, s':>20}"]
+    lines.extend(
+        f"{name:<35}{time_before:>20.2f}{time_after:>20.2f}" for name, time_before, time_after in rows
+    )
+    return "\n".join(lines)
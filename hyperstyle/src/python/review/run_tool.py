@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import argparse
 import logging.config
+import math
 import os
 import sys
 import traceback
@@ -13,10 +14,16 @@ sys.path.append("../../../..")
 
 from hyperstyle.src.python.common.tool_arguments import RunToolArgument, VerbosityLevel
 from hyperstyle.src.python.review.application_config import ApplicationConfig
+from hyperstyle.src.python.review.common.issue_cache import DEFAULT_CACHE_SIZE
 from hyperstyle.src.python.review.common.language import Language
 from hyperstyle.src.python.review.common.language_version import LanguageVersion
+from hyperstyle.src.python.review.common.subprocess_runner import ResourceLimits
 from hyperstyle.src.python.review.inspectors.common.inspector.inspector_type import InspectorType
 from hyperstyle.src.python.review.logging_config import logging_config
+from hyperstyle.src.python.review.reviewers.batch_review import (
+    DEFAULT_MAX_IN_FLIGHT,
+    perform_and_print_review_batch,
+)
 from hyperstyle.src.python.review.reviewers.exceptions import (
     InspectionError,
     PathNotExistsError,
@@ -26,9 +33,16 @@ from hyperstyle.src.python.review.reviewers.perform_review import (
     OutputFormat,
     perform_and_print_review,
 )
+from hyperstyle.src.python.review.reviewers.utils.warmup import (
+    format_warmup_results,
+    warm_up_go_linter,
+    warm_up_jvm_linters,
+)
 
 logger = logging.getLogger(__name__)
 
+MEGABYTE = 1024 * 1024
+
 
 def parse_disabled_inspectors(value: str) -> set[InspectorType]:
     passed_names = value.upper().split(",")
@@ -40,6 +54,38 @@ def parse_disabled_inspectors(value: str) -> set[InspectorType]:
     return {InspectorType(name) for name in passed_names}
 
 
+def parse_inspector_limits(value: str) -> dict[InspectorType | None, float]:
+    """Parse limits like "60,pmd=120,pylint=30". The limit without an inspector name is stored with the None key."""
+    limits = {}
+    for limit in value.split(","):
+        name, _, seconds = limit.rpartition("=")
+        inspector_type = InspectorType(name.upper()) if name else None
+        limits[inspector_type] = float(seconds)
+        if limits[inspector_type] <= 0:
+            raise ValueError
+
+    return limits
+
+
+def create_inspector_limits(
+    timeouts: dict[InspectorType | None, float] | None,
+    cpu_time_limits: dict[InspectorType | None, float] | None,
+) -> dict[InspectorType, ResourceLimits]:
+    timeouts = timeouts or {}
+    cpu_time_limits = cpu_time_limits or {}
+
+    inspector_limits = {}
+    for inspector_type in InspectorType:
+        wall_time = timeouts.get(inspector_type, timeouts.get(None))
+        cpu_time = cpu_time_limits.get(inspector_type, cpu_time_limits.get(None))
+        if wall_time is not None or cpu_time is not None:
+            inspector_limits[inspector_type] = ResourceLimits(
+                wall_time, None if cpu_time is None else math.ceil(cpu_time)
+            )
+
+    return inspector_limits
+
+
 def positive_int(value: str) -> int:
     value_int = int(value)
     if value_int <= 0:
@@ -102,6 +148,7 @@ def configure_arguments(parser: argparse.ArgumentParser) -> None:
 
     parser.add_argument(
         RunToolArgument.PATH.value.long_name,
+        nargs="?",
         type=lambda value: Path(value).absolute(),
         help=RunToolArgument.PATH.value.description,
     )
@@ -157,6 +204,79 @@ def configure_arguments(parser: argparse.ArgumentParser) -> None:
         RunToolArgument.IJ_CONFIG.value.long_name, help=RunToolArgument.IJ_CONFIG.value.description, type=str
     )
 
+    parser.add_argument(
+        RunToolArgument.TIMEOUT.value.long_name,
+        help=RunToolArgument.TIMEOUT.value.description,
+        default=None,
+        type=parse_inspector_limits,
+    )
+
+    parser.add_argument(
+        RunToolArgument.CPU_TIME_LIMIT.value.long_name,
+        help=RunToolArgument.CPU_TIME_LIMIT.value.description,
+        default=None,
+        type=parse_inspector_limits,
+    )
+
+    parser.add_argument(
+        RunToolArgument.MANIFEST.value.long_name,
+        help=RunToolArgument.MANIFEST.value.description,
+        default=None,
+        type=lambda value: Path(value).absolute(),
+    )
+
+    parser.add_argument(
+        RunToolArgument.WARMUP.value.long_name,
+        help=RunToolArgument.WARMUP.value.description,
+        action="store_true",
+    )
+
+    parser.add_argument(
+        RunToolArgument.BATCH.value.long_name,
+        help=RunToolArgument.BATCH.value.description,
+        default=None,
+        type=lambda value: Path(value).absolute(),
+    )
+
+    parser.add_argument(
+        RunToolArgument.BATCH_WORKERS.value.long_name,
+        help=RunToolArgument.BATCH_WORKERS.value.description,
+        default=1,
+        type=positive_int,
+    )
+
+    parser.add_argument(
+        RunToolArgument.BATCH_WINDOW.value.long_name,
+        help=RunToolArgument.BATCH_WINDOW.value.description,
+        default=DEFAULT_MAX_IN_FLIGHT,
+        type=positive_int,
+    )
+
+    parser.add_argument(
+        RunToolArgument.BATCH_PACK_SIZE.value.long_name,
+        help=RunToolArgument.BATCH_PACK_SIZE.value.description,
+        default=1,
+        type=positive_int,
+    )
+
+    configure_cache_arguments(parser)
+
+
+def configure_cache_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        RunToolArgument.CACHE_DIR.value.long_name,
+        help=RunToolArgument.CACHE_DIR.value.description,
+        default=None,
+        type=lambda value: Path(value).absolute(),
+    )
+
+    parser.add_argument(
+        RunToolArgument.CACHE_SIZE.value.long_name,
+        help=RunToolArgument.CACHE_SIZE.value.description,
+        default=DEFAULT_CACHE_SIZE // MEGABYTE,
+        type=positive_int,
+    )
+
 
 def configure_logging(verbosity: VerbosityLevel) -> None:
     if verbosity is VerbosityLevel.ERROR:
@@ -179,6 +299,13 @@ def main() -> int:
         args = parser.parse_args()
         configure_logging(VerbosityLevel(args.verbosity))
 
+        if args.warmup:
+            print(format_warmup_results(warm_up_jvm_linters(), warm_up_go_linter()))
+            return 0
+
+        if args.path is None and args.batch is None:
+            parser.error("the following arguments are required: path")
+
         n_cpu = args.n_cpu
         max_n_cpu = os.cpu_count()
         if n_cpu > max_n_cpu:
@@ -208,8 +335,18 @@ def main() -> int:
             with_all_categories=args.with_all_categories,
             group_by_difficulty=args.group_by_difficulty,
             ij_config=args.ij_config,
+            cache_dir=args.cache_dir,
+            cache_size=args.cache_size * MEGABYTE,
+            manifest_path=args.manifest,
+            inspector_limits=create_inspector_limits(args.timeout, args.cpu_time_limit),
         )
 
+        if args.batch is not None:
+            n_failed = perform_and_print_review_batch(
+                args.batch, config, args.batch_workers, args.batch_window, args.batch_pack_size
+            )
+            return 2 if n_failed else 0
+
         n_issues = perform_and_print_review(args.path, OutputFormat(args.format), config)
         return bool(n_issues)
     except PathNotExistsError:
@@ -0,0 +1,114 @@
+"""The benchmark of the issue classification: the time to turn a linter output into the issues, per issue.
+
+Run it from the root of the repository: ``python -m test.python.benchmarks.bench_issue_registry``.
+The outputs are generated from the known codes of the linters, so no linter is run.
+Each issue is classified and converted as in a review, so the time per issue must stay small and constant.
+"""
+
+from __future__ import annotations
+
+import itertools
+import json
+import tempfile
+import timeit
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from hyperstyle.src.python.review.inspectors.common.issue.issue import (
+    IssueType,
+)
+from hyperstyle.src.python.review.inspectors.flake8.flake8 import Flake8Inspector
+from hyperstyle.src.python.review.inspectors.flake8.issue_configs import ISSUE_CONFIGS as FLAKE8_ISSUE_CONFIGS
+from hyperstyle.src.python.review.inspectors.flake8.issue_types import (
+    CODE_TO_ISSUE_TYPE as FLAKE8_CODE_TO_ISSUE_TYPE,
+)
+from hyperstyle.src.python.review.inspectors.golang_lint.golang_lint import GolangLintInspector
+from hyperstyle.src.python.review.inspectors.golang_lint.issue_configs import (
+    ISSUE_CONFIGS as GOLANG_ISSUE_CONFIGS,
+)
+from hyperstyle.src.python.review.inspectors.golang_lint.issue_types import (
+    CODE_TO_ISSUE_TYPE as GOLANG_CODE_TO_ISSUE_TYPE,
+)
+from hyperstyle.src.python.review.inspectors.pylint.issue_configs import ISSUE_CONFIGS as PYLINT_ISSUE_CONFIGS
+from hyperstyle.src.python.review.inspectors.pylint.issue_types import (
+    CODE_TO_ISSUE_TYPE as PYLINT_CODE_TO_ISSUE_TYPE,
+)
+from hyperstyle.src.python.review.inspectors.pylint.pylint import PylintInspector
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+
+    from hyperstyle.src.python.review.inspectors.common.issue.issue_configs import IssueConfig
+
+# The types of the issues that are not measurable and are supported by all the inspectors
+CODE_ISSUE_TYPES = (IssueType.CODE_STYLE, IssueType.BEST_PRACTICES, IssueType.ERROR_PRONE)
+
+N_ISSUES = 10000
+N_REPEATS = 5
+
+# The codes that are classified by the prefixes
+FLAKE8_PREFIX_CODES = ["E225", "W605", "F401", "B006", "N802", "WPS221", "WPS110", "I100", "SC200", "P101"]
+GOLANG_PREFIX_CODES = ["gosimple-S1000", "staticcheck-SA1000", "govet-printf", "stylecheck-ST1000"]
+
+
+def get_codes(code_to_issue_type: Mapping[str, IssueType], issue_configs: list[IssueConfig]) -> list[str]:
+    """Get the codes of the code issues without the configs, so that only the classification and the conversion
+    are measured.
+    """
+    configured_codes = {issue_config.origin_class for issue_config in issue_configs}
+    return [
+        code
+        for code, issue_type in code_to_issue_type.items()
+        if code not in configured_codes and issue_type in CODE_ISSUE_TYPES
+    ]
+
+
+def generate_output(n_issues: int, codes: list[str], column_no: int) -> str:
+    return "".join(
+        f"main.py:{index + 1}:{column_no}:{code}:The description of the issue\n"
+        for index, code in zip(range(n_issues), itertools.cycle(codes), strict=False)
+    )
+
+
+def generate_golang_output(n_issues: int, codes: list[str], output_path: Path) -> None:
+    issues = [
+        {
+            "FromLinter": code,
+            "Text": "The description of the issue",
+            "Pos": {"Filename": "main.go", "Line": 1, "Column": 1},
+        }
+        for _, code in zip(range(n_issues), itertools.cycle(codes), strict=False)
+    ]
+    output_path.write_text(json.dumps({"Issues": issues}))
+
+
+def measure(function: Callable[[], object]) -> float:
+    """Get the time per issue in microseconds."""
+    return min(timeit.repeat(function, number=1, repeat=N_REPEATS)) * 1000 * 1000 / N_ISSUES
+
+
+def main() -> None:
+    flake8_codes = [*FLAKE8_PREFIX_CODES, *get_codes(FLAKE8_CODE_TO_ISSUE_TYPE, FLAKE8_ISSUE_CONFIGS)]
+    flake8_output = generate_output(N_ISSUES, flake8_codes, column_no=1)
+    pylint_output = generate_output(
+        N_ISSUES, get_codes(PYLINT_CODE_TO_ISSUE_TYPE, PYLINT_ISSUE_CONFIGS), column_no=0
+    )
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        golang_output_path = Path(temp_dir) / "output.json"
+        golang_codes = [*GOLANG_PREFIX_CODES, *get_codes(GOLANG_CODE_TO_ISSUE_TYPE, GOLANG_ISSUE_CONFIGS)]
+        generate_golang_output(N_ISSUES, golang_codes, golang_output_path)
+
+        benchmarks = {
+            "Flake8 output": lambda: Flake8Inspector.parse(flake8_output),
+            "Pylint output": lambda: PylintInspector.parse(pylint_output),
+            "golangci-lint output": lambda: GolangLintInspector.parse(golang_output_path),
+        }
+
+        print(f"{'Benchmark':<22} {'us per issue':>13}")
+        for name, function in benchmarks.items():
+            print(f"{name:<22} {measure(function):>13.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""The benchmark of the Python AST inspector on the generated files of growing size.
+
+Run it from the root of the repository: ``python -m test.python.benchmarks.bench_python_ast``.
+The time per thousand lines must stay about the same for all sizes, i.e. the inspector must scale linearly.
+"""
+
+from __future__ import annotations
+
+import timeit
+from pathlib import Path
+
+from hyperstyle.src.python.review.inspectors.pyast.python_ast import PythonAstInspector
+
+N_FUNCTIONS = [250, 500, 1000, 2000, 4000]
+N_REPEATS = 5
+
+FUNCTION_TEMPLATE = '''
+@staticmethod
+def function_{index}(a, b, c):
+    """The docstring of the function."""
+    if a and (b or c) and not (a or b and c):
+        return [x for x in range(a) if x or b]
+
+    def nested(d):
+        return d and a or b
+
+    # The comment inside the function
+    return nested(c) or (a and b)
+'''
+
+
+def generate_code(n_functions: int) -> str:
+    return "".join(FUNCTION_TEMPLATE.format(index=index) for index in range(n_functions))
+
+
+def main() -> None:
+    print(f"{'Functions':>10} {'Lines':>8} {'Time, ms':>10} {'ms per 1k lines':>16}")
+    for n_functions in N_FUNCTIONS:
+        code = generate_code(n_functions)
+        n_lines = code.count("\n")
+        time = min(
+            timeit.repeat(
+                lambda code=code: PythonAstInspector._inspect_code(code, Path()), number=1, repeat=N_REPEATS
+            )
+        )
+        print(f"{n_functions:>10} {n_lines:>8} {time * 1000:>10.1f} {time * 1000 * 1000 / n_lines:>16.2f}")
+
+
+if __name__ == "__main__":
+    main()
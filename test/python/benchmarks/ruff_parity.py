@@ -0,0 +1,105 @@
+"""The parity report of the Flake8 and Ruff rules backends of the Flake8 inspector.
+
+Run it from the root of the repository: ``python -m test.python.benchmarks.ruff_parity [path ...]``,
+by default ``test/resources`` is inspected. For each code whose issues differ between the backends, the report shows
+the number of the issues found only by Flake8, only by Ruff, and found by both but with different descriptions.
+The issues are matched by the file and the line, since some rules report different columns.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import timeit
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from hyperstyle.src.python.review.inspectors.flake8.flake8 import Flake8Inspector
+from hyperstyle.src.python.review.inspectors.flake8.ruff import FLAKE8_RULES_BACKEND_ENV, Flake8RulesBackend
+
+if TYPE_CHECKING:
+    from hyperstyle.src.python.review.inspectors.common.issue.issue import BaseIssue
+
+DEFAULT_PATH = Path("test/resources")
+
+IssueLocation = tuple[str, str, int]
+
+
+@dataclass
+class CodeParity:
+    n_flake8_only: int = 0
+    n_ruff_only: int = 0
+    n_different_descriptions: int = 0
+
+
+def inspect_with_backend(path: Path, backend: Flake8RulesBackend) -> list[BaseIssue]:
+    previous_value = os.environ.get(FLAKE8_RULES_BACKEND_ENV)
+    os.environ[FLAKE8_RULES_BACKEND_ENV] = backend.value
+    try:
+        return Flake8Inspector.inspect(path, {})
+    finally:
+        if previous_value is None:
+            del os.environ[FLAKE8_RULES_BACKEND_ENV]
+        else:
+            os.environ[FLAKE8_RULES_BACKEND_ENV] = previous_value
+
+
+def _get_descriptions(issues: list[BaseIssue]) -> dict[IssueLocation, Counter[str]]:
+    descriptions: dict[IssueLocation, Counter[str]] = {}
+    for issue in issues:
+        location = (str(issue.file_path), issue.origin_class, issue.line_no)
+        descriptions.setdefault(location, Counter())[issue.description] += 1
+
+    return descriptions
+
+
+def compare_backends(flake8_issues: list[BaseIssue], ruff_issues: list[BaseIssue]) -> dict[str, CodeParity]:
+    """Compare the issues of the backends, only the codes with differences are returned."""
+    flake8_descriptions = _get_descriptions(flake8_issues)
+    ruff_descriptions = _get_descriptions(ruff_issues)
+
+    parities: dict[str, CodeParity] = {}
+    for location in flake8_descriptions.keys() | ruff_descriptions.keys():
+        flake8_counter = flake8_descriptions.get(location, Counter())
+        ruff_counter = ruff_descriptions.get(location, Counter())
+        if flake8_counter == ruff_counter:
+            continue
+
+        parity = parities.setdefault(location[1], CodeParity())
+        n_flake8 = sum(flake8_counter.values())
+        n_ruff = sum(ruff_counter.values())
+        n_common = min(n_flake8, n_ruff)
+
+        parity.n_flake8_only += n_flake8 - n_common
+        parity.n_ruff_only += n_ruff - n_common
+        parity.n_different_descriptions += n_common - sum((flake8_counter & ruff_counter).values())
+
+    return dict(sorted(parities.items()))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("paths", nargs="*", type=Path, default=[DEFAULT_PATH])
+    args = parser.parse_args()
+
+    issues: dict[Flake8RulesBackend, list[BaseIssue]] = {backend: [] for backend in Flake8RulesBackend}
+    for backend in Flake8RulesBackend:
+        time = timeit.default_timer()
+        for path in args.paths:
+            issues[backend].extend(inspect_with_backend(path, backend))
+        time = timeit.default_timer() - time
+        print(f"{backend.value}: {len(issues[backend])} issues in {time:.2f} s")
+
+    parities = compare_backends(issues[Flake8RulesBackend.FLAKE8], issues[Flake8RulesBackend.RUFF])
+
+    print(f"{'Code':<8} {'Flake8 only':>12} {'Ruff only':>10} {'Different descriptions':>23}")
+    for code, parity in parities.items():
+        print(
+            f"{code:<8} {parity.n_flake8_only:>12} {parity.n_ruff_only:>10} {parity.n_different_descriptions:>23}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+import json
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from hyperstyle.src.python.review.application_config import ApplicationConfig
+from hyperstyle.src.python.review.common.issue_cache import (
+    create_cache_key,
+    IssueCache,
+    STATS_FILE,
+    STATS_FLUSH_INTERVAL,
+)
+from hyperstyle.src.python.review.common.parallel_runner import run_inspector, run_inspector_in_memory
+from hyperstyle.src.python.review.inspectors.common.inspector.inspector_type import InspectorType
+from hyperstyle.src.python.review.inspectors.common.issue.issue import (
+    BaseIssue,
+    CodeIssue,
+    CyclomaticComplexityIssue,
+    IssueDifficulty,
+    IssueType,
+)
+from hyperstyle.src.python.review.inspectors.common.issue.issue_serialization import (
+    convert_issue_to_json_dict,
+    convert_json_dict_to_issue,
+)
+from hyperstyle.src.python.review.inspectors.pyast.python_ast import PythonAstInspector
+from hyperstyle.src.python.review.inspectors.pylint.pylint import PylintInspector
+from test.python.inspectors import PYTHON_DATA_FOLDER
+
+
+def _create_issues(base_path: Path) -> list[BaseIssue]:
+    return [
+        CodeIssue(
+            origin_class="C0103",
+            type=IssueType.CODE_STYLE,
+            description="Variable name doesn't conform to snake_case naming style",
+            file_path=base_path / "main.py",
+            line_no=1,
+            column_no=1,
+            inspector_type=InspectorType.PYLINT,
+            difficulty=IssueDifficulty.EASY,
+        ),
+        CyclomaticComplexityIssue(
+            origin_class="C901",
+            type=IssueType.CYCLOMATIC_COMPLEXITY,
+            description="Too complex",
+            file_path=base_path / "main.py",
+            line_no=3,
+            column_no=1,
+            inspector_type=InspectorType.FLAKE8,
+            cc_value=12,
+            difficulty=IssueDifficulty.HARD,
+        ),
+    ]
+
+
+def test_serialization_round_trip() -> None:
+    for issue in _create_issues(Path("submission").absolute()):
+        assert convert_json_dict_to_issue(convert_issue_to_json_dict(issue)) == issue
+
+
+def test_unknown_issue_class() -> None:
+    with pytest.raises(ValueError, match="Unknown issue class"):
+        convert_json_dict_to_issue({"class": "UnknownIssue"})
+
+
+def test_hits_and_misses(tmp_path: Path) -> None:
+    cache = IssueCache(tmp_path / "cache")
+    issues = _create_issues(tmp_path)
+
+    assert cache.get_issues("key") is None
+    cache.save_issues("key", issues)
+    assert cache.get_issues("key") == issues
+
+    stats = cache.stats
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["size"] > 0
+
+
+def test_file_paths_are_rebased(tmp_path: Path) -> None:
+    cache = IssueCache(tmp_path / "cache")
+    cache.save_issues("key", _create_issues(tmp_path / "first"), tmp_path / "first")
+
+    assert cache.get_issues("key", tmp_path / "second") == _create_issues(tmp_path / "second")
+
+
+def test_corrupted_entry(tmp_path: Path) -> None:
+    cache = IssueCache(tmp_path / "cache")
+    cache.save_issues("key", _create_issues(tmp_path))
+
+    entry_path = next((tmp_path / "cache").rglob("key.json"))
+    # The corrupted entry has the same size, so the size of the cache is not changed
+    entry_path.write_text("[" * entry_path.stat().st_size)
+
+    assert cache.get_issues("key") is None
+    assert not entry_path.exists()
+    assert cache.stats["size"] == 0
+
+
+def test_hits_and_misses_are_batched(tmp_path: Path) -> None:
+    cache = IssueCache(tmp_path / "cache")
+    cache.save_issues("key", _create_issues(tmp_path))
+    stats_path = tmp_path / "cache" / STATS_FILE
+    saved_stats = stats_path.read_text(encoding="utf-8")
+
+    for _ in range(STATS_FLUSH_INTERVAL - 1):
+        cache.get_issues("key")
+    assert stats_path.read_text(encoding="utf-8") == saved_stats
+
+    cache.get_issues("key")
+    assert json.loads(stats_path.read_text(encoding="utf-8"))["hits"] == STATS_FLUSH_INTERVAL
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path: Path) -> None:
+    issues = _create_issues(tmp_path)
+    cache = IssueCache(tmp_path / "cache")
+    cache.save_issues("first", issues)
+    entry_size = cache.stats["size"]
+
+    max_size = int(entry_size * 2.5)
+    cache = IssueCache(tmp_path / "cache", max_size=max_size)
+    cache.save_issues("second", issues)
+    cache.get_issues("first")
+    cache.save_issues("third", issues)
+
+    assert cache.get_issues("first") == issues
+    assert cache.get_issues("second") is None
+    assert cache.get_issues("third") == issues
+    assert cache.stats["size"] <= max_size
+
+
+@pytest.fixture
+def config(tmp_path: Path) -> ApplicationConfig:
+    config = ApplicationConfig.get_default_config()
+    config.cache_dir = tmp_path / "cache"
+    return config
+
+
+class CountingPylintInspector(PylintInspector):
+    def __init__(self) -> None:
+        self.runs = 0
+
+    def inspect(self, path: Path, config: dict[str, Any]) -> list[BaseIssue]:
+        self.runs += 1
+        return super().inspect(path, config)
+
+    def inspect_in_memory(self, code: str, config: dict[str, Any]) -> list[BaseIssue]:
+        self.runs += 1
+        return super().inspect_in_memory(code, config)
+
+
+def test_run_inspector_with_cache(tmp_path: Path, config: ApplicationConfig) -> None:
+    inspector = CountingPylintInspector()
+    first_path = tmp_path / "first"
+    second_path = tmp_path / "second"
+    for path in (first_path, second_path):
+        path.mkdir()
+        shutil.copy(PYTHON_DATA_FOLDER / "case10_unused_variable_in_loop.py", path / "main.py")
+
+    first_issues = run_inspector(first_path, config, inspector)
+    second_issues = run_inspector(second_path, config, inspector)
+
+    assert inspector.runs == 1
+    assert first_issues
+    assert [issue.file_path.relative_to(first_path) for issue in first_issues] == [
+        issue.file_path.relative_to(second_path) for issue in second_issues
+    ]
+
+    (second_path / "main.py").write_text("x = 1\n")
+    run_inspector(second_path, config, inspector)
+    assert inspector.runs == 2
+
+
+def test_concurrent_runs_with_cache(tmp_path: Path, config: ApplicationConfig) -> None:
+    inspector = CountingPylintInspector()
+    paths = [tmp_path / "first", tmp_path / "second"]
+    for path in paths:
+        path.mkdir()
+        shutil.copy(PYTHON_DATA_FOLDER / "case10_unused_variable_in_loop.py", path / "main.py")
+
+    with ThreadPoolExecutor(len(paths)) as executor:
+        issues = list(executor.map(lambda path: run_inspector(path, config, inspector), paths))
+
+    # The second run waits for the first one and reuses its issues
+    assert inspector.runs == 1
+    assert all(issues)
+
+
+def test_run_inspector_in_memory_with_cache(config: ApplicationConfig) -> None:
+    inspector = CountingPylintInspector()
+    code = (PYTHON_DATA_FOLDER / "case1_simple_valid_program.py").read_text()
+
+    assert run_inspector_in_memory(code, config, inspector) == run_inspector_in_memory(
+        code, config, inspector
+    )
+    assert inspector.runs == 1
+
+
+def test_cache_key_depends_on_inspector(config: ApplicationConfig) -> None:
+    pylint_key = create_cache_key(PylintInspector(), config, "hash", in_memory=False)
+    ast_key = create_cache_key(PythonAstInspector(), config, "hash", in_memory=False)
+
+    assert pylint_key != ast_key
+    assert pylint_key != create_cache_key(PylintInspector(), config, "hash", in_memory=True)
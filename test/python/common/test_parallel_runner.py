@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from hyperstyle.src.python.review.application_config import ApplicationConfig
+from hyperstyle.src.python.review.common.parallel_runner import inspect_in_parallel, run_inspector
+from hyperstyle.src.python.review.common.subprocess_runner import ResourceLimits, run_in_subprocess
+from hyperstyle.src.python.review.inspectors.common.inspector.base_inspector import BaseInspector
+from hyperstyle.src.python.review.inspectors.common.inspector.inspector_type import InspectorType
+from hyperstyle.src.python.review.inspectors.common.issue.issue import (
+    BaseIssue,
+    CodeIssue,
+    IssueDifficulty,
+    IssueType,
+)
+
+LINTER_DURATION = 1
+
+
+class SleepingInspector(BaseInspector):
+    """Runs a subprocess that sleeps like a slow linter and returns one issue."""
+
+    def __init__(self, inspector_type: InspectorType) -> None:
+        self._inspector_type = inspector_type
+
+    @property
+    def inspector_type(self) -> InspectorType:
+        return self._inspector_type
+
+    def inspect(self, path: Path, config: dict[str, Any]) -> list[BaseIssue]:
+        run_in_subprocess([sys.executable, "-c", f"import time; time.sleep({LINTER_DURATION})"])
+        return [
+            CodeIssue(
+                origin_class="C0000",
+                type=IssueType.CODE_STYLE,
+                description=self.inspector_type.value,
+                file_path=path,
+                line_no=1,
+                column_no=1,
+                inspector_type=self.inspector_type,
+                difficulty=IssueDifficulty.EASY,
+            ),
+        ]
+
+    def inspect_in_memory(self, code: str, config: dict[str, Any]) -> list[BaseIssue]:
+        raise NotImplementedError
+
+
+class CpuBoundInspector(SleepingInspector):
+    """Returns an issue with the id of the process that it is run in."""
+
+    @classmethod
+    def is_cpu_bound(cls) -> bool:
+        return True
+
+    def inspect(self, path: Path, config: dict[str, Any]) -> list[BaseIssue]:
+        return [
+            CodeIssue(
+                origin_class="C0000",
+                type=IssueType.CODE_STYLE,
+                description=str(os.getpid()),
+                file_path=path,
+                line_no=1,
+                column_no=1,
+                inspector_type=self.inspector_type,
+                difficulty=IssueDifficulty.EASY,
+            ),
+        ]
+
+
+class FailingInspector(SleepingInspector):
+    def inspect(self, path: Path, config: dict[str, Any]) -> list[BaseIssue]:
+        msg = "The linter failed"
+        raise RuntimeError(msg)
+
+
+INSPECTOR_TYPES = [InspectorType.PYLINT, InspectorType.FLAKE8, InspectorType.RADON, InspectorType.PYTHON_AST]
+
+
+def test_inspectors_are_run_concurrently() -> None:
+    config = ApplicationConfig.get_default_config()
+    inspectors = [SleepingInspector(inspector_type) for inspector_type in INSPECTOR_TYPES]
+
+    start = time.monotonic()
+    issues = inspect_in_parallel(run_inspector, Path("main.py"), config, inspectors).issues
+    duration = time.monotonic() - start
+
+    # The issues are in the order of the inspectors
+    assert [issue.inspector_type for issue in issues] == INSPECTOR_TYPES
+    assert duration < LINTER_DURATION * len(INSPECTOR_TYPES) / 2
+
+
+def test_disabled_inspectors_are_not_run() -> None:
+    config = ApplicationConfig.get_default_config()
+    config.disabled_inspectors = {InspectorType.PYLINT, InspectorType.RADON}
+    inspectors = [SleepingInspector(inspector_type) for inspector_type in INSPECTOR_TYPES]
+
+    issues = inspect_in_parallel(run_inspector, Path("main.py"), config, inspectors).issues
+
+    assert [issue.inspector_type for issue in issues] == [InspectorType.FLAKE8, InspectorType.PYTHON_AST]
+
+
+def test_inspector_error_is_raised() -> None:
+    config = ApplicationConfig.get_default_config()
+    inspectors = [SleepingInspector(InspectorType.PYLINT), FailingInspector(InspectorType.FLAKE8)]
+
+    with pytest.raises(RuntimeError, match="The linter failed"):
+        inspect_in_parallel(run_inspector, Path("main.py"), config, inspectors)
+
+
+class HangingInProcessInspector(SleepingInspector):
+    def inspect(self, path: Path, config: dict[str, Any]) -> list[BaseIssue]:
+        time.sleep(LINTER_DURATION * 5)
+        return []
+
+
+def test_timed_out_inspectors_are_reported() -> None:
+    config = ApplicationConfig.get_default_config()
+    config.inspector_limits = {
+        InspectorType.PYLINT: ResourceLimits(wall_time=LINTER_DURATION / 4),
+        InspectorType.RADON: ResourceLimits(wall_time=LINTER_DURATION / 4),
+    }
+    inspectors = [
+        SleepingInspector(InspectorType.PYLINT),
+        SleepingInspector(InspectorType.FLAKE8),
+        HangingInProcessInspector(InspectorType.RADON),
+    ]
+
+    start = time.monotonic()
+    result = inspect_in_parallel(run_inspector, Path("main.py"), config, inspectors)
+
+    assert time.monotonic() - start < LINTER_DURATION * 4
+    assert result.timed_out_inspectors == [InspectorType.PYLINT, InspectorType.RADON]
+    assert [issue.inspector_type for issue in result.issues] == [InspectorType.FLAKE8]
+
+
+def test_linter_subprocesses_are_run_by_event_loop(monkeypatch: pytest.MonkeyPatch) -> None:
+    create_subprocess_exec = asyncio.create_subprocess_exec
+    commands = []
+
+    async def create_recorded_subprocess_exec(*command: str, **kwargs: Any) -> asyncio.subprocess.Process:
+        commands.append(command)
+        return await create_subprocess_exec(*command, **kwargs)
+
+    monkeypatch.setattr(asyncio, "create_subprocess_exec", create_recorded_subprocess_exec)
+    config = ApplicationConfig.get_default_config()
+    inspectors = [SleepingInspector(inspector_type) for inspector_type in INSPECTOR_TYPES]
+
+    issues = inspect_in_parallel(run_inspector, Path("main.py"), config, inspectors).issues
+
+    assert len(issues) == len(commands) == len(INSPECTOR_TYPES)
+
+
+@pytest.mark.parametrize(
+    ("n_cpu", "limits", "is_run_in_worker_process"),
+    [
+        (2, {}, True),
+        (1, {}, False),
+        (2, {InspectorType.PYTHON_AST: ResourceLimits(wall_time=30)}, False),
+    ],
+)
+def test_cpu_bound_inspectors_are_run_in_worker_processes(
+    n_cpu: int, limits: dict[InspectorType, ResourceLimits], is_run_in_worker_process: bool
+) -> None:
+    config = ApplicationConfig.get_default_config()
+    config.n_cpu = n_cpu
+    config.inspector_limits = limits
+    inspectors = [CpuBoundInspector(InspectorType.PYTHON_AST), SleepingInspector(InspectorType.PYLINT)]
+
+    cpu_bound_issue, issue = inspect_in_parallel(run_inspector, Path("main.py"), config, inspectors).issues
+
+    assert (cpu_bound_issue.description != str(os.getpid())) == is_run_in_worker_process
+    assert issue.description == InspectorType.PYLINT.value
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from hyperstyle.src.python.review.common.single_flight import SingleFlight
+
+N_CALLERS = 4
+
+
+def _call_concurrently(single_flight: SingleFlight[int], key: str) -> tuple[list[tuple[int, bool]], int]:
+    n_runs = 0
+    started = threading.Event()
+    release = threading.Event()
+
+    def function() -> int:
+        nonlocal n_runs
+        n_runs += 1
+        started.set()
+        release.wait()
+        return 42
+
+    with ThreadPoolExecutor(N_CALLERS) as executor:
+        leader = executor.submit(single_flight.do, key, function)
+        started.wait()
+        followers = [executor.submit(single_flight.do, key, function) for _ in range(N_CALLERS - 1)]
+        # Let the followers join the running call
+        time.sleep(0.2)
+        release.set()
+        results = [leader.result()] + [follower.result() for follower in followers]
+
+    return results, n_runs
+
+
+def test_concurrent_calls_are_coalesced() -> None:
+    results, n_runs = _call_concurrently(SingleFlight(), "key")
+
+    assert n_runs == 1
+    assert results == [(42, False)] + [(42, True)] * (N_CALLERS - 1)
+
+
+def test_result_is_not_kept() -> None:
+    single_flight: SingleFlight[int] = SingleFlight()
+
+    assert single_flight.do("key", lambda: 1) == (1, False)
+    assert single_flight.do("key", lambda: 2) == (2, False)
+
+
+def test_exception_is_shared() -> None:
+    single_flight: SingleFlight[int] = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+
+    def fail() -> int:
+        started.set()
+        release.wait()
+        msg = "The inspection failed"
+        raise RuntimeError(msg)
+
+    with ThreadPoolExecutor(2) as executor:
+        leader = executor.submit(single_flight.do, "key", fail)
+        started.wait()
+        follower = executor.submit(single_flight.do, "key", fail)
+        time.sleep(0.2)
+        release.set()
+
+        for future in (leader, follower):
+            with pytest.raises(RuntimeError, match="The inspection failed"):
+                future.result()
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import sys
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, TypeVar
+
+import pytest
+
+from hyperstyle.src.python.review.common.subprocess_runner import (
+    resource_limits,
+    ResourceLimits,
+    run_in_subprocess,
+    run_subprocesses_in_event_loop,
+)
+from hyperstyle.src.python.review.reviewers.exceptions import InspectionError, InspectorTimeoutError
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+T = TypeVar("T")
+
+
+def _is_process_alive(pid: int) -> bool:
+    # A killed process can stay a zombie until its new parent reaps it
+    try:
+        stat = Path(f"/proc/{pid}/stat").read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return False
+    return stat.rpartition(")")[2].split()[0] != "Z"
+
+
+def _call(function: Callable[[], T]) -> T:
+    return function()
+
+
+def _call_in_event_loop(function: Callable[[], T]) -> T:
+    async def call() -> T:
+        async with run_subprocesses_in_event_loop():
+            return await asyncio.to_thread(function)
+
+    return asyncio.run(call())
+
+
+CALLERS = [_call, _call_in_event_loop]
+
+
+def _run_with_limits(limits: ResourceLimits | None, command: list[str], **kwargs: str) -> str:
+    if limits is None:
+        return run_in_subprocess(command, **kwargs)
+
+    with resource_limits(limits):
+        return run_in_subprocess(command, **kwargs)
+
+
+@pytest.mark.parametrize("caller", CALLERS)
+@pytest.mark.parametrize("limits", [None, ResourceLimits(wall_time=10, cpu_time=10)])
+def test_run_in_subprocess(limits: ResourceLimits | None, caller: Callable[[Callable[[], str]], str]) -> None:
+    command = [sys.executable, "-c", "import sys; print(sys.stdin.read().upper())"]
+
+    output = caller(lambda: _run_with_limits(limits, command, subprocess_input="code"))
+
+    assert output == "CODE\n"
+
+
+@pytest.mark.parametrize("caller", CALLERS)
+def test_process_group_is_killed_on_timeout(
+    tmp_path: Path, caller: Callable[[Callable[[], str]], str]
+) -> None:
+    pid_file = tmp_path / "child.pid"
+    # The shell starts a child like run.sh of PMD starts a JVM
+    command = ["/bin/sh", "-c", f"sleep 30 & echo $! > {pid_file}; wait"]
+
+    start = time.monotonic()
+    with pytest.raises(InspectorTimeoutError):
+        caller(lambda: _run_with_limits(ResourceLimits(wall_time=0.5), command))
+
+    assert time.monotonic() - start < 10
+    time.sleep(0.1)
+    assert not _is_process_alive(int(pid_file.read_text()))
+
+
+def test_wall_time_is_shared_by_subprocesses() -> None:
+    command = [sys.executable, "-c", "import time; time.sleep(0.4)"]
+    with resource_limits(ResourceLimits(wall_time=1)), pytest.raises(InspectorTimeoutError):
+        for _ in range(5):
+            run_in_subprocess(command)
+
+
+@pytest.mark.parametrize("caller", CALLERS)
+def test_cpu_time_limit(caller: Callable[[Callable[[], str]], str]) -> None:
+    command = [sys.executable, "-c", "while True: pass"]
+    with pytest.raises(InspectorTimeoutError, match="cpu time"):
+        caller(lambda: _run_with_limits(ResourceLimits(wall_time=30, cpu_time=1), command))
+
+
+def _read_pid(pid_file: Path) -> int:
+    while not pid_file.exists() or not pid_file.read_text(encoding="utf-8").strip():
+        time.sleep(0.05)
+    return int(pid_file.read_text(encoding="utf-8"))
+
+
+def test_subprocesses_are_killed_when_event_loop_is_left(tmp_path: Path) -> None:
+    pid_file = tmp_path / "linter.pid"
+    command = ["/bin/sh", "-c", f"echo $$ > {pid_file}; exec sleep 30"]
+    executor = ThreadPoolExecutor(1)
+
+    async def leave_running_subprocess() -> tuple[Future[str], contextvars.Context]:
+        async with run_subprocesses_in_event_loop():
+            context = contextvars.copy_context()
+            future = executor.submit(context.run, run_in_subprocess, command)
+            await asyncio.to_thread(_read_pid, pid_file)
+        return future, context
+
+    future, context = asyncio.run(leave_running_subprocess())
+
+    with pytest.raises(InspectionError, match="killed"):
+        future.result(timeout=10)
+    assert not _is_process_alive(_read_pid(pid_file))
+
+    with pytest.raises(InspectionError, match="not run"):
+        context.run(run_in_subprocess, command)
+    executor.shutdown()
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import json
+import threading
+from http import HTTPStatus
+from http.client import HTTPConnection
+from typing import TYPE_CHECKING
+
+import pytest
+
+from hyperstyle.src.python.review.common.language import Language
+from hyperstyle.src.python.review.daemon.review_pool import ReviewPool, ReviewRequest, run_review_request
+from hyperstyle.src.python.review.daemon.server import create_server
+from hyperstyle.src.python.review.inspectors.common.inspector.inspector_type import InspectorType
+from test.python.inspectors import PYTHON_DATA_FOLDER
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+ENABLED_INSPECTORS = {InspectorType.PYTHON_AST}
+DISABLED_INSPECTORS = [inspector.value for inspector in InspectorType if inspector not in ENABLED_INSPECTORS]
+
+
+@pytest.fixture
+def daemon_connection() -> Iterator[HTTPConnection]:
+    review_pool = ReviewPool(workers=1, max_jobs_per_worker=2, max_queue=1, root=PYTHON_DATA_FOLDER)
+    server = create_server(review_pool, port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    host, port = server.server_address
+    connection = HTTPConnection(host, port, timeout=60)
+    try:
+        yield connection
+    finally:
+        connection.close()
+        server.shutdown()
+        server.server_close()
+        review_pool.close()
+
+
+def _post(connection: HTTPConnection, data: dict[str, object]) -> tuple[int, dict[str, object]]:
+    connection.request("POST", "/review", body=json.dumps(data), headers={"Content-Type": "application/json"})
+    response = connection.getresponse()
+    return response.status, json.loads(response.read())
+
+
+INCORRECT_REQUESTS = [
+    {},
+    {"path": "a.py", "code": "print(1)"},
+    {"code": "print(1)"},
+    {"code": "print(1)", "language": "cobol"},
+    {"path": "a.py", "disable": ["unknown"]},
+    {"path": "a.py", "language_version": "python2"},
+    {"path": "a.py", "n_cpu": 0},
+    {"path": "../a.py"},
+    {"path": "/etc/passwd"},
+    {"code": "print(1)", "language": "python", "manifest": "../manifest.json"},
+]
+
+
+@pytest.mark.parametrize("data", INCORRECT_REQUESTS)
+def test_incorrect_request(data: dict[str, object]) -> None:
+    with pytest.raises(ValueError):
+        ReviewRequest.from_json_dict(data, PYTHON_DATA_FOLDER)
+
+
+def test_request_without_root() -> None:
+    with pytest.raises(ValueError, match="root directory is not configured"):
+        ReviewRequest.from_json_dict({"path": "case2_boolean_expressions.py"})
+
+
+def test_request_path_is_resolved_in_root() -> None:
+    request = ReviewRequest.from_json_dict({"path": "case2_boolean_expressions.py"}, PYTHON_DATA_FOLDER)
+
+    assert request.path == (PYTHON_DATA_FOLDER / "case2_boolean_expressions.py").resolve()
+
+
+def test_request_from_json_dict() -> None:
+    request = ReviewRequest.from_json_dict(
+        {
+            "code": "print(1)",
+            "language": "python",
+            "disable": ["pylint", "flake8"],
+            "new_format": True,
+            "history": {"python": []},
+        },
+    )
+
+    assert request.path is None
+    assert request.code == "print(1)"
+    assert request.config.language == Language.PYTHON
+    assert request.config.disabled_inspectors == {InspectorType.PYLINT, InspectorType.FLAKE8}
+    assert request.config.new_format
+    assert request.config.history == '{"python": []}'
+
+
+def test_review_inline_code(daemon_connection: HTTPConnection) -> None:
+    code = (PYTHON_DATA_FOLDER / "case24_long_function.py").read_text()
+    data = {"code": code, "language": "python", "disable": DISABLED_INSPECTORS}
+
+    status, response = _post(daemon_connection, data)
+
+    assert status == HTTPStatus.OK
+    assert response == run_review_request(ReviewRequest.from_json_dict(data))
+    assert [issue["code"] for issue in response["issues"]] == ["C002"]
+
+
+def test_review_path(daemon_connection: HTTPConnection) -> None:
+    data = {
+        "path": str(PYTHON_DATA_FOLDER / "case2_boolean_expressions.py"),
+        "disable": DISABLED_INSPECTORS,
+        "new_format": True,
+    }
+
+    status, response = _post(daemon_connection, data)
+
+    assert status == HTTPStatus.OK
+    assert response == run_review_request(ReviewRequest.from_json_dict(data, PYTHON_DATA_FOLDER))
+    assert len(response["file_review_results"]) == 1
+
+
+def test_review_unknown_path(daemon_connection: HTTPConnection) -> None:
+    status, response = _post(daemon_connection, {"path": str(PYTHON_DATA_FOLDER / "unknown_file.py")})
+
+    assert status == HTTPStatus.BAD_REQUEST
+    assert response["error"]
+
+
+def test_review_path_outside_root(daemon_connection: HTTPConnection) -> None:
+    status, response = _post(daemon_connection, {"path": str(PYTHON_DATA_FOLDER.parent / "java")})
+
+    assert status == HTTPStatus.BAD_REQUEST
+    assert "outside the root" in response["error"]
+
+
+def test_health(daemon_connection: HTTPConnection) -> None:
+    daemon_connection.request("GET", "/health")
+    response = daemon_connection.getresponse()
+
+    assert response.status == HTTPStatus.OK
+    assert json.loads(response.read())["status"] == "ok"
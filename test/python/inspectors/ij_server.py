@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import socket
+import threading
+import time
+from concurrent import futures
+from typing import TYPE_CHECKING
+
+import grpc
+
+from hyperstyle.src.python.review.inspectors.common.inspector.proto import model_pb2, model_pb2_grpc
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+HOST = "localhost"
+
+
+def get_free_port() -> int:
+    """Get a local port without a server to check the connection failures."""
+    with socket.socket() as sock:
+        sock.bind((HOST, 0))
+        return sock.getsockname()[1]
+
+
+class LocalInspectionService(model_pb2_grpc.CodeInspectionServiceServicer):
+    """Stand-in for the IJ code server: reports one problem with the text of each non-empty line.
+
+    The connections and the calls are recorded, so the tests can check how the server is used.
+    The batch results are sent in the reverse order to check that the client maps them by ids.
+    Set ``delay`` to simulate a slow server.
+    """
+
+    def __init__(self, support_batch: bool = True) -> None:
+        self.support_batch = support_batch
+        self.delay = 0.0
+        self.peers: set[str] = set()
+        self.calls: list[str] = []
+        self._lock = threading.Lock()
+
+    def inspect(self, request: model_pb2.Code, context: grpc.ServicerContext) -> model_pb2.InspectionResult:
+        self._record_call("inspect", context)
+        time.sleep(self.delay)
+        return self._inspect_code(request)
+
+    def inspectBatch(  # noqa: N802 The name of the method is defined by the proto file
+        self, request_iterator: Iterator[model_pb2.Code], context: grpc.ServicerContext
+    ) -> Iterator[model_pb2.InspectionResult]:
+        if not self.support_batch:
+            context.abort(grpc.StatusCode.UNIMPLEMENTED, "Method not implemented!")
+
+        self._record_call("inspectBatch", context)
+        yield from reversed([self._inspect_code(code) for code in request_iterator])
+
+    def _record_call(self, name: str, context: grpc.ServicerContext) -> None:
+        with self._lock:
+            self.peers.add(context.peer())
+            self.calls.append(name)
+
+    @staticmethod
+    def _inspect_code(code: model_pb2.Code) -> model_pb2.InspectionResult:
+        return model_pb2.InspectionResult(
+            id=code.id,
+            problems=[
+                model_pb2.Problem(name=line, inspector="LineInspection", lineNumber=number)
+                for number, line in enumerate(code.text.splitlines(), start=1)
+                if line.strip()
+            ],
+        )
+
+
+class LocalIJServer:
+    """Runs the ``LocalInspectionService`` on a free local port."""
+
+    def __init__(self, service: LocalInspectionService | None = None) -> None:
+        self.service = LocalInspectionService() if service is None else service
+        self._server = grpc.server(futures.ThreadPoolExecutor(max_workers=4))
+        model_pb2_grpc.add_CodeInspectionServiceServicer_to_server(self.service, self._server)
+        self.port = self._server.add_insecure_port(f"{HOST}:0")
+
+    def start(self) -> None:
+        self._server.start()
+
+    def stop(self) -> None:
+        self._server.stop(None)
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+from hyperstyle.src.python.review.inspectors.checkstyle.checkstyle import (
+    CHECKSTYLE_DIRECTORY_ENV,
+    CHECKSTYLE_MAIN_CLASS,
+    CHECKSTYLE_VERSION_ENV,
+    CheckstyleInspector,
+)
+from hyperstyle.src.python.review.inspectors.common import cds
+from hyperstyle.src.python.review.inspectors.common.cds import (
+    build_cds_archive,
+    CDS_DIRECTORY_ENV,
+    create_cds_command,
+    JvmTool,
+    TUNED_JVM_OPTIONS,
+)
+from hyperstyle.src.python.review.reviewers.exceptions import InspectionError
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+TOOL = JvmTool("linter", "1.0", "org.example.Main", (Path("linter.jar"),))
+
+
+@pytest.fixture(autouse=True)
+def cds_directory(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Path:
+    directory = tmp_path / "cds"
+    monkeypatch.setenv(CDS_DIRECTORY_ENV, str(directory))
+    return directory
+
+
+def _fake_java(commands: list[list[str]], *, dump_archive: bool = True) -> Callable[[list[str]], str]:
+    def run(command: list[str]) -> str:
+        commands.append(command)
+        archive_options = [option for option in command if option.startswith("-XX:SharedArchiveFile=")]
+        if dump_archive and "-Xshare:dump" in command:
+            Path(archive_options[0].split("=", 1)[1]).write_bytes(b"archive")
+        return ""
+
+    return run
+
+
+def test_no_archive() -> None:
+    assert create_cds_command(TOOL, ["Main.java"]) is None
+
+
+def test_cds_command(cds_directory: Path) -> None:
+    cds_directory.mkdir()
+    TOOL.archive_path.write_bytes(b"archive")
+
+    assert TOOL.archive_path.parent == cds_directory
+    assert create_cds_command(TOOL, ["Main.java"]) == [
+        "java",
+        f"-XX:SharedArchiveFile={TOOL.archive_path}",
+        "-Xshare:auto",
+        *TUNED_JVM_OPTIONS,
+        "-cp",
+        "linter.jar",
+        "org.example.Main",
+        "Main.java",
+    ]
+
+
+def test_build_cds_archive(monkeypatch: pytest.MonkeyPatch, cds_directory: Path) -> None:
+    commands = []
+    monkeypatch.setattr(cds, "run_in_subprocess", _fake_java(commands))
+
+    result = build_cds_archive(TOOL, ["Main.java"])
+
+    assert result.tool == TOOL
+    assert TOOL.archive_path.read_bytes() == b"archive"
+    assert [path.name for path in cds_directory.iterdir()] == [TOOL.archive_path.name]
+
+    without_archive, dump_class_list, dump_archive, with_archive = commands
+    assert without_archive == ["java", "-cp", "linter.jar", "org.example.Main", "Main.java"]
+    assert f"-XX:DumpLoadedClassList={TOOL.class_list_path}" in dump_class_list
+    assert f"-XX:SharedClassListFile={TOOL.class_list_path}" in dump_archive
+    assert with_archive == create_cds_command(TOOL, ["Main.java"])
+
+
+def test_archive_is_not_created(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(cds, "run_in_subprocess", _fake_java([], dump_archive=False))
+
+    with pytest.raises(InspectionError):
+        build_cds_archive(TOOL, ["Main.java"])
+
+
+def test_checkstyle_uses_archive(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.setenv(CHECKSTYLE_DIRECTORY_ENV, str(tmp_path))
+    monkeypatch.setenv(CHECKSTYLE_VERSION_ENV, "8.44")
+    path, output_path = Path("Main.java"), Path("output.xml")
+
+    assert CheckstyleInspector._create_command(path, output_path)[:2] == ["java", "-jar"]
+
+    commands = []
+    monkeypatch.setattr(cds, "run_in_subprocess", _fake_java(commands))
+    CheckstyleInspector.warm_up(path, output_path)
+
+    command = CheckstyleInspector._create_command(path, output_path)
+    assert command == commands[-1]
+    assert command[command.index("-cp") + 1 :][:2] == [
+        str(tmp_path / "checkstyle-8.44-all.jar"),
+        CHECKSTYLE_MAIN_CLASS,
+    ]
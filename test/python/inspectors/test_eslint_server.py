@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import shutil
+from typing import TYPE_CHECKING
+
+import pytest
+
+from hyperstyle.src.python.review.common.subprocess_runner import resource_limits, ResourceLimits
+from hyperstyle.src.python.review.inspectors.eslint import eslint_server
+from hyperstyle.src.python.review.inspectors.eslint.eslint import (
+    ESLINT_BACKEND_ENV,
+    ESLintInspector,
+    PATH_ESLINT_CONFIG,
+)
+from hyperstyle.src.python.review.inspectors.eslint.eslint_server import ESLintServer
+from hyperstyle.src.python.review.reviewers.exceptions import InspectorTimeoutError
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+NODE_COMMAND = shutil.which("node")
+
+pytestmark = pytest.mark.skipif(NODE_COMMAND is None, reason="Node is not installed")
+
+# Reports a "curly" issue on each line of the code that contains "if" and hangs or exits on special codes
+FAKE_ESLINT_MODULE = """
+const fs = require("fs");
+
+const escape = (text) =>
+  text.replace(/&/g, "&amp;").replace(/</g, "&lt;").replace(/>/g, "&gt;").replace(/"/g, "&quot;");
+
+class ESLint {
+  constructor(options) {
+    this.options = options;
+  }
+
+  async lintFiles(patterns) {
+    return patterns.map((path) => this.lint(fs.readFileSync(path, "utf-8"), path));
+  }
+
+  async lintText(code) {
+    if (code === "hang") {
+      return new Promise(() => {});
+    }
+    if (code === "exit") {
+      process.exit(1);
+    }
+    return [this.lint(code, "<text>")];
+  }
+
+  lint(code, filePath) {
+    const messages = code
+      .split("\\n")
+      .map((line, index) => ({ line, index }))
+      .filter(({ line }) => line.includes("if"))
+      .map(({ index }) => ({ line: index + 1, column: 1, message: "Expected { after 'if' condition." }));
+    return { filePath, messages };
+  }
+
+  async loadFormatter() {
+    return {
+      format: (results) =>
+        "<checkstyle>" +
+        results
+          .map(
+            ({ filePath, messages }) =>
+              `<file name="${escape(filePath)}">` +
+              messages
+                .map(
+                  ({ line, column, message }) =>
+                    `<error line="${line}" column="${column}" severity="error" ` +
+                    `message="${escape(message)}" source="eslint.rules.curly" />`,
+                )
+                .join("") +
+              "</file>",
+          )
+          .join("") +
+        "</checkstyle>",
+    };
+  }
+}
+
+module.exports = { ESLint };
+"""
+
+CODE = "if (a) b();\nlet c = 1;\nif (c) d();\n"
+
+
+@pytest.fixture
+def eslint_module(tmp_path: Path) -> Path:
+    module = tmp_path / "eslint"
+    module.mkdir()
+    (module / "index.js").write_text(FAKE_ESLINT_MODULE)
+    return module
+
+
+@pytest.fixture
+def server(eslint_module: Path) -> Iterator[ESLintServer]:
+    worker = ESLintServer(NODE_COMMAND, eslint_module, PATH_ESLINT_CONFIG)
+    yield worker
+    worker.stop()
+
+
+def test_lint_code(server: ESLintServer) -> None:
+    output = server.lint_code(CODE)
+
+    assert output.count("<error ") == 2
+    assert 'name="&lt;text&gt;"' in output
+
+
+def test_lint_file(server: ESLintServer, tmp_path: Path) -> None:
+    path = tmp_path / "main.js"
+    path.write_text(CODE)
+
+    assert f'name="{path}"' in server.lint_file(path)
+
+
+def test_worker_is_reused(server: ESLintServer) -> None:
+    server.lint_code(CODE)
+    pid = server._process.pid
+    server.lint_code(CODE)
+
+    assert server._process.pid == pid
+
+
+def test_worker_is_restarted(server: ESLintServer) -> None:
+    assert server.lint_code("exit") is None
+    assert server.lint_code(CODE) is not None
+
+
+def test_timeout(server: ESLintServer) -> None:
+    with resource_limits(ResourceLimits(wall_time=0.5)), pytest.raises(InspectorTimeoutError):
+        server.lint_code("hang")
+
+    # The hung worker is killed, and a new one is started
+    assert server.lint_code(CODE) is not None
+
+
+def test_inspector_uses_server(monkeypatch: pytest.MonkeyPatch, eslint_module: Path, tmp_path: Path) -> None:
+    monkeypatch.setenv(ESLINT_BACKEND_ENV, "server")
+    monkeypatch.setattr(eslint_server, "find_eslint_module", lambda: eslint_module)
+    eslint_server._create_eslint_server.cache_clear()
+
+    path = tmp_path / "main.js"
+    path.write_text(CODE)
+
+    try:
+        issues = ESLintInspector().inspect(path, {})
+        in_memory_issues = ESLintInspector.inspect_in_memory(CODE, {})
+    finally:
+        eslint_server._create_eslint_server(PATH_ESLINT_CONFIG).stop()
+        eslint_server._create_eslint_server.cache_clear()
+
+    assert [(issue.origin_class, issue.line_no, issue.file_path) for issue in issues] == [
+        ("curly", 1, path),
+        ("curly", 3, path),
+    ]
+    assert [issue.line_no for issue in in_memory_issues] == [1, 3]
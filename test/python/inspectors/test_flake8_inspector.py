@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import sys
 from textwrap import dedent
+from typing import TYPE_CHECKING
 
 import pytest
 
 from hyperstyle.src.python.review.common.language import Language
+from hyperstyle.src.python.review.inspectors.common.inspector.inspector_backend import InspectorBackend
 from hyperstyle.src.python.review.inspectors.common.issue.issue import IssueType
 from hyperstyle.src.python.review.inspectors.common.issue.tips import (
     get_augmented_assign_pattern_tip,
@@ -13,11 +16,16 @@ from hyperstyle.src.python.review.inspectors.common.issue.tips import (
     get_line_len_tip,
     get_magic_number_tip,
 )
-from hyperstyle.src.python.review.inspectors.flake8.flake8 import Flake8Inspector
+from hyperstyle.src.python.review.inspectors.flake8.flake8 import FLAKE8_BACKEND_ENV, Flake8Inspector
 from hyperstyle.src.python.review.reviewers.utils.issues_filter import filter_low_measure_issues
 from test.python.inspectors import FLAKE_DATA_FOLDER, PYTHON_DATA_FOLDER
 from test.python.inspectors.conftest import gather_issues_test_info, IssuesTestInfo, use_file_metadata
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from hyperstyle.src.python.review.inspectors.common.issue.issue import BaseIssue
+
 FILE_NAMES_AND_N_ISSUES = [
     ("case0_spaces.py", 5),
     ("case1_simple_valid_program.py", 0),
@@ -119,6 +127,15 @@ def test_parse() -> None:
     assert [issue.type for issue in issues] == [IssueType.CODE_STYLE, IssueType.CODE_STYLE, IssueType.INFO]
 
 
+def test_parse_code_with_colon() -> None:
+    output = "test.py:1:11:N400::Found backslash that is used for line breaking"
+
+    issues = Flake8Inspector.parse(output)
+
+    assert [issue.origin_class for issue in issues] == ["N400"]
+    assert [issue.description for issue in issues] == ["Found backslash that is used for line breaking"]
+
+
 def test_choose_issue_type() -> None:
     error_codes = ["B006", "SC100", "R503", "ABC123", "E101"]
     expected_issue_types = [
@@ -189,3 +206,72 @@ def test_new_issue_description(origin_class: str, expected_description: str) ->
     issue = next(filter(lambda elem: elem.origin_class == origin_class, issues))
 
     assert issue.description == expected_description
+
+
+def _to_comparable(issues: list[BaseIssue]) -> list[tuple[str, int, int, str]]:
+    return sorted((issue.origin_class, issue.line_no, issue.column_no, issue.description) for issue in issues)
+
+
+BACKEND_FILE_NAMES = [
+    "case0_spaces.py",
+    "case4_naming.py",
+    "case13_complex_logic.py",
+    "case31_line_break.py",
+]
+
+
+@pytest.mark.parametrize("file_name", BACKEND_FILE_NAMES)
+def test_backends_return_same_issues(file_name: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    path_to_file = PYTHON_DATA_FOLDER / file_name
+
+    monkeypatch.setenv(FLAKE8_BACKEND_ENV, InspectorBackend.SUBPROCESS.value)
+    subprocess_issues = Flake8Inspector.inspect(path_to_file, {})
+
+    monkeypatch.setenv(FLAKE8_BACKEND_ENV, InspectorBackend.IN_PROCESS.value)
+    in_process_issues = Flake8Inspector.inspect(path_to_file, {})
+
+    assert _to_comparable(subprocess_issues) == _to_comparable(in_process_issues)
+
+
+@pytest.mark.parametrize("backend", InspectorBackend.values())
+def test_inspect_in_memory(backend: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv(FLAKE8_BACKEND_ENV, backend)
+
+    for file_name in ["case4_naming.py", "case20_imports_order.py"]:
+        path_to_file = PYTHON_DATA_FOLDER / file_name
+
+        in_memory_issues = Flake8Inspector.inspect_in_memory(path_to_file.read_text(), {})
+        issues = Flake8Inspector.inspect(path_to_file, {})
+
+        assert _to_comparable(in_memory_issues) == _to_comparable(issues)
+
+
+class UnreadableStdin:
+    def __getattr__(self, name: str) -> None:
+        pytest.fail("Stdin is read")
+
+
+def test_inspect_in_memory_does_not_read_stdin(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv(FLAKE8_BACKEND_ENV, InspectorBackend.IN_PROCESS.value)
+    stdin = UnreadableStdin()
+    monkeypatch.setattr("sys.stdin", stdin)
+
+    for file_name in [
+        "case3_redefining_builtin.py",
+        "case20_imports_order.py",
+        "case10_unused_variable_in_loop.py",
+    ]:
+        path_to_file = PYTHON_DATA_FOLDER / file_name
+
+        in_memory_issues = Flake8Inspector.inspect_in_memory(path_to_file.read_text(), {})
+        issues = Flake8Inspector.inspect(path_to_file, {})
+
+        assert _to_comparable(in_memory_issues) == _to_comparable(issues)
+
+    # Some plugins read the code on their own if it is empty
+    path_to_empty_file = tmp_path / "main.py"
+    path_to_empty_file.touch()
+    in_memory_issues = Flake8Inspector.inspect_in_memory("", {})
+    assert _to_comparable(in_memory_issues) == _to_comparable(Flake8Inspector.inspect(path_to_empty_file, {}))
+
+    assert sys.stdin is stdin
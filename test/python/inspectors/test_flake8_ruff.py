@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import pytest
+
+from hyperstyle.src.python.review.inspectors.flake8 import ruff
+from hyperstyle.src.python.review.inspectors.flake8.flake8 import _get_application, Flake8Inspector
+from hyperstyle.src.python.review.inspectors.flake8.issue_configs import ISSUE_CONFIGS
+from hyperstyle.src.python.review.inspectors.flake8.ruff import (
+    FLAKE8_RULES_BACKEND_ENV,
+    Flake8RulesBackend,
+    get_flake8_code,
+    get_flake8_description,
+    get_flake8_rules_backend,
+)
+from hyperstyle.src.python.review.inspectors.pyast.metrics import PythonMetricsBackend
+from test.python.benchmarks.ruff_parity import compare_backends, inspect_with_backend
+from test.python.inspectors import PYTHON_DATA_FOLDER
+
+# Ruff reports C813, C815 and C816 as COM812, doesn't check the blank returns after the loops in R503
+# and reports R504 and R505 in other cases than flake8-return
+EXPECTED_DIFFERING_CODES = {"A003", "C419", "C812", "C813", "C815", "C816", "R503", "R504", "R505"}
+
+
+@pytest.mark.parametrize(
+    ("ruff_code", "expected_code"),
+    [
+        ("F841", "F841"),
+        ("E501", "E501"),
+        ("ERA001", "E800"),
+        ("COM812", "C812"),
+        ("RET504", "R504"),
+        ("C408", "C408"),
+        ("N802", "N802"),
+    ],
+)
+def test_flake8_code(ruff_code: str, expected_code: str) -> None:
+    assert get_flake8_code(ruff_code) == expected_code
+
+
+@pytest.mark.parametrize(
+    ("code", "ruff_message", "expected_description"),
+    [
+        ("E501", "Line too long (130 > 120)", "line too long (130 > 120 characters)"),
+        (
+            "B007",
+            "Loop control variable `i` not used within loop body",
+            "Loop control variable 'i' not used within the loop body",
+        ),
+        (
+            "F841",
+            "Local variable `x` is assigned to but never used",
+            "local variable 'x' is assigned to but never used",
+        ),
+        ("C812", "Trailing comma missing", "missing trailing comma"),
+        ("C416", "Unnecessary `list` comprehension", "Unnecessary 'list' comprehension"),
+    ],
+)
+def test_flake8_description(code: str, ruff_message: str, expected_description: str) -> None:
+    assert get_flake8_description(code, ruff_message) == expected_description
+
+
+def test_ruff_backend_parity() -> None:
+    flake8_issues = inspect_with_backend(PYTHON_DATA_FOLDER, Flake8RulesBackend.FLAKE8)
+    ruff_issues = inspect_with_backend(PYTHON_DATA_FOLDER, Flake8RulesBackend.RUFF)
+
+    parities = compare_backends(flake8_issues, ruff_issues)
+
+    assert {
+        code for code, parity in parities.items() if parity.n_flake8_only != 0 or parity.n_ruff_only != 0
+    } == EXPECTED_DIFFERING_CODES
+    # The descriptions of the issues with the configs are parsed, so they must be the same
+    assert not {config.origin_class for config in ISSUE_CONFIGS} & parities.keys()
+
+
+def test_ruff_backend_in_memory(monkeypatch: pytest.MonkeyPatch) -> None:
+    code = "def f( x ):\n    for i in x:\n        pass\n    return None\n"
+    monkeypatch.setenv(FLAKE8_RULES_BACKEND_ENV, Flake8RulesBackend.RUFF.value)
+
+    issues = Flake8Inspector.inspect_in_memory(code, {})
+
+    assert sorted((issue.origin_class, issue.line_no, issue.column_no) for issue in issues) == [
+        ("B007", 2, 9),
+        ("C901", 1, 1),
+        ("E201", 1, 7),
+        ("E202", 1, 9),
+        ("R501", 4, 5),
+        ("WPS328", 2, 5),
+    ]
+
+
+def test_replaced_plugins_are_not_loaded() -> None:
+    plugin_names = _get_application(
+        PythonMetricsBackend.NATIVE, Flake8RulesBackend.RUFF
+    ).check_plugins.manager.names
+
+    assert sorted(plugin_names) == ["I", "N4", "P", "R70", "SC", "WPS"]
+
+
+@pytest.mark.parametrize(
+    ("value", "is_installed", "expected_backend"),
+    [
+        (None, True, Flake8RulesBackend.FLAKE8),
+        ("ruff", True, Flake8RulesBackend.RUFF),
+        (" Flake8 ", True, Flake8RulesBackend.FLAKE8),
+        ("unknown", True, Flake8RulesBackend.FLAKE8),
+        ("ruff", False, Flake8RulesBackend.FLAKE8),
+    ],
+)
+def test_get_flake8_rules_backend(
+    monkeypatch: pytest.MonkeyPatch,
+    value: str | None,
+    is_installed: bool,
+    expected_backend: Flake8RulesBackend,
+) -> None:
+    if value is None:
+        monkeypatch.delenv(FLAKE8_RULES_BACKEND_ENV, raising=False)
+    else:
+        monkeypatch.setenv(FLAKE8_RULES_BACKEND_ENV, value)
+    monkeypatch.setattr(ruff, "is_ruff_installed", lambda: is_installed)
+
+    assert get_flake8_rules_backend() == expected_backend
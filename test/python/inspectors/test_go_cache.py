@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from hyperstyle.src.python.review.common.file_system import file_lock
+from hyperstyle.src.python.review.inspectors.golang_lint import go_cache, golang_lint
+from hyperstyle.src.python.review.inspectors.golang_lint.go_cache import (
+    BUILD_CACHE_DIRECTORY,
+    GO_CACHE_DIRECTORY_ENV,
+    GoCacheManager,
+    LOCK_FILE,
+    MODULE_CACHE_DIRECTORY,
+    TRIM_FILE,
+    TRIM_INTERVAL,
+    TRIM_RETRY_INTERVAL,
+)
+from hyperstyle.src.python.review.inspectors.golang_lint.golang_lint import (
+    GOLANG_LINT_DIRECTORY_ENV,
+    GOLANG_LINT_VERSION_ENV,
+    GolangLintInspector,
+)
+from test.python.inspectors import GO_DATA_FOLDER
+
+VERSIONS_KEY = "go1.18-golangci-lint1.49.0"
+
+
+def _fill_build_cache(manager: GoCacheManager, n_files: int, file_size: int) -> list[Path]:
+    cache_directory = manager.get_version_directory(VERSIONS_KEY) / BUILD_CACHE_DIRECTORY / "00"
+    cache_directory.mkdir(parents=True)
+
+    paths = []
+    for index in range(n_files):
+        path = cache_directory / f"entry_{index}"
+        path.write_bytes(b"a" * file_size)
+        os.utime(path, (index, index))
+        paths.append(path)
+
+    return paths
+
+
+def test_environment(tmp_path: Path) -> None:
+    manager = GoCacheManager(tmp_path)
+
+    with manager.use(VERSIONS_KEY) as environment:
+        assert environment == {
+            "GOCACHE": str(tmp_path / VERSIONS_KEY / "build"),
+            "GOLANGCI_LINT_CACHE": str(tmp_path / VERSIONS_KEY / "lint"),
+        }
+
+    # The module cache is used only after the warm-up fills it
+    (tmp_path / MODULE_CACHE_DIRECTORY).mkdir()
+    assert manager.get_environment(VERSIONS_KEY)["GOMODCACHE"] == str(tmp_path / MODULE_CACHE_DIRECTORY)
+    assert manager.get_environment("go1.19-golangci-lint1.49.0")["GOCACHE"] != environment["GOCACHE"]
+
+
+def test_eviction(tmp_path: Path) -> None:
+    manager = GoCacheManager(tmp_path, max_size=250)
+    paths = _fill_build_cache(manager, n_files=3, file_size=100)
+
+    with manager.use(VERSIONS_KEY):
+        pass
+
+    # The least recently used file is removed
+    assert [path.exists() for path in paths] == [False, True, True]
+
+
+def test_eviction_interval(tmp_path: Path) -> None:
+    manager = GoCacheManager(tmp_path, max_size=250)
+    paths = _fill_build_cache(manager, n_files=3, file_size=100)
+    (manager.get_version_directory(VERSIONS_KEY) / TRIM_FILE).touch()
+
+    with manager.use(VERSIONS_KEY):
+        pass
+
+    # The caches were trimmed recently, so they are not checked again
+    assert all(path.exists() for path in paths)
+
+
+def test_caches_in_use_are_not_evicted(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(go_cache, "TRIM_LOCK_TIMEOUT", 0.1)
+    manager = GoCacheManager(tmp_path, max_size=250)
+    paths = _fill_build_cache(manager, n_files=3, file_size=100)
+
+    # Another review uses the caches
+    with (
+        file_lock(manager.get_version_directory(VERSIONS_KEY) / LOCK_FILE, shared=True),
+        manager.use(VERSIONS_KEY),
+    ):
+        pass
+
+    assert all(path.exists() for path in paths)
+    # The trimming is tried again after the retry interval rather than the full one
+    trim_age = time.time() - (manager.get_version_directory(VERSIONS_KEY) / TRIM_FILE).stat().st_mtime
+    assert trim_age == pytest.approx(TRIM_INTERVAL - TRIM_RETRY_INTERVAL, abs=5)
+
+
+def test_caches_are_trimmed_under_overlapping_reviews(tmp_path: Path) -> None:
+    manager = GoCacheManager(tmp_path, max_size=250)
+    paths = _fill_build_cache(manager, n_files=3, file_size=100)
+    first_review_started = threading.Event()
+
+    def review_first() -> None:
+        with manager.use(VERSIONS_KEY):
+            first_review_started.set()
+            # The second review finishes and starts the trimming while the first one is still running
+            time.sleep(0.3)
+            assert all(path.exists() for path in paths)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        first_review = executor.submit(review_first)
+        first_review_started.wait()
+        with manager.use(VERSIONS_KEY):
+            pass
+        first_review.result()
+
+    assert [path.exists() for path in paths] == [False, True, True]
+
+
+def test_golang_lint_uses_caches(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.setenv(GOLANG_LINT_DIRECTORY_ENV, str(tmp_path / "golangci-lint"))
+    monkeypatch.setenv(GOLANG_LINT_VERSION_ENV, "1.49.0")
+    monkeypatch.setenv(GO_CACHE_DIRECTORY_ENV, str(tmp_path / "cache"))
+
+    environments = []
+
+    def run_golang_lint(command: list[str], working_directory: Path, environment: dict[str, str]) -> str:
+        environments.append(environment)
+        output = next(argument for argument in command if argument.startswith("json:"))
+        Path(output.removeprefix("json:")).write_text(json.dumps({"Issues": []}), encoding="utf-8")
+        return ""
+
+    monkeypatch.setattr(golang_lint, "run_in_subprocess", run_golang_lint)
+
+    assert GolangLintInspector().inspect(GO_DATA_FOLDER / "case0_empty.go", {"n_cpu": 1}) == []
+    assert environments == [
+        {
+            "GOCACHE": str(tmp_path / "cache" / VERSIONS_KEY / "build"),
+            "GOLANGCI_LINT_CACHE": str(tmp_path / "cache" / VERSIONS_KEY / "lint"),
+        }
+    ]
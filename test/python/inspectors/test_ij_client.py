@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING
+
+import pytest
+
+from hyperstyle.src.python.review.inspectors.common.inspector.ij_client import channel_pool, IJClient
+from hyperstyle.src.python.review.inspectors.common.inspector.proto import model_pb2
+from hyperstyle.src.python.review.inspectors.ij_python.ij_python import PythonIJInspector
+from test.python.inspectors.ij_server import get_free_port, HOST, LocalIJServer, LocalInspectionService
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+
+@pytest.fixture
+def server() -> Iterator[LocalIJServer]:
+    server = LocalIJServer()
+    server.start()
+    yield server
+    server.stop()
+    channel_pool.close()
+
+
+@pytest.fixture
+def server_without_batch() -> Iterator[LocalIJServer]:
+    server = LocalIJServer(LocalInspectionService(support_batch=False))
+    server.start()
+    yield server
+    server.stop()
+    channel_pool.close()
+
+
+def _create_code(text: str, code_id: str = "") -> model_pb2.Code:
+    return model_pb2.Code(text=text, languageId=model_pb2.python, id=code_id)
+
+
+def test_channel_is_reused(server: LocalIJServer) -> None:
+    for number in range(1, 4):
+        client = IJClient(HOST, server.port)
+        result = client.inspect(_create_code("a\n" * number))
+        assert len(result.problems) == number
+
+    assert IJClient(HOST, server.port).channel is client.channel
+    assert len(server.service.peers) == 1
+
+
+def test_unreachable_server_fails_fast() -> None:
+    port = get_free_port()
+
+    with pytest.raises(Exception, match="Failed to connect to ij code server"):
+        IJClient(HOST, port).inspect(_create_code("a"))
+
+    start = time.monotonic()
+    for _ in range(10):
+        with pytest.raises(Exception, match="Failed to connect to ij code server"):
+            IJClient(HOST, port).inspect(_create_code("a"))
+    assert time.monotonic() - start < 1
+
+    channel_pool.close()
+
+
+def test_inspect_batch(server: LocalIJServer) -> None:
+    codes = [_create_code("a\n" * number, code_id=f"file_{number}") for number in range(1, 4)]
+
+    results = IJClient(HOST, server.port).inspect_batch(codes)
+
+    assert {code_id: len(result.problems) for code_id, result in results.items()} == {
+        "file_1": 1,
+        "file_2": 2,
+        "file_3": 3,
+    }
+    assert server.service.calls == ["inspectBatch"]
+
+
+def test_inspect_batch_duplicate_ids(server: LocalIJServer) -> None:
+    with pytest.raises(ValueError, match="unique"):
+        IJClient(HOST, server.port).inspect_batch([_create_code("a", "id"), _create_code("b", "id")])
+
+
+def test_inspect_batch_without_server_support(server_without_batch: LocalIJServer) -> None:
+    codes = [_create_code("a", code_id="first"), _create_code("b\nc", code_id="second")]
+
+    results = IJClient(HOST, server_without_batch.port).inspect_batch(codes)
+
+    assert {code_id: len(result.problems) for code_id, result in results.items()} == {"first": 1, "second": 2}
+    assert server_without_batch.service.calls == ["inspect", "inspect"]
+
+
+def test_inspect_project(server: LocalIJServer, tmp_path: Path) -> None:
+    files = {
+        tmp_path / "main.py": "import utils\n\nprint(utils.VALUE)",
+        tmp_path / "package" / "utils.py": "VALUE = 1",
+        tmp_path / "README.md": "Not a Python file",
+    }
+    for file_path, content in files.items():
+        file_path.parent.mkdir(exist_ok=True)
+        file_path.write_text(content)
+
+    inspector = PythonIJInspector()
+    inspector.setup_connection_parameters(HOST, server.port)
+    issues = inspector.inspect(tmp_path, {})
+
+    assert sorted((issue.file_path, issue.line_no, issue.description) for issue in issues) == [
+        (tmp_path / "main.py", 1, "import utils"),
+        (tmp_path / "main.py", 3, "print(utils.VALUE)"),
+        (tmp_path / "package" / "utils.py", 1, "VALUE = 1"),
+    ]
+    assert server.service.calls == ["inspectBatch"]
+
+
+def test_inspect_in_memory_batch(server: LocalIJServer) -> None:
+    inspector = PythonIJInspector()
+    inspector.setup_connection_parameters(HOST, server.port)
+
+    issues = inspector.inspect_in_memory_batch(["a = 1", "b = 2\nc = 3", ""])
+
+    assert [[issue.description for issue in submission_issues] for submission_issues in issues] == [
+        ["a = 1"],
+        ["b = 2", "c = 3"],
+        [],
+    ]
+    assert server.service.calls == ["inspectBatch"]
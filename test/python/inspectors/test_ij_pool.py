@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+import pytest
+
+from hyperstyle.src.python.review.inspectors.common.inspector import ij_pool
+from hyperstyle.src.python.review.inspectors.common.inspector.ij_client import channel_pool, IJConnectionError
+from hyperstyle.src.python.review.inspectors.common.inspector.ij_pool import (
+    CIRCUIT_BREAKER_THRESHOLD,
+    create_ij_server_pool,
+    IJEndpoint,
+    IJServerPool,
+    MIN_HEDGING_SAMPLES,
+)
+from hyperstyle.src.python.review.inspectors.common.inspector.proto import model_pb2
+from test.python.inspectors.ij_server import get_free_port, HOST, LocalIJServer
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+@pytest.fixture
+def servers() -> Iterator[tuple[LocalIJServer, LocalIJServer]]:
+    servers = LocalIJServer(), LocalIJServer()
+    for server in servers:
+        server.start()
+    yield servers
+    for server in servers:
+        server.stop()
+    channel_pool.close()
+
+
+def _create_code(text: str = "a") -> model_pb2.Code:
+    return model_pb2.Code(text=text, languageId=model_pb2.python)
+
+
+def test_requests_are_spread_over_endpoints(servers: tuple[LocalIJServer, LocalIJServer]) -> None:
+    pool = IJServerPool(tuple(IJEndpoint(HOST, server.port) for server in servers))
+
+    for _ in range(10):
+        assert len(pool.inspect(_create_code()).problems) == 1
+
+    assert [len(server.service.calls) for server in servers] == [5, 5]
+    assert [endpoint_stats["requests"] for endpoint_stats in pool.stats.values()] == [5, 5]
+
+
+def test_dead_endpoint_is_skipped(servers: tuple[LocalIJServer, LocalIJServer]) -> None:
+    live_server, _ = servers
+    dead_endpoint = IJEndpoint(HOST, get_free_port())
+    pool = IJServerPool((dead_endpoint, IJEndpoint(HOST, live_server.port)))
+
+    for _ in range(10):
+        assert len(pool.inspect(_create_code()).problems) == 1
+
+    stats = pool.stats
+    assert stats[str(dead_endpoint)]["errors"] == CIRCUIT_BREAKER_THRESHOLD
+    assert stats[str(dead_endpoint)]["circuit_open"]
+    assert stats[f"{HOST}:{live_server.port}"]["requests"] == 10
+    assert len(live_server.service.calls) == 10
+
+
+def test_all_endpoints_are_unavailable() -> None:
+    pool = IJServerPool((IJEndpoint(HOST, get_free_port()), IJEndpoint(HOST, get_free_port())))
+
+    for _ in range(CIRCUIT_BREAKER_THRESHOLD):
+        with pytest.raises(IJConnectionError):
+            pool.inspect(_create_code())
+
+    start = time.monotonic()
+    with pytest.raises(IJConnectionError, match="all servers are unavailable"):
+        pool.inspect(_create_code())
+    assert time.monotonic() - start < 0.1
+
+    channel_pool.close()
+
+
+def test_half_open_circuit_lets_one_probe_through(
+    servers: tuple[LocalIJServer, LocalIJServer], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    server, _ = servers
+    endpoint = IJEndpoint(HOST, server.port)
+    pool = IJServerPool((endpoint,))
+    # The cooldown is over right away, so the circuit is half-open after the failures
+    monkeypatch.setattr(ij_pool, "CIRCUIT_BREAKER_COOLDOWN", 0)
+    for _ in range(CIRCUIT_BREAKER_THRESHOLD):
+        pool._record_failure(endpoint)
+
+    server.service.delay = 0.5
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        probe = executor.submit(pool.inspect, _create_code())
+        while pool.stats[str(endpoint)]["in_flight"] == 0:
+            time.sleep(0.01)
+
+        with pytest.raises(IJConnectionError, match="all servers are unavailable"):
+            pool.inspect(_create_code())
+
+        assert len(probe.result().problems) == 1
+
+    # The successful probe closes the circuit
+    server.service.delay = 0
+    assert len(pool.inspect(_create_code()).problems) == 1
+    assert len(server.service.calls) == 2
+
+
+def test_slow_request_is_hedged(servers: tuple[LocalIJServer, LocalIJServer]) -> None:
+    slow_server, fast_server = servers
+    pool = IJServerPool(tuple(IJEndpoint(HOST, server.port) for server in servers), hedge_percentile=90)
+    for _ in range(MIN_HEDGING_SAMPLES):
+        pool.inspect(_create_code())
+
+    slow_server.service.delay = 2
+    start = time.monotonic()
+    for _ in range(4):
+        assert len(pool.inspect(_create_code()).problems) == 1
+    assert time.monotonic() - start < 2
+
+    assert pool.stats[f"{HOST}:{fast_server.port}"]["hedged"] > 0
+
+
+def test_batches_are_not_hedged(servers: tuple[LocalIJServer, LocalIJServer]) -> None:
+    pool = IJServerPool(tuple(IJEndpoint(HOST, server.port) for server in servers), hedge_percentile=90)
+
+    results = pool.inspect_batch([model_pb2.Code(text="a\nb", languageId=model_pb2.python, id="main")])
+
+    assert len(results["main"].problems) == 2
+    assert sum(endpoint_stats["hedged"] for endpoint_stats in pool.stats.values()) == 0
+
+
+def test_take_counters(servers: tuple[LocalIJServer, LocalIJServer]) -> None:
+    endpoint = IJEndpoint(HOST, servers[0].port)
+    pool = IJServerPool((endpoint,))
+    pool.inspect(_create_code())
+
+    counters = pool.take_counters()
+
+    assert counters[endpoint].requests == 1
+    assert counters[endpoint].errors == 0
+    assert counters[endpoint].latency > 0
+    assert pool.take_counters()[endpoint].requests == 0
+
+
+@pytest.mark.parametrize(
+    ("connection_parameters", "expected_endpoints", "expected_hedge_percentile"),
+    [
+        ({"host": "localhost", "port": 8080}, (IJEndpoint("localhost", 8080),), None),
+        (
+            {
+                "endpoints": [{"host": "first", "port": 8080}, {"host": "second", "port": 8081}],
+                "hedge_percentile": 95,
+            },
+            (IJEndpoint("first", 8080), IJEndpoint("second", 8081)),
+            95,
+        ),
+    ],
+)
+def test_create_ij_server_pool(
+    connection_parameters: dict,
+    expected_endpoints: tuple[IJEndpoint, ...],
+    expected_hedge_percentile: float | None,
+) -> None:
+    pool = create_ij_server_pool(connection_parameters)
+
+    assert pool.endpoints == expected_endpoints
+    assert pool.hedge_percentile == expected_hedge_percentile
+    assert create_ij_server_pool(connection_parameters) is pool
+
+
+@pytest.mark.parametrize(
+    "connection_parameters",
+    [
+        {"endpoints": []},
+        {"endpoints": [{"host": "localhost", "port": 8080}], "hedge_percentile": 100},
+    ],
+)
+def test_create_ij_server_pool_incorrect_parameters(connection_parameters: dict) -> None:
+    with pytest.raises(ValueError):
+        create_ij_server_pool(connection_parameters)
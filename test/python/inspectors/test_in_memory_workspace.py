@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from hyperstyle.src.python.review.common.language import Language
+from hyperstyle.src.python.review.inspectors.common.in_memory_workspace import (
+    get_in_memory_file_name,
+    get_workspace_pool,
+    inspect_in_workspace,
+    WorkspacePool,
+)
+from hyperstyle.src.python.review.inspectors.common.inspector.inspector_type import InspectorType
+from hyperstyle.src.python.review.inspectors.common.issue.issue import BaseIssue, IssueDifficulty, IssueType
+
+JAVA_CODE = """import java.util.List;
+
+class Helper {
+    public static class Inner {}
+}
+
+public final class Solution {
+    public static void main(String[] args) {}
+}
+"""
+
+KOTLIN_CODE = """data class Point(val x: Int, val y: Int) {
+    companion object {}
+}
+
+fun main() {}
+"""
+
+KOTLIN_CODE_WITH_SEVERAL_CLASSES = """class First
+
+object Second
+"""
+
+FILE_NAME_TEST_DATA = [
+    (JAVA_CODE, Language.JAVA, "Solution.java"),
+    ("class Solution {}\n", Language.JAVA, "main.java"),
+    (KOTLIN_CODE, Language.KOTLIN, "Point.kt"),
+    (KOTLIN_CODE_WITH_SEVERAL_CLASSES, Language.KOTLIN, "main.kt"),
+    ("package main\n", Language.GO, "main.go"),
+]
+
+
+@pytest.mark.parametrize(("code", "language", "expected_file_name"), FILE_NAME_TEST_DATA)
+def test_in_memory_file_name(code: str, language: Language, expected_file_name: str) -> None:
+    assert get_in_memory_file_name(code, language) == expected_file_name
+
+
+def test_workspace_reuse(tmp_path: Path) -> None:
+    pool = WorkspacePool(tmp_path)
+
+    with pool.use() as workspace:
+        (workspace / "directory").mkdir()
+        (workspace / "directory" / "Main.java").write_text("class Main {}")
+        (workspace / "main.go").write_text("package main")
+
+        with pool.use() as concurrent_workspace:
+            assert concurrent_workspace != workspace
+
+    # The workspace is cleared and reused
+    with pool.use() as reused_workspace:
+        assert reused_workspace in {workspace, concurrent_workspace}
+        assert not list(reused_workspace.iterdir())
+
+    assert len(list(tmp_path.iterdir())) == 2
+
+    pool.close()
+    assert not tmp_path.exists()
+
+
+def test_inspect_in_workspace() -> None:
+    inspected_paths = []
+
+    def inspect(path: Path, config: dict[str, Any]) -> list[BaseIssue]:
+        inspected_paths.append(path)
+        assert path.read_text() == JAVA_CODE
+        return [
+            BaseIssue(
+                origin_class="UnusedImports",
+                type=IssueType.BEST_PRACTICES,
+                description="Unused import",
+                file_path=path,
+                line_no=1,
+                column_no=1,
+                inspector_type=InspectorType.CHECKSTYLE,
+                difficulty=IssueDifficulty.EASY,
+            ),
+        ]
+
+    issues = inspect_in_workspace(inspect, JAVA_CODE, {}, Language.JAVA)
+
+    assert [issue.file_path for issue in issues] == [Path()]
+    assert inspected_paths[0].name == "Solution.java"
+    assert inspected_paths[0].parent.parent == get_workspace_pool().root
+    assert not inspected_paths[0].exists()
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import dataclasses
+import re
+from pathlib import Path
+
+import pytest
+
+from hyperstyle.src.python.review.inspectors.common.inspector.inspector_type import InspectorType
+from hyperstyle.src.python.review.inspectors.common.issue.issue import (
+    BaseIssue,
+    CodeIssue,
+    IssueDifficulty,
+    IssueType,
+    LineLenIssue,
+)
+from hyperstyle.src.python.review.inspectors.common.issue.issue_configs import (
+    IssueDescriptionParser,
+    MeasurableIssueConfig,
+)
+from hyperstyle.src.python.review.inspectors.common.issue.issue_registry import (
+    IssueClassification,
+    IssueRegistry,
+    PrefixTrie,
+)
+
+PREFIX_TO_VALUE = {
+    "W": "code style",
+    "WPS": "wps",
+    "WPS1": "wps naming",
+    "SC": "spellcheck",
+}
+
+
+@pytest.mark.parametrize(
+    ("text", "expected_value"),
+    [
+        ("W291", "code style"),
+        ("WPS110", "wps naming"),
+        ("WPS200", "wps"),
+        ("WP", "code style"),
+        ("SC100", "spellcheck"),
+        ("S100", None),
+        ("", None),
+    ],
+)
+def test_prefix_trie(text: str, expected_value: str | None) -> None:
+    assert PrefixTrie(PREFIX_TO_VALUE).find(text) == expected_value
+
+
+def test_prefix_trie_with_empty_prefix() -> None:
+    trie = PrefixTrie({"": "default", "E": "error"})
+
+    assert trie.find("E501") == "error"
+    assert trie.find("W291") == "default"
+
+
+LINE_LEN_CONFIG = MeasurableIssueConfig(
+    origin_class="E501",
+    new_description="Too long line: {0}",
+    parser=IssueDescriptionParser(re.compile(r"\((\d+)\)"), converter={0: int}),
+)
+
+
+def test_issue_registry() -> None:
+    selected_origin_classes = []
+
+    def choose_issue_type(origin_class: str) -> IssueType:
+        selected_origin_classes.append(origin_class)
+        return IssueType.LINE_LEN if origin_class == "E501" else IssueType.ERROR_PRONE
+
+    registry = IssueRegistry(choose_issue_type, [LINE_LEN_CONFIG])
+
+    assert registry.classify("E501") == IssueClassification(
+        issue_type=IssueType.LINE_LEN,
+        difficulty=IssueDifficulty.EASY,
+        issue_class=LineLenIssue,
+    )
+    assert registry.classify("B001") == IssueClassification(
+        issue_type=IssueType.ERROR_PRONE,
+        difficulty=IssueDifficulty.HARD,
+        issue_class=CodeIssue,
+    )
+    assert registry.get_issue_type("E501") == IssueType.LINE_LEN
+    assert (
+        registry.issue_configs_handler.get_description("E501", "line too long (130)") == "Too long line: 130"
+    )
+
+    # The issue type is chosen only once per origin class
+    assert selected_origin_classes == ["E501", "B001"]
+
+
+def test_issue_registry_convert() -> None:
+    registry = IssueRegistry(lambda _: IssueType.LINE_LEN, [LINE_LEN_CONFIG])
+    base_issue = BaseIssue(
+        origin_class="E501",
+        type=IssueType.LINE_LEN,
+        description="line too long (130)",
+        file_path=Path("main.py"),
+        line_no=1,
+        column_no=1,
+        inspector_type=InspectorType.FLAKE8,
+        difficulty=IssueDifficulty.EASY,
+    )
+
+    issue = registry.convert(base_issue)
+
+    assert isinstance(issue, LineLenIssue)
+    assert issue.line_len == 130
+    assert issue.description == "Too long line: 130"
+
+    # The issue type chosen by other rules is kept
+    issue = registry.convert(dataclasses.replace(base_issue, type=IssueType.CODE_STYLE))
+
+    assert type(issue) is CodeIssue
+    assert issue.type == IssueType.CODE_STYLE
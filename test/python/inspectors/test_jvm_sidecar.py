@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import os
+import shutil
+import socketserver
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+from hyperstyle.src.python.review.common.subprocess_runner import resource_limits, ResourceLimits
+from hyperstyle.src.python.review.inspectors.checkstyle.checkstyle import (
+    CHECKSTYLE_DIRECTORY_ENV,
+    CHECKSTYLE_MAIN_CLASS,
+    CHECKSTYLE_VERSION_ENV,
+    CheckstyleInspector,
+)
+from hyperstyle.src.python.review.inspectors.common.jvm_sidecar import jvm_sidecar
+from hyperstyle.src.python.review.inspectors.common.jvm_sidecar.jvm_sidecar import (
+    JVM_SIDECAR_PORT_ENV,
+    run_in_jvm_sidecar,
+)
+from hyperstyle.src.python.review.reviewers.exceptions import InspectorTimeoutError
+from test.python.inspectors import CHECKSTYLE_DATA_FOLDER, JAVA_DATA_FOLDER
+from test.python.inspectors.ij_server import get_free_port
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+
+@dataclass
+class SidecarRequest:
+    main_class: str
+    classpath: str
+    timeout_ms: int
+    arguments: list[str]
+
+
+@dataclass
+class FakeSidecar:
+    """Speaks the protocol of the JVM sidecar and answers with ``run(request)`` instead of running a linter."""
+
+    run: Callable[[SidecarRequest], str] = lambda _: "OK 0"
+    requests: list[SidecarRequest] = field(default_factory=list)
+
+    def handle(self, handler: socketserver.StreamRequestHandler) -> None:
+        lines = iter(handler.rfile.readline, b"")
+        command, main_class, classpath, timeout_ms, arguments_number = (
+            next(lines).decode().rstrip("\n") for _ in range(5)
+        )
+        assert command == "RUN"
+        arguments = [next(lines).decode().rstrip("\n") for _ in range(int(arguments_number))]
+
+        request = SidecarRequest(main_class, classpath, int(timeout_ms), arguments)
+        self.requests.append(request)
+        handler.wfile.write(f"{self.run(request)}\n".encode())
+
+
+@pytest.fixture
+def sidecar(monkeypatch: pytest.MonkeyPatch) -> Iterator[FakeSidecar]:
+    fake_sidecar = FakeSidecar()
+
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self) -> None:
+            fake_sidecar.handle(self)
+
+    server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    monkeypatch.setenv(JVM_SIDECAR_PORT_ENV, str(server.server_address[1]))
+    monkeypatch.setattr(jvm_sidecar._state, "unavailable_until", 0.0)
+    yield fake_sidecar
+
+    server.shutdown()
+    server.server_close()
+
+
+def test_run_in_jvm_sidecar(sidecar: FakeSidecar) -> None:
+    classpath = [Path("first.jar"), Path("second.jar")]
+
+    assert run_in_jvm_sidecar("org.example.Main", classpath, ["-o", "report.xml", "Main.java"])
+
+    assert sidecar.requests == [
+        SidecarRequest(
+            "org.example.Main", f"first.jar{os.pathsep}second.jar", 0, ["-o", "report.xml", "Main.java"]
+        )
+    ]
+
+
+def test_sidecar_gets_timeout(sidecar: FakeSidecar) -> None:
+    with resource_limits(ResourceLimits(wall_time=10)):
+        assert run_in_jvm_sidecar("org.example.Main", [], [])
+
+    # The sidecar interrupts the linter at the deadline of the review
+    assert 0 < sidecar.requests[0].timeout_ms <= 10_000
+
+
+def test_sidecar_is_not_set_up(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv(JVM_SIDECAR_PORT_ENV, raising=False)
+
+    assert not run_in_jvm_sidecar("org.example.Main", [], [])
+
+
+def test_sidecar_is_unavailable(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv(JVM_SIDECAR_PORT_ENV, str(get_free_port()))
+    monkeypatch.setattr(jvm_sidecar._state, "unavailable_until", 0.0)
+
+    assert not run_in_jvm_sidecar("org.example.Main", [], [])
+    assert jvm_sidecar._state.unavailable_until > time.monotonic()
+
+
+@pytest.mark.parametrize(
+    "response",
+    [
+        "ERROR java.lang.ClassNotFoundException: org.example.Main",
+        "ERROR java.lang.IllegalArgumentException: The sidecar is not started with org.example.Main and this classpath",
+    ],
+)
+def test_sidecar_error(sidecar: FakeSidecar, response: str) -> None:
+    sidecar.run = lambda _: response
+
+    assert not run_in_jvm_sidecar("org.example.Main", [], [])
+    # The sidecar itself works, so it is used for the next requests
+    assert jvm_sidecar._state.unavailable_until == 0
+
+
+def test_sidecar_timeout(sidecar: FakeSidecar) -> None:
+    def run(request: SidecarRequest) -> str:
+        time.sleep(1)
+        return "OK 0"
+
+    sidecar.run = run
+
+    with resource_limits(ResourceLimits(wall_time=0.2)), pytest.raises(InspectorTimeoutError):
+        run_in_jvm_sidecar("org.example.Main", [], [])
+
+
+def test_sidecar_is_not_used_with_cpu_time_limit(sidecar: FakeSidecar) -> None:
+    with resource_limits(ResourceLimits(cpu_time=10)):
+        assert not run_in_jvm_sidecar("org.example.Main", [], [])
+
+    assert sidecar.requests == []
+
+
+def test_checkstyle_in_sidecar(sidecar: FakeSidecar, monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.setenv(CHECKSTYLE_DIRECTORY_ENV, str(tmp_path))
+    monkeypatch.setenv(CHECKSTYLE_VERSION_ENV, "8.44")
+
+    def run(request: SidecarRequest) -> str:
+        output_path = request.arguments[request.arguments.index("-o") + 1]
+        shutil.copy(CHECKSTYLE_DATA_FOLDER / "single_file_project_without_metric_issues.xml", output_path)
+        return "OK 3"
+
+    sidecar.run = run
+
+    issues = CheckstyleInspector().inspect(JAVA_DATA_FOLDER / "test_algorithm_with_scanner.java", {})
+
+    assert [request.main_class for request in sidecar.requests] == [CHECKSTYLE_MAIN_CLASS]
+    assert sidecar.requests[0].classpath == str(tmp_path / "checkstyle-8.44-all.jar")
+    assert len(issues) == 3
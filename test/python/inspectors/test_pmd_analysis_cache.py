@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from hyperstyle.src.python.review.common.language_version import LanguageVersion
+from hyperstyle.src.python.review.inspectors.pmd import analysis_cache, pmd
+from hyperstyle.src.python.review.inspectors.pmd.analysis_cache import (
+    CACHE_EXTENSION,
+    get_task_fingerprint,
+    PMD_CACHE_DIRECTORY_ENV,
+    PMDAnalysisCache,
+)
+from hyperstyle.src.python.review.inspectors.pmd.pmd import (
+    PATH_TOOLS_PMD_RULES_SET,
+    PMD_DIRECTORY_ENV,
+    PMD_VERSION_ENV,
+    PMDInspector,
+)
+
+PMD_VERSION = "6.37.0"
+
+
+def _get_cache_files(directory: Path) -> list[str]:
+    return sorted(path.name for path in directory.glob(f"*{CACHE_EXTENSION}"))
+
+
+def _create_project(directory: Path) -> Path:
+    (directory / "src").mkdir(parents=True)
+    (directory / "src" / "Main.java").write_text("class Main {}\n", encoding="utf-8")
+    (directory / "README.md").write_text("readme", encoding="utf-8")
+    return directory
+
+
+def test_task_fingerprint(tmp_path: Path) -> None:
+    fingerprint = get_task_fingerprint(_create_project(tmp_path / "first"))
+
+    # The submissions of the same task in different directories share the fingerprint
+    assert fingerprint == get_task_fingerprint(_create_project(tmp_path / "second"))
+    assert fingerprint != get_task_fingerprint(tmp_path / "first" / "src")
+    assert get_task_fingerprint(tmp_path / "first" / "src" / "Main.java") == get_task_fingerprint(
+        tmp_path / "second" / "src" / "Main.java"
+    )
+
+
+def test_cache_key_depends_on_fingerprint(tmp_path: Path) -> None:
+    cache = PMDAnalysisCache(tmp_path / "cache")
+    key = cache.get_cache_key("task", PATH_TOOLS_PMD_RULES_SET, PMD_VERSION, "11")
+
+    assert key == cache.get_cache_key("task", PATH_TOOLS_PMD_RULES_SET, PMD_VERSION, "11")
+    assert key != cache.get_cache_key("another", PATH_TOOLS_PMD_RULES_SET, PMD_VERSION, "11")
+    assert key != cache.get_cache_key("task", PATH_TOOLS_PMD_RULES_SET, PMD_VERSION, "17")
+    assert key != cache.get_cache_key("task", PATH_TOOLS_PMD_RULES_SET, "7.0.0", "11")
+
+    rule_set = tmp_path / "rule_set.xml"
+    rule_set.write_text("<ruleset/>", encoding="utf-8")
+    rule_set_key = cache.get_cache_key("task", rule_set, PMD_VERSION, "11")
+    assert key != rule_set_key
+
+    # The edited rule set is hashed again
+    rule_set.write_text("<ruleset></ruleset>", encoding="utf-8")
+    assert rule_set_key != cache.get_cache_key("task", rule_set, PMD_VERSION, "11")
+
+
+def test_use_cache(tmp_path: Path) -> None:
+    cache = PMDAnalysisCache(tmp_path / "cache")
+
+    with cache.use(_create_project(tmp_path / "first"), "key") as (staged_path, work_path):
+        # There is no cache yet, so PMD creates a new one
+        assert not work_path.exists()
+        assert sorted(str(path.relative_to(staged_path)) for path in staged_path.rglob("*")) == [
+            "src",
+            "src/Main.java",
+        ]
+        work_path.write_text("first", encoding="utf-8")
+        first_staged_path = staged_path
+
+    with cache.use(_create_project(tmp_path / "second"), "key") as (staged_path, work_path):
+        # PMD sees the same paths in each review of the task
+        assert staged_path == first_staged_path
+        assert work_path.read_text(encoding="utf-8") == "first"
+        work_path.write_text("second", encoding="utf-8")
+        # The cache is replaced only after PMD finishes
+        assert _get_cache_files(tmp_path / "cache") == ["key-0.cache"]
+        assert (tmp_path / "cache" / "key-0.cache").read_text(encoding="utf-8") == "first"
+
+    assert (tmp_path / "cache" / "key-0.cache").read_text(encoding="utf-8") == "second"
+    assert not first_staged_path.exists()
+
+
+def test_parallel_runs_use_different_stages(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(analysis_cache, "MAX_STAGES_PER_TASK", 2)
+    cache = PMDAnalysisCache(tmp_path / "cache")
+    path = _create_project(tmp_path / "project")
+
+    with cache.use(path, "key") as first_run, cache.use(path, "key") as second_run:
+        assert first_run[0] != second_run[0]
+        assert first_run[1] != second_run[1]
+
+        # All the stages are in use, so the third run is not cached
+        with cache.use(path, "key") as third_run:
+            assert third_run is None
+
+
+def test_failed_run_keeps_cache(tmp_path: Path) -> None:
+    cache = PMDAnalysisCache(tmp_path / "cache")
+    cache_path = tmp_path / "cache" / f"key-0{CACHE_EXTENSION}"
+    cache_path.write_text("cache", encoding="utf-8")
+
+    with (
+        pytest.raises(RuntimeError),
+        cache.use(_create_project(tmp_path / "project"), "key") as (_, work_path),
+    ):
+        work_path.write_text("partial", encoding="utf-8")
+        raise RuntimeError
+
+    assert cache_path.read_text(encoding="utf-8") == "cache"
+    assert _get_cache_files(tmp_path / "cache") == [cache_path.name]
+    assert not list((tmp_path / "cache").glob("*.tmp"))
+
+
+def test_eviction(tmp_path: Path) -> None:
+    cache = PMDAnalysisCache(tmp_path / "cache", max_size=250)
+    path = _create_project(tmp_path / "project")
+
+    for index in range(3):
+        with cache.use(path, f"key_{index}") as (_, work_path):
+            work_path.write_text("a" * 100, encoding="utf-8")
+        os.utime(tmp_path / "cache" / f"key_{index}-0{CACHE_EXTENSION}", (index, index))
+
+    # The least recently used cache is removed
+    assert _get_cache_files(tmp_path / "cache") == [f"key_1-0{CACHE_EXTENSION}", f"key_2-0{CACHE_EXTENSION}"]
+
+
+def test_pmd_uses_cache(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    pmd_directory = tmp_path / "pmd"
+    run_script = pmd_directory / f"pmd-bin-{PMD_VERSION}" / "bin" / "run.sh"
+    run_script.parent.mkdir(parents=True)
+    run_script.touch()
+
+    cache_directory = tmp_path / "cache"
+    monkeypatch.setenv(PMD_DIRECTORY_ENV, str(pmd_directory))
+    monkeypatch.setenv(PMD_VERSION_ENV, PMD_VERSION)
+    monkeypatch.setenv(PMD_CACHE_DIRECTORY_ENV, str(cache_directory))
+
+    inspected_paths = []
+
+    def run_pmd(command: list[str]) -> str:
+        inspected_path = Path(command[command.index("-d") + 1])
+        inspected_paths.append(inspected_path)
+        Path(command[command.index("-r") + 1]).write_text(
+            "Problem,Package,File,Priority,Line,Description,Rule\n"
+            f'"1","","{inspected_path / "src" / "Main.java"}","3","1","Avoid unused imports","UnusedImports"\n',
+            encoding="utf-8",
+        )
+        Path(command[command.index("-cache") + 1]).write_text("cache", encoding="utf-8")
+        return ""
+
+    monkeypatch.setattr(pmd, "run_in_subprocess", run_pmd)
+
+    inspector = PMDInspector()
+    config = {"n_cpu": 1, "language_version": LanguageVersion.JAVA_11}
+    # The submissions of the same task are reviewed in different directories
+    for name in ("first", "second"):
+        path = _create_project(tmp_path / name)
+        issues = inspector.inspect(path, config)
+        assert [issue.file_path for issue in issues] == [path / "src" / "Main.java"]
+
+    # PMD sees the same paths, so its cache of the first review is used by the second one
+    assert inspected_paths[0] == inspected_paths[1]
+    assert len(_get_cache_files(cache_directory)) == 1
@@ -1,15 +1,31 @@
 from __future__ import annotations
 
 import textwrap
+from pathlib import Path
+from typing import TYPE_CHECKING
 
 import pytest
+from astroid import MANAGER
+from pylint.lint import PyLinter
 
+from hyperstyle.src.python.review.common.file_system import new_temp_dir
+from hyperstyle.src.python.review.inspectors.common.inspector.inspector_backend import InspectorBackend
 from hyperstyle.src.python.review.inspectors.common.issue.issue import IssueType
-from hyperstyle.src.python.review.inspectors.pylint.pylint import PylintInspector
+from hyperstyle.src.python.review.inspectors.pylint import pylint
+from hyperstyle.src.python.review.inspectors.pylint.pylint import (
+    IN_MEMORY_FILE_NAME,
+    PYLINT_BACKEND_ENV,
+    PylintInspector,
+)
 from test.python.inspectors import PYLINT_DATA_FOLDER, PYTHON_DATA_FOLDER
 
 from .conftest import use_file_metadata
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from hyperstyle.src.python.review.inspectors.common.issue.issue import BaseIssue
+
 FILE_NAMES_AND_N_ISSUES = [
     ("case0_spaces.py", 0),
     ("case1_simple_valid_program.py", 0),
@@ -123,3 +139,87 @@ def test_new_issue_description(origin_class: str, expected_description: str) ->
     issue = next(filter(lambda elem: elem.origin_class == origin_class, issues))
 
     assert issue.description == expected_description
+
+
+def _to_comparable(issues: list[BaseIssue]) -> list[tuple[str, int, int, str]]:
+    return sorted((issue.origin_class, issue.line_no, issue.column_no, issue.description) for issue in issues)
+
+
+BACKEND_FILE_NAMES = [
+    "case2_boolean_expressions.py",
+    "case6_unused_variables.py",
+    "case14_returns_errors.py",
+    "case25_django.py",
+]
+
+
+@pytest.mark.parametrize("file_name", BACKEND_FILE_NAMES)
+def test_backends_return_same_issues(file_name: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    path_to_file = PYTHON_DATA_FOLDER / file_name
+
+    monkeypatch.setenv(PYLINT_BACKEND_ENV, InspectorBackend.SUBPROCESS.value)
+    subprocess_issues = PylintInspector.inspect(path_to_file, {})
+
+    monkeypatch.setenv(PYLINT_BACKEND_ENV, InspectorBackend.IN_PROCESS.value)
+    in_process_issues = PylintInspector.inspect(path_to_file, {})
+
+    assert _to_comparable(subprocess_issues) == _to_comparable(in_process_issues)
+
+
+@pytest.mark.parametrize("backend", InspectorBackend.values())
+def test_inspect_in_memory(backend: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv(PYLINT_BACKEND_ENV, backend)
+    path_to_file = PYTHON_DATA_FOLDER / "case6_unused_variables.py"
+
+    in_memory_issues = PylintInspector.inspect_in_memory(path_to_file.read_text(), {})
+    issues = PylintInspector.inspect(path_to_file, {})
+
+    assert _to_comparable(in_memory_issues) == _to_comparable(issues)
+
+
+def test_in_memory_module_is_forgotten(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv(PYLINT_BACKEND_ENV, InspectorBackend.IN_PROCESS.value)
+
+    PylintInspector.inspect_in_memory("def get_value():\n    return 1\n", {})
+
+    # The next code is not linted against the module of the previous one
+    in_memory_path = Path(IN_MEMORY_FILE_NAME).absolute()
+    assert all(
+        module.file is None or Path(module.file) != in_memory_path
+        for module in MANAGER.astroid_cache.values()
+    )
+
+
+@pytest.mark.parametrize(
+    "disable_private_api",
+    [
+        lambda monkeypatch: monkeypatch.delattr(PyLinter, "_check_files"),
+        lambda monkeypatch: monkeypatch.delattr(PyLinter, "_get_file_descr_from_stdin"),
+        lambda monkeypatch: monkeypatch.setattr(pylint, "numversion", (3, 0, 0)),
+    ],
+)
+def test_inspect_in_memory_without_private_api(
+    disable_private_api: Callable[[pytest.MonkeyPatch], None], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv(PYLINT_BACKEND_ENV, InspectorBackend.IN_PROCESS.value)
+    path_to_file = PYTHON_DATA_FOLDER / "case6_unused_variables.py"
+    issues = PylintInspector.inspect(path_to_file, {})
+
+    # The code is linted in a subprocess
+    disable_private_api(monkeypatch)
+    in_memory_issues = PylintInspector.inspect_in_memory(path_to_file.read_text(), {})
+
+    assert _to_comparable(in_memory_issues) == _to_comparable(issues)
+
+
+def test_in_process_backend_sees_changed_file(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv(PYLINT_BACKEND_ENV, InspectorBackend.IN_PROCESS.value)
+
+    with new_temp_dir() as temp_dir:
+        path_to_file = temp_dir / "main.py"
+
+        path_to_file.write_text("def get_value():\n    return 1\n")
+        assert PylintInspector.inspect(path_to_file, {}) == []
+
+        path_to_file.write_text("def get_value():\n    a = 1\n    return 1\n")
+        assert [issue.origin_class for issue in PylintInspector.inspect(path_to_file, {})] == ["W0612"]
@@ -1,19 +1,23 @@
 from __future__ import annotations
 
 import ast
+from typing import TYPE_CHECKING
 
 import pytest
 
 from hyperstyle.src.python.review.inspectors.common.inspector.inspector_type import InspectorType
 from hyperstyle.src.python.review.inspectors.common.issue.tips import get_bool_expr_len_tip, get_func_len_tip
 from hyperstyle.src.python.review.inspectors.pyast.python_ast import (
-    BoolExpressionLensGatherer,
-    FunctionLensGatherer,
+    MIN_FILES_TO_INSPECT_IN_PARALLEL,
     PythonAstInspector,
+    PythonAstMetricsGatherer,
 )
 from test.python.inspectors import PYTHON_AST_DATA_FOLDER, PYTHON_DATA_FOLDER
 from test.python.inspectors.conftest import use_file_metadata
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
 FILE_NAMES_AND_N_ISSUES = [
     ("case0_spaces.py", 0),
     ("case1_simple_valid_program.py", 0),
@@ -50,12 +54,25 @@ def test_file_with_issues(file_name: str, n_issues: int) -> None:
     assert len(issues) == n_issues
 
 
+@pytest.mark.parametrize(("file_name", "n_issues"), FILE_NAMES_AND_N_ISSUES)
+def test_inspect_in_memory(file_name: str, n_issues: int) -> None:
+    path_to_file = PYTHON_DATA_FOLDER / file_name
+
+    in_memory_issues = PythonAstInspector.inspect_in_memory(path_to_file.read_text(), {})
+    issues = PythonAstInspector.inspect(path_to_file, {})
+
+    assert len(in_memory_issues) == n_issues
+    assert [(issue.origin_class, issue.line_no, issue.measure()) for issue in in_memory_issues] == [
+        (issue.origin_class, issue.line_no, issue.measure()) for issue in issues
+    ]
+
+
 def test_bool_expr_len_gatherer_one_expr() -> None:
     file_path = PYTHON_AST_DATA_FOLDER / "one_bool_expression.py"
     code = file_path.read_text()
 
     tree = ast.parse(code, file_path)
-    gatherer = BoolExpressionLensGatherer(file_path, InspectorType.PYTHON_AST)
+    gatherer = PythonAstMetricsGatherer(file_path, InspectorType.PYTHON_AST)
     gatherer.visit(tree)
 
     assert len(gatherer.bool_expression_lens) == 1
@@ -69,7 +86,7 @@ def test_bool_expr_len_gatherer_many_exprs() -> None:
     code = file_path.read_text()
 
     tree = ast.parse(code, file_path)
-    gatherer = BoolExpressionLensGatherer(file_path, InspectorType.PYTHON_AST)
+    gatherer = PythonAstMetricsGatherer(file_path, InspectorType.PYTHON_AST)
     gatherer.visit(tree)
 
     assert len(gatherer.bool_expression_lens) == 3
@@ -84,9 +101,62 @@ def test_function_lens_gatherer() -> None:
     code = file_path.read_text()
 
     tree = ast.parse(code, file_path)
-    gatherer = FunctionLensGatherer(code, file_path, InspectorType.PYTHON_AST)
+    gatherer = PythonAstMetricsGatherer(file_path, InspectorType.PYTHON_AST)
     gatherer.visit(tree)
 
     assert len(gatherer.function_lens) == 1
     assert gatherer.function_lens[0].func_len == 15
     assert gatherer.function_lens[0].description == get_func_len_tip().format(15)
+
+
+FUNCTIONS_CODE = """class Point:
+    def __init__(self, x):
+        self.x = x
+
+    @staticmethod
+    def create():
+        def nested():
+            return 1 and 2
+
+        return Point(nested() or 3)
+    # The comment after the function
+
+
+async def run():
+    pass
+"""
+
+
+def test_function_lens_gatherer_many_functions() -> None:
+    tree = ast.parse(FUNCTIONS_CODE)
+    gatherer = PythonAstMetricsGatherer(PYTHON_AST_DATA_FOLDER, InspectorType.PYTHON_AST)
+    gatherer.visit(tree)
+
+    # The decorators and the comments around a function and the nested functions are not counted
+    assert [(issue.line_no, issue.func_len) for issue in gatherer.function_lens] == [(2, 1), (6, 4), (14, 1)]
+    assert [(issue.line_no, issue.bool_expr_len) for issue in gatherer.bool_expression_lens] == [
+        (8, 1),
+        (10, 1),
+    ]
+
+
+def test_unparsable_files_have_no_issues(tmp_path: Path) -> None:
+    # The syntax errors are reported by Pylint and Flake8, so the files just have no metrics
+    (tmp_path / "syntax_error.py").write_text("def f(:\n    pass\n")
+    (tmp_path / "not_utf8.py").write_bytes(b"print('\xff')\n")
+
+    assert PythonAstInspector.inspect(tmp_path, {}) == []
+
+
+def test_inspect_in_parallel(tmp_path: Path) -> None:
+    for index in range(MIN_FILES_TO_INSPECT_IN_PARALLEL):
+        package = tmp_path / f"package{index % 3}"
+        package.mkdir(exist_ok=True)
+        (package / f"module{index}.py").write_text(FUNCTIONS_CODE * (index % 5 + 1))
+    (tmp_path / "broken.py").write_text("print(")
+
+    issues = PythonAstInspector.inspect(tmp_path, {"n_cpu": 1})
+
+    # The files are split between the worker processes, and the issues keep the order of the files
+    assert PythonAstInspector.inspect(tmp_path, {"n_cpu": 2}) == issues
+    assert all(issue.file_path.name != "broken.py" for issue in issues)
@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+import ast
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+from hyperstyle.src.python.review.inspectors.common.issue.issue import IssueType
+from hyperstyle.src.python.review.inspectors.flake8.flake8 import (
+    COHESION_ORIGIN_CLASS,
+    CYCLOMATIC_COMPLEXITY_ORIGIN_CLASS,
+    Flake8Inspector,
+)
+from hyperstyle.src.python.review.inspectors.pyast.metrics import (
+    get_python_metrics_backend,
+    PYTHON_METRICS_BACKEND_ENV,
+    PythonMetricsBackend,
+)
+from hyperstyle.src.python.review.inspectors.pyast.python_ast import (
+    gather_python_metrics,
+    get_python_metrics,
+    PythonAstInspector,
+    PythonAstMetricsGatherer,
+)
+from hyperstyle.src.python.review.inspectors.radon.radon import RadonInspector
+from test.python.inspectors import FLAKE_DATA_FOLDER, PYTHON_AST_DATA_FOLDER, PYTHON_DATA_FOLDER
+
+if TYPE_CHECKING:
+    from hyperstyle.src.python.review.inspectors.common.issue.issue import BaseIssue
+
+METRICS_ORIGIN_CLASSES = {CYCLOMATIC_COMPLEXITY_ORIGIN_CLASS, COHESION_ORIGIN_CLASS}
+
+PARITY_DATA_FOLDERS = [PYTHON_DATA_FOLDER, PYTHON_AST_DATA_FOLDER, FLAKE_DATA_FOLDER]
+
+
+def _to_comparable(issues: list[BaseIssue]) -> list[tuple[str, str, int, int, str, int]]:
+    return sorted(
+        (
+            str(issue.file_path),
+            issue.origin_class,
+            issue.line_no,
+            issue.column_no,
+            issue.description,
+            issue.measure(),
+        )
+        for issue in issues
+        if issue.origin_class in METRICS_ORIGIN_CLASSES or issue.type == IssueType.MAINTAINABILITY
+    )
+
+
+def _inspect(
+    monkeypatch: pytest.MonkeyPatch,
+    backend: PythonMetricsBackend,
+    inspector: type[Flake8Inspector | RadonInspector],
+) -> dict[Path, list[tuple[str, str, int, int, str, int]]]:
+    monkeypatch.setenv(PYTHON_METRICS_BACKEND_ENV, backend.value)
+    return {folder: _to_comparable(inspector.inspect(folder, {})) for folder in PARITY_DATA_FOLDERS}
+
+
+@pytest.mark.parametrize("inspector", [Flake8Inspector, RadonInspector])
+def test_native_backend_parity(
+    monkeypatch: pytest.MonkeyPatch, inspector: type[Flake8Inspector | RadonInspector]
+) -> None:
+    linters_issues = _inspect(monkeypatch, PythonMetricsBackend.LINTERS, inspector)
+    native_issues = _inspect(monkeypatch, PythonMetricsBackend.NATIVE, inspector)
+
+    assert all(linters_issues.values())
+    assert native_issues == linters_issues
+
+
+@pytest.mark.parametrize("inspector", [Flake8Inspector, RadonInspector])
+@pytest.mark.parametrize(
+    "file_name", ["case8_good_class.py", "case13_complex_logic.py", "case24_long_function.py"]
+)
+def test_native_backend_parity_in_memory(
+    monkeypatch: pytest.MonkeyPatch, inspector: type[Flake8Inspector | RadonInspector], file_name: str
+) -> None:
+    code = (PYTHON_DATA_FOLDER / file_name).read_text()
+
+    monkeypatch.setenv(PYTHON_METRICS_BACKEND_ENV, PythonMetricsBackend.LINTERS.value)
+    linters_issues = _to_comparable(inspector.inspect_in_memory(code, {}))
+
+    monkeypatch.setenv(PYTHON_METRICS_BACKEND_ENV, PythonMetricsBackend.NATIVE.value)
+    native_issues = _to_comparable(inspector.inspect_in_memory(code, {}))
+
+    assert native_issues == linters_issues
+
+
+COMPLEXITY_CODE = """def f(x):
+    for i in x:
+        try:
+            if i:
+                continue
+        except ValueError:
+            pass
+        finally:
+            def g():
+                if x:
+                    return 1
+    with open(x) as file:
+        def h():
+            pass
+    return 0
+
+
+if __name__ == "__main__":
+    f([])
+
+
+class A:
+    while True:
+        break
+
+    def method(self):
+        match self:
+            case 1:
+                return 1
+        return 2
+"""
+
+
+def test_complexities() -> None:
+    gatherer = PythonAstMetricsGatherer(Path(), PythonAstInspector.inspector_type)
+    gatherer.visit(ast.parse(COMPLEXITY_CODE))
+
+    # A nested function is a branch of the outer function, and the functions in the finally blocks
+    # are not a part of any graph, as in mccabe
+    assert [(complexity.line_no, complexity.complexity) for complexity in gatherer.complexities] == [
+        (1, 6),
+        (18, 2),
+        (23, 2),
+        (26, 1),
+    ]
+
+
+COHESION_CODE = """class Point:
+    dimensions = 2
+
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+    def norm(self):
+        return self.x * self.x + self.y * self.y
+
+    def shift(self, dx):
+        self.x += dx
+        self.update()
+
+
+class Broken:
+    first, second = 1, 2
+
+    def method(self):
+        return self.first
+"""
+
+
+def test_cohesions() -> None:
+    gatherer = PythonAstMetricsGatherer(Path(), PythonAstInspector.inspector_type)
+    gatherer.visit(ast.parse(COHESION_CODE))
+
+    # The cohesion plugin fails on the tuple target of the assignment, so the class is skipped
+    assert [(cohesion.line_no, cohesion.percentage) for cohesion in gatherer.cohesions] == [(1, 55.56)]
+
+
+def test_flake8_issues_of_unmeasurable_class(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv(PYTHON_METRICS_BACKEND_ENV, PythonMetricsBackend.NATIVE.value)
+
+    issues = Flake8Inspector.inspect_in_memory(COHESION_CODE, {})
+
+    # The cohesion plugin fails on the whole code, while the native backend skips only the class it can't measure
+    assert [
+        (issue.origin_class, issue.line_no, issue.measure())
+        for issue in issues
+        if issue.origin_class == COHESION_ORIGIN_CLASS
+    ] == [
+        (COHESION_ORIGIN_CLASS, 1, 44),
+    ]
+    assert any(issue.origin_class not in METRICS_ORIGIN_CLASSES for issue in issues)
+
+
+def test_metrics_are_shared() -> None:
+    code = (PYTHON_DATA_FOLDER / "case13_complex_logic.py").read_text()
+
+    metrics = get_python_metrics(code, Path())
+
+    assert get_python_metrics(code, Path()) is metrics
+    assert metrics == gather_python_metrics(code, Path())
+    assert gather_python_metrics(code, Path(), with_maintainability_index=False).maintainability_index is None
+
+
+def test_metrics_of_invalid_code() -> None:
+    metrics = gather_python_metrics("def f(:\n", Path())
+
+    assert metrics.issues == ()
+    assert metrics.complexities == ()
+    assert metrics.cohesions == ()
+    assert metrics.maintainability_index is None
+
+
+@pytest.mark.parametrize(
+    ("value", "expected_backend"),
+    [
+        (None, PythonMetricsBackend.NATIVE),
+        ("linters", PythonMetricsBackend.LINTERS),
+        (" Native ", PythonMetricsBackend.NATIVE),
+        ("unknown", PythonMetricsBackend.NATIVE),
+    ],
+)
+def test_get_python_metrics_backend(
+    monkeypatch: pytest.MonkeyPatch, value: str | None, expected_backend: PythonMetricsBackend
+) -> None:
+    if value is None:
+        monkeypatch.delenv(PYTHON_METRICS_BACKEND_ENV, raising=False)
+    else:
+        monkeypatch.setenv(PYTHON_METRICS_BACKEND_ENV, value)
+
+    assert get_python_metrics_backend() == expected_backend
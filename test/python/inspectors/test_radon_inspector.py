@@ -31,6 +31,23 @@ def test_file_with_issues(file_name: str, n_issues: int) -> None:
         assert len(issues) == n_issues
 
 
+@pytest.mark.parametrize(("file_name", "n_issues"), FILE_NAMES_AND_N_ISSUES)
+def test_inspect_in_memory(file_name: str, n_issues: int) -> None:
+    path_to_file = PYTHON_DATA_FOLDER / file_name
+
+    in_memory_issues = RadonInspector.inspect_in_memory(path_to_file.read_text(), {})
+    issues = RadonInspector.inspect(path_to_file, {})
+
+    assert [issue.maintainability_lack for issue in in_memory_issues] == [
+        issue.maintainability_lack for issue in issues
+    ]
+    assert len(filter_low_measure_issues(in_memory_issues, Language.PYTHON)) == n_issues
+
+
+def test_inspect_in_memory_syntax_error() -> None:
+    assert RadonInspector.inspect_in_memory("def f(:\n", {}) == []
+
+
 def test_mi_parse() -> None:
     file_name = "test.py"
     output = f"""\
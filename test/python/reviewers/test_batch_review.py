@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+import pytest
+
+from hyperstyle.src.python.review.application_config import ApplicationConfig
+from hyperstyle.src.python.review.common.language import Language
+from hyperstyle.src.python.review.inspectors.common.inspector.inspector_type import InspectorType
+from hyperstyle.src.python.review.reviewers.batch_review import (
+    BatchItem,
+    perform_and_print_review_batch,
+    perform_review_batch,
+)
+from hyperstyle.src.python.review.reviewers.perform_review import (
+    perform_code_review_as_json,
+    perform_review_as_json,
+)
+from test.python.inspectors import PYTHON_DATA_FOLDER
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+CODE = "a=1\nprint(a)\n"
+HISTORY = {"python": [{"origin_class": "E225", "number": 10}]}
+
+
+@pytest.fixture
+def config() -> ApplicationConfig:
+    config = ApplicationConfig.get_default_config()
+    config.disabled_inspectors = {InspectorType.IJ_PYTHON}
+    return config
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"path": "main.py"},
+        {"id": 1},
+        {"id": 1, "path": "main.py", "code": CODE},
+        {"id": 1, "code": CODE},
+        {"id": 1, "code": CODE, "language": "cobol"},
+    ],
+)
+def test_incorrect_item(data: dict) -> None:
+    with pytest.raises(ValueError):
+        BatchItem.from_json_dict(data)
+
+
+def test_batch_review(config: ApplicationConfig) -> None:
+    path = PYTHON_DATA_FOLDER / "case0_spaces.py"
+    items = [
+        BatchItem.from_json_dict({"id": "path", "path": str(path)}),
+        BatchItem.from_json_dict({"id": "code", "code": CODE, "language": "python", "history": HISTORY}),
+    ]
+
+    results = {result.id: result for result in perform_review_batch(items, config)}
+
+    # Each review is the same as the review of a single submission
+    assert results["path"].review == perform_review_as_json(path, config)
+    config.language = Language.PYTHON
+    config.history = json.dumps(HISTORY)
+    assert results["code"].review == perform_code_review_as_json(CODE, config)
+
+
+def test_failed_item(config: ApplicationConfig, tmp_path: Path) -> None:
+    items = [
+        BatchItem.from_json_dict({"id": "missing", "path": str(tmp_path / "missing.py")}),
+        BatchItem.from_json_dict({"id": "code", "code": CODE, "language": "python"}),
+    ]
+
+    results = {result.id: result for result in perform_review_batch(items, config)}
+
+    assert results["missing"].error is not None
+    assert results["code"].review is not None
+
+
+def test_in_flight_window(config: ApplicationConfig) -> None:
+    max_in_flight = 2
+    n_taken = 0
+
+    def create_items() -> Iterator[BatchItem]:
+        nonlocal n_taken
+        for index in range(5):
+            n_taken += 1
+            yield BatchItem(str(index), code=CODE, language=Language.PYTHON)
+
+    ids = []
+    for result in perform_review_batch(create_items(), config, workers=2, max_in_flight=max_in_flight):
+        # The next items are taken only after the results of the previous ones are yielded
+        assert n_taken <= len(ids) + max_in_flight + 1
+        assert result.review is not None
+        ids.append(result.id)
+
+    assert sorted(ids) == [str(index) for index in range(5)]
+
+
+def test_batch_output(config: ApplicationConfig, tmp_path: Path, capsys: pytest.CaptureFixture) -> None:
+    input_path = tmp_path / "input.jsonl"
+    input_path.write_text(
+        "\n".join(
+            [
+                json.dumps({"id": 1, "code": CODE, "language": "python"}),
+                "not json",
+                json.dumps({"id": 2, "code": CODE}),
+            ]
+        )
+    )
+
+    assert perform_and_print_review_batch(input_path, config) == 2
+
+    lines = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert sorted(line["id"] or "" for line in lines) == ["", "1", "2"]
+    assert [line["id"] for line in lines if "review" in line] == ["1"]
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import linecache
+import tempfile
+from typing import NoReturn, TYPE_CHECKING
+
+import pytest
+
+from hyperstyle.src.python.review.application_config import ApplicationConfig
+from hyperstyle.src.python.review.common.language import Language
+from hyperstyle.src.python.review.inspectors.common.inspector.inspector_type import InspectorType
+from hyperstyle.src.python.review.inspectors.eslint.eslint import ESLintInspector
+from hyperstyle.src.python.review.reviewers.perform_review import (
+    perform_code_review_as_json,
+    perform_review_as_json,
+    preform_review_in_memory,
+)
+from hyperstyle.src.python.review.reviewers.utils.print_review import get_review_result_as_json
+from test.python.inspectors import PYTHON_DATA_FOLDER
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from hyperstyle.src.python.review.inspectors.common.issue.issue import BaseIssue
+
+FILE_NAMES = [
+    "case0_spaces.py",
+    "case2_boolean_expressions.py",
+    "case13_complex_logic.py",
+    "case24_long_function.py",
+]
+
+
+@pytest.fixture
+def config() -> ApplicationConfig:
+    config = ApplicationConfig.get_default_config()
+    config.disabled_inspectors = {InspectorType.IJ_PYTHON}
+    config.language = Language.PYTHON
+    return config
+
+
+@pytest.mark.parametrize("new_format", [False, True])
+@pytest.mark.parametrize("file_name", FILE_NAMES)
+def test_in_memory_review(
+    config: ApplicationConfig, file_name: str, new_format: bool, tmp_path: Path
+) -> None:
+    config.new_format = new_format
+    code = (PYTHON_DATA_FOLDER / file_name).read_text()
+    path = tmp_path / "main.py"
+    path.write_text(code)
+
+    review_result = preform_review_in_memory(code, Language.PYTHON, config)
+
+    # The review of the code is the same as the review of the file with this code
+    assert get_review_result_as_json(review_result, config) == perform_review_as_json(path, config)
+
+
+def test_in_memory_review_does_not_use_files(
+    config: ApplicationConfig, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    path = PYTHON_DATA_FOLDER / "case13_complex_logic.py"
+    expected_review = perform_review_as_json(path, config)
+    code = path.read_text()
+
+    def fail(*args: object, **kwargs: object) -> NoReturn:
+        msg = "The in-memory review must not use files"
+        raise AssertionError(msg)
+
+    for function_name in ("mkstemp", "mkdtemp", "NamedTemporaryFile", "TemporaryDirectory"):
+        monkeypatch.setattr(tempfile, function_name, fail)
+    monkeypatch.setattr(linecache, "getline", fail)
+
+    assert perform_code_review_as_json(code, config) == expected_review
+
+
+def test_in_memory_review_of_javascript(config: ApplicationConfig, monkeypatch: pytest.MonkeyPatch) -> None:
+    config.language = Language.JS
+    codes = []
+
+    def inspect_in_memory(
+        inspector: ESLintInspector, code: str, inspector_config: dict[str, object]
+    ) -> list[BaseIssue]:
+        codes.append(code)
+        return []
+
+    def fail(*args: object, **kwargs: object) -> NoReturn:
+        msg = "The in-memory review must not use files"
+        raise AssertionError(msg)
+
+    monkeypatch.setattr(ESLintInspector, "inspect_in_memory", inspect_in_memory)
+    monkeypatch.setattr(ESLintInspector, "inspect", fail)
+    for function_name in ("mkstemp", "mkdtemp", "NamedTemporaryFile", "TemporaryDirectory"):
+        monkeypatch.setattr(tempfile, function_name, fail)
+
+    review = perform_code_review_as_json("console.log(1);\n", config)
+
+    assert codes == ["console.log(1);\n"]
+    assert review["issues"] == []
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import dataclasses
+import shutil
+from typing import Any, TYPE_CHECKING
+
+import pytest
+
+from hyperstyle.src.python.review.application_config import ApplicationConfig
+from hyperstyle.src.python.review.inspectors.common.inspector.inspector_type import InspectorType
+from hyperstyle.src.python.review.inspectors.flake8.flake8 import Flake8Inspector
+from hyperstyle.src.python.review.inspectors.pylint.pylint import PylintInspector
+from hyperstyle.src.python.review.reviewers.perform_review import perform_review_as_json
+from hyperstyle.src.python.review.reviewers.utils.incremental_review import (
+    inspect_project_incrementally,
+    ReviewManifest,
+)
+from test.python.inspectors import PYTHON_DATA_FOLDER
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from hyperstyle.src.python.review.inspectors.common.issue.issue import BaseIssue
+
+PROJECT_FILES = [
+    "case10_unused_variable_in_loop.py",
+    "case13_complex_logic.py",
+    "case15_redefining.py",
+]
+
+
+@pytest.fixture
+def project_path(tmp_path: Path) -> Path:
+    project_path = tmp_path / "project"
+    project_path.mkdir()
+    for file_name in PROJECT_FILES:
+        shutil.copy(PYTHON_DATA_FOLDER / file_name, project_path / file_name)
+    return project_path
+
+
+@pytest.fixture
+def config(tmp_path: Path) -> ApplicationConfig:
+    config = ApplicationConfig.get_default_config()
+    config.disabled_inspectors = {InspectorType.IJ_PYTHON}
+    config.manifest_path = tmp_path / "manifest.json"
+    return config
+
+
+def _review_fully_and_incrementally(
+    project_path: Path, config: ApplicationConfig
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    full_result = perform_review_as_json(project_path, dataclasses.replace(config, manifest_path=None))
+    incremental_result = perform_review_as_json(project_path, config)
+    return full_result, incremental_result
+
+
+def test_incremental_review_is_equal_to_full_review(project_path: Path, config: ApplicationConfig) -> None:
+    full_result, incremental_result = _review_fully_and_incrementally(project_path, config)
+    assert incremental_result == full_result
+    assert config.manifest_path.exists()
+
+    # Nothing is changed, so all issues are taken from the manifest
+    full_result, incremental_result = _review_fully_and_incrementally(project_path, config)
+    assert incremental_result == full_result
+
+    (project_path / PROJECT_FILES[0]).write_text("x = 1\n")
+    (project_path / PROJECT_FILES[1]).unlink()
+    shutil.copy(PYTHON_DATA_FOLDER / "case14_returns_errors.py", project_path / "case14_returns_errors.py")
+    full_result, incremental_result = _review_fully_and_incrementally(project_path, config)
+    assert incremental_result == full_result
+
+
+class PathsRecorder:
+    def __init__(self) -> None:
+        self.paths: list[Path] = []
+
+    def inspect(self, path: Path, config: dict[str, Any]) -> list[BaseIssue]:
+        self.paths.append(path)
+        return super().inspect(path, config)
+
+
+class RecordingFlake8Inspector(PathsRecorder, Flake8Inspector):
+    pass
+
+
+class RecordingPylintInspector(PathsRecorder, PylintInspector):
+    pass
+
+
+def test_only_changed_files_are_inspected(project_path: Path, config: ApplicationConfig) -> None:
+    flake8_inspector = RecordingFlake8Inspector()
+    pylint_inspector = RecordingPylintInspector()
+    inspectors = [flake8_inspector, pylint_inspector]
+    language_files = sorted(project_path.iterdir())
+
+    inspect_project_incrementally(project_path, language_files, config, inspectors)
+    assert flake8_inspector.paths == [project_path]
+    assert pylint_inspector.paths == [project_path]
+
+    inspect_project_incrementally(project_path, language_files, config, inspectors)
+    assert len(flake8_inspector.paths) == 1
+    assert len(pylint_inspector.paths) == 1
+
+    changed_file = project_path / PROJECT_FILES[0]
+    changed_file.write_text("x = 1\n")
+    issues = inspect_project_incrementally(project_path, language_files, config, inspectors).issues
+    assert flake8_inspector.paths[1:] == [changed_file]
+    assert pylint_inspector.paths[1:] == [project_path]
+    assert issues == flake8_inspector.inspect(project_path, {}) + pylint_inspector.inspect(project_path, {})
+
+    manifest = ReviewManifest.load(config.manifest_path, project_path)
+    assert set(manifest.inspectors) == {InspectorType.FLAKE8, InspectorType.PYLINT}
+
+
+def test_corrupted_manifest(project_path: Path, config: ApplicationConfig) -> None:
+    config.manifest_path.write_text("{")
+    assert ReviewManifest.load(config.manifest_path, project_path) == ReviewManifest()
+
+    full_result, incremental_result = _review_fully_and_incrementally(project_path, config)
+    assert incremental_result == full_result
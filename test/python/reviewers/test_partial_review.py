@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import sys
+import threading
+from typing import TYPE_CHECKING
+
+from hyperstyle.src.python.review.application_config import ApplicationConfig
+from hyperstyle.src.python.review.common.subprocess_runner import ResourceLimits
+from hyperstyle.src.python.review.inspectors.common.inspector.inspector_type import InspectorType
+from hyperstyle.src.python.review.inspectors.pylint import pylint
+from hyperstyle.src.python.review.inspectors.pylint.pylint import PylintInspector
+from hyperstyle.src.python.review.reviewers.perform_review import perform_review_as_json
+from test.python.inspectors import PYTHON_DATA_FOLDER
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    import pytest
+
+
+def test_partial_review(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("PYLINT_BACKEND", "subprocess")
+    config = ApplicationConfig.get_default_config()
+    config.disabled_inspectors = {InspectorType.IJ_PYTHON}
+    config.inspector_limits = {InspectorType.PYLINT: ResourceLimits(wall_time=0.01)}
+
+    result = perform_review_as_json(PYTHON_DATA_FOLDER / "case10_unused_variable_in_loop.py", config)
+
+    assert result["partial"] is True
+    assert result["timed_out_inspectors"] == [InspectorType.PYLINT.value]
+    assert result["issues"]
+
+
+def test_complete_review_is_not_marked() -> None:
+    config = ApplicationConfig.get_default_config()
+    config.disabled_inspectors = {InspectorType.IJ_PYTHON}
+    config.new_format = True
+
+    result = perform_review_as_json(PYTHON_DATA_FOLDER / "case10_unused_variable_in_loop.py", config)
+
+    assert "partial" not in result
+    assert "timed_out_inspectors" not in result
+
+
+def test_hanging_linter_does_not_block_next_review(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("PYLINT_BACKEND", "in_process")
+    config = ApplicationConfig.get_default_config()
+    config.disabled_inspectors = {InspectorType.IJ_PYTHON}
+    config.cache_dir = tmp_path / "cache"
+    config.inspector_limits = {InspectorType.PYLINT: ResourceLimits(wall_time=1)}
+    path = PYTHON_DATA_FOLDER / "case10_unused_variable_in_loop.py"
+
+    hang = threading.Event()
+    try:
+        with monkeypatch.context() as patch:
+            # The in-process linter would hang forever holding its lock, so it must not be used under the limits
+            patch.setattr(PylintInspector, "_inspect_in_process", lambda *_: hang.wait())
+            patch.setattr(pylint, "BASE_COMMAND", [sys.executable, "-c", "import time; time.sleep(60)"])
+            result = perform_review_as_json(path, config)
+
+        assert result["timed_out_inspectors"] == [InspectorType.PYLINT.value]
+
+        config.inspector_limits = {InspectorType.PYLINT: ResourceLimits(wall_time=60)}
+        result = perform_review_as_json(path, config)
+
+        assert "partial" not in result
+        assert any(issue["code"].startswith("W") for issue in result["issues"])
+    finally:
+        hang.set()
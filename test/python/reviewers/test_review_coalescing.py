@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import dataclasses
+import itertools
+import json
+import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+import pytest
+
+from hyperstyle.src.python.review.application_config import ApplicationConfig
+from hyperstyle.src.python.review.common.language import Language
+from hyperstyle.src.python.review.inspectors.common.inspector.inspector_type import InspectorType
+from hyperstyle.src.python.review.reviewers import common
+from hyperstyle.src.python.review.reviewers.perform_review import perform_review_as_json
+from hyperstyle.src.python.review.reviewers.utils.metadata_exploration import InMemoryMetadata
+from test.python.inspectors import PYTHON_DATA_FOLDER
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from hyperstyle.src.python.review.common.parallel_runner import InspectionResult
+    from hyperstyle.src.python.review.reviewers.utils.metadata_exploration import Metadata
+
+HISTORIES = [
+    None,
+    json.dumps({"python": [{"origin_class": "E225", "number": 10}, {"origin_class": "W0612", "number": 5}]}),
+]
+
+
+@pytest.fixture
+def config() -> ApplicationConfig:
+    config = ApplicationConfig.get_default_config()
+    config.disabled_inspectors = {InspectorType.IJ_PYTHON}
+    return config
+
+
+def test_concurrent_reviews_share_inspection(
+    monkeypatch: pytest.MonkeyPatch, config: ApplicationConfig, tmp_path: Path
+) -> None:
+    # The same code is submitted to different paths
+    paths = []
+    for index in range(len(HISTORIES)):
+        path = tmp_path / str(index) / "main.py"
+        path.parent.mkdir()
+        shutil.copy(PYTHON_DATA_FOLDER / "case10_unused_variable_in_loop.py", path)
+        paths.append(path)
+
+    configs = [dataclasses.replace(config, history=history) for history in HISTORIES]
+    expected_reviews = list(itertools.starmap(perform_review_as_json, zip(paths, configs, strict=False)))
+    # The reviews with different histories get different penalties
+    assert expected_reviews[0] != expected_reviews[1]
+
+    inspect_code = common._inspect_code
+    n_inspections = 0
+
+    def slow_inspect_code(
+        metadata: Metadata, config: ApplicationConfig, language: Language
+    ) -> InspectionResult:
+        nonlocal n_inspections
+        n_inspections += 1
+        # The reviews overlap
+        time.sleep(1)
+        return inspect_code(metadata, config, language)
+
+    monkeypatch.setattr(common, "_inspect_code", slow_inspect_code)
+
+    with ThreadPoolExecutor(len(paths)) as executor:
+        reviews = list(executor.map(perform_review_as_json, paths, configs))
+
+    assert n_inspections == 1
+    assert reviews == expected_reviews
+
+
+def test_different_options_are_not_shared(config: ApplicationConfig) -> None:
+    metadata = InMemoryMetadata("print(1)\n")
+    other_config = dataclasses.replace(config, disabled_inspectors={InspectorType.PYLINT})
+    history_config = dataclasses.replace(config, history=HISTORIES[1])
+
+    key = common._get_inspection_key(metadata, config, Language.PYTHON)
+    assert key != common._get_inspection_key(metadata, other_config, Language.PYTHON)
+    # The history is applied after the inspection
+    assert key == common._get_inspection_key(metadata, history_config, Language.PYTHON)
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+from typing import Any, TYPE_CHECKING
+
+import pytest
+
+from hyperstyle.src.python.review.application_config import ApplicationConfig
+from hyperstyle.src.python.review.common.language import Language
+from hyperstyle.src.python.review.inspectors.common.inspector.inspector_type import InspectorType
+from hyperstyle.src.python.review.reviewers.batch_review import BatchItem, perform_review_batch
+from hyperstyle.src.python.review.reviewers.common import LANGUAGE_TO_INSPECTORS
+from test.python.inspectors import PYTHON_DATA_FOLDER
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from hyperstyle.src.python.review.inspectors.common.issue.issue import BaseIssue
+
+CODES = [
+    "a=1\nprint(a)\n",
+    "def f(x):\n  if x: return 1\n  return 2\n",
+    "import os\nx = [i for i in range(10)]\n",
+]
+
+
+@pytest.fixture
+def config() -> ApplicationConfig:
+    config = ApplicationConfig.get_default_config()
+    config.disabled_inspectors = {InspectorType.IJ_PYTHON}
+    return config
+
+
+def _create_items() -> list[BatchItem]:
+    items = [BatchItem(str(index), code=code, language=Language.PYTHON) for index, code in enumerate(CODES)]
+    items.append(BatchItem("path", path=PYTHON_DATA_FOLDER / "case0_spaces.py"))
+    return items
+
+
+def _review(config: ApplicationConfig, pack_size: int) -> dict[str, dict[str, object]]:
+    return {
+        result.id: result.review
+        for result in perform_review_batch(_create_items(), config, pack_size=pack_size)
+    }
+
+
+def _track_inspected_paths(
+    monkeypatch: pytest.MonkeyPatch, inspector_type: InspectorType, *, fail_on_pack: bool = False
+) -> list[Path]:
+    inspector = next(
+        inspector
+        for inspector in LANGUAGE_TO_INSPECTORS[Language.PYTHON]
+        if inspector.inspector_type == inspector_type
+    )
+    inspect = inspector.inspect
+    paths = []
+
+    def track(path: Path, config: dict[str, Any]) -> list[BaseIssue]:
+        paths.append(path)
+        if fail_on_pack and path.is_dir():
+            msg = "The pack is not supported"
+            raise RuntimeError(msg)
+        return inspect(path, config)
+
+    monkeypatch.setattr(inspector, "inspect", track)
+    return paths
+
+
+def test_packed_review(monkeypatch: pytest.MonkeyPatch, config: ApplicationConfig) -> None:
+    expected_reviews = _review(config, pack_size=1)
+
+    flake8_paths = _track_inspected_paths(monkeypatch, InspectorType.FLAKE8)
+    pylint_paths = _track_inspected_paths(monkeypatch, InspectorType.PYLINT)
+
+    assert _review(config, pack_size=len(CODES) + 1) == expected_reviews
+    # Flake8 is file-local, so it is run once over the pack, while Pylint is run on each submission
+    assert len(flake8_paths) == 1
+    assert flake8_paths[0].name == Language.PYTHON.value.lower()
+    assert len(pylint_paths) == len(CODES) + 1
+
+
+def test_failed_pack_fallback(monkeypatch: pytest.MonkeyPatch, config: ApplicationConfig) -> None:
+    expected_reviews = _review(config, pack_size=1)
+
+    radon_paths = _track_inspected_paths(monkeypatch, InspectorType.RADON, fail_on_pack=True)
+
+    assert _review(config, pack_size=len(CODES) + 1) == expected_reviews
+    # The inspector failed on the pack and is run on each submission separately
+    assert len(radon_paths) == len(CODES) + 2
+
+
+def test_unpacked_items(config: ApplicationConfig, tmp_path: Path) -> None:
+    items = [
+        BatchItem("missing", path=tmp_path / "missing.py"),
+        BatchItem("code", code=CODES[0], language=Language.PYTHON),
+    ]
+
+    results = {result.id: result for result in perform_review_batch(items, config, pack_size=2)}
+
+    # The submissions that can't be packed are reviewed separately
+    assert results["missing"].error is not None
+    assert results["code"].review is not None